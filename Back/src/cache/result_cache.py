@@ -0,0 +1,242 @@
+# result_cache.py (내용 해시 기반 결과 캐시: 메모리 LRU + 선택적 SQLite 저장소)
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ..db.async_database import run_in_db_thread
+
+# 디스크 저장소 경로 (비어 있으면 메모리 캐시만 사용)
+CACHE_DB_FILE = os.getenv("FRIDGE_CACHE_DB", "")
+
+# 레벨별 메모리 한도
+OCR_CACHE_MAX_ENTRIES = int(os.getenv("FRIDGE_OCR_CACHE_ENTRIES", "128"))
+OCR_CACHE_MAX_BYTES = int(os.getenv("FRIDGE_OCR_CACHE_BYTES", str(16 * 1024 * 1024)))
+REFINE_CACHE_MAX_ENTRIES = int(os.getenv("FRIDGE_REFINE_CACHE_ENTRIES", "2048"))
+REFINE_CACHE_MAX_BYTES = int(os.getenv("FRIDGE_REFINE_CACHE_BYTES", str(8 * 1024 * 1024)))
+# 디스크 저장소에 남겨둘 최대 항목 수 (캐시 이름별)
+CACHE_DISK_MAX_ENTRIES = int(os.getenv("FRIDGE_CACHE_DISK_ENTRIES", "10000"))
+
+
+# 캐시 키 생성 (여러 부분을 구분자로 이어 SHA-256)
+def make_cache_key(*parts: Any) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, (bytes, bytearray, memoryview)):
+            part = str(part).encode("utf-8")
+        digest.update(part)
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    JSON 직렬화 가능한 결과를 보관하는 LRU 캐시.
+    - 메모리에는 항목 수(max_entries)와 직렬화 크기 합(max_bytes)을 넘지 않도록 오래된 것부터 제거합니다.
+    - db_path를 지정하면 SQLite 파일에도 저장하여 서버를 재시작해도 결과를 재사용합니다.
+    - 이벤트 루프에서는 get_async / put_async 사용: 디스크 읽기/쓰기는 DB 전용 스레드에서 실행합니다.
+    - 디스크 저장소는 별도 잠금(_disk_lock)을 사용하므로 디스크를 읽고 쓰는 동안에도 메모리 조회는 기다리지 않습니다.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            max_entries: int,
+            max_bytes: int,
+            db_path: str = CACHE_DB_FILE,
+            disk_max_entries: int = CACHE_DISK_MAX_ENTRIES
+        ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_max_entries = disk_max_entries
+
+        self._lock = threading.Lock()        # 메모리 항목 / 지표
+        self._disk_lock = threading.Lock()   # 디스크 저장소 커넥션
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_puts = 0
+
+        # 지표
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._puts = 0
+        self._evictions = 0
+
+        if db_path:
+            self._open_disk(db_path)
+
+    def _open_disk(self, db_path: str) -> None:
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS Result_Cache (
+                cache_name TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (cache_name, cache_key)
+            ) WITHOUT ROWID
+        """)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_result_cache_accessed ON Result_Cache (cache_name, accessed_at)"
+        )
+        self._db.commit()
+
+    # (잠금 안에서 호출) 메모리 조회 (없으면 None, 미스는 집계하지 않음)
+    def _get_memory(self, key: str) -> Optional[Any]:
+        raw = self._entries.get(key)
+        if raw is None:
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return json.loads(raw)
+
+    # 디스크 저장소 조회 (없거나 저장소가 없으면 None, 찾으면 접근 시각 갱신)
+    def _get_disk(self, key: str) -> Optional[bytes]:
+        with self._disk_lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT value FROM Result_Cache WHERE cache_name = ? AND cache_key = ?", (self.name, key)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE Result_Cache SET accessed_at = ? WHERE cache_name = ? AND cache_key = ?",
+                (time.time(), self.name, key)
+            )
+            self._db.commit()
+            return bytes(row[0])
+
+    # 조회 (없으면 None, 디스크는 메모리 잠금 밖에서 읽음)
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._get_memory(key)
+        if value is not None:
+            return value
+
+        raw = self._get_disk(key)
+        with self._lock:
+            if raw is None:
+                self._misses += 1
+                return None
+            self._store_in_memory(key, raw)
+            self._disk_hits += 1
+        return json.loads(raw)
+
+    # 비동기 조회: 메모리에 있으면 바로 반환, 디스크를 읽어야 할 때만 DB 전용 스레드에서 조회
+    async def get_async(self, key: str) -> Optional[Any]:
+        if self._db is None:
+            return self.get(key)
+        with self._lock:
+            value = self._get_memory(key)
+        if value is not None:
+            return value
+        return await run_in_db_thread(self.get, key)
+
+    # 저장
+    def put(self, key: str, value: Any) -> None:
+        raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            self._store_in_memory(key, raw)
+            self._puts += 1
+        self._put_disk(key, raw)
+
+    # 비동기 저장: 메모리에는 바로 넣고 디스크 쓰기(INSERT + COMMIT)는 DB 전용 스레드에서 실행
+    async def put_async(self, key: str, value: Any) -> None:
+        raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            self._store_in_memory(key, raw)
+            self._puts += 1
+        if self._db is not None:
+            await run_in_db_thread(self._put_disk, key, raw)
+
+    # 디스크 저장소에 기록 (저장소가 없으면 아무것도 하지 않음)
+    def _put_disk(self, key: str, raw: bytes) -> None:
+        with self._disk_lock:
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO Result_Cache (cache_name, cache_key, value, accessed_at) VALUES (?, ?, ?, ?)",
+                (self.name, key, raw, time.time())
+            )
+            self._disk_puts += 1
+            # 저장 100번마다 오래된 항목 정리
+            if self._disk_puts % 100 == 0:
+                self._db.execute("""
+                    DELETE FROM Result_Cache WHERE cache_name = ? AND cache_key IN (
+                        SELECT cache_key FROM Result_Cache WHERE cache_name = ?
+                        ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.name, self.name, self.disk_max_entries))
+            self._db.commit()
+
+    # (잠금 안에서 호출) 메모리에 넣고 한도를 넘으면 오래된 것부터 제거
+    def _store_in_memory(self, key: str, raw: bytes) -> None:
+        if len(raw) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+
+        self._entries[key] = raw
+        self._bytes += len(raw)
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._evictions += 1
+
+    # 메모리와 디스크 모두 비우기
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        with self._disk_lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM Result_Cache WHERE cache_name = ?", (self.name,))
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._disk_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "disk": self._db is not None,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "puts": self._puts,
+                "evictions": self._evictions,
+                "hit_rate": round((self._hits + self._disk_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+# 1단계: 이미지 바이트 해시 → OCR 결과
+ocr_result_cache = ResultCache("ocr", OCR_CACHE_MAX_ENTRIES, OCR_CACHE_MAX_BYTES)
+# 2단계: (모델, 프롬프트 버전, 정규화된 청크 텍스트) 해시 → LLM 보정 결과
+refine_result_cache = ResultCache("refine", REFINE_CACHE_MAX_ENTRIES, REFINE_CACHE_MAX_BYTES)
+
+# 서버 종료 시 디스크 저장소 닫기
+def close_result_caches() -> None:
+    ocr_result_cache.close()
+    refine_result_cache.close()
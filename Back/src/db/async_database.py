@@ -0,0 +1,50 @@
+# async_database.py (비동기 DB 접근 계층)
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from .database import POOL_SIZE, db_connection
+
+T = TypeVar("T")
+
+# DB 전용 실행기 스레드 수 (커넥션 풀 크기와 같게 두어 풀 대기가 생기지 않도록 함)
+DB_EXECUTOR_WORKERS = POOL_SIZE
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+# DB 전용 실행기 조회 (최초 호출 시 생성)
+# Starlette 기본 스레드풀(40개)과 분리되어 OCR/LLM 같은 느린 작업이 DB 조회를 막지 않음
+def get_db_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db")
+    return _executor
+
+# DB 전용 실행기 종료 (서버 종료 시)
+def shutdown_db_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+# 동기 함수를 DB 전용 스레드에서 실행
+async def run_in_db_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), functools.partial(func, *args, **kwargs))
+
+# 풀에서 빌린 커넥션을 첫 번째 인자로 넘겨 동기 CRUD 함수를 DB 전용 스레드에서 실행
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    def task() -> T:
+        with db_connection() as conn:
+            return func(conn, *args, **kwargs)
+
+    return await run_in_db_thread(task)
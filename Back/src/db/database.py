@@ -2,82 +2,203 @@
 
 import os
 import sqlite3
-from typing import List, Tuple
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .migrations import migrate
 
 # DB 파일 경로 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATABASE_FILE = os.path.join(BASE_DIR, "fridge_app.db")
 
-# 1. Categories 테이블 (분류 태그)
-CATEGORIES_SCHEMA = """
-CREATE TABLE IF NOT EXISTS Categories (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL UNIQUE
-);
-"""
-
-# 2. Storage_Locations 테이블 (보관 위치)
-STORAGE_LOCATIONS_SCHEMA = """
-CREATE TABLE IF NOT EXISTS Storage_Locations (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL UNIQUE
-);
-"""
-
-# 3. Ingredients 테이블 (식재료 주 데이터)
-INGREDIENTS_SCHEMA = """
-CREATE TABLE IF NOT EXISTS Ingredients (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- 고유 식별자
-    name TEXT NOT NULL,                    -- 음식 또는 식재료 이름
-    quantity REAL NOT NULL,                -- 수량 값
-    unit TEXT NOT NULL,                    -- 수량 단위
-    category_id INTEGER NOT NULL,          -- 분류 태그
-    storage_location_id INTEGER NOT NULL,  -- 보관 위치
-    expiry_date TEXT NOT NULL,             -- 유통기한 만료 날짜 (TEXT로 저장)
-    registration_date TEXT NOT NULL,       -- 등록 날짜 (TEXT로 저장)
-    status TEXT NOT NULL DEFAULT 'active', -- 상태 추적
-    is_cooked BOOLEAN NOT NULL DEFAULT 0,  -- 0: 식재료, 1: 조리된 음식
-    memo TEXT,                             -- 사용자 메모
-    source_image_id INTEGER,               -- 영수증 이미지
-
-    FOREIGN KEY (category_id) REFERENCES Categories(id),
-    FOREIGN KEY (storage_location_id) REFERENCES Storage_Locations(id)
-);
-"""
-
-# 4. Expiration_Mapping 테이블 (유통기한 자동 설정 기준)
-EXPIRATION_MAPPING_SCHEMA = """
-CREATE TABLE IF NOT EXISTS Expiration_Mapping (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    category_id INTEGER NOT NULL,
-    storage_location_id INTEGER NOT NULL,
-    default_days INTEGER NOT NULL,             -- 유통기한 기본 일수
-
-    UNIQUE(category_id, storage_location_id),  -- 같은 태그와 위치 조합은 하나만 존재하도록 보장
-    FOREIGN KEY (category_id) REFERENCES Categories(id),
-    FOREIGN KEY (storage_location_id) REFERENCES Storage_Locations(id)
-);
-"""
-
-# 5. Cooked_Dishes 테이블 (조리된 음식 데이터)
-COOKED_DISHES_SCHEMA = """
-CREATE TABLE IF NOT EXISTS Cooked_Dishes (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL, 
-    type TEXT NOT NULL,  -- '조리음식', '냉동식품', '그 외' 중 하나
-    registration_date TEXT NOT NULL DEFAULT (date('now')),
-    expiry_date TEXT NOT NULL,
-    memo TEXT,
-    status TEXT NOT NULL DEFAULT 'ACTIVE' 
-);
-"""
-
-# DB 연결
-def get_db_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(DATABASE_FILE)
+# 커넥션 풀 설정
+POOL_SIZE = int(os.getenv("FRIDGE_DB_POOL_SIZE", "8"))         # 미리 열어둘 커넥션 수 (최대치)
+POOL_TIMEOUT = float(os.getenv("FRIDGE_DB_POOL_TIMEOUT", "10"))  # 커넥션 대기 최대 시간(초)
+
+# 커넥션마다 적용할 PRAGMA (WAL 모드 + 캐시/메모리 매핑 설정)
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 134217728",   # 128MB
+    "PRAGMA cache_size = -16000",     # 약 16MB (음수: KB 단위)
+    "PRAGMA busy_timeout = 5000",
+)
+
+
+# 새 커넥션 생성 (PRAGMA 설정 포함)
+def create_connection(database: str = DATABASE_FILE) -> sqlite3.Connection:
+    # 풀에서 꺼낸 커넥션은 요청마다 다른 스레드에서 사용되므로 check_same_thread 비활성화
+    conn = sqlite3.connect(database, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
+
+class PoolTimeoutError(Exception):
+    # 제한 시간 내에 반환된 커넥션이 없을 때 발생
+    pass
+
+
+class ConnectionPool:
+    """
+    크기가 제한된 스레드 안전 SQLite 커넥션 풀.
+    - 커넥션은 최초 생성 시 미리 열어두고 재사용합니다.
+    - 모든 커넥션이 사용 중이면 반환될 때까지 대기합니다(최대 timeout 초).
+    """
+
+    def __init__(self, database: str = DATABASE_FILE, size: int = POOL_SIZE, timeout: float = POOL_TIMEOUT):
+        if size < 1:
+            raise ValueError("커넥션 풀 크기는 1 이상이어야 합니다.")
+
+        self.database = database
+        self.size = size
+        self.timeout = timeout
+
+        self._idle: List[sqlite3.Connection] = []
+        self._cond = threading.Condition()
+        self._closed = False
+
+        # 풀 지표
+        self._checked_out = 0
+        self._total_checkouts = 0
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._timeouts = 0
+
+        for _ in range(size):
+            self._idle.append(create_connection(database))
+
+    # 커넥션 대여
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        timeout = self.timeout if timeout is None else timeout
+
+        with self._cond:
+            if self._closed:
+                raise PoolTimeoutError("커넥션 풀이 이미 종료되었습니다.")
+
+            if not self._idle:
+                self._waits += 1
+                started = time.perf_counter()
+                deadline = started + timeout
+
+                while not self._idle and not self._closed:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                waited = time.perf_counter() - started
+                self._wait_time_total += waited
+                self._wait_time_max = max(self._wait_time_max, waited)
+
+                if self._closed or not self._idle:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(f"{timeout}초 안에 사용 가능한 DB 커넥션이 없습니다.")
+
+            conn = self._idle.pop()
+            self._checked_out += 1
+            self._total_checkouts += 1
+            return conn
+
+    # 커넥션 반납 (열린 트랜잭션은 롤백 후 반납)
+    def release(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            # 손상된 커넥션은 닫고 새 커넥션으로 교체
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            conn = create_connection(self.database)
+
+        with self._cond:
+            self._checked_out -= 1
+            if self._closed:
+                conn.close()
+                return
+            self._idle.append(conn)
+            self._cond.notify()
+
+    # with 문으로 사용: 블록이 끝나면 항상 반납
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    # 풀 지표 조회
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "checked_out": self._checked_out,
+                "idle": len(self._idle),
+                "total_checkouts": self._total_checkouts,
+                "waits": self._waits,
+                "wait_time_total_ms": round(self._wait_time_total * 1000, 3),
+                "wait_time_max_ms": round(self._wait_time_max * 1000, 3),
+                "timeouts": self._timeouts,
+            }
+
+    # 모든 커넥션 종료 (사용 중인 커넥션은 반납 시점에 닫힘)
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            for conn in self._idle:
+                conn.close()
+            self._idle.clear()
+            self._cond.notify_all()
+
+
+# 프로세스 전역 커넥션 풀
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+# 전역 풀 조회 (최초 호출 시 생성)
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+# 전역 풀 재생성 (서버 시작, 테스트용 DB 교체 등)
+def init_pool(database: str = DATABASE_FILE, size: int = POOL_SIZE, timeout: float = POOL_TIMEOUT) -> ConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = ConnectionPool(database, size, timeout)
+    return _pool
+
+# 전역 풀 종료
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+# 풀에서 커넥션을 빌려 쓰는 컨텍스트 매니저 (라우터 외부 모듈용)
+@contextmanager
+def db_connection() -> Iterator[sqlite3.Connection]:
+    with get_pool().connection() as conn:
+        yield conn
+
+# DB 연결 (FastAPI 의존성: 요청이 끝나면 커넥션을 풀에 반납)
+def get_db_connection() -> Iterator[sqlite3.Connection]:
+    with db_connection() as conn:
+        yield conn
+
 # ID 조회
 def get_id_by_name(cursor: sqlite3.Cursor, table_name: str, name: str) -> int:
     cursor.execute(f"SELECT id FROM {table_name} WHERE name = ?", (name,))
@@ -86,7 +207,7 @@ def get_id_by_name(cursor: sqlite3.Cursor, table_name: str, name: str) -> int:
         return result['id']
     raise ValueError(f"ID를 찾을 수 없습니다: {table_name} - {name}")
 
-# 값이 없으면 자동 추가 (이 함수는 현재 initialize_database에서는 사용되지 않지만 유틸리티로 남겨둠)
+# 값이 없으면 자동 추가 (이 함수는 현재 마이그레이션에서는 사용되지 않지만 유틸리티로 남겨둠)
 def ensure_value_exists(cursor, table, name):
     cursor.execute(f"SELECT id FROM {table} WHERE name = ?", (name,))
     row = cursor.fetchone()
@@ -96,138 +217,11 @@ def ensure_value_exists(cursor, table, name):
     cursor.execute(f"INSERT INTO {table} (name) VALUES (?)", (name,))
     return cursor.lastrowid
 
-# 초기 DB 세팅
-def initialize_database():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # 테이블 생성
-    cursor.execute(CATEGORIES_SCHEMA)
-    cursor.execute(STORAGE_LOCATIONS_SCHEMA)
-    cursor.execute(INGREDIENTS_SCHEMA)
-    cursor.execute(EXPIRATION_MAPPING_SCHEMA)
-    cursor.execute(COOKED_DISHES_SCHEMA)
-
-    # 기본 카테고리 / 저장 위치
-    initial_categories = [
-        '유제품', '채소', '과일', '빵류', '떡류', '육류', '어묵',
-        '두부', '묵류', '과일·채소류음료', '도시락', '김밥', '샌드위치', '햄버거',
-        '건면', '비건조면류', '식용유', '참기름', '들기름', '마가린류', '달걀',
-        '냉동식품', '조미료', '기타'
-    ]
-
-    initial_locations = ['냉장', '냉동', '상온', '진공-냉장']
-
-    # Categories 초기 데이터 삽입
-    cursor.execute("SELECT COUNT(*) FROM Categories")
-    if cursor.fetchone()[0] == 0:
-        category_data = [(name,) for name in initial_categories]
-        cursor.executemany("INSERT INTO Categories (name) VALUES (?)", category_data)
-        print("초기 분류(Categories) 데이터 삽입 완료.")
-
-    # Storage_Locations 초기 데이터 삽입
-    cursor.execute("SELECT COUNT(*) FROM Storage_Locations")
-    if cursor.fetchone()[0] == 0:
-        location_data = [(name,) for name in initial_locations]
-        cursor.executemany("INSERT INTO Storage_Locations (name) VALUES (?)", location_data)
-        print("초기 보관 위치(Storage_Locations) 데이터 삽입 완료.")
-
-    # Expiration_Mapping 초기 데이터 정의 (TEXT 기준)
-    text_mapping_data: List[Tuple[str, str, int]] = [
-        # 유제품
-        ('유제품', '냉장', 7),
-        ('유제품', '냉동', 30),
-
-        # 채소
-        ('채소', '냉장', 7),
-        ('채소', '상온', 3),
-
-        # 과일
-        ('과일', '냉장', 5),
-        ('과일', '상온', 4),
-
-        # 빵류
-        ('빵류', '상온', 5),  # 크림빵, 단팥빵 평균
-        ('빵류', '냉장', 4),  # 생크림빵
-
-        # 떡류
-        ('떡류', '상온', 1),
-
-        # 육류
-        ('육류', '냉장', 5),
-        ('육류', '냉동', 90),
-
-        # 어묵
-        ('어묵', '냉장', 8),
-        ('어묵', '냉동', 20),
-
-        # 두부
-        ('두부', '냉장', 3),   # 비포장
-        ('두부', '냉동', 15),  # 살균제품
-
-        # 묵류
-        ('묵류', '냉장', 3),
-
-        # 과일·채소류음료
-        ('과일·채소류음료', '냉장', 3),
-
-        # 즉석섭취, 편의식품류
-        ('도시락', '냉장', 1),
-        ('김밥', '냉장', 1),
-        ('샌드위치', '냉장', 2),
-        ('햄버거', '냉장', 3),
-
-        # 면류
-        ('건면', '상온', 730),    # 건조제품 2년
-        ('비건조면류', '상온', 60), # 비건조 살균제품 2개월
-
-        # 식용유지류
-        ('식용유', '상온', 360),
-        ('참기름', '상온', 270),
-        ('들기름', '상온', 270),
-
-        # 식용유지가공품
-        ('마가린류', '냉장', 360),
-
-        # 달걀
-        ('달걀', '냉장', 45),
-
-        # 냉동식품
-        ('냉동식품', '냉동', 180),
-
-        # 조미료
-        ('조미료', '상온', 180),
-
-        # 기타
-        ('기타', '상온', 30),
-    ]
-
-    # Expiration_Mapping에 ID 기반 데이터 삽입
-    cursor.execute("SELECT COUNT(*) FROM Expiration_Mapping")
-    if cursor.fetchone()[0] == 0:
-
-         id_mapping_data = []
-         for category_name, location_name, days in text_mapping_data:
-             try:
-                 # 텍스트 이름으로 ID 조회
-                 category_id = get_id_by_name(cursor, "Categories", category_name)
-                 location_id = get_id_by_name(cursor, "Storage_Locations", location_name)
-
-                 # ID 기반의 최종 데이터 리스트 구성
-                 id_mapping_data.append((category_id, location_id, days))
-             except ValueError as e:
-                 print(f"경고: 매핑 데이터 준비 중 오류 발생 - {e}")
-                 continue
-
-         cursor.executemany("""
-             INSERT INTO Expiration_Mapping (category_id, storage_location_id, default_days)
-             VALUES (?, ?, ?)
-         """, id_mapping_data)
-         print("초기 유통기한 매핑 데이터 삽입 완료.")
-
-    conn.commit()
-    conn.close()
+# 초기 DB 세팅 (스키마 버전 확인 후 필요한 마이그레이션만 적용)
+def initialize_database() -> int:
+    with db_connection() as conn:
+        return migrate(conn)
 
 if __name__ == '__main__':
     initialize_database()
-    print(f"'{DATABASE_FILE}' 데이터베이스 파일이 준비되었습니다.")
\ No newline at end of file
+    print(f"'{DATABASE_FILE}' 데이터베이스 파일이 준비되었습니다.")
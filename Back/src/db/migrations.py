@@ -0,0 +1,336 @@
+# migrations.py (스키마 버전 관리 및 마이그레이션)
+
+import sqlite3
+from typing import Callable, List, Tuple
+
+from .text_search import search_index_select_sql
+
+# ---------- 스키마 정의 ----------
+
+# 1. Categories 테이블 (분류 태그)
+CATEGORIES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Categories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+"""
+
+# 2. Storage_Locations 테이블 (보관 위치)
+STORAGE_LOCATIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Storage_Locations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+"""
+
+# 3. Ingredients 테이블 (식재료 주 데이터)
+INGREDIENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Ingredients (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- 고유 식별자
+    name TEXT NOT NULL,                    -- 음식 또는 식재료 이름
+    quantity REAL NOT NULL,                -- 수량 값
+    unit TEXT NOT NULL,                    -- 수량 단위
+    category_id INTEGER NOT NULL,          -- 분류 태그
+    storage_location_id INTEGER NOT NULL,  -- 보관 위치
+    expiry_date TEXT NOT NULL,             -- 유통기한 만료 날짜 (TEXT로 저장)
+    registration_date TEXT NOT NULL,       -- 등록 날짜 (TEXT로 저장)
+    status TEXT NOT NULL DEFAULT 'active', -- 상태 추적
+    is_cooked BOOLEAN NOT NULL DEFAULT 0,  -- 0: 식재료, 1: 조리된 음식
+    memo TEXT,                             -- 사용자 메모
+    source_image_id INTEGER,               -- 영수증 이미지
+
+    FOREIGN KEY (category_id) REFERENCES Categories(id),
+    FOREIGN KEY (storage_location_id) REFERENCES Storage_Locations(id)
+);
+"""
+
+# 4. Expiration_Mapping 테이블 (유통기한 자동 설정 기준)
+EXPIRATION_MAPPING_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Expiration_Mapping (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category_id INTEGER NOT NULL,
+    storage_location_id INTEGER NOT NULL,
+    default_days INTEGER NOT NULL,             -- 유통기한 기본 일수
+
+    UNIQUE(category_id, storage_location_id),  -- 같은 태그와 위치 조합은 하나만 존재하도록 보장
+    FOREIGN KEY (category_id) REFERENCES Categories(id),
+    FOREIGN KEY (storage_location_id) REFERENCES Storage_Locations(id)
+);
+"""
+
+# 5. Cooked_Dishes 테이블 (조리된 음식 데이터)
+COOKED_DISHES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Cooked_Dishes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL, 
+    type TEXT NOT NULL,  -- '조리음식', '냉동식품', '그 외' 중 하나
+    registration_date TEXT NOT NULL DEFAULT (date('now')),
+    expiry_date TEXT NOT NULL,
+    memo TEXT,
+    status TEXT NOT NULL DEFAULT 'ACTIVE' 
+);
+"""
+
+# 6. Ingredients 보조 인덱스 (목록/알림/히스토리/레시피 조회용)
+INGREDIENTS_INDEXES = (
+    # 활성 목록 + 유통기한 정렬, 알림(기간 조회), 레시피 재료 조회
+    "CREATE INDEX IF NOT EXISTS idx_ingredients_status_expiry ON Ingredients(status, expiry_date)",
+    # 카테고리 / 보관 위치 필터링
+    "CREATE INDEX IF NOT EXISTS idx_ingredients_status_category ON Ingredients(status, category_id)",
+    "CREATE INDEX IF NOT EXISTS idx_ingredients_status_storage ON Ingredients(status, storage_location_id)",
+    # 이름 검색 / 이름 정렬
+    "CREATE INDEX IF NOT EXISTS idx_ingredients_status_name ON Ingredients(status, name)",
+)
+
+# 7. Receipt_Line_Dictionary 테이블 (영수증 줄 → 식재료 학습 사전, items: 보정 결과 JSON / 식재료가 아니면 '[]')
+RECEIPT_LINE_DICTIONARY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Receipt_Line_Dictionary (
+    raw_text TEXT PRIMARY KEY,             -- 앞뒤 공백만 제거한 원본 줄
+    norm_key TEXT NOT NULL,                -- 접두어/공백을 제거한 정규화 키
+    items TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# 8. Recipe_Corpus 테이블 (생성 / 가져온 레시피 모음, recipe: 레시피 JSON / source: 'llm' 또는 'import')
+RECIPE_CORPUS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Recipe_Corpus (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recipe_key TEXT NOT NULL UNIQUE,       -- 정규화한 요리 이름 + 재료 (같은 레시피 중복 방지)
+    recipe_name TEXT NOT NULL,
+    recipe TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT 'llm',
+    created_at REAL NOT NULL
+);
+"""
+
+# 9. Ingredients 히스토리 인덱스 (상태별 최근 id 순 키셋 페이지 조회)
+INGREDIENTS_HISTORY_INDEX = "CREATE INDEX IF NOT EXISTS idx_ingredients_status_id ON Ingredients(status, id)"
+
+# 10. Ingredients_FTS 전문 검색 테이블 (rowid = Ingredients.id)
+# - name_key / initials: 정규화한 이름 / 초성 문자열 (후보 확인 및 접두어 순위용, 색인하지 않음)
+# - grams / initial_grams: 한 글자 + 두 글자 n-gram 토큰
+INGREDIENTS_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS Ingredients_FTS USING fts5(
+    name_key UNINDEXED,
+    initials UNINDEXED,
+    grams,
+    initial_grams,
+    tokenize = 'unicode61'
+);
+"""
+
+# Ingredients 가 바뀔 때마다 같은 트랜잭션 안에서 검색 테이블도 고침
+# (값은 text_search 의 SQL 식으로 계산: 앱 전용 SQL 함수가 없으므로 앱 밖의 커넥션으로 써도 색인이 맞음)
+INGREDIENTS_FTS_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_fts_insert AFTER INSERT ON Ingredients BEGIN
+        INSERT INTO Ingredients_FTS (rowid, name_key, initials, grams, initial_grams)
+        {search_index_select_sql("new.id", "new.name")};
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_fts_delete AFTER DELETE ON Ingredients BEGIN
+        DELETE FROM Ingredients_FTS WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_fts_update AFTER UPDATE OF name ON Ingredients BEGIN
+        DELETE FROM Ingredients_FTS WHERE rowid = old.id;
+        INSERT INTO Ingredients_FTS (rowid, name_key, initials, grams, initial_grams)
+        {search_index_select_sql("new.id", "new.name")};
+    END
+    """,
+)
+
+# ---------- 기준 데이터 ----------
+
+# 기본 카테고리 / 저장 위치
+INITIAL_CATEGORIES = [
+    '유제품', '채소', '과일', '빵류', '떡류', '육류', '어묵',
+    '두부', '묵류', '과일·채소류음료', '도시락', '김밥', '샌드위치', '햄버거',
+    '건면', '비건조면류', '식용유', '참기름', '들기름', '마가린류', '달걀',
+    '냉동식품', '조미료', '기타'
+]
+
+INITIAL_LOCATIONS = ['냉장', '냉동', '상온', '진공-냉장']
+
+# Expiration_Mapping 초기 데이터 정의 (TEXT 기준)
+INITIAL_EXPIRATION_MAPPING: List[Tuple[str, str, int]] = [
+    # 유제품
+    ('유제품', '냉장', 7),
+    ('유제품', '냉동', 30),
+
+    # 채소
+    ('채소', '냉장', 7),
+    ('채소', '상온', 3),
+
+    # 과일
+    ('과일', '냉장', 5),
+    ('과일', '상온', 4),
+
+    # 빵류
+    ('빵류', '상온', 5),  # 크림빵, 단팥빵 평균
+    ('빵류', '냉장', 4),  # 생크림빵
+
+    # 떡류
+    ('떡류', '상온', 1),
+
+    # 육류
+    ('육류', '냉장', 5),
+    ('육류', '냉동', 90),
+
+    # 어묵
+    ('어묵', '냉장', 8),
+    ('어묵', '냉동', 20),
+
+    # 두부
+    ('두부', '냉장', 3),   # 비포장
+    ('두부', '냉동', 15),  # 살균제품
+
+    # 묵류
+    ('묵류', '냉장', 3),
+
+    # 과일·채소류음료
+    ('과일·채소류음료', '냉장', 3),
+
+    # 즉석섭취, 편의식품류
+    ('도시락', '냉장', 1),
+    ('김밥', '냉장', 1),
+    ('샌드위치', '냉장', 2),
+    ('햄버거', '냉장', 3),
+
+    # 면류
+    ('건면', '상온', 730),    # 건조제품 2년
+    ('비건조면류', '상온', 60), # 비건조 살균제품 2개월
+
+    # 식용유지류
+    ('식용유', '상온', 360),
+    ('참기름', '상온', 270),
+    ('들기름', '상온', 270),
+
+    # 식용유지가공품
+    ('마가린류', '냉장', 360),
+
+    # 달걀
+    ('달걀', '냉장', 45),
+
+    # 냉동식품
+    ('냉동식품', '냉동', 180),
+
+    # 조미료
+    ('조미료', '상온', 180),
+
+    # 기타
+    ('기타', '상온', 30),
+]
+
+
+# 이름 목록을 한 번의 INSERT 문으로 입력 (이미 있는 이름은 무시)
+def _seed_names(cursor: sqlite3.Cursor, table_name: str, names: List[str]) -> None:
+    placeholders = ", ".join("(?)" for _ in names)
+    cursor.execute(f"INSERT OR IGNORE INTO {table_name} (name) VALUES {placeholders}", names)
+
+
+# ---------- 마이그레이션 ----------
+
+# 1. 기본 테이블 생성 및 기준 데이터 입력
+# (기존 CREATE-IF-NOT-EXISTS 방식으로 만들어진 DB에도 안전하게 적용되도록 모두 멱등하게 작성)
+def _migration_001_base_schema(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(CATEGORIES_SCHEMA)
+    cursor.execute(STORAGE_LOCATIONS_SCHEMA)
+    cursor.execute(INGREDIENTS_SCHEMA)
+    cursor.execute(EXPIRATION_MAPPING_SCHEMA)
+    cursor.execute(COOKED_DISHES_SCHEMA)
+
+    _seed_names(cursor, "Categories", INITIAL_CATEGORIES)
+    _seed_names(cursor, "Storage_Locations", INITIAL_LOCATIONS)
+
+    # 텍스트 기준 매핑을 이름 JOIN으로 ID로 변환하여 한 번에 입력
+    values = ", ".join("(?, ?, ?)" for _ in INITIAL_EXPIRATION_MAPPING)
+    params = [value for row in INITIAL_EXPIRATION_MAPPING for value in row]
+    cursor.execute(f"""
+        WITH M(category_name, location_name, default_days) AS (VALUES {values})
+        INSERT OR IGNORE INTO Expiration_Mapping (category_id, storage_location_id, default_days)
+        SELECT C.id, S.id, M.default_days
+        FROM M
+        JOIN Categories C ON C.name = M.category_name
+        JOIN Storage_Locations S ON S.name = M.location_name
+    """, params)
+
+# 2. Ingredients 보조 인덱스
+def _migration_002_ingredients_indexes(cursor: sqlite3.Cursor) -> None:
+    for index_sql in INGREDIENTS_INDEXES:
+        cursor.execute(index_sql)
+
+# 3. 영수증 줄 학습 사전
+def _migration_003_receipt_line_dictionary(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(RECEIPT_LINE_DICTIONARY_SCHEMA)
+
+# 4. 로컬 레시피 모음
+def _migration_004_recipe_corpus(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(RECIPE_CORPUS_SCHEMA)
+
+# 5. Ingredients 히스토리 인덱스
+def _migration_005_ingredients_history_index(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(INGREDIENTS_HISTORY_INDEX)
+
+# 6. 식재료 이름 전문 검색 테이블 + 동기화 트리거, 기존 행 색인
+def _migration_006_ingredients_fts(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(INGREDIENTS_FTS_SCHEMA)
+    for trigger_sql in INGREDIENTS_FTS_TRIGGERS:
+        cursor.execute(trigger_sql)
+    cursor.execute(f"""
+        INSERT INTO Ingredients_FTS (rowid, name_key, initials, grams, initial_grams)
+        {search_index_select_sql("I.id", "I.name", "Ingredients I")}
+    """)
+
+
+# 마이그레이션 목록: (버전, 설명, 적용 함수) - 버전은 1부터 순서대로 증가
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "기본 테이블 및 기준 데이터", _migration_001_base_schema),
+    (2, "Ingredients 보조 인덱스", _migration_002_ingredients_indexes),
+    (3, "영수증 줄 학습 사전", _migration_003_receipt_line_dictionary),
+    (4, "로컬 레시피 모음", _migration_004_recipe_corpus),
+    (5, "Ingredients 히스토리 인덱스", _migration_005_ingredients_history_index),
+    (6, "식재료 이름 전문 검색", _migration_006_ingredients_fts),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+# 현재 DB 스키마 버전 조회 (PRAGMA user_version)
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+# 적용되지 않은 마이그레이션을 하나의 트랜잭션으로 적용하고 최종 버전을 반환
+def migrate(conn: sqlite3.Connection) -> int:
+    # 최신 버전이면 PRAGMA 한 번만 읽고 종료
+    version = get_schema_version(conn)
+    if version >= LATEST_VERSION:
+        return version
+
+    # 트랜잭션을 직접 제어하기 위해 자동 트랜잭션 비활성화
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+
+        # 다른 프로세스가 먼저 마이그레이션했을 수 있으므로 잠금 획득 후 다시 확인
+        version = get_schema_version(conn)
+        for migration_version, description, apply in MIGRATIONS:
+            if migration_version <= version:
+                continue
+            apply(cursor)
+            print(f"DB 마이그레이션 {migration_version:03d} 적용: {description}")
+
+        cursor.execute(f"PRAGMA user_version = {LATEST_VERSION}")
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.isolation_level = isolation_level
+
+    return LATEST_VERSION
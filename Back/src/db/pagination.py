@@ -0,0 +1,77 @@
+# pagination.py (키셋 페이지 조회: 커서 인코딩 / 반환 필드 선택)
+
+import base64
+import binascii
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# 커서만 주고 limit 을 생략했을 때의 페이지 크기 / 한 페이지 최대 크기
+DEFAULT_PAGE_SIZE = int(os.getenv("FRIDGE_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = int(os.getenv("FRIDGE_MAX_PAGE_SIZE", "500"))
+
+
+# 마지막 행의 정렬 키 값 → 불투명 커서 문자열 (order_key: 정렬 기준, 다른 정렬의 커서를 거부하는 데 사용)
+def encode_cursor(order_key: str, values: Sequence[Any]) -> str:
+    payload = json.dumps([order_key, *values], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+# 커서 문자열 → 정렬 키 값 (형식이 잘못되었거나 정렬 기준이 다르면 ValueError)
+def decode_cursor(cursor: str, order_key: str, size: int) -> List[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("잘못된 커서입니다.")
+
+    if not isinstance(payload, list) or len(payload) != size + 1 or payload[0] != order_key:
+        raise ValueError("잘못된 커서이거나 다른 정렬 조건의 커서입니다.")
+    return payload[1:]
+
+# "id,name,label_color" → 필드 이름 목록 (지정하지 않으면 전체, 알 수 없는 필드가 있으면 ValueError)
+def parse_fields(fields: Optional[str], available: Dict[str, str]) -> List[str]:
+    if not fields:
+        return list(available)
+
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in available]
+    if unknown or not names:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(available)})")
+    return names
+
+# SELECT 목록: 요청 필드 + 커서에 필요한 컬럼 (available: 필드 이름 → SQL 식)
+def select_sql(names: Iterable[str], available: Dict[str, str], extra: Iterable[str] = ()) -> str:
+    columns = dict.fromkeys([*names, *extra])
+    return ", ".join(f"{available[name]} AS {name}" for name in columns)
+
+
+class Page:
+    """
+    키셋 페이지 조회 결과.
+    - items: 이번 페이지 행 (요청한 필드만 담은 dict, 바로 직렬화 가능)
+    - next_cursor: 다음 페이지 커서 (마지막 페이지면 None), total: 요청한 경우에만 전체 개수
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], next_cursor: Optional[str] = None, total: Optional[int] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+
+
+# limit + 1 개까지 조회한 행 → 페이지 (한 행이 더 있으면 다음 페이지가 있으므로 마지막 행으로 커서 생성)
+def build_page(
+        rows: Sequence[Any],
+        limit: Optional[int],
+        fields: List[str],
+        order_key: str,
+        cursor_columns: Sequence[str]
+    ) -> Page:
+
+    has_more = limit is not None and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+
+    next_cursor = encode_cursor(order_key, [rows[-1][column] for column in cursor_columns]) if has_more else None
+    # 커서용으로 더 조회한 컬럼이 없으면 행 전체를 그대로 변환 (필드별 조회보다 빠름)
+    if rows and list(rows[0].keys()) == fields:
+        return Page([dict(row) for row in rows], next_cursor)
+    return Page([{name: row[name] for name in fields} for row in rows], next_cursor)
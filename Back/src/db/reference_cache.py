@@ -0,0 +1,164 @@
+# reference_cache.py (기준 데이터 메모리 캐시)
+
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .async_database import run_in_db_thread
+from .database import db_connection
+
+# 캐시 대상 이름 테이블
+REFERENCE_TABLES = ("Categories", "Storage_Locations")
+
+
+class ReferenceDataCache:
+    """
+    Categories / Storage_Locations / Expiration_Mapping 을 프로세스 전역으로 보관하는 캐시.
+    - 서버 시작 시 한 번 적재하고, 이후 조회는 DB 접근 없이 메모리에서 처리합니다.
+    - 기준 테이블에 쓰기가 발생하면 invalidate()로 비우고, 다음 조회 시 다시 적재합니다.
+    - 캐시에 없는 이름은 다시 적재하지 않고 바로 실패합니다 (잘못된 태그마다 DB를 다시 읽지 않도록).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, Dict[str, int]] = {}
+        self._default_days: Dict[Tuple[int, int], int] = {}
+        self._loaded = False
+
+    # DB에서 기준 데이터 전체 적재
+    def load(self, conn: sqlite3.Connection) -> None:
+        ids = {
+            table: {row[1]: row[0] for row in conn.execute(f"SELECT id, name FROM {table}")}
+            for table in REFERENCE_TABLES
+        }
+        default_days = {
+            (row[0], row[1]): row[2]
+            for row in conn.execute(
+                "SELECT category_id, storage_location_id, default_days FROM Expiration_Mapping"
+            )
+        }
+
+        with self._lock:
+            self._ids = ids
+            self._default_days = default_days
+            self._loaded = True
+
+    # 새 커넥션으로 다시 적재
+    def reload(self) -> None:
+        with db_connection() as conn:
+            self.load(conn)
+
+    # 캐시 무효화 (다음 조회 시 다시 적재)
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.reload()
+
+    # 적재되지 않았을 때만 DB 전용 스레드에서 적재 (비동기 요청 경로에서 이벤트 루프를 막지 않도록 조회 전에 호출)
+    async def ensure_loaded_async(self) -> None:
+        if not self._loaded:
+            await run_in_db_thread(self.reload)
+
+    # 이름으로 ID 조회 (없으면 ValueError, 메모리에서만 조회)
+    # 다른 프로세스에서 기준 데이터를 바꾼 경우에는 invalidate() 후 다시 조회해야 반영됨
+    def get_id(self, table_name: str, name: str) -> int:
+        if table_name not in REFERENCE_TABLES:
+            raise ValueError(f"캐시 대상 테이블이 아닙니다: {table_name}")
+
+        self._ensure_loaded()
+        found = self._ids[table_name].get(name)
+        if found is None:
+            raise ValueError(f"ID를 찾을 수 없습니다: {table_name} - {name}")
+        return found
+
+    # (카테고리 ID, 보관 위치 ID) 조합의 기본 유통기한 일수 조회 (매핑이 없으면 None)
+    def get_default_days(self, category_id: int, location_id: int) -> Optional[int]:
+        self._ensure_loaded()
+        return self._default_days.get((category_id, location_id))
+
+    # 테이블의 이름 목록 조회
+    def names(self, table_name: str) -> List[str]:
+        self._ensure_loaded()
+        return list(self._ids.get(table_name, {}))
+
+    # 이름 추가 (없을 때만) 후 캐시 무효화
+    def add_name(self, conn: sqlite3.Connection, table_name: str, name: str) -> int:
+        if table_name not in REFERENCE_TABLES:
+            raise ValueError(f"캐시 대상 테이블이 아닙니다: {table_name}")
+
+        conn.execute(f"INSERT OR IGNORE INTO {table_name} (name) VALUES (?)", (name,))
+        conn.commit()
+        self.invalidate()
+        return self.get_id(table_name, name)
+
+    # 기본 유통기한 일수 저장 후 캐시 무효화
+    def set_default_days(self, conn: sqlite3.Connection, category_id: int, location_id: int, days: int) -> None:
+        conn.execute("""
+            INSERT INTO Expiration_Mapping (category_id, storage_location_id, default_days)
+            VALUES (?, ?, ?)
+            ON CONFLICT(category_id, storage_location_id) DO UPDATE SET default_days = excluded.default_days
+        """, (category_id, location_id, days))
+        conn.commit()
+        self.invalidate()
+
+
+# 프로세스 전역 캐시
+reference_cache = ReferenceDataCache()
+
+
+# ---------- LLM 분류 → DB 카테고리 매핑 ----------
+
+# LLM이 반환하는 분류(refine_batch_items 프롬프트 기준)의 기본 DB 카테고리
+LLM_CATEGORY_TO_TAG = {
+    '채소': '채소',
+    '과일': '과일',
+    '육류': '육류',
+    '수산물': '기타',
+    '유제품/두부/알류': '유제품',
+    '면/빵/떡': '빵류',
+    '가공/냉동식품': '냉동식품',
+    '양념/오일': '조미료',
+    '음료': '과일·채소류음료',
+    '기타': '기타',
+}
+
+# 상품명에 포함되면 우선 적용할 키워드 (DB 카테고리 이름 외의 동의어)
+PRODUCT_KEYWORD_TO_TAG = {
+    '계란': '달걀',
+    '우유': '유제품',
+    '치즈': '유제품',
+    '요거트': '유제품',
+    '떡': '떡류',
+    '빵': '빵류',
+    '라면': '건면',
+    '국수': '건면',
+    '우동': '비건조면류',
+    '버터': '마가린류',
+    '소스': '조미료',
+}
+
+# LLM 분류와 상품명을 DB 카테고리 이름으로 변환 (캐시에 없는 이름이면 '기타')
+def resolve_category_tag(llm_category: str, product_name: str = "") -> str:
+    try:
+        known = set(reference_cache.names("Categories"))
+    except sqlite3.Error as e:
+        # DB를 사용할 수 없는 환경(LLM 단독 테스트 등)에서는 정적 매핑만 사용
+        print(f"경고: 카테고리 캐시 적재 실패 - {e}")
+        known = set(LLM_CATEGORY_TO_TAG.values()) | set(PRODUCT_KEYWORD_TO_TAG.values())
+
+    # 1) 상품명에 DB 카테고리 이름이 그대로 포함된 경우 (예: '부침두부' -> '두부')
+    for name in sorted(known, key=len, reverse=True):
+        if name != '기타' and name in product_name:
+            return name
+
+    # 2) 동의어 키워드
+    for keyword, tag in PRODUCT_KEYWORD_TO_TAG.items():
+        if keyword in product_name and tag in known:
+            return tag
+
+    # 3) LLM 분류 기본 매핑
+    tag = llm_category if llm_category in known else LLM_CATEGORY_TO_TAG.get(llm_category, '기타')
+    return tag if tag in known else '기타'
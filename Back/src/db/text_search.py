@@ -0,0 +1,109 @@
+# text_search.py (식재료 이름 전문 검색: 한글 n-gram / 초성 색인과 FTS5 검색식 구성)
+
+import os
+import re
+import unicodedata
+from typing import Optional, Tuple
+
+# 한글 음절(가~힣) → 초성 (유니코드 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSEONG_SET = set(CHOSEONG)
+
+# 검색 대상 문자: 글자/숫자만 남김 (공백, 괄호, 가운뎃점 등은 무시)
+_NON_WORD = re.compile(r"[^\w]|_")
+
+# NFKC 는 호환용 자모(ㄷ, U+3137)를 첫가끝 초성(U+1103)으로 바꾸므로 다시 호환용 자모로 되돌림
+_JAMO_TO_CHOSEONG = {0x1100 + index: char for index, char in enumerate(CHOSEONG)}
+
+
+# 검색용 정규화 (전각/반각 통일, 소문자, 글자/숫자 이외 제거): "돼지고기 (목살)" → "돼지고기목살"
+def search_key(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return _NON_WORD.sub("", unicodedata.normalize("NFKC", text).lower()).translate(_JAMO_TO_CHOSEONG)
+
+# 초성 문자열: "두부" → "ㄷㅂ" (한글 음절이 아닌 글자는 그대로)
+def to_choseong(text: Optional[str]) -> str:
+    result = []
+    for char in search_key(text):
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+# ---------- 색인 값 계산 (SQL 식) ----------
+# 트리거가 식재료를 쓰는 트랜잭션 안에서 바로 색인하도록 색인 값을 SQLite 기본 함수만으로 계산
+# (앱 전용 SQL 함수가 없으므로 앱 밖의 커넥션으로 써도 색인이 맞음)
+# - 트리거 안에서는 재귀 CTE 를 쓸 수 없으므로 글자 위치를 SEARCH_INDEX_MAX_CHARS 개까지 펼침
+#   (더 긴 이름은 그 뒤의 글자만 n-gram 토큰이 없어 검색되지 않음)
+# - SQLite lower() 는 ASCII 만, 기호는 SQL_NON_WORD 만 제거 (검색어 쪽 search_key 는 NFKC 후 모든 기호 제거,
+#   그 밖의 기호는 unicode61 토크나이저가 토큰 경계로 처리)
+SEARCH_INDEX_MAX_CHARS = int(os.getenv("FRIDGE_SEARCH_INDEX_MAX_CHARS", "40"))
+SQL_NON_WORD = " \t\u3000()[]·.,-_/+&*"   # replace() 를 겹쳐 쓰므로 SQLite 파서 깊이 안에서 식재료 이름에 흔한 것만
+
+
+def _sql_literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+# search_key 의 SQL 식: lower + 자주 쓰는 공백/기호 제거
+def search_key_sql(expression: str) -> str:
+    for char in SQL_NON_WORD:
+        expression = f"replace({expression}, {_sql_literal(char)}, '')"
+    return f"lower({expression})"
+
+# to_choseong 의 SQL 식 (expression 은 정규화한 이름, 한글 음절 → 초성)
+def choseong_sql(expression: str) -> str:
+    parts = []
+    for position in range(1, SEARCH_INDEX_MAX_CHARS + 1):
+        char = f"substr({expression}, {position}, 1)"
+        parts.append(f"CASE WHEN length({expression}) < {position} THEN '' "
+                     f"WHEN unicode({char}) BETWEEN {HANGUL_BASE} AND {HANGUL_LAST} "
+                     f"THEN substr({_sql_literal(CHOSEONG)}, (unicode({char}) - {HANGUL_BASE}) / 588 + 1, 1) "
+                     f"ELSE {char} END")
+    return " || ".join(parts)
+
+# 색인 토큰의 SQL 식: 위치마다 한 글자 + 두 글자 (공백으로 구분, FTS5 unicode61 토크나이저가 그대로 토큰으로 사용)
+# "두부조림" → "두 두부 부 부조 조 조림 림 림" - 어느 위치의 부분 문자열이든 두 글자씩 끊어 AND 로 찾을 수 있음
+def ngram_tokens_sql(expression: str) -> str:
+    tokens = " || ".join(
+        f"CASE WHEN length({expression}) < {position} THEN '' "
+        f"ELSE substr({expression}, {position}, 1) || ' ' || substr({expression}, {position}, 2) || ' ' END"
+        for position in range(1, SEARCH_INDEX_MAX_CHARS + 1)
+    )
+    return f"rtrim({tokens})"
+
+# Ingredients_FTS 에 넣을 행을 만드는 SELECT (rowid, name_key, initials, grams, initial_grams)
+# - id_expression / name_expression: 트리거에서는 new.id / new.name, 기존 행 색인에서는 source 의 컬럼
+# - json_each(json_array(값)): 정규화한 이름 / 초성 문자열을 한 번만 계산해 컬럼으로 넘김
+#   (하위 쿼리로 쓰면 SQLite 가 펼쳐서 위치마다 식 전체를 다시 계산함)
+def search_index_select_sql(id_expression: str, name_expression: str, source: str = "") -> str:
+    return f"""
+        SELECT {id_expression}, K.value, C.value, {ngram_tokens_sql("K.value")}, {ngram_tokens_sql("C.value")}
+        FROM {source + ", " if source else ""}json_each(json_array({search_key_sql(name_expression)})) K,
+             json_each(json_array({choseong_sql("K.value")})) C
+    """
+
+
+# 초성만으로 된 검색어인지 ("ㄷㅂ" → True, "두ㅂ" → False)
+def is_choseong_query(key: str) -> bool:
+    return bool(key) and all(char in CHOSEONG_SET for char in key)
+
+def _quote(token: str) -> str:
+    return '"' + token.replace('"', '""') + '"'
+
+# 검색어 → (검색 컬럼, FTS5 MATCH 식, 부분 문자열 확인용 정규화 검색어), 검색할 글자가 없으면 None
+# - 초성 검색어("ㄷㅂ")는 초성 색인(initial_grams), 그 외는 이름 색인(grams)에서 찾음
+# - 두 글자씩 끊은 토큰을 모두 포함하는 행만 후보가 되고, 후보는 정규화한 이름에 검색어가 그대로 있는지 다시 확인
+def build_match_query(term: Optional[str]) -> Optional[Tuple[str, str, str]]:
+    key = search_key(term)
+    if not key:
+        return None
+
+    column = "initial_grams" if is_choseong_query(key) else "grams"
+    tokens = [key] if len(key) == 1 else list(dict.fromkeys(key[i:i + 2] for i in range(len(key) - 1)))
+    return column, f"{column} : ({' AND '.join(_quote(token) for token in tokens)})", key
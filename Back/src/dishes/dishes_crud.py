@@ -1,6 +1,7 @@
 import sqlite3
 from typing import Any, Dict, Optional
 from datetime import datetime
+from ..db.async_database import run_db
 
 # 조리된 음식 등록 로직
 def register_cooked_dish_to_db(
@@ -115,3 +116,20 @@ def delete_cooked_dish_db(conn: sqlite3.Connection, dish_id: int) -> Dict[str, A
         conn.rollback()
         return {"success": False, "message": f"DB 오류: {e}"}
 
+
+# ---------- 비동기 API (DB 전용 스레드에서 실행) ----------
+
+async def register_cooked_dish_to_db_async(**kwargs: Any) -> Dict[str, Any]:
+    return await run_db(register_cooked_dish_to_db, **kwargs)
+
+async def get_all_cooked_dishes_async() -> list[sqlite3.Row]:
+    return await run_db(get_all_cooked_dishes)
+
+async def get_cooked_dish_by_id_async(dish_id: int) -> Optional[sqlite3.Row]:
+    return await run_db(get_cooked_dish_by_id, dish_id)
+
+async def update_cooked_dish_db_async(dish_id: int, update_data: Dict[str, Any]) -> Dict[str, Any]:
+    return await run_db(update_cooked_dish_db, dish_id, update_data)
+
+async def delete_cooked_dish_db_async(dish_id: int) -> Dict[str, Any]:
+    return await run_db(delete_cooked_dish_db, dish_id)
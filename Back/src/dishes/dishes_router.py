@@ -1,12 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
-import sqlite3
-from ..db.database import get_db_connection
+from fastapi import APIRouter, HTTPException
 from datetime import datetime
 from typing import List
 
 from .dishes_schemas import DishRegister, CookedDish, DishUpdate
-from .dishes_crud import (register_cooked_dish_to_db, get_all_cooked_dishes, 
-                          get_cooked_dish_by_id, update_cooked_dish_db, delete_cooked_dish_db)
+from .dishes_crud import (register_cooked_dish_to_db_async, get_all_cooked_dishes_async, 
+                          get_cooked_dish_by_id_async, update_cooked_dish_db_async, delete_cooked_dish_db_async)
 from ..ingredients.expiry_calculator import calculate_dish_expiry_date
 
 # API 객체 생성
@@ -14,7 +12,7 @@ router = APIRouter(prefix="", tags=["Cooked Dishes"])
 
 # POST /dishes/register (조리된 음식 등록)
 @router.post("/register", response_model=CookedDish, summary="조리 음식 등록 및 유통기한 자동 지정")
-def register_dish(item: DishRegister, conn: sqlite3.Connection = Depends(get_db_connection)):
+async def register_dish(item: DishRegister):
 
     # 1. 유통기한 계산 로직
     calculated_date = calculate_dish_expiry_date(
@@ -23,8 +21,7 @@ def register_dish(item: DishRegister, conn: sqlite3.Connection = Depends(get_db_
     )
     
     # 2. DB에 최종 저장
-    result = register_cooked_dish_to_db(
-        conn=conn,
+    result = await register_cooked_dish_to_db_async(
         name=item.name,
         dish_type=item.type,
         expiry_date=calculated_date,
@@ -48,24 +45,23 @@ def register_dish(item: DishRegister, conn: sqlite3.Connection = Depends(get_db_
 
 # GET /dishes/list (조리된 음식 목록 조회)
 @router.get("/list", response_model=List[CookedDish], summary="조리된 음식 목록 조회")
-def list_dishes(conn: sqlite3.Connection = Depends(get_db_connection)):
+async def list_dishes():
 
-    dishes = get_all_cooked_dishes(conn)
+    dishes = await get_all_cooked_dishes_async()
 
     return [CookedDish(**dict(row)) for row in dishes]
 
 # PUT /dishes/{dish_id} (조리된 음식 수정)
 @router.put("/{dish_id}", response_model=CookedDish, summary="조리 음식 정보 수정")
-def update_dish(
+async def update_dish(
     dish_id: int, 
-    item: DishUpdate,
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    item: DishUpdate
 ):
     update_data = item.model_dump(exclude_unset=True) 
 
     # 1. manual_days가 수정되었다면 expiry_date를 다시 계산
     if 'manual_days' in update_data:
-        existing_dish = get_cooked_dish_by_id(conn, dish_id)
+        existing_dish = await get_cooked_dish_by_id_async(dish_id)
         if not existing_dish:
             raise HTTPException(status_code=404, detail=f"ID {dish_id}의 음식을 찾을 수 없습니다.")
 
@@ -80,14 +76,14 @@ def update_dish(
         del update_data['manual_days'] 
 
     # 2. DB 업데이트
-    result = update_cooked_dish_db(conn, dish_id, update_data)
+    result = await update_cooked_dish_db_async(dish_id, update_data)
     
     if not result["success"]:
         status_code = 404 if "찾을 수 없습니다" in result["message"] else 400
         raise HTTPException(status_code=status_code, detail=result["message"])
 
     # 3. 수정된 항목 재조회 및 반환
-    updated_dish_row = get_cooked_dish_by_id(conn, dish_id)
+    updated_dish_row = await get_cooked_dish_by_id_async(dish_id)
     if not updated_dish_row:
          raise HTTPException(status_code=500, detail="수정 후 데이터 조회 실패")
 
@@ -96,9 +92,9 @@ def update_dish(
 
 # DELETE /dishes/{dish_id} (조리된 음식 삭제)
 @router.delete("/{dish_id}", summary="조리 음식 삭제")
-def delete_dish(dish_id: int, conn: sqlite3.Connection = Depends(get_db_connection)):
+async def delete_dish(dish_id: int):
 
-    result = delete_cooked_dish_db(conn, dish_id)
+    result = await delete_cooked_dish_db_async(dish_id)
 
     if not result["success"]:
         status_code = 404 if "찾을 수 없습니다" in result["message"] else 500
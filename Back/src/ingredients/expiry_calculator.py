@@ -1,45 +1,13 @@
 # expiry_calculator.py (유통기한 계산
 
 from datetime import datetime, timedelta, date
-from typing import Optional, Any
-from ..db.database import get_db_connection
+from typing import Dict, List, Optional, Tuple
+from ..db.reference_cache import reference_cache
 from .ingredients_crud import get_id_by_name
 
 def calculate_expiry_date(category_tag: str, storage_location: str, manual_days: Optional[int] = None) -> str:
 
-    # 유통기한 수동 지정
-    if manual_days is not None and manual_days >= 0:
-        default_days = manual_days
-    else:
-        # 유통기한 자동 설정(식재료 태그, 보관 위치 기반)
-        conn = get_db_connection()
-        try:
-            category_id = get_id_by_name(conn, 'Categories', category_tag)
-            location_id = get_id_by_name(conn, 'Storage_Locations', storage_location)
-
-            cursor = conn.cursor()
-
-            # 표준 일수 조회
-            cursor.execute("""
-                    SELECT default_days FROM Expiration_Mapping
-                    WHERE category_id = ? AND storage_location_id = ?
-            """, (category_id, location_id))
-
-            result: Any = cursor.fetchone()
-
-            if result:
-                default_days = result['default_days']
-            else:
-                #매핑 데이터가 없는 경우
-                default_days = 3
-                print(f"경고: 매칭 데이터가 없습니다. 3일 기본값 적용: {category_tag}, {storage_location}")
-
-        except ValueError as e:
-            # ID를 찾지 못한 경우
-            default_days = 3
-            print(f"오류: {e}. 유통기한 기본값 3일 적용.")
-        finally:
-            conn.close()
+    default_days = _resolve_default_days(category_tag, storage_location, manual_days)
 
     # 유통기한 만료 날짜 계산
     today = datetime.now()
@@ -47,6 +15,52 @@ def calculate_expiry_date(category_tag: str, storage_location: str, manual_days:
 
     return expiry_date.strftime("%Y-%m-%d")
 
+# 기본 유통기한 일수 결정
+def _resolve_default_days(category_tag: str, storage_location: str, manual_days: Optional[int] = None) -> int:
+
+    # 유통기한 수동 지정
+    if manual_days is not None and manual_days >= 0:
+        return manual_days
+
+    # 유통기한 자동 설정(식재료 태그, 보관 위치 기반) - 기준 데이터 캐시에서 조회
+    try:
+        category_id = get_id_by_name('Categories', category_tag)
+        location_id = get_id_by_name('Storage_Locations', storage_location)
+
+        # 표준 일수 조회
+        result = reference_cache.get_default_days(category_id, location_id)
+
+        if result is not None:
+            return result
+
+        #매핑 데이터가 없는 경우
+        print(f"경고: 매칭 데이터가 없습니다. 3일 기본값 적용: {category_tag}, {storage_location}")
+        return 3
+
+    except ValueError as e:
+        # ID를 찾지 못한 경우
+        print(f"오류: {e}. 유통기한 기본값 3일 적용.")
+        return 3
+
+# 여러 식재료의 유통기한을 한 번에 계산
+# items: (category_tag, storage_location, manual_days) - 같은 조합/일수는 한 번만 계산
+def calculate_expiry_dates(items: List[Tuple[str, str, Optional[int]]]) -> List[str]:
+    today = datetime.now()
+    days_by_key: Dict[Tuple[str, str, Optional[int]], int] = {}
+    date_by_days: Dict[int, str] = {}
+
+    results = []
+    for key in items:
+        if key not in days_by_key:
+            days_by_key[key] = _resolve_default_days(*key)
+
+        days = days_by_key[key]
+        if days not in date_by_days:
+            date_by_days[days] = (today + timedelta(days=days)).strftime("%Y-%m-%d")
+
+        results.append(date_by_days[days])
+    return results
+
 # 조리 음식 종류에 따라 유통기한을 자동 계산
 def calculate_dish_expiry_date(dish_type: str, manual_days: Optional[int] = None) -> str:
     if manual_days is not None and manual_days > 0:
@@ -65,4 +79,3 @@ def calculate_dish_expiry_date(dish_type: str, manual_days: Optional[int] = None
     # 오늘 날짜 + 기본 일수 계산
     expiry_date = date.today() + timedelta(days=default_days)
     return expiry_date.strftime("%Y-%m-%d")
-        
\ No newline at end of file
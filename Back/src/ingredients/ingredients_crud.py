@@ -2,21 +2,21 @@
 
 from datetime import datetime
 import sqlite3
-from typing import Any, Dict, Optional
-from ..db.database import get_db_connection
+from typing import Any, Dict, List, Optional, Tuple
+from ..db.async_database import run_db
+from ..db.reference_cache import reference_cache
+from ..recipes.recipe_cache import recipe_cache
+from ..db.pagination import Page, build_page, decode_cursor, parse_fields, select_sql
+from ..db.text_search import build_match_query
+from .labeling import labeling_column_sql
 
-# TEXT로 ID 조회
-def get_id_by_name(conn: sqlite3.Connection, table_name: str, name: str) -> int:
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT id FROM {table_name} WHERE name = ?", (name, ))
-    result = cursor.fetchone()
-    if result:
-        return result['id']
-
-    raise ValueError(f"ID를 찾을 수 없습니다: {table_name} - {name}")
+# TEXT로 ID 조회 (기준 데이터 캐시 사용, DB 접근 없음)
+def get_id_by_name(table_name: str, name: str) -> int:
+    return reference_cache.get_id(table_name, name)
 
 # DB 저장 로직
 def register_ingredient_to_db(
+        conn: sqlite3.Connection,
         name: str,
         category_id: int,
         storage_location_id: int,
@@ -26,7 +26,6 @@ def register_ingredient_to_db(
     ) -> Dict[str, Any]:
 
     # 유통기한, 식재료 정보 Ingredients 테이블에 저장
-    conn = get_db_connection()
     cursor = conn.cursor()
     registration_date = datetime.now().strftime("%Y-%m-%d")
 
@@ -38,6 +37,7 @@ def register_ingredient_to_db(
         """, (name, category_id, storage_location_id, quantity, unit, expiry_date, registration_date, 'active', 0, None, None))
 
         conn.commit()
+        recipe_cache.invalidate_pantry()
 
         return {
             "message": "식재료 등록 완료",
@@ -47,8 +47,48 @@ def register_ingredient_to_db(
     except Exception as e:
         conn.rollback()
         return {"message" : f"등록 실패: {e}"}
-    finally:
-        conn.close()
+
+
+# 여러 행 INSERT 한 문장에 넣을 최대 행 수 (행당 7개 파라미터, 오래된 SQLite 의 파라미터 한도 999 안쪽)
+BATCH_INSERT_ROWS = 100
+
+# 일괄 저장 로직 (하나의 트랜잭션, 여러 행 INSERT ... RETURNING id 로 부여된 ID를 그대로 받음)
+# - RETURNING 순서는 보장되지 않지만 AUTOINCREMENT id 는 VALUES 순서대로 커지므로 정렬하면 rows 순서와 같음
+# rows: (name, category_id, storage_location_id, quantity, unit, expiry_date)
+def register_ingredients_batch_to_db(
+        conn: sqlite3.Connection,
+        rows: List[Tuple[str, int, int, float, str, str]]
+    ) -> Dict[str, Any]:
+
+    if not rows:
+        return {"success": True, "ids": [], "registration_date": datetime.now().strftime("%Y-%m-%d")}
+
+    cursor = conn.cursor()
+    registration_date = datetime.now().strftime("%Y-%m-%d")
+
+    try:
+        ids: List[int] = []
+        for start in range(0, len(rows), BATCH_INSERT_ROWS):
+            chunk = rows[start:start + BATCH_INSERT_ROWS]
+            values = ", ".join("(?, ?, ?, ?, ?, ?, ?, 'active', 0, NULL, NULL)" for _ in chunk)
+            cursor.execute(f"""
+                INSERT INTO Ingredients
+                (name, category_id, storage_location_id, quantity, unit, expiry_date, registration_date, status, is_cooked, memo, source_image_id)
+                VALUES {values}
+                RETURNING id
+            """, [value for row in chunk for value in (*row, registration_date)])
+            ids += sorted(row[0] for row in cursor.fetchall())
+        conn.commit()
+        recipe_cache.invalidate_pantry()
+
+        return {
+            "success": True,
+            "ids": ids,
+            "registration_date": registration_date
+        }
+    except sqlite3.Error as e:
+        conn.rollback()
+        return {"success": False, "message": f"일괄 등록 실패: {e}"}
 
 
 # 식재료 상태 업데이트
@@ -64,13 +104,18 @@ def update_ingredient_status(conn: sqlite3.Connection, ingredient_id: int, new_s
         cursor.execute(
             """
             UPDATE Ingredients SET status = ? WHERE id = ? 
+            RETURNING name
             """,
             (new_status, ingredient_id)
         )
+        changed = [row[0] for row in cursor.fetchall()]
         conn.commit()
 
-        if cursor.rowcount == 0:
+        if not changed:
             return {"success": False, "message": f"ID {ingredient_id}를 가진 식재료를 찾을 수 없습니다."}
+
+        # 이 재료로 만들어 둔 레시피 추천은 더 이상 맞지 않음
+        recipe_cache.invalidate_ingredients(changed)
         
         return {"success": True, "message": f"식재료 ID {ingredient_id}의 상태가 {new_status.upper()}로 변경되었습니다."}
 
@@ -78,47 +123,93 @@ def update_ingredient_status(conn: sqlite3.Connection, ingredient_id: int, new_s
         return {"success": False, "message": f"상태 업데이트 DB 오류: {e}"}
     
 
-# 히스토리 목록 조회(USED or DISCARDED 상태의 식재료만 조회)
-def get_history_ingredients(conn: sqlite3.Connection) -> list[sqlite3.Row]:
-    cursor = conn.cursor()
-    try:
-        cursor.execute(
-            """
-            SELECT * FROM Ingredients WHERE status IN ('used', 'discarded')
-            ORDER BY id DESC            
-            """
+# Ingredients 컬럼 (SELECT * 순서와 동일)
+INGREDIENT_COLUMNS = (
+    "id", "name", "quantity", "unit", "category_id", "storage_location_id",
+    "expiry_date", "registration_date", "status", "is_cooked", "memo", "source_image_id",
+)
+
+# 목록 조회 반환 필드: 필드 이름 → SQL 식 (fields= 로 일부만 선택 가능)
+LIST_FIELDS: Dict[str, str] = {
+    **{column: f"I.{column}" for column in INGREDIENT_COLUMNS},
+    "storage_name": "S.name",
+    "category_name": "C.name",
+    **labeling_column_sql("I.expiry_date"),
+}
+
+# 히스토리 조회 반환 필드
+HISTORY_FIELDS: Dict[str, str] = {
+    **{column: f"H.{column}" for column in INGREDIENT_COLUMNS},
+    **labeling_column_sql("H.expiry_date"),
+}
+HISTORY_STATUSES = ("used", "discarded")
+
+# 목록 정렬 기준 (같은 값이면 id 로 순서를 고정해 커서가 항상 한 위치를 가리키도록 함)
+SORT_FIELDS = ("expiry_date", "name", "quantity", "registration_date")
+
+# 이름 검색 시에만 쓸 수 있는 정렬 / 반환 필드: 관련도 단계 (0 일치 < 1 접두어 < 2 부분 일치, 같은 단계는 id 순)
+# (bm25 점수는 다른 행이 추가될 때마다 바뀌므로 커서 키로 쓰지 않음)
+RELEVANCE_FIELD = "relevance"
+
+
+# 히스토리 목록 페이지 조회(USED or DISCARDED 상태의 식재료, 최근 id 순)
+# 커서: 마지막 행의 id / 상태별로 (status, id) 인덱스를 역순으로 limit + 1 개씩만 읽고 합쳐서
+# IN 조건 + ORDER BY id 처럼 히스토리 전체를 모아 정렬하지 않음 (페이지마다 일정한 비용)
+def get_history_page(
+        conn: sqlite3.Connection,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page:
+
+    names = parse_fields(fields, HISTORY_FIELDS)
+    before_id = decode_cursor(cursor, "id:desc", 1)[0] if cursor else None
+    fetch = limit + 1 if limit else -1   # LIMIT -1: 전체
+
+    branch = f"""
+        SELECT * FROM (
+            SELECT * FROM Ingredients
+            WHERE status = ?{" AND id < ?" if before_id is not None else ""}
+            ORDER BY id DESC LIMIT ?
         )
-        return cursor.fetchall()
+    """
+    params: List[Any] = []
+    for status in HISTORY_STATUSES:
+        params += [status, before_id, fetch] if before_id is not None else [status, fetch]
+
+    query = f"""
+        SELECT {select_sql(names, HISTORY_FIELDS, ("id",))}
+        FROM ({" UNION ALL ".join(branch for _ in HISTORY_STATUSES)}) H
+        ORDER BY H.id DESC LIMIT ?
+    """
+    try:
+        rows = conn.execute(query, params + [fetch]).fetchall()
+        page = build_page(rows, limit, names, "id:desc", ("id",))
+        if include_total:
+            placeholders = ", ".join("?" for _ in HISTORY_STATUSES)
+            page.total = conn.execute(
+                f"SELECT COUNT(*) FROM Ingredients WHERE status IN ({placeholders})", HISTORY_STATUSES
+            ).fetchone()[0]
+        return page
     except sqlite3.Error as e:
         print(f"히스토리 조회 DB 오류: {e}")
-        return []
+        return Page([])
 
-# 보관 위치 이름 또는 카레고리 이름으로 식재료 목록을 필터링하여 조회
-def get_filtered_ingredients(
-        conn: sqlite3.Connection, 
-        storage_name: Optional[str] = None, 
-        category_name: Optional[str] = None,
-        search_term: Optional[str] = None, 
-        sort_by: str = 'expiry_date',
-        sort_order: str = 'ASC'
-    ) -> list[sqlite3.Row]:
+# 히스토리 목록 조회 (전체)
+def get_history_ingredients(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    return get_history_page(conn).items
 
-    cursor = conn.cursor()
 
-    # 쿼리 기본 구조 정의
-    base_query = """
-        SELECT 
-            I.*, 
-            S.name AS storage_name, 
-            C.name AS category_name
-        FROM Ingredients I
-        JOIN Storage_Locations S ON I.storage_location_id = S.id
-        JOIN Categories C ON I.category_id = C.id
-        WHERE I.status = 'active'
-    """
+# 목록 조회 필터 조건 (보관 위치 / 카테고리 / 이름 검색)
+def _ingredient_filters(
+        storage_name: Optional[str],
+        category_name: Optional[str],
+        search_term: Optional[str]
+    ) -> Tuple[List[str], List[Any]]:
 
-    conditions = []
-    params = []
+    conditions = ["I.status = 'active'"]
+    params: List[Any] = []
 
     # 1. 보관 위치, 카테고리 필터링 
     if storage_name:
@@ -128,33 +219,128 @@ def get_filtered_ingredients(
         conditions.append("C.name = ?")
         params.append(category_name)
 
-    # 2. 검색 조건 
-    if search_term:
+    # 2. 검색 조건 (글자/숫자가 없는 검색어만 LIKE, 나머지는 _search_join 의 전문 검색)
+    if search_term and build_match_query(search_term) is None:
         conditions.append("I.name LIKE ?")
         params.append(f"%{search_term}%")
 
-    # 3. 조건들을 쿼리에 통합
-    if conditions:
-        base_query += " AND " + " AND ".join(conditions)
+    return conditions, params
+
+# 이름 검색 조인 (Ingredients_FTS): n-gram 토큰으로 후보를 찾고 정규화한 이름(초성 검색이면 초성 문자열)에
+# 검색어가 그대로 들어 있는 행만 남김 - LIKE '%검색어%' 처럼 전체 식재료를 훑지 않음
+# CROSS JOIN: 검색 결과를 바깥 루프로 고정 (그냥 JOIN 이면 (status, expiry_date) 인덱스로 Ingredients 를 먼저 돌며
+# 행마다 MATCH 를 다시 실행하는 계획이 선택됨)
+def _search_join(search_term: Optional[str]) -> Tuple[str, List[Any]]:
+    match = build_match_query(search_term)
+    if match is None:
+        return "Ingredients I", []
+
+    column, expression, key = match
+    target = "initials" if column == "initial_grams" else "name_key"
+    join = f"""(
+            SELECT rowid AS id,
+                   CASE WHEN {target} = ? THEN 0 WHEN instr({target}, ?) = 1 THEN 1 ELSE 2 END AS rank
+            FROM Ingredients_FTS
+            WHERE Ingredients_FTS MATCH ? AND instr({target}, ?) > 0
+        ) F
+        CROSS JOIN Ingredients I ON I.id = F.id"""
+    return join, [key, key, expression, key]
 
-    # 4. 정렬 기준 설정 및 검증
-    valid_sort_fields = {
-        'expiry_date': 'I.expiry_date',
-        'name': 'I.name',
-        'quantity': 'I.quantity',
-        'registration_date': 'I.registration_date'
-    }
+# 보관 위치 이름 또는 카레고리 이름으로 식재료 목록을 필터링하여 페이지 단위로 조회
+# 커서: 마지막 행의 (정렬 컬럼, id) - 그보다 뒤의 행만 조회하므로 조회 사이에 식재료가 추가되어도 중복/누락 없음
+# 이름 검색: 부분 문자열 / 초성("ㄷㅂ" → 두부) 검색, sort_by='relevance' 로 관련도 순 정렬
+def get_ingredients_page(
+        conn: sqlite3.Connection, 
+        storage_name: Optional[str] = None, 
+        category_name: Optional[str] = None,
+        search_term: Optional[str] = None, 
+        sort_by: str = 'expiry_date',
+        sort_order: str = 'ASC',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page:
 
-    field_to_sort = valid_sort_fields.get(sort_by.lower(), 'I.expiry_date')
+    # 1. 필터 조건
+    conditions, filter_params = _ingredient_filters(storage_name, category_name, search_term)
+    search_source, params = _search_join(search_term)
+    searching = bool(params)
+    params += filter_params   # 조인 파라미터가 WHERE 파라미터보다 앞
+    from_clause = f"""
+        FROM {search_source}
+        JOIN Storage_Locations S ON I.storage_location_id = S.id
+        JOIN Categories C ON I.category_id = C.id
+    """
+    available = {**LIST_FIELDS, RELEVANCE_FIELD: "F.rank"} if searching else LIST_FIELDS
+
+    # 2. 정렬 기준 설정 및 검증
+    sort_fields = (*SORT_FIELDS, RELEVANCE_FIELD) if searching else SORT_FIELDS
+    sort_field = sort_by.lower() if sort_by.lower() in sort_fields else 'expiry_date'
     order = 'ASC' if sort_order.upper() == 'ASC' else 'DESC'
+    order_key = f"{sort_field}:{order.lower()}"
 
-    # 5. 정렬 구문을 쿼리에 통합
-    base_query += f" ORDER BY {field_to_sort} {order}"
+    # 3. 반환 필드 (기본: 관련도 제외 전체) / 커서 조건
+    names = parse_fields(fields, available) if fields else list(LIST_FIELDS)
+    page_conditions, page_params = list(conditions), list(params)
+    if cursor:
+        page_conditions.append(f"({available[sort_field]}, I.id) {'>' if order == 'ASC' else '<'} (?, ?)")
+        page_params += decode_cursor(cursor, order_key, 2)
+
+    # 4. 쿼리 구성 (정렬 컬럼 + id 순, limit + 1 개까지 조회해 다음 페이지 여부 확인)
+    query = f"""
+        SELECT {select_sql(names, available, (sort_field, "id"))}
+        {from_clause}
+        WHERE {" AND ".join(page_conditions)}
+        ORDER BY {available[sort_field]} {order}, I.id {order}
+        LIMIT ?
+    """
+    page_params.append(limit + 1 if limit else -1)
 
     try:
-        cursor.execute(base_query, params)
-        return cursor.fetchall()
+        rows = conn.execute(query, page_params).fetchall()
+        page = build_page(rows, limit, names, order_key, (sort_field, "id"))
+        if include_total:
+            page.total = conn.execute(
+                f"SELECT COUNT(*) {from_clause} WHERE {' AND '.join(conditions)}", params
+            ).fetchone()[0]
+        return page
     except sqlite3.Error as e:
         print(f"통합 조회 DB 오류: {e}")
-        return []
-    
\ No newline at end of file
+        return Page([])
+
+# 식재료 목록 필터링 조회 (전체)
+def get_filtered_ingredients(
+        conn: sqlite3.Connection, 
+        storage_name: Optional[str] = None, 
+        category_name: Optional[str] = None,
+        search_term: Optional[str] = None, 
+        sort_by: str = 'expiry_date',
+        sort_order: str = 'ASC'
+    ) -> List[Dict[str, Any]]:
+
+    return get_ingredients_page(conn, storage_name, category_name, search_term, sort_by, sort_order).items
+
+
+# ---------- 비동기 API (DB 전용 스레드에서 실행) ----------
+
+async def register_ingredient_to_db_async(**kwargs: Any) -> Dict[str, Any]:
+    return await run_db(register_ingredient_to_db, **kwargs)
+
+async def register_ingredients_batch_to_db_async(rows: List[Tuple[str, int, int, float, str, str]]) -> Dict[str, Any]:
+    return await run_db(register_ingredients_batch_to_db, rows)
+
+async def update_ingredient_status_async(ingredient_id: int, new_status: str) -> Dict[str, Any]:
+    return await run_db(update_ingredient_status, ingredient_id, new_status)
+
+async def get_history_ingredients_async() -> List[Dict[str, Any]]:
+    return await run_db(get_history_ingredients)
+
+async def get_filtered_ingredients_async(**kwargs: Any) -> List[Dict[str, Any]]:
+    return await run_db(get_filtered_ingredients, **kwargs)
+
+async def get_history_page_async(**kwargs: Any) -> Page:
+    return await run_db(get_history_page, **kwargs)
+
+async def get_ingredients_page_async(**kwargs: Any) -> Page:
+    return await run_db(get_ingredients_page, **kwargs)
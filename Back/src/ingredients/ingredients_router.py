@@ -1,31 +1,31 @@
 # ingredients_router.py (API 엔드포인트 분리)
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-import sqlite3
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import Any, List, Optional
 from datetime import datetime
-from ..db.database import get_db_connection
 
-from .ingredients_schemas import IngredientRegister, Ingredient
+from .ingredients_schemas import IngredientRegister, Ingredient, IngredientBatchItemResult, IngredientBatchResult
 from .ingredients_crud import (
-    register_ingredient_to_db, get_id_by_name, update_ingredient_status,
-    get_history_ingredients, get_filtered_ingredients )
+    register_ingredient_to_db_async, register_ingredients_batch_to_db_async, get_id_by_name,
+    update_ingredient_status_async, get_history_page_async, get_ingredients_page_async )
+from ..db.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from ..db.reference_cache import reference_cache
 
-from .expiry_calculator import calculate_expiry_date
-from .labeling import calculate_remaining_days, get_visual_labeling_data
-from .notifier import get_alert_ingredients
+from .expiry_calculator import calculate_expiry_date, calculate_expiry_dates
+from .notifier import get_alert_ingredients_async
 
 # API 객체 생성
 router = APIRouter()
 
 # POST /register (식재료 등록)
 @router.post("/register", response_model=Ingredient, tags=["Ingredients"])
-def register_ingredient(item: IngredientRegister, conn: sqlite3.Connection = Depends(get_db_connection)):
+async def register_ingredient(item: IngredientRegister):
 
-    # 1. 문자열 태그를 ID로 변환
+    # 1. 문자열 태그를 ID로 변환 (기준 데이터 캐시, 무효화된 경우에만 DB 전용 스레드에서 다시 적재)
+    await reference_cache.ensure_loaded_async()
     try:
-        category_id = get_id_by_name(conn, 'Categories', item.category_tag)
-        location_id = get_id_by_name(conn, 'Storage_Locations', item.storage_location)
+        category_id = get_id_by_name('Categories', item.category_tag)
+        location_id = get_id_by_name('Storage_Locations', item.storage_location)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"등록 실패: {e}")
 
@@ -37,7 +37,7 @@ def register_ingredient(item: IngredientRegister, conn: sqlite3.Connection = Dep
     )
 
     # 3. DB에 최종 저장
-    result = register_ingredient_to_db(
+    result = await register_ingredient_to_db_async(
         name=item.name,
         category_id=category_id,
         storage_location_id=location_id,
@@ -67,63 +67,153 @@ def register_ingredient(item: IngredientRegister, conn: sqlite3.Connection = Dep
     )
 
 
+# 일괄 등록 최대 개수 (영수증 1장 기준 넉넉하게)
+MAX_BATCH_SIZE = 200
+
+# POST /register/batch (OCR 결과 등 여러 식재료 일괄 등록)
+@router.post("/register/batch", response_model=IngredientBatchResult, tags=["Ingredients"])
+async def register_ingredients_batch(items: List[IngredientRegister]):
+
+    if not items:
+        raise HTTPException(status_code=400, detail="등록할 식재료 목록이 비어있습니다.")
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BATCH_SIZE}개까지 등록할 수 있습니다.")
+
+    results: List[Optional[IngredientBatchItemResult]] = [None] * len(items)
+
+    # 1. 문자열 태그를 ID로 변환 (한 번에 처리, 실패 항목은 개별 보고)
+    await reference_cache.ensure_loaded_async()
+    valid = []  # (요청 위치, 카테고리 ID, 보관 위치 ID)
+    for index, item in enumerate(items):
+        try:
+            category_id = get_id_by_name('Categories', item.category_tag)
+            location_id = get_id_by_name('Storage_Locations', item.storage_location)
+        except ValueError as e:
+            results[index] = IngredientBatchItemResult(index=index, success=False, error=f"등록 실패: {e}")
+            continue
+        valid.append((index, category_id, location_id))
+
+    if valid:
+        # 2. 유통기한 일괄 계산 (같은 태그/위치 조합은 한 번만 계산)
+        expiry_dates = calculate_expiry_dates([
+            (items[index].category_tag, items[index].storage_location, items[index].manual_days)
+            for index, _, _ in valid
+        ])
+
+        # 3. 하나의 트랜잭션으로 일괄 저장
+        rows = [
+            (items[index].name, category_id, location_id, items[index].quantity, items[index].unit, expiry_date)
+            for (index, category_id, location_id), expiry_date in zip(valid, expiry_dates)
+        ]
+        result = await register_ingredients_batch_to_db_async(rows)
+
+        if not result["success"]:
+            raise HTTPException(status_code=500, detail=result["message"])
+
+        # 4. 항목별 결과 구성
+        for (index, category_id, location_id), expiry_date, new_id in zip(valid, expiry_dates, result["ids"]):
+            item = items[index]
+            results[index] = IngredientBatchItemResult(
+                index=index,
+                success=True,
+                ingredient=Ingredient(
+                    id = new_id,
+                    name = item.name,
+                    quantity = item.quantity,
+                    unit = item.unit,
+                    category_id = category_id,
+                    storage_location_id = location_id,
+                    expiry_date = expiry_date,
+                    registration_date = result["registration_date"],
+                    status = 'active',
+                    is_cooked = False,
+                    memo = None,
+                    source_image_id = None
+                )
+            )
+
+    succeeded = len(valid)
+    return IngredientBatchResult(
+        total=len(items),
+        succeeded=succeeded,
+        failed=len(items) - succeeded,
+        results=results
+    )
+
+
+# 페이지 조회 결과 → 응답 본문 (목록) + 헤더 (X-Next-Cursor: 다음 페이지 커서, X-Total-Count: 요청 시 전체 개수)
+def page_response(response: Response, page: Page) -> List[Any]:
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    if page.total is not None:
+        response.headers["X-Total-Count"] = str(page.total)
+    return page.items
+
+# 페이지 크기: limit 을 생략하면 전체 목록(기존 동작), 커서만 주면 기본 페이지 크기
+def resolve_page_size(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    if limit is None and cursor:
+        return DEFAULT_PAGE_SIZE
+    return limit
+
+
 # GET/list (식재료 목록 조회 및 필터링/정렬/검색 기능 통합)
 @router.get("/list", response_model=List[Any], tags=["Ingredients"])
-def list_ingredients(
+async def list_ingredients(
+        response: Response,
         storage: Optional[str] = Query(None, description="보관 위치 이름으로 필터링"),
         category: Optional[str] = Query(None, description="식재료 카테고리 이름으로 필터링"),
-        search: Optional[str] = Query(None, description="식재료 이름으로 검색"),
-        sort_by: str = Query('expiry_date', description="정렬 기준: 'expiry_date', 'name', 'quantity'"),
+        search: Optional[str] = Query(None, description="식재료 이름으로 검색 (부분 문자열, 초성 예: 'ㄷㅂ')"),
+        sort_by: str = Query('expiry_date', description="정렬 기준: 'expiry_date', 'name', 'quantity', 'registration_date', 'relevance'(검색 시 관련도 순)"),
         sort_order: str = Query('asc', description="정렬 순서: 'asc' (오름차순) 또는 'desc' (내림차순)"),
-        conn: sqlite3.Connection = Depends(get_db_connection)
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (생략하면 전체 목록)"),
+        cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더 값)"),
+        fields: Optional[str] = Query(None, description="반환할 필드 (쉼표로 구분, 예: id,name,label_color)"),
+        include_total: bool = Query(False, description="true면 전체 개수를 X-Total-Count 헤더로 반환")
     ):
     """
     모든 활성화된 식재료 목록을 유통기한 임박 순으로 반환하며, 보관 위치와 카테고리로 필터링 가능합니다.
+    limit 을 주면 페이지 단위로 반환하고, 다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담습니다.
     """
     
-    # 1. CRUD 함수 호출 (필터링 조건 전달)
-    rows = get_filtered_ingredients(
-        conn, 
-        storage_name=storage, 
-        category_name=category,
-        search_term=search,
-        sort_by=sort_by,
-        sort_order=sort_order
-        )
-
-    ingredients_list = []
-
-    # 2. 시각적 라벨링 데이터 계산 로직 반복 적용
-    for row in rows:
-        ingredient = dict(row) 
-
-        remaining_days = calculate_remaining_days(ingredient['expiry_date'])
-        labeling_data = get_visual_labeling_data(remaining_days)
-
-        ingredient.update(labeling_data)
-        ingredients_list.append(ingredient)
+    # 1. CRUD 함수 호출 (필터링 조건 / 페이지 조건 전달)
+    # 시각적 라벨링 데이터(remaining_days, label_text, label_color)는 조회 쿼리에서 함께 계산됨
+    try:
+        page = await get_ingredients_page_async(
+            storage_name=storage, 
+            category_name=category,
+            search_term=search,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=resolve_page_size(limit, cursor),
+            cursor=cursor,
+            fields=fields,
+            include_total=include_total
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return ingredients_list
+    # 2. 응답 본문 + 페이지 헤더
+    return page_response(response, page)
 
 
 # GET/alerts (유통기한 임박 알림)
 @router.get("/alerts", response_model=List[Any], tags=["Notifications"])
-def get_expiry_alerts(
+async def get_expiry_alerts(
     alert_days: int = Query(7, description="오늘부터 며칠 이내의 유통기한 임박 식재료를 조회할지 (기본 7일)")
 ):
     # 유통기한 임박 알림 대상 식재료 목록을 반환
     if alert_days < 1:
         raise HTTPException(status_code=400, detail="alert_days는 1 이상의 값이어야 합니다.")
     
-    alert_list = get_alert_ingredients(alert_days)
+    alert_list = await get_alert_ingredients_async(alert_days)
 
     return alert_list
 
 # PUT /ingreditns/{id}/status (식재료 상태 변경: 사용 완료, 폐기, 복구)
 @router.put("/{ingredient_id}/status", tags=["Ingredients"])
-def update_status(ingredient_id: int, new_status: str, conn: sqlite3.Connection = Depends(get_db_connection)):
+async def update_status(ingredient_id: int, new_status: str):
 
-    result = update_ingredient_status(conn, ingredient_id, new_status)
+    result = await update_ingredient_status_async(ingredient_id, new_status)
 
     if result["success"]:
         return{"message": result["message"], "id": ingredient_id, "status": new_status.upper()}
@@ -131,23 +221,26 @@ def update_status(ingredient_id: int, new_status: str, conn: sqlite3.Connection
         status_code = 404 if "찾을 수 없습니다" in result["message"] else 400
         raise HTTPException(status_code=status_code, detail=result["message"])
     
-# GET /ingredients/history (사용 완료 및 폐기 목록 조회)
+# GET /ingredients/history (사용 완료 및 폐기 목록 조회, 최근 순)
 @router.get("/history", response_model=List[Any], tags=["Ingredients"])
-def list_history(conn: sqlite3.Connection = Depends(get_db_connection)):
+async def list_history(
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (생략하면 전체 목록)"),
+        cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더 값)"),
+        fields: Optional[str] = Query(None, description="반환할 필드 (쉼표로 구분, 예: id,name,status)"),
+        include_total: bool = Query(False, description="true면 전체 개수를 X-Total-Count 헤더로 반환")
+    ):
 
-    history_rows = get_history_ingredients(conn)
-    history_list = []
-    
-    # 2. 시각적 라벨링 데이터 계산 로직 반복 적용 (GET /list와 동일)
-    for row in history_rows:
-        ingredient = dict(row) 
-        
-        # history의 경우, status가 USED/DISCARDED이므로 remaining_days 계산은 선택적임.
-        # 그러나 기존 list와 데이터 구조 통일을 위해 계산 로직을 그대로 사용합니다.
-        remaining_days = calculate_remaining_days(ingredient['expiry_date'])
-        labeling_data = get_visual_labeling_data(remaining_days)
-
-        ingredient.update(labeling_data)
-        history_list.append(ingredient)
-
-    return history_list
+    # history의 경우, status가 USED/DISCARDED이므로 remaining_days 계산은 선택적임.
+    # 그러나 기존 list와 데이터 구조 통일을 위해 라벨링 컬럼을 쿼리에서 함께 계산합니다. (GET /list와 동일)
+    try:
+        page = await get_history_page_async(
+            limit=resolve_page_size(limit, cursor),
+            cursor=cursor,
+            fields=fields,
+            include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return page_response(response, page)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 # API 요청 모델
 class IngredientRegister(BaseModel):
@@ -44,4 +44,18 @@ class Ingredient(BaseModel):
 class ExpirationMapping(BaseModel):
     category_tag: str
     storage_location: str
-    default_days: int
\ No newline at end of file
+    default_days: int
+
+# 일괄 등록 결과 - 항목별 결과
+class IngredientBatchItemResult(BaseModel):
+    index: int                                # 요청 목록에서의 위치 (0부터)
+    success: bool
+    ingredient: Optional[Ingredient] = None   # 성공 시 등록된 식재료
+    error: Optional[str] = None               # 실패 사유
+
+# 일괄 등록 결과 - 전체 요약
+class IngredientBatchResult(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    results: List[IngredientBatchItemResult]
@@ -3,6 +3,10 @@
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
+# 라벨 색상 기준: 지남(red) / 3일 이내(orange) / 7일 이내(yellow) / 그 이후(green)
+ORANGE_DAYS = 3
+YELLOW_DAYS = 7
+
 # 유통기한 만료 날짜를 기준으로 오늘까지 남은 일수 계산
 def calculate_remaining_days(expiry_date_str: str) -> int:
     try:
@@ -21,10 +25,10 @@ def get_visual_labeling_data(remaining_days: int) -> Dict[str, Any]:
     if remaining_days < 0:
         label_text = f"{abs(remaining_days)}일 지남"
         label_color = 'red'
-    elif remaining_days <= 3:
+    elif remaining_days <= ORANGE_DAYS:
         label_text = f"{remaining_days}일 남음"
         label_color = 'orange'
-    elif remaining_days <= 7:
+    elif remaining_days <= YELLOW_DAYS:
         label_text = f"{remaining_days}일 남음"
         label_color = 'yellow'
     else:
@@ -37,3 +41,24 @@ def get_visual_labeling_data(remaining_days: int) -> Dict[str, Any]:
         "label_color": label_color
     }
 
+# 남은 일수 SQL 식 (calculate_remaining_days 와 같은 값: 오늘 날짜 기준, 날짜 형식이 잘못되면 0)
+def remaining_days_sql(column: str = "expiry_date") -> str:
+    return f"COALESCE(CAST(julianday({column}) - julianday('now', 'localtime', 'start of day') AS INTEGER), 0)"
+
+# 라벨링 컬럼별 SQL 식 (get_visual_labeling_data 와 같은 remaining_days / label_text / label_color)
+def labeling_column_sql(column: str = "expiry_date") -> Dict[str, str]:
+    days = remaining_days_sql(column)
+    return {
+        "remaining_days": days,
+        "label_text": f"CASE WHEN {days} < 0 THEN (-{days}) || '일 지남' ELSE {days} || '일 남음' END",
+        "label_color": f"""CASE
+            WHEN {days} < 0 THEN 'red'
+            WHEN {days} <= {ORANGE_DAYS} THEN 'orange'
+            WHEN {days} <= {YELLOW_DAYS} THEN 'yellow'
+            ELSE 'green'
+        END""",
+    }
+
+# 라벨링 컬럼 SQL - 조회 쿼리의 SELECT 목록에 붙여 행마다 파이썬에서 날짜를 파싱하지 않고 DB에서 한 번에 계산
+def labeling_columns_sql(column: str = "expiry_date") -> str:
+    return ",\n".join(f"{sql} AS {name}" for name, sql in labeling_column_sql(column).items())
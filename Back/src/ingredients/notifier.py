@@ -1,15 +1,13 @@
 # notifier.py (알림 조회)
 
+import sqlite3
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-from ..db.database import get_db_connection
-from .labeling import calculate_remaining_days, get_visual_labeling_data
+from ..db.async_database import run_db
+from .labeling import labeling_columns_sql
 
-# 유통기한이 임박한 식재료 목록 조회
-def get_alert_ingredients(alert_days: int) -> List[Dict[str, Any]]:
-
-    conn = get_db_connection()
-    cursor = conn.cursor()
+# 유통기한이 임박한 식재료 목록 조회 (조회 실패 시 빈 목록)
+def get_alert_ingredients(conn: sqlite3.Connection, alert_days: int) -> List[Dict[str, Any]]:
 
     # 알림 기준일 계산: 오늘 날짜 + alert_days
     alert_date = (datetime.now() + timedelta(days=alert_days)).strftime("%Y-%m-%d")
@@ -17,35 +15,23 @@ def get_alert_ingredients(alert_days: int) -> List[Dict[str, Any]]:
 
     try:
         #Ingredients 테이블에서 유통기한이 오늘 이후부터 alert_date 이내인 식재료 조회
-        cursor.execute("""
-            SELECT id, name, expiry_date, quantity, unit, category_id, storage_location_id
+        # 남은 일수 / 라벨링 정보는 쿼리에서 함께 계산
+        rows = conn.execute(f"""
+            SELECT id, name, expiry_date, quantity, unit, category_id, storage_location_id,
+                {labeling_columns_sql()}
             FROM Ingredients
             WHERE status = 'active'
             AND expiry_date BETWEEN ? AND ?
             ORDER BY expiry_date ASC
-        """, (today_date, alert_date))
-
-        rows = cursor.fetchall()
-        alert_list = []
-
-        for row in rows:
-            ingredient = dict(row)
-
-            # 남은 일수 및 라벨링 정보 계산
-            remaining_days = calculate_remaining_days(ingredient['expiry_date'])
-            labeling_data = get_visual_labeling_data(remaining_days)
-
-            # 기존 데이터에 라벨링 정보 병합
-            ingredient.update(labeling_data)
-
-            alert_list.append(ingredient)
+        """, (today_date, alert_date)).fetchall()
 
-        return alert_list
+        return [dict(row) for row in rows]
 
+    except sqlite3.Error as e:
+        print(f"알림 대상 조회 실패: {e}")
+        return []
 
 
-    except Exception as e:
-        conn.rollback()
-        return {"message" : f"등록 실패: {e}"}
-    finally:
-        conn.close()
\ No newline at end of file
+# 비동기 API: DB 전용 스레드에서 알림 대상 조회
+async def get_alert_ingredients_async(alert_days: int) -> List[Dict[str, Any]]:
+    return await run_db(get_alert_ingredients, alert_days)
@@ -0,0 +1,105 @@
+# garbage_filter.py (OCR 줄 1차 필터: 불용어 / 의미 없는 줄 / 낮은 신뢰도 제거)
+
+import bisect
+import json
+import os
+import re
+from typing import Any, Iterable, List, Optional, Tuple
+
+# 불용어/신뢰도 기준 설정 파일
+GARBAGE_FILTER_CONFIG = os.getenv(
+    "FRIDGE_GARBAGE_FILTER_CONFIG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "garbage_keywords.json")
+)
+
+# "의미 있는 문자" (이 문자가 하나도 없는 줄은 삭제: ".", "-", "*" 등)
+_MEANINGFUL_CHARS = "가-힣0-9a-zA-Z"
+
+
+# OCR 줄에서 텍스트와 평균 신뢰도 추출 (신뢰도가 없으면 None)
+def extract_text_and_confidence(item: Any) -> Tuple[str, Optional[float]]:
+    if not isinstance(item, dict):
+        return str(item).strip(), None
+
+    text = str(item.get('raw_text', '') or item.get('text', '') or '').strip()
+
+    # 신뢰도 추출 (List/Float 처리 호환)
+    confidence = None
+    if 'avg_confidence' in item and item['avg_confidence'] is not None:
+        confidence = float(item['avg_confidence'])
+    elif 'confidence' in item:
+        conf_data = item['confidence']
+        if isinstance(conf_data, list) and conf_data:
+            confidence = sum(conf_data) / len(conf_data)
+        elif isinstance(conf_data, (float, int)):
+            confidence = float(conf_data)
+    return text, confidence
+
+
+class GarbageFilter:
+    """
+    불용어(단일 alternation 정규식)와 "의미 있는 문자 없음" 조건을 한 번만 컴파일해 두고 재사용하는 필터.
+    - 한 줄: 정규식 두 개로 판정합니다.
+    - 줄 목록: 모든 줄을 이어 붙인 텍스트에 정규식별로 finditer 한 번씩만 실행합니다.
+      (두 조건을 한 패턴으로 합치면 re의 리터럴 접두어 최적화가 꺼져 오히려 느려짐)
+    - 신뢰도가 있는 줄은 min_confidence 미만이면 삭제합니다 (0이면 사용 안 함).
+    """
+
+    def __init__(self, keywords: Iterable[str], min_confidence: float = 0.0):
+        self.keywords = sorted({k for k in keywords if k}, key=len, reverse=True)
+        self.min_confidence = min_confidence
+
+        # 의미 있는 문자 없이 끝나는 줄 / 불용어 (불용어가 없으면 어떤 것과도 일치하지 않는 패턴)
+        self._meaningless = re.compile(rf"^[^{_MEANINGFUL_CHARS}\n]*$", re.MULTILINE)
+        self._keywords = re.compile("|".join(map(re.escape, self.keywords)) if self.keywords else r"(?!)")
+
+    @classmethod
+    def from_config(cls, path: str = GARBAGE_FILTER_CONFIG) -> "GarbageFilter":
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        return cls(config.get("keywords", []), float(config.get("min_confidence", 0.0)))
+
+    def _low_confidence(self, confidence: Optional[float]) -> bool:
+        return confidence is not None and confidence < self.min_confidence
+
+    # 한 줄 판정
+    def is_garbage(self, item: Any) -> bool:
+        text, confidence = extract_text_and_confidence(item)
+        if not text or self._low_confidence(confidence):
+            return True
+        text = text.replace("\n", " ")
+        return self._meaningless.match(text) is not None or self._keywords.search(text) is not None
+
+    # 줄 목록 전체 판정 (True: 삭제 대상)
+    def garbage_mask(self, items: List[Any]) -> List[bool]:
+        # 빈 목록은 바로 반환 (빈 문자열에도 매치되는 패턴이 있어 줄 번호 -1 이 됨)
+        if not items:
+            return []
+
+        mask = [False] * len(items)
+        texts = []
+        for index, item in enumerate(items):
+            text, confidence = extract_text_and_confidence(item)
+            if not text or self._low_confidence(confidence):
+                mask[index] = True
+            texts.append(text.replace("\n", " "))
+
+        # 줄 시작 위치 목록 (매치 위치 → 줄 번호)
+        starts, offset = [], 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        joined = "\n".join(texts)
+        for pattern in (self._meaningless, self._keywords):
+            for found in pattern.finditer(joined):
+                mask[bisect.bisect_right(starts, found.start()) - 1] = True
+        return mask
+
+    # 쓰레기 줄을 뺀 목록
+    def filter_lines(self, items: List[Any]) -> List[Any]:
+        return [item for item, garbage in zip(items, self.garbage_mask(items)) if not garbage]
+
+
+# 모듈 import 시 한 번만 컴파일
+garbage_filter = GarbageFilter.from_config()
@@ -0,0 +1,168 @@
+# json_stream.py (스트리밍 LLM 응답용 증분 JSON 파서: 최상위 필드 / 배열 원소가 완성되는 즉시 꺼냄)
+
+import json
+from typing import Any, List, Optional, Tuple
+
+# 이벤트: ("field", 키, 값) - 최상위 필드 값 완성
+#         ("item", 키, 위치, 값) - 최상위 배열 필드의 원소 하나 완성
+StreamEvent = Tuple[Any, ...]
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONObjectParser:
+    """
+    조각(chunk)으로 들어오는 JSON 객체 텍스트를 한 글자씩 한 번만 훑으며 완성된 부분을 바로 돌려주는 파서.
+    - 첫 '{' 이전의 텍스트(```json 코드블록 표시 등)는 무시합니다.
+    - 최상위 필드 값이 끝나면 ("field", key, value), 최상위 배열의 원소가 끝나면 ("item", key, index, value)를 냅니다.
+    - 완성된 조각만 json.loads 하므로 문자열 이스케이프 / 중첩 구조도 그대로 처리됩니다.
+    """
+
+    def __init__(self):
+        self._text = ""                # '{' 이후의 전체 텍스트 (완성된 조각을 잘라낼 때 사용)
+        self._pos = 0                  # 다음에 볼 위치
+        self._started = False
+        self.finished = False
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+        # 최상위 객체 안에서의 상태: key → colon → value → comma
+        self._expect = "key"
+        self._key: Optional[str] = None
+        self._token_start: Optional[int] = None   # 진행 중인 키/값의 시작 위치
+
+        # 최상위 배열 값 안에서의 원소 상태
+        self._item_start: Optional[int] = None
+        self._item_index = 0
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        if self.finished or not chunk:
+            return []
+        if not self._started:
+            brace = chunk.find("{")
+            if brace < 0:
+                return []
+            chunk = chunk[brace:]
+            self._started = True
+        self._text += chunk
+
+        events: List[StreamEvent] = []
+        text = self._text
+        for pos in range(self._pos, len(text)):
+            if self.finished:
+                break
+            self._step(pos, text[pos], events)
+        self._pos = len(text)
+        return events
+
+    def _slice_value(self, start: int, end: int) -> Any:
+        return json.loads(self._text[start:end])
+
+    def _step(self, pos: int, ch: str, events: List[StreamEvent]) -> None:
+        # 1) 문자열 안
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                self._close_string(pos, events)
+            return
+
+        # 2) 문자열 밖
+        if ch == '"':
+            self._in_string = True
+            self._open_token(pos)
+            return
+
+        if ch in "{[":
+            self._open_token(pos)
+            self._depth += 1
+            return
+
+        if ch in "}]":
+            # 최상위 배열 원소(스칼라)가 ']' 바로 앞에서 끝나는 경우
+            if self._depth == 2 and self._item_start is not None:
+                self._emit_item(self._item_start, pos, events)
+            self._depth -= 1
+            if self._depth == 0:
+                # 최상위 객체 종료: 진행 중인 스칼라 값이 있으면 마무리
+                self._close_scalar(pos, events)
+                self.finished = True
+            elif self._depth == 1:
+                # 최상위 필드의 배열/객체 값 종료
+                self._emit_field(self._token_start, pos + 1, events)
+            elif self._depth == 2 and self._item_start is not None:
+                # 배열 원소(객체/배열) 종료
+                self._emit_item(self._item_start, pos + 1, events)
+            return
+
+        if ch == ",":
+            if self._depth == 1:
+                self._close_scalar(pos, events)
+                self._expect = "key"
+            elif self._depth == 2 and self._item_start is not None:
+                self._emit_item(self._item_start, pos, events)
+            return
+
+        if ch == ":" and self._depth == 1 and self._expect == "colon":
+            self._expect = "value"
+            return
+
+        if ch in _WHITESPACE:
+            return
+
+        # 숫자 / true / false / null 시작
+        self._open_token(pos)
+
+    # 키/값/원소 시작 위치 기록
+    def _open_token(self, pos: int) -> None:
+        if self._depth == 1 and self._expect in ("key", "value") and self._token_start is None:
+            self._token_start = pos
+            if self._expect == "value" and self._text[pos] == "[":
+                self._item_index = 0
+        elif (self._depth == 2 and self._expect == "value" and self._token_start is not None
+                and self._text[self._token_start] == "[" and self._item_start is None):
+            self._item_start = pos
+
+    def _close_string(self, pos: int, events: List[StreamEvent]) -> None:
+        if self._depth == 1 and self._token_start is not None:
+            if self._expect == "key":
+                self._key = self._slice_value(self._token_start, pos + 1)
+                self._token_start = None
+                self._expect = "colon"
+            elif self._expect == "value":
+                self._emit_field(self._token_start, pos + 1, events)
+        elif self._depth == 2 and self._item_start is not None and self._text[self._item_start] == '"':
+            self._emit_item(self._item_start, pos + 1, events)
+
+    # 최상위 스칼라 값(숫자 등)을 ',' 또는 '}' 에서 마무리
+    def _close_scalar(self, pos: int, events: List[StreamEvent]) -> None:
+        if self._expect == "value" and self._token_start is not None:
+            self._emit_field(self._token_start, pos, events)
+
+    def _emit_field(self, start: Optional[int], end: int, events: List[StreamEvent]) -> None:
+        if start is None or self._key is None:
+            return
+        try:
+            value = self._slice_value(start, end)
+        except ValueError:
+            value = None
+        if value is not None or self._text[start:end].strip() == "null":
+            events.append(("field", self._key, value))
+        self._token_start = None
+        self._item_start = None
+        self._expect = "comma"
+
+    def _emit_item(self, start: int, end: int, events: List[StreamEvent]) -> None:
+        try:
+            value = self._slice_value(start, end)
+        except ValueError:
+            self._item_start = None
+            return
+        events.append(("item", self._key, self._item_index, value))
+        self._item_index += 1
+        self._item_start = None
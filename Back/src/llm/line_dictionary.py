@@ -0,0 +1,193 @@
+# line_dictionary.py (영수증 줄 → 식재료 학습 사전: 한 번 본 줄은 LLM 없이 바로 변환)
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..db.database import db_connection
+
+# 줄 앞의 품목 번호/상품 코드/표시 문자/브랜드 접두어 (예: '001.', '3)', '009', '*', 'P ', '풀/')
+# - 수량 / 용량은 남김: '2L 우유' 와 '1L 우유', '3 계란 30구' 와 '10 계란 30구' 는 다른 줄
+# - 숫자 코드는 0으로 시작하는 것만 (영수증 상품 코드는 자릿수를 맞춰 0으로 채움)
+_LINE_PREFIX = re.compile(r'^(?:\d+[.)]\s*|0\d+\s*|[*#]+\s*|[A-Za-z]\s+|[^\s/\d]{1,4}/)+')
+_WHITESPACE = re.compile(r'\s+')
+
+# '식재료 아님'(빈 목록)으로 기록한 줄의 유효 기간(초) - 지나면 다시 LLM으로 보내 확인 (기본 7일)
+NEGATIVE_TTL = float(os.getenv("FRIDGE_LINE_DICT_NEGATIVE_TTL", str(7 * 24 * 3600)))
+
+
+# 정확 일치 키 (앞뒤 공백만 제거)
+def exact_line_key(text: str) -> str:
+    return str(text).strip()
+
+# 정규화 키 (유니코드 정규화 → 접두어 제거 → 공백 제거 → 소문자, 수량/단위는 키에 남김)
+# 예: '009풀/소가부침두부 1 3,500' 과 '012 풀/소가부침두부  1 3,500' 은 같은 키
+def normalize_line_key(text: str) -> str:
+    text = unicodedata.normalize("NFKC", str(text)).strip()
+    text = _LINE_PREFIX.sub("", text)
+    return _WHITESPACE.sub("", text).lower()
+
+
+class LineDictionary:
+    """
+    영수증 줄 텍스트 → LLM 보정 결과(식재료 목록, 식재료가 아니면 빈 목록) 사전.
+    - 정확 일치 키와 정규화 키, 두 개의 해시 색인으로 조회합니다.
+    - 처음 보는 줄만 LLM으로 보내고, 그 답을 다시 사전에 기록(메모리 + Receipt_Line_Dictionary 테이블)합니다.
+    - 식재료가 아닌 줄(빈 목록)은 negative_ttl 초 동안만 유효합니다 (잘못 학습되어도 영구히 LLM에서 빠지지 않도록).
+    """
+
+    # persistent=False 이면 DB 없이 메모리 사전만 사용
+    def __init__(self, persistent: bool = True, negative_ttl: float = NEGATIVE_TTL):
+        self._lock = threading.Lock()
+        # 키 → (식재료 목록, 만료 시각: 빈 목록만 있음, 식재료가 있으면 None)
+        self._exact: Dict[str, Tuple[List[Dict[str, Any]], Optional[float]]] = {}
+        self._normalized: Dict[str, Tuple[List[Dict[str, Any]], Optional[float]]] = {}
+        self._loaded = not persistent
+        self._persistent = persistent
+        self.negative_ttl = negative_ttl
+
+        # 지표
+        self._lookups = 0
+        self._exact_hits = 0
+        self._normalized_hits = 0
+        self._learned = 0
+
+    # 기록 시각 → 만료 시각 (식재료가 있는 답은 만료 없음)
+    def _expires_at(self, value: List[Dict[str, Any]], updated_at: float) -> Optional[float]:
+        return None if value else updated_at + self.negative_ttl
+
+    # DB에서 사전 전체 적재 (만료된 '식재료 아님' 줄은 제외)
+    # 정규화 키는 저장된 값 대신 원문에서 다시 계산 (정규화 규칙이 바뀌어도 예전 키로 잘못 적중하지 않도록)
+    def load(self, conn: sqlite3.Connection) -> None:
+        exact, normalized = {}, {}
+        now = time.time()
+        for raw_text, items, updated_at in conn.execute(
+                "SELECT raw_text, items, updated_at FROM Receipt_Line_Dictionary ORDER BY updated_at"):
+            value = json.loads(items)
+            expires_at = self._expires_at(value, updated_at)
+            if expires_at is not None and expires_at <= now:
+                continue
+            exact[raw_text] = (value, expires_at)
+            norm_key = normalize_line_key(raw_text)
+            if norm_key:
+                normalized[norm_key] = (value, expires_at)
+
+        with self._lock:
+            self._exact = exact
+            self._normalized = normalized
+            self._loaded = True
+
+    def reload(self) -> None:
+        with db_connection() as conn:
+            self.load(conn)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        try:
+            self.reload()
+        except sqlite3.Error as e:
+            # DB를 사용할 수 없는 환경(LLM 단독 테스트 등)에서는 메모리 사전만 사용
+            print(f"경고: 줄 사전 적재 실패 - {e}")
+            with self._lock:
+                self._loaded = True
+                self._persistent = False
+
+    # (잠금 안에서 호출) 색인 조회, 만료된 항목은 지우고 None
+    def _get(self, index: Dict[str, Tuple[List[Dict[str, Any]], Optional[float]]], key: str, now: float):
+        entry = index.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del index[key]
+            return None
+        return value
+
+    # 한 줄 조회 (없으면 None, 식재료가 아닌 줄로 기록되어 있으면 빈 목록)
+    def lookup(self, text: str) -> Optional[List[Dict[str, Any]]]:
+        self._ensure_loaded()
+        now = time.time()
+        with self._lock:
+            self._lookups += 1
+            found = self._get(self._exact, exact_line_key(text), now)
+            if found is not None:
+                self._exact_hits += 1
+                return [dict(item) for item in found]
+
+            norm_key = normalize_line_key(text)
+            found = self._get(self._normalized, norm_key, now) if norm_key else None
+            if found is not None:
+                self._normalized_hits += 1
+                return [dict(item) for item in found]
+            return None
+
+    # 줄 목록을 사전으로 해결된 것과 LLM이 필요한 것으로 분리
+    # 반환: ({줄 위치: 식재료 목록}, [LLM에 보낼 줄 위치])
+    def split(self, lines: List[str]) -> Tuple[Dict[int, List[Dict[str, Any]]], List[int]]:
+        resolved, pending = {}, []
+        for index, text in enumerate(lines):
+            found = self.lookup(text)
+            if found is None:
+                pending.append(index)
+            else:
+                resolved[index] = found
+        return resolved, pending
+
+    # LLM 답을 메모리 사전에 기록하고, DB에 저장할 행을 반환
+    def learn(self, answers: List[Tuple[str, List[Dict[str, Any]]]]) -> List[Tuple[str, str, str, float]]:
+        rows = []
+        now = time.time()
+        with self._lock:
+            for text, items in answers:
+                raw_text = exact_line_key(text)
+                if not raw_text:
+                    continue
+                value = [dict(item) for item in items]
+                norm_key = normalize_line_key(raw_text)
+                entry = (value, self._expires_at(value, now))
+                self._exact[raw_text] = entry
+                if norm_key:
+                    self._normalized[norm_key] = entry
+                self._learned += 1
+                rows.append((raw_text, norm_key, json.dumps(value, ensure_ascii=False), now))
+        return rows
+
+    # learn() 결과를 DB에 저장
+    def persist(self, rows: List[Tuple[str, str, str, float]]) -> None:
+        if not rows or not self._persistent:
+            return
+        try:
+            with db_connection() as conn:
+                conn.executemany("""
+                    INSERT INTO Receipt_Line_Dictionary (raw_text, norm_key, items, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(raw_text) DO UPDATE SET
+                        norm_key = excluded.norm_key, items = excluded.items, updated_at = excluded.updated_at
+                """, rows)
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"경고: 줄 사전 저장 실패 - {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            skipped = self._exact_hits + self._normalized_hits
+            return {
+                "entries": len(self._exact),
+                "normalized_keys": len(self._normalized),
+                "lookups": self._lookups,
+                "exact_hits": self._exact_hits,
+                "normalized_hits": self._normalized_hits,
+                "sent_to_llm": self._lookups - skipped,
+                "learned": self._learned,
+                "llm_skip_ratio": round(skipped / self._lookups, 4) if self._lookups else 0.0,
+            }
+
+
+# 프로세스 전역 줄 사전
+line_dictionary = LineDictionary()
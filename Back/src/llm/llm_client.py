@@ -0,0 +1,357 @@
+# llm_client.py (Ollama 호출 단일 진입점: 모델 상주 정책 / 유휴 해제 / 예열 / 호출 지표)
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+import ollama
+
+# 동시에 상주시킬 모델들의 메모리 합 한도(MB, 0이면 제한 없음)
+LLM_MEMORY_BUDGET_MB = int(os.getenv("FRIDGE_LLM_MEMORY_BUDGET_MB", "12000"))
+# 등록되지 않은 모델의 기본 상주 시간(초)
+LLM_DEFAULT_KEEP_ALIVE = float(os.getenv("FRIDGE_LLM_DEFAULT_KEEP_ALIVE", "300"))
+# 유휴 모델 확인 주기(초)
+LLM_IDLE_CHECK_INTERVAL = float(os.getenv("FRIDGE_LLM_IDLE_CHECK_INTERVAL", "15"))
+# load_duration 이 이 값(ms)을 넘으면 모델을 새로 올린 호출(콜드 로드)로 집계
+LLM_COLD_LOAD_MS = float(os.getenv("FRIDGE_LLM_COLD_LOAD_MS", "500"))
+# 서버 시작 시 예열할 모델 (쉼표로 구분, 예: 'deepseek-r1:8b,exaone3.5:7.8b')
+LLM_WARM_UP_MODELS = [name.strip() for name in os.getenv("FRIDGE_LLM_WARM_UP", "").split(",") if name.strip()]
+# 최근 호출 지표 보관 개수
+LLM_RECENT_CALLS = 50
+
+_NS_TO_MS = 1e-6
+
+
+class ModelPolicy:
+    # 모델 하나의 상주 정책: keep_alive(초, -1이면 계속 상주, 0이면 호출 직후 해제) / 예상 메모리(MB)
+    def __init__(self, name: str, keep_alive: float, memory_mb: int = 0):
+        self.name = name
+        self.keep_alive = keep_alive
+        self.memory_mb = memory_mb
+
+
+class LLMClient:
+    """
+    Ollama 모델 상주 정책을 한 곳에서 관리하는 클라이언트.
+    - 모델마다 keep_alive를 두고, 유휴 스케줄러가 마지막 호출 후 keep_alive가 지난 모델을 해제합니다.
+      (Ollama에는 keep_alive + 확인 주기 x 2 를 보내 서버가 죽어도 모델이 계속 남지 않도록 함)
+    - 새 모델을 올릴 때 상주 중인 모델과의 메모리 합이 예산을 넘으면 오래 쓰지 않은 모델부터 먼저 내립니다.
+    - 응답의 load_duration / prompt_eval_duration / eval_duration 으로 로드 시간과 생성 시간을 나눠 집계합니다.
+    """
+
+    def __init__(
+            self,
+            memory_budget_mb: int = LLM_MEMORY_BUDGET_MB,
+            idle_check_interval: float = LLM_IDLE_CHECK_INTERVAL,
+            cold_load_ms: float = LLM_COLD_LOAD_MS,
+            host: Optional[str] = None
+        ):
+        self.memory_budget_mb = memory_budget_mb
+        self.idle_check_interval = idle_check_interval
+        self.cold_load_ms = cold_load_ms
+        self.host = host
+
+        self._lock = threading.Lock()
+        self._policies: Dict[str, ModelPolicy] = {}
+        self._resident: Dict[str, float] = {}   # 상주 중으로 보는 모델 → 마지막 사용 시각(monotonic)
+        self._in_flight: Dict[str, int] = {}
+        self._last_activity = time.monotonic()
+        self._client: Optional[ollama.Client] = None
+        self._aclient: Optional[ollama.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scheduler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        # 지표
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=LLM_RECENT_CALLS)
+        self._evictions = 0
+        self._idle_unloads = 0
+
+    # ---------- 정책 ----------
+
+    def register(self, name: str, keep_alive: float, memory_mb: int = 0) -> None:
+        with self._lock:
+            self._policies[name] = ModelPolicy(name, keep_alive, memory_mb)
+
+    def policy(self, name: str) -> ModelPolicy:
+        with self._lock:
+            return self._policies.get(name) or ModelPolicy(name, LLM_DEFAULT_KEEP_ALIVE)
+
+    # Ollama에 보낼 keep_alive (유휴 해제는 스케줄러가 하고, Ollama 쪽 값은 안전장치)
+    def _ollama_keep_alive(self, policy: ModelPolicy) -> float:
+        if policy.keep_alive <= 0:
+            return policy.keep_alive
+        return policy.keep_alive + self.idle_check_interval * 2
+
+    # (잠금 안에서 호출) model을 올릴 자리를 만들기 위해 내려야 할 모델 목록 (오래 안 쓴 순서, 호출 중인 모델 제외)
+    def _plan_evictions(self, model: str) -> List[str]:
+        if self.memory_budget_mb <= 0 or model in self._resident:
+            return []
+        memory = {name: self._policies.get(name, ModelPolicy(name, 0)).memory_mb for name in self._resident}
+        needed = self._policies.get(model, ModelPolicy(model, 0)).memory_mb
+        used = sum(memory.values())
+
+        evict = []
+        for name, _ in sorted(self._resident.items(), key=lambda item: item[1]):
+            if used + needed <= self.memory_budget_mb:
+                break
+            if self._in_flight.get(name):
+                continue
+            evict.append(name)
+            used -= memory[name]
+        for name in evict:
+            del self._resident[name]
+        self._evictions += len(evict)
+        return evict
+
+    # 호출 전: 호출 중 표시 + 예산 초과 시 내릴 모델 결정
+    def _before_call(self, model: str) -> Tuple[float, List[str]]:
+        policy = self.policy(model)
+        with self._lock:
+            self._in_flight[model] = self._in_flight.get(model, 0) + 1
+            evict = self._plan_evictions(model)
+        if evict:
+            print(f"[LLM] 메모리 예산 초과 → {evict} 해제 후 {model} 로드")
+        return self._ollama_keep_alive(policy), evict
+
+    # 호출 후: 상주 상태 / 지표 갱신
+    def _after_call(self, model: str, response: Any, wall_seconds: float, ok: bool) -> None:
+        policy = self.policy(model)
+        with self._lock:
+            self._in_flight[model] -= 1
+            self._last_activity = time.monotonic()
+            if ok and policy.keep_alive != 0:
+                self._resident[model] = time.monotonic()
+            elif policy.keep_alive == 0:
+                self._resident.pop(model, None)
+
+            stats = self._stats.setdefault(model, {
+                "calls": 0, "errors": 0, "cold_loads": 0,
+                "load_ms": 0.0, "prompt_eval_ms": 0.0, "eval_ms": 0.0, "wall_ms": 0.0, "eval_tokens": 0,
+            })
+            stats["calls"] += 1
+            stats["wall_ms"] += wall_seconds * 1000
+            if not ok:
+                stats["errors"] += 1
+                return
+
+            load_ms = (_field(response, "load_duration") or 0) * _NS_TO_MS
+            prompt_ms = (_field(response, "prompt_eval_duration") or 0) * _NS_TO_MS
+            eval_ms = (_field(response, "eval_duration") or 0) * _NS_TO_MS
+            eval_tokens = _field(response, "eval_count") or 0
+            cold = load_ms >= self.cold_load_ms
+
+            stats["cold_loads"] += int(cold)
+            stats["load_ms"] += load_ms
+            stats["prompt_eval_ms"] += prompt_ms
+            stats["eval_ms"] += eval_ms
+            stats["eval_tokens"] += eval_tokens
+            self._recent.append({
+                "model": model,
+                "cold": cold,
+                "load_ms": round(load_ms, 1),
+                "prompt_eval_ms": round(prompt_ms, 1),
+                "eval_ms": round(eval_ms, 1),
+                "eval_tokens": eval_tokens,
+                "wall_ms": round(wall_seconds * 1000, 1),
+            })
+
+    # ---------- 호출 ----------
+
+    def _sync_client(self) -> ollama.Client:
+        if self._client is None:
+            self._client = ollama.Client(host=self.host)
+        return self._client
+
+    # 비동기 호출이 함께 쓰는 AsyncClient (연결 재사용, 이벤트 루프가 바뀌면 (테스트 등) 새로 만듦)
+    def _async_client(self) -> ollama.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._async_loop is not loop:
+            self._aclient = ollama.AsyncClient(host=self.host)
+            self._async_loop = loop
+        return self._aclient
+
+    # 서버 종료 시 AsyncClient 의 연결 닫기 (ollama.AsyncClient 에는 닫는 메서드가 없어 내부 httpx 클라이언트를 닫음)
+    async def aclose(self) -> None:
+        client = self._aclient
+        self._aclient, self._async_loop = None, None
+        if client is not None:
+            await client._client.aclose()
+
+    # 동기 chat (스레드에서 호출)
+    def chat(self, model: str, messages: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        keep_alive, evict = self._before_call(model)
+        for name in evict:
+            self._unload_sync(name)
+
+        started = time.perf_counter()
+        response, ok = None, False
+        try:
+            response = self._sync_client().chat(model=model, messages=messages, keep_alive=keep_alive, **kwargs)
+            ok = True
+            return response
+        finally:
+            self._after_call(model, response, time.perf_counter() - started, ok)
+
+    # 비동기 chat (공용 AsyncClient 사용)
+    async def chat_async(self, model: str, messages: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        client = self._async_client()
+        keep_alive, evict = self._before_call(model)
+        for name in evict:
+            await self._unload_async(name, client)
+
+        started = time.perf_counter()
+        response, ok = None, False
+        try:
+            response = await client.chat(model=model, messages=messages, keep_alive=keep_alive, **kwargs)
+            ok = True
+            return response
+        finally:
+            self._after_call(model, response, time.perf_counter() - started, ok)
+
+    # 스트리밍 chat: 조각을 받는 대로 넘기고, 지표는 마지막 조각(done)의 duration 값으로 집계
+    async def chat_stream_async(self, model: str, messages: List[Dict[str, Any]], **kwargs: Any) -> AsyncIterator[Any]:
+        client = self._async_client()
+        keep_alive, evict = self._before_call(model)
+        for name in evict:
+            await self._unload_async(name, client)
+
+        started = time.perf_counter()
+        last, ok = None, False
+        try:
+            async for chunk in await client.chat(model=model, messages=messages, keep_alive=keep_alive, stream=True, **kwargs):
+                last = chunk
+                yield chunk
+            ok = True
+        finally:
+            self._after_call(model, last, time.perf_counter() - started, ok)
+
+    # ---------- 로드 / 해제 ----------
+
+    # 빈 프롬프트 generate: keep_alive=0 이면 해제, 아니면 모델만 올림
+    def _unload_sync(self, model: str) -> None:
+        try:
+            self._sync_client().generate(model=model, keep_alive=0)
+        except Exception as e:
+            print(f"경고: LLM 모델 해제 실패 - {model}: {e}")
+
+    async def _unload_async(self, model: str, client: ollama.AsyncClient) -> None:
+        try:
+            await client.generate(model=model, keep_alive=0)
+        except Exception as e:
+            print(f"경고: LLM 모델 해제 실패 - {model}: {e}")
+
+    def unload(self, model: str) -> None:
+        with self._lock:
+            self._resident.pop(model, None)
+        self._unload_sync(model)
+
+    # 예열: 빈 프롬프트로 모델만 미리 올림 (예산을 넘으면 다른 모델을 먼저 내림)
+    def warm_up(self, models: List[str]) -> None:
+        for model in models:
+            keep_alive, evict = self._before_call(model)
+            for name in evict:
+                self._unload_sync(name)
+            started = time.perf_counter()
+            response, ok = None, False
+            try:
+                response = self._sync_client().generate(model=model, keep_alive=keep_alive)
+                ok = True
+            except Exception as e:
+                print(f"경고: LLM 모델 예열 실패 - {model}: {e}")
+            finally:
+                self._after_call(model, response, time.perf_counter() - started, ok)
+
+    async def warm_up_async(self, models: List[str]) -> None:
+        await asyncio.to_thread(self.warm_up, models)
+
+    # 마지막 호출 후 keep_alive가 지난 모델 해제, 해제한 모델 목록 반환
+    def unload_idle(self) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                name for name, last_used in self._resident.items()
+                if not self._in_flight.get(name)
+                and 0 < self._policies.get(name, ModelPolicy(name, LLM_DEFAULT_KEEP_ALIVE)).keep_alive <= now - last_used
+            ]
+            for name in idle:
+                del self._resident[name]
+            self._idle_unloads += len(idle)
+        for name in idle:
+            print(f"[LLM] 유휴 모델 해제: {name}")
+            self._unload_sync(name)
+        return idle
+
+    # 유휴 스케줄러 시작 (백그라운드 스레드)
+    def start_idle_scheduler(self) -> None:
+        if self._scheduler is not None or self.idle_check_interval <= 0:
+            return
+
+        def _loop() -> None:
+            while not self._stop.wait(self.idle_check_interval):
+                self.unload_idle()
+
+        self._scheduler = threading.Thread(target=_loop, name="llm-idle-scheduler", daemon=True)
+        self._scheduler.start()
+
+    def stop_idle_scheduler(self) -> None:
+        self._stop.set()
+        if self._scheduler is not None:
+            self._scheduler.join(timeout=1)
+            self._scheduler = None
+        self._stop.clear()
+
+    # 진행 중인 호출이 없으면 마지막 호출이 끝난 뒤 지난 시간(초), 호출 중이면 0
+    def idle_seconds(self) -> float:
+        with self._lock:
+            if any(self._in_flight.values()):
+                return 0.0
+            return time.monotonic() - self._last_activity
+
+    # ---------- 지표 ----------
+
+    def metrics(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            models = {}
+            for name, stats in self._stats.items():
+                succeeded = stats["calls"] - stats["errors"]
+                models[name] = {
+                    **{key: round(value, 1) if isinstance(value, float) else value for key, value in stats.items()},
+                    "avg_load_ms": round(stats["load_ms"] / succeeded, 1) if succeeded else 0.0,
+                    "avg_eval_ms": round(stats["eval_ms"] / succeeded, 1) if succeeded else 0.0,
+                    "tokens_per_second": round(stats["eval_tokens"] / (stats["eval_ms"] / 1000), 1) if stats["eval_ms"] else 0.0,
+                }
+            return {
+                "memory_budget_mb": self.memory_budget_mb,
+                "resident": {
+                    name: {"idle_seconds": round(now - last_used, 1), "memory_mb": self._policies.get(name, ModelPolicy(name, 0)).memory_mb}
+                    for name, last_used in self._resident.items()
+                },
+                "policies": {
+                    name: {"keep_alive": policy.keep_alive, "memory_mb": policy.memory_mb}
+                    for name, policy in self._policies.items()
+                },
+                "evictions": self._evictions,
+                "idle_unloads": self._idle_unloads,
+                "models": models,
+                "recent_calls": list(self._recent),
+            }
+
+
+# Ollama 응답(ChatResponse / dict)에서 필드 읽기
+def _field(response: Any, name: str) -> Any:
+    if response is None:
+        return None
+    try:
+        return response[name]
+    except (KeyError, TypeError):
+        return getattr(response, name, None)
+
+
+# 프로세스 전역 LLM 클라이언트
+llm_client = LLMClient()
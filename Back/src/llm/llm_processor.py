@@ -1,59 +1,118 @@
-import ollama
+import asyncio
 import json
 import re
 import os
+from ..db.reference_cache import resolve_category_tag
+from ..cache.result_cache import make_cache_key, refine_result_cache
+from ..db.async_database import run_in_db_thread
+from .line_dictionary import line_dictionary
+from .garbage_filter import garbage_filter
+from .llm_client import llm_client
+from .json_stream import IncrementalJSONObjectParser
 
+# 1차 필터링 (불용어 / 의미 없는 줄 / 낮은 신뢰도) - 규칙은 garbage_keywords.json
 def is_garbage_text(item):
-    """
-    [수정됨] 1차 필터링 로직 개선
-    - avg_confidence 활용
-    - 숫자(수량/가격)와 영어(단위/코드)가 삭제되지 않도록 정규식 범위 확장
-    """
-    text = ""
-    avg_conf = 0.0
-    
-    # 1. 텍스트 및 신뢰도 추출
-    if isinstance(item, dict):
-        text = str(item.get('raw_text', '') or item.get('text', '') or '').strip()
-        
-        # 신뢰도 추출 (List/Float 처리 호환)
-        if 'avg_confidence' in item:
-            avg_conf = float(item['avg_confidence'])
-        elif 'confidence' in item:
-            conf_data = item['confidence']
-            if isinstance(conf_data, list) and conf_data:
-                avg_conf = sum(conf_data) / len(conf_data)
-            elif isinstance(conf_data, (float, int)):
-                avg_conf = float(conf_data)
-    else:
-        text = str(item).strip()
+    return garbage_filter.is_garbage(item)
 
-    # 2. 빈 문자열 삭제
-    if not text: return True
-    
-    # 3. [중요 수정] "의미 있는 문자"가 하나도 없으면 삭제
-    # -> 이렇게 하면 특수문자만 있는 경우(예: ".", "-", "*")는 걸러지고, "1", "100g", "mart" 등은 살아남음
-    if not re.search(r'[가-힣0-9a-zA-Z]', text):
-        return True
-
-    # 4. 불용어(Garbage Keywords) 필터링
-    # (헤더나 명백한 쓰레기 단어 삭제)
-    GARBAGE_KEYWORDS = [
-        "결제", "카드", "부가세", "포인트", "주소", "TEL", "대표", 
-        "영수증", "Total", "내역", "배달", "반품", "교환", "가맹점", 
-        "승인", "매출", "사업자", "품목", "봉투", "쇼핑백", "종량제", "비닐", "Trash",
-        "POINT", "Point", "적립", "사용", "소멸", "잔여", "누리", "에누리",
-        "PL", "S-OIL", "L.POINT", "CASH", "CARD", "쿠폰", "부가세", "바코드", "회원", "포인트"
-        "미사용", "개월", "문의", "안내", "영수증확인", "서명", "사업자번호", "전화", "홈페이지"
-    ]
-    
-    # 키워드가 텍스트에 포함되어 있으면 삭제
-    if any(k in text for k in GARBAGE_KEYWORDS): return True
+# 재료 보정 모델 / 호출 옵션
+REFINE_MODEL = 'deepseek-r1:8b'
+REFINE_OPTIONS = {
+    'temperature': 0.0,
+    'num_ctx': 8192,
+    'num_predict': 4096,
+}
 
-    return False
+# 레시피 추천 모델
+RECIPE_MODEL = 'exaone3.5:7.8b'
 
-# 2. LLM 호출 함수 (One-Shot 프롬프트 적용)
-def refine_batch_items(lines: list):
+# 모델별 상주 시간(초, 마지막 호출 이후) / 예상 메모리(MB) - 상주 정책은 llm_client 가 관리
+REFINE_KEEP_ALIVE = float(os.getenv("FRIDGE_LLM_REFINE_KEEP_ALIVE", "1800"))
+REFINE_MEMORY_MB = int(os.getenv("FRIDGE_LLM_REFINE_MEMORY_MB", "5500"))
+RECIPE_KEEP_ALIVE = float(os.getenv("FRIDGE_LLM_RECIPE_KEEP_ALIVE", "600"))
+RECIPE_MEMORY_MB = int(os.getenv("FRIDGE_LLM_RECIPE_MEMORY_MB", "5000"))
+llm_client.register(REFINE_MODEL, keep_alive=REFINE_KEEP_ALIVE, memory_mb=REFINE_MEMORY_MB)
+llm_client.register(RECIPE_MODEL, keep_alive=RECIPE_KEEP_ALIVE, memory_mb=RECIPE_MEMORY_MB)
+
+# 프롬프트/파싱 규칙을 바꾸면 올려서 이전 보정 결과 캐시를 무효화
+REFINE_PROMPT_VERSION = 2
+
+# 청크 분할 기준: 한 번의 호출에 넣을 입력 토큰 예산 / 최대 줄 수
+REFINE_CHUNK_TOKENS = int(os.getenv("FRIDGE_LLM_CHUNK_TOKENS", "400"))
+REFINE_CHUNK_MAX_LINES = int(os.getenv("FRIDGE_LLM_CHUNK_MAX_LINES", "40"))
+# 영수증 한 장에서 동시에 Ollama로 보내는 청크 수
+REFINE_PARALLEL = int(os.getenv("FRIDGE_LLM_PARALLEL", "2"))
+
+# [핵심] 모델에게 "생각"할 틈을 주지 않는 예시(Few-Shot) 제공
+REFINE_SYSTEM_PROMPT = """
+You are an AI expert specializing in OCR data extraction from Korean receipts.
+
+[Primary Instructions]
+1. **Process ALL Lines (CRITICAL):** You must iterate through **EVERY single line** provided in the input. Do NOT stop processing after finding the first ingredient. Check all lines from top to bottom.
+2. **Target:** Extract ONLY food ingredients. Ignore non-food items (e.g., plastic bags, fees, headers).
+
+3. **Extraction Strategy:**
+    - **Step 1: Keyword Spotting:** Scan the current line for a recognizable Korean food noun (e.g., '두부', '우유', '삼겹살', '양파').
+        - If a clear food noun is found: Extract it and **move to the next line immediately**. (Do NOT stop the entire task).
+        - Ignore prefixes (e.g., '풀/', 'CJ'), suffixes, or brand names. 
+        - *Example:* '009풀/소가부침두부' -> Keyword '두부' found -> Extract '두부' -> Next line.
+    - **Step 2: Typo Correction:** If NO food noun is found, try to correct typos (e.g., '면필' -> '연필').
+    - **Step 3: Skip:** If the line is definitely not food, skip to the next line.
+
+4. **Formatting:** Return the result strictly as a JSON List.
+
+[Data Extraction Rules]
+- **line**: The number of the input line the item was extracted from (e.g., 'Line 3: ...' -> 3).
+- **product_name**: Extract the core ingredient name only. (e.g., '풀/소가부침두부' -> '두부', '008 상추' -> '상추').
+- **quantity**: Numeric (default 1).
+- **unit**: ['개', 'g', 'kg', 'ml', 'L'] (default '개').
+- **category**: Choose exactly one from: ['채소', '과일', '육류', '수산물', '유제품/두부/알류', '면/빵/떡', '가공/냉동식품', '양념/오일', '음료', '기타'].
+
+[Few-Shot Examples (Structure Only)]
+*Note: These examples use non-food items to demonstrate the correction and formatting logic. Apply this same logic to FOOD ingredients in the actual task.*
+
+Input Lines:
+Line 1: 001. P 몽나미 볼팬 (Black)
+Line 2: 3M 스카치테이푸 1,500
+Line 3: 003. A4 용지 1Box
+
+Output JSON:
+[
+    {"line": 1, "product_name": "볼펜", "quantity": 1, "unit": "개", "category": "기타"},
+    {"line": 2, "product_name": "테이프", "quantity": 1, "unit": "개", "category": "기타"},
+    {"line": 3, "product_name": "A4 용지", "quantity": 1, "unit": "개", "category": "기타"}
+]
+
+[Task]
+Analyze ALL provided text lines below and extract every food ingredient found.
+""".strip()
+
+
+# 토큰 수 추정 (한글은 글자당 약 1토큰, 영문/숫자는 약 3~4글자당 1토큰)
+def estimate_text_tokens(text: str) -> int:
+    hangul = sum(1 for ch in text if '가' <= ch <= '힣')
+    return hangul + (len(text) - hangul + 3) // 4
+
+# 보정 입력 한 줄의 토큰 수 추정 (+ 줄 머리말 "Line N: ")
+def estimate_tokens(text: str) -> int:
+    return estimate_text_tokens(text) + 4
+
+# 줄 목록을 토큰 예산에 맞춰 청크로 분할 (순서 유지, 한 줄이 예산을 넘어도 단독 청크로 포함)
+def chunk_lines_by_tokens(lines: list, token_budget: int = REFINE_CHUNK_TOKENS, max_lines: int = REFINE_CHUNK_MAX_LINES) -> list:
+    chunks = []
+    current, used = [], 0
+    for item in lines:
+        cost = estimate_tokens(str(item))
+        if current and (used + cost > token_budget or len(current) >= max_lines):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+# 청크 → 채팅 메시지
+def build_refine_messages(lines: list) -> list:
     input_lines = []
     for i, item in enumerate(lines):
         text = str(item).strip()
@@ -64,158 +123,220 @@ def refine_batch_items(lines: list):
     
     # 디버깅: 실제로 LLM에 들어가는 텍스트 확인
     print(f"\n[Debug Batch Input]\n{input_text}\n----------------")
-    
-    print(f"\n[Debug] LLM Input:\n{input_text[:100]}...\n")
-
-    # [핵심] 모델에게 "생각"할 틈을 주지 않는 예시(Few-Shot) 제공
-    system_prompt = """
-    You are an AI expert specializing in OCR data extraction from Korean receipts.
-
-    [Primary Instructions]
-    1. **Process ALL Lines (CRITICAL):** You must iterate through **EVERY single line** provided in the input. Do NOT stop processing after finding the first ingredient. Check all lines from top to bottom.
-    2. **Target:** Extract ONLY food ingredients. Ignore non-food items (e.g., plastic bags, fees, headers).
-
-    3. **Extraction Strategy:**
-        - **Step 1: Keyword Spotting:** Scan the current line for a recognizable Korean food noun (e.g., '두부', '우유', '삼겹살', '양파').
-            - If a clear food noun is found: Extract it and **move to the next line immediately**. (Do NOT stop the entire task).
-            - Ignore prefixes (e.g., '풀/', 'CJ'), suffixes, or brand names. 
-            - *Example:* '009풀/소가부침두부' -> Keyword '두부' found -> Extract '두부' -> Next line.
-        - **Step 2: Typo Correction:** If NO food noun is found, try to correct typos (e.g., '면필' -> '연필').
-        - **Step 3: Skip:** If the line is definitely not food, skip to the next line.
-
-    4. **Formatting:** Return the result strictly as a JSON List.
-
-    [Data Extraction Rules]
-    - **product_name**: Extract the core ingredient name only. (e.g., '풀/소가부침두부' -> '두부', '008 상추' -> '상추').
-    - **quantity**: Numeric (default 1).
-    - **unit**: ['개', 'g', 'kg', 'ml', 'L'] (default '개').
-    - **category**: Choose exactly one from: ['채소', '과일', '육류', '수산물', '유제품/두부/알류', '면/빵/떡', '가공/냉동식품', '양념/오일', '음료', '기타'].
-
-    [Few-Shot Examples (Structure Only)]
-    *Note: These examples use non-food items to demonstrate the correction and formatting logic. Apply this same logic to FOOD ingredients in the actual task.*
-
-    Input Lines:
-    - 001. P 몽나미 볼팬 (Black)
-    - 3M 스카치테이푸 1,500
-    - 003. A4 용지 1Box
-
-    Output JSON:
-    [
-        {"product_name": "볼펜", "quantity": 1, "unit": "개", "category": "기타"},
-        {"product_name": "테이프", "quantity": 1, "unit": "개", "category": "기타"},
-        {"product_name": "A4 용지", "quantity": 1, "unit": "개", "category": "기타"}
-    ]
-
-    [Task]
-    Analyze ALL provided text lines below and extract every food ingredient found.
-    """.strip()
 
     # 실제 사용자 입력
     user_content = f"User:\n{input_text}\n\nAssistant:"
-    user_message = {
-        "role": "user",
-        "content": user_content
-    }
-    
+    return [
+        {'role': 'system', 'content': REFINE_SYSTEM_PROMPT},
+        {'role': 'user', 'content': user_content}
+    ]
+
+# 모델 응답 → 정규화된 식재료 목록
+def parse_refine_response(content: str) -> list:
+    # JSON 추출 (Markdown 제거 및 파싱)
+    restored_items = []
     try:
-        response = ollama.chat(
-            model='deepseek-r1:8b', 
-            messages=[
-                {'role': 'system', 'content': system_prompt},
-                user_message  
-            ],
+        # 1. 가장 넓은 범위의 대괄호 [] 찾기
+        json_match = re.search(r'\[.*\]', content, re.DOTALL)
+        if json_match:
+            json_str = json_match.group(0)
+            restored_items = json.loads(json_str)
+        else:
+            # 2. 실패 시 개별 객체 {} 찾기
+            matches = re.findall(r'\{.*?\}', content, re.DOTALL)
+            for m in matches:
+                restored_items.append(json.loads(m))
+    except Exception:
+        pass
+
+    # 구조 정리
+    if isinstance(restored_items, dict):
+        # {"items": [...]} 형태일 경우
+        for val in restored_items.values():
+            if isinstance(val, list):
+                restored_items = val
+                break
+        else:
+            restored_items = [restored_items]
+
+    # 최종 정규화
+    normalized = []
+    if isinstance(restored_items, list):
+        for item in restored_items:
+            if isinstance(item, dict):
+                p_name = str(item.get("product_name", "")).strip()
+                if not p_name: continue
+                
+                category = str(item.get("category", "기타")).strip()
+                line = item.get("line")
+                normalized.append({
+                    # 입력 청크 안에서의 줄 번호 (1부터, 모르면 None) - 줄 사전 학습용
+                    "line": int(line) if isinstance(line, (int, float)) or str(line).isdigit() else None,
+                    "product_name": p_name,
+                    "quantity": float(item.get("quantity", 1) or 1),
+                    "unit": str(item.get("unit", "개")).strip(),
+                    "category": category,
+                    # 식재료 등록 API(category_tag)에 바로 쓸 수 있는 DB 카테고리 이름
+                    "category_tag": resolve_category_tag(category, p_name),
+                })
+        
+    return normalized
+
+# 보정 결과 캐시 키 (모델 + 프롬프트 버전 + 공백을 정리한 청크 텍스트)
+def refine_cache_key(lines: list) -> str:
+    normalized = [" ".join(str(item).split()) for item in lines]
+    text = "\n".join(line for line in normalized if line)
+    return make_cache_key("refine", REFINE_MODEL, REFINE_PROMPT_VERSION, text)
+
+# 2. LLM 호출 함수 (One-Shot 프롬프트 적용)
+def refine_batch_items(lines: list):
+    key = refine_cache_key(lines)
+    cached = refine_result_cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = llm_client.chat(
+            REFINE_MODEL,
+            build_refine_messages(lines),
             format='json',
-            options={
-                'temperature': 0.0,
-                'num_ctx': 8192,
-                'num_predict': 4096,
-            },
-            keep_alive=-1
+            options=REFINE_OPTIONS
         )
-        
-        content = response['message']['content']
-        
-        print(f"[Debug] Model Thought:\n{response}...\n")
-        # print(f"[Debug] Raw Output:\n{content[:200]}...") # 디버깅
-        
-        # JSON 추출 (Markdown 제거 및 파싱)
-        restored_items = []
-        try:
-            # 1. 가장 넓은 범위의 대괄호 [] 찾기
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                restored_items = json.loads(json_str)
-            else:
-                # 2. 실패 시 개별 객체 {} 찾기
-                matches = re.findall(r'\{.*?\}', content, re.DOTALL)
-                for m in matches:
-                    restored_items.append(json.loads(m))
-        except Exception:
-            pass
-
-        # 구조 정리
-        if isinstance(restored_items, dict):
-            # {"items": [...]} 형태일 경우
-            for val in restored_items.values():
-                if isinstance(val, list):
-                    restored_items = val
-                    break
-            else:
-                restored_items = [restored_items]
-
-        # 최종 정규화
-        normalized = []
-        if isinstance(restored_items, list):
-            for item in restored_items:
-                if isinstance(item, dict):
-                    p_name = str(item.get("product_name", "")).strip()
-                    if not p_name: continue
-                    
-                    normalized.append({
-                        "product_name": p_name,
-                        "quantity": float(item.get("quantity", 1) or 1),
-                        "unit": str(item.get("unit", "개")).strip(),
-                        "category": str(item.get("category", "기타")).strip(),
-                    })
-            
-        return normalized
+        items = parse_refine_response(response['message']['content'])
+        refine_result_cache.put(key, items)
+        return items
     
     except Exception as e:
         print(f"Error in refine_batch_items: {e}")
         return []
-    
-def refine_ingredients_with_llm(ocr_data_list):
+
+# 2-1. 비동기 LLM 호출 (여러 청크를 동시에 보낼 때 사용)
+async def refine_batch_items_async(lines: list):
+    key = refine_cache_key(lines)
+    cached = await refine_result_cache.get_async(key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await llm_client.chat_async(
+            REFINE_MODEL,
+            build_refine_messages(lines),
+            format='json',
+            options=REFINE_OPTIONS
+        )
+        items = parse_refine_response(response['message']['content'])
+        await refine_result_cache.put_async(key, items)
+        return items
+
+    except Exception as e:
+        print(f"Error in refine_batch_items_async: {e}")
+        return []
+
+# OCR 결과에서 LLM에 보낼 줄만 남김
+def _clean_candidates(ocr_data_list) -> list:
+    if isinstance(ocr_data_list, dict) and 'lines' in ocr_data_list:
+        ocr_data_list = ocr_data_list['lines']
+    # 1. Regex 기반 1차 쓰레기 제거 (필수, 줄 목록 전체를 한 번에 검사)
+    clean_candidates = garbage_filter.filter_lines(ocr_data_list)
+    print(f"Processing {len(clean_candidates)} items (Filtered from {len(ocr_data_list)})...")
+    return clean_candidates
+
+# 줄 사전으로 해결되지 않은 줄만 토큰 예산 청크로 나눔
+# 반환: ({줄 위치: 식재료 목록}, [청크별 줄 위치 목록])
+def _plan_refine_chunks(lines: list):
+    resolved, pending = line_dictionary.split(lines)
+    chunks, start = [], 0
+    for chunk in chunk_lines_by_tokens([lines[i] for i in pending]):
+        chunks.append(pending[start:start + len(chunk)])
+        start += len(chunk)
+    print(f"[Line Dictionary] {len(resolved)}/{len(lines)}줄은 사전으로 처리, {len(pending)}줄은 LLM으로 전달")
+    return resolved, chunks
+
+# 청크의 LLM 답을 줄 위치별로 배치하고, 줄 사전에 기록할 행을 반환
+def _assign_chunk_answers(lines: list, indexes: list, items: list, per_line: list) -> list:
+    by_line = {index: [] for index in indexes}
+    unmatched = []
+    for item in items:
+        line = item.get("line")
+        clean = {key: value for key, value in item.items() if key != "line"}
+        if line is not None and 1 <= line <= len(indexes):
+            by_line[indexes[line - 1]].append(clean)
+        else:
+            unmatched.append(clean)
+
+    # 모든 답에 줄 번호가 있을 때만 학습 (답이 없는 줄은 '식재료 아님'으로 기록, 줄 사전에서 유효 기간이 지나면 다시 확인)
+    # - 줄 번호가 없는 답이 하나라도 있으면 그 답이 어느 줄의 것인지 모르므로 청크 전체를 학습하지 않음
+    # - 답이 하나도 없으면(호출 실패 포함) 학습하지 않음
+    rows = []
+    if items and not unmatched:
+        rows = line_dictionary.learn([(lines[index], by_line[index]) for index in indexes])
+
+    for index in indexes:
+        per_line[index] = by_line[index]
+    # 줄 번호가 없는 답은 청크 마지막 줄 뒤에 붙임 (학습하지 않음)
+    per_line[indexes[-1]] = per_line[indexes[-1]] + unmatched
+    return rows
+
+# 앞에서부터 처리가 끝난 줄까지의 결과 (부분 결과도 줄 순서를 지킴)
+def _merged_prefix(per_line: list) -> list:
+    items = []
+    for result in per_line:
+        if result is None:
+            break
+        items.extend(result)
+    return items
+
+# progress_callback(완료 청크 수, 전체 청크 수, 지금까지의 결과): 청크가 끝날 때마다 호출
+def refine_ingredients_with_llm(ocr_data_list, progress_callback=None):
     """
     """
     if not ocr_data_list: return []
 
-    if isinstance(ocr_data_list, dict) and 'lines' in ocr_data_list:
-        ocr_data_list = ocr_data_list['lines']
-    # 1. Regex 기반 1차 쓰레기 제거 (필수)
-    clean_candidates = [item for item in ocr_data_list if not is_garbage_text(item)]
+    lines = _clean_candidates(ocr_data_list)
+    resolved, chunks = _plan_refine_chunks(lines)
+    per_line = [resolved.get(index) for index in range(len(lines))]
+    if progress_callback:
+        progress_callback(0, len(chunks), _merged_prefix(per_line))
 
-    CHUNK_SIZE = 20
-    final_items = []
-    
-    print(f"Processing {len(clean_candidates)} items (Filtered from {len(ocr_data_list)})...")
-    # 2. 배치 처리
-    for i in range(0, len(clean_candidates), CHUNK_SIZE):
-        chunk = clean_candidates[i:i + CHUNK_SIZE]
-        if not chunk: continue
-        
-        items = refine_batch_items(chunk)
-        
-        if items:
-            final_items.extend(items)
+    # 2. 배치 처리 (순차, 사전에 없는 줄만)
+    for done, indexes in enumerate(chunks, start=1):
+        items = refine_batch_items([lines[index] for index in indexes])
+        rows = _assign_chunk_answers(lines, indexes, items, per_line)
+        line_dictionary.persist(rows)
+
+        if progress_callback:
+            progress_callback(done, len(chunks), _merged_prefix(per_line))
             
-    return final_items
+    return _merged_prefix(per_line)
 
-# 레시피 추천용 LLM 함수
-def run_recipe_llm(user_prompt: str):
-   
-    # 레시피 추천 LLM 호출
-    system_prompt = """
+# 비동기 버전: 청크를 최대 parallel 개씩 동시에 보내고, 결과는 원래 줄 순서대로 합침
+async def refine_ingredients_with_llm_async(ocr_data_list, progress_callback=None, parallel: int = REFINE_PARALLEL):
+    if not ocr_data_list: return []
+
+    lines = _clean_candidates(ocr_data_list)
+    resolved, chunks = _plan_refine_chunks(lines)
+    per_line = [resolved.get(index) for index in range(len(lines))]
+    if progress_callback:
+        progress_callback(0, len(chunks), _merged_prefix(per_line))
+
+    slots = asyncio.Semaphore(max(parallel, 1))
+    done = 0
+
+    async def run_chunk(indexes: list) -> None:
+        nonlocal done
+        async with slots:
+            items = await refine_batch_items_async([lines[index] for index in indexes])
+        rows = _assign_chunk_answers(lines, indexes, items, per_line)
+        done += 1
+        if progress_callback:
+            progress_callback(done, len(chunks), _merged_prefix(per_line))
+        await run_in_db_thread(line_dictionary.persist, rows)
+
+    await asyncio.gather(*(run_chunk(indexes) for indexes in chunks))
+    return _merged_prefix(per_line)
+
+# 레시피 추천 시스템 프롬프트
+RECIPE_SYSTEM_PROMPT = """
     너는 가정용 레시피를 연구하는 "전문 요리 연구가"이다. 주어진 재료 목록을 바탕으로 가장 합리적이고 맛있는 레시피를 반환하라.
 
     [출력 규칙(아주 중요)]
@@ -262,17 +383,20 @@ def run_recipe_llm(user_prompt: str):
 
     """
 
-    response = ollama.chat(
-        model="exaone3.5:7.8b",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ],
-        options={"temperature": 0.6, "num_ctx": 4096},
-        keep_alive=0
-    )
-
-    content = response["message"]["content"]
+RECIPE_OPTIONS = {"temperature": 0.6, "num_ctx": 4096}
+
+def build_recipe_messages(user_prompt: str) -> list:
+    return [
+        {"role": "system", "content": RECIPE_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+# 단계 앞의 번호 제거: "1. 끓인다", "1) 끓인다" -> "끓인다"
+def clean_recipe_step(step) -> str:
+    return re.sub(r'^\d+[\.\)]\s*', '', str(step))
+
+# 레시피 응답 파싱 (코드블록 제거 → JSON 파싱 → 실패 시 정규식으로 JSON 부분만 추출)
+def parse_recipe_response(content: str) -> dict:
     content = content.replace("```json", "").replace("```", "").strip()
 
     # 1. JSON 파싱 시도
@@ -299,12 +423,34 @@ def run_recipe_llm(user_prompt: str):
 
     # 2. [공통 로직] steps 번호 제거 (파싱 성공한 data에 대해 수행)
     if "steps" in data and isinstance(data["steps"], list):
-        cleaned_steps = []
-        for step in data["steps"]:
-            # "1. 끓인다", "1) 끓인다" -> "끓인다" 제거
-            clean_step = re.sub(r'^\d+[\.\)]\s*', '', str(step))
-            cleaned_steps.append(clean_step)
-        data["steps"] = cleaned_steps
+        data["steps"] = [clean_recipe_step(step) for step in data["steps"]]
 
     # 3. 최종 반환
-    return data
\ No newline at end of file
+    return data
+
+# 레시피 추천용 LLM 함수
+def run_recipe_llm(user_prompt: str):
+    # 레시피 추천 LLM 호출
+    response = llm_client.chat(RECIPE_MODEL, build_recipe_messages(user_prompt), options=RECIPE_OPTIONS)
+    return parse_recipe_response(response["message"]["content"])
+
+# 레시피 스트리밍: Ollama 스트리밍 응답을 증분 파싱해 완성된 부분부터 (이벤트 이름, 데이터)로 전달
+# - recipe_name / ingredients_main: 값이 완성되면 바로
+# - step: steps 배열의 원소가 하나 완성될 때마다 (번호 제거 적용)
+# - field: 그 밖의 필드 / done: 전체 응답을 기존 규칙으로 파싱한 최종 레시피
+async def stream_recipe_llm(user_prompt: str):
+    parser = IncrementalJSONObjectParser()
+    content = []
+    async for chunk in llm_client.chat_stream_async(RECIPE_MODEL, build_recipe_messages(user_prompt), options=RECIPE_OPTIONS):
+        piece = chunk["message"]["content"]
+        content.append(piece)
+        for event in parser.feed(piece):
+            if event[0] == "item":
+                if event[1] == "steps":
+                    yield "step", {"index": event[2], "text": clean_recipe_step(event[3])}
+            elif event[1] in ("recipe_name", "ingredients_main"):
+                yield event[1], {event[1]: event[2]}
+            elif event[1] != "steps":
+                yield "field", {"key": event[1], "value": event[2]}
+
+    yield "done", parse_recipe_response("".join(content))
@@ -4,7 +4,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List, Optional, Any
 # [수정] refine_batch_items 대신 refine_ingredients_with_llm 임포트
-from .llm_processor import refine_ingredients_with_llm
+from .llm_processor import refine_ingredients_with_llm_async
 
 router = APIRouter()
 
@@ -25,6 +25,7 @@ class IngredientItem(BaseModel):
     category: str
     quantity: float
     unit: str
+    category_tag: Optional[str] = None  # DB Categories 이름으로 변환된 분류
 
 @router.post("/refine", response_model=List[IngredientItem])
 async def refine_from_ocr(payload: OCRLinesPayload):
@@ -35,7 +36,8 @@ async def refine_from_ocr(payload: OCRLinesPayload):
     
     ocr_data_list = [line.model_dump() for line in payload.lines]
 
-    refined_items = refine_ingredients_with_llm(
+    # 청크를 병렬로 보정 (이벤트 루프를 막지 않음)
+    refined_items = await refine_ingredients_with_llm_async(
         ocr_data_list=ocr_data_list
     )
 
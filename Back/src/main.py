@@ -1,10 +1,21 @@
 #main.py (FastAPI 실행 및 API 경로 정의)
 
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware # CORS 미들웨어 import
 from anyio import to_thread
 
-from .db.database import initialize_database # DB 초기화 함수
+from .db.database import initialize_database, init_pool, close_pool # DB 초기화 / 커넥션 풀 관리
+from .db.async_database import shutdown_db_executor # DB 전용 실행기
+from .db.reference_cache import reference_cache # 기준 데이터 캐시
+from .llm.line_dictionary import line_dictionary # 영수증 줄 학습 사전
+from .llm.llm_client import llm_client, LLM_WARM_UP_MODELS # Ollama 모델 상주 관리
+from .ocr.ocr_worker_pool import ocr_pool, OCR_WARM_UP # OCR 전용 프로세스 풀
+from .ocr.ocr_jobs import receipt_jobs # 영수증 처리 작업 관리자
+from .cache.result_cache import close_result_caches # OCR / LLM 결과 캐시
+from .recipes.recipe_cache import recipe_cache, RECIPE_PREGENERATE # 레시피 추천 캐시
+from .recipes.recipe_corpus import recipe_corpus # 로컬 레시피 모음
+from .recipes.llm_recipe_service import pregenerate_recipe
 from contextlib import asynccontextmanager
 
 from .ingredients.ingredients_router import router as ingredients_router
@@ -12,6 +23,7 @@ from .ocr.ocr_router import router as ocr_router
 from .recipes.recipes_router import router as recipes_router
 from .dishes.dishes_router import router as dishes_router
 from .llm.llm_router import router as llm_router
+from .system.system_router import router as system_router
 
 # ---------- Lifespan Context Manager 정의 (Startup/Shutdown 관리) ----------
 @asynccontextmanager
@@ -19,11 +31,38 @@ async def lifespan(app: FastAPI):
     print("FastAPI 서버 시작: 데이터베이스 초기화 작업 시작")
 
     # [수정] 동기 함수를 별도 스레드에서 실행하여 메인 루프 막힘 방지
+    await to_thread.run_sync(init_pool)
     await to_thread.run_sync(initialize_database)
+    await to_thread.run_sync(reference_cache.reload)
+    await to_thread.run_sync(line_dictionary.reload)
+    await to_thread.run_sync(recipe_corpus.reload)
+    ocr_pool.start()
+    # OCR 모델은 백그라운드에서 예열 (서버는 바로 요청을 받고, 상태는 /system/ready 로 확인)
+    if OCR_WARM_UP:
+        ocr_pool.start_warm_up()
+    # LLM 유휴 모델 해제 스케줄러 + 지정한 모델 백그라운드 예열
+    llm_client.start_idle_scheduler()
+    if LLM_WARM_UP_MODELS:
+        llm_warm_up = asyncio.create_task(llm_client.warm_up_async(LLM_WARM_UP_MODELS))
+    # LLM이 한가할 때 최근 요청한 냉장고 구성의 레시피를 미리 생성
+    if RECIPE_PREGENERATE:
+        recipe_cache.start_pregeneration(pregenerate_recipe, llm_client.idle_seconds)
     
     print("FastAPI 서버 시작: 초기화 완료!")
 
     yield
+
+    # 진행 중인 영수증 작업, OCR 워커, DB 전용 실행기 및 풀에 열려 있는 DB 커넥션 정리
+    await receipt_jobs.shutdown()
+    if LLM_WARM_UP_MODELS:
+        llm_warm_up.cancel()
+    await to_thread.run_sync(recipe_cache.stop_pregeneration)
+    await to_thread.run_sync(llm_client.stop_idle_scheduler)
+    await llm_client.aclose()
+    await to_thread.run_sync(ocr_pool.shutdown)
+    await to_thread.run_sync(shutdown_db_executor)
+    close_pool()
+    close_result_caches()
     print("FastAPI 서버 종료")
 
 
@@ -43,6 +82,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count"], # 목록 / 히스토리 페이지 조회 헤더
 )
 
 # ---------- API Endpoints (라우터) ----------
@@ -57,4 +97,6 @@ app.include_router(recipes_router, prefix="/recipes", tags=["Recipes"])
 app.include_router(dishes_router, prefix="/dishes", tags=["Cooked Dishes"])
 # LLM 관련 라우터
 app.include_router(llm_router, prefix="/llm", tags=["AI Processing"])
+# 서버 상태 / 지표 라우터
+app.include_router(system_router, prefix="/system", tags=["System"])
 
@@ -1,19 +1,71 @@
 import cv2
 import numpy as np
-from paddleocr import PaddleOCR
 import os
 import json
+from functools import partial
+from .image_io import ImageBuffer, decode_image
+from .line_grouping import LINE_Y_THRESHOLD, group_lines
+from .model_registry import ModelRegistry, model_registry
+from .receipt_detector import RECEIPT_CROP_ENABLED, crop_receipt
+from .tiling import TILE_ENABLED, ocr_tiled, should_tile
+
+OCR_MODEL_NAME = "paddle_ocr"
+
+# 레지스트리 모델 이름 (장치별로 따로 등록: 레지스트리는 먼저 등록한 로더를 유지하므로 같은 이름이면 다른 장치의 모델을 받게 됨)
+def ocr_model_name(use_gpu: bool = False) -> str:
+    return f"{OCR_MODEL_NAME}:{'gpu' if use_gpu else 'cpu'}"
+
+# PaddleOCR 로더 (paddleocr는 여기서 처음 import: 모듈 import만으로 프레임워크/모델을 올리지 않음)
+def load_paddle_ocr(use_gpu: bool = False):
+    from paddleocr import PaddleOCR
+    print("Loading PaddleOCR model...")
+    return PaddleOCR(lang='korean', device="gpu" if use_gpu else "cpu")
 
 class AdvancedOCRProcessor:
-    def __init__(self, use_gpu=False):
-        print("Loading PaddleOCR model...")
-        self.ocr = PaddleOCR(lang='korean')   # CPU
+    # 모델은 처음 OCR 할 때(또는 warm_up 호출 시) 레지스트리에서 로드
+    def __init__(self, use_gpu=False, registry: ModelRegistry = model_registry):
+        self.use_gpu = use_gpu
+        self.models = registry
+        self.model_name = ocr_model_name(use_gpu)
+        self.models.register(self.model_name, partial(load_paddle_ocr, use_gpu))
         self.DEBUG_MODE = True
+        self.receipt_crop = RECEIPT_CROP_ENABLED
+        self.tiling = TILE_ENABLED
+
+    @property
+    def ocr(self):
+        return self.models.get(self.model_name)
+
+    # 모델 미리 로드 (첫 요청이 모델 로드 시간을 기다리지 않도록)
+    def warm_up(self) -> None:
+        self.models.warm_up([self.model_name])
+
+    # PaddleOCR 1회 실행 → (texts, boxes, scores)
+    @staticmethod
+    def _predict_with(model, image):
+        ocr_result = model.predict(image)
+        if not ocr_result:
+            return [], np.zeros((0, 4)), np.zeros(0)
+        res = ocr_result[0]
+        return list(res["rec_texts"]), res["rec_boxes"], res["rec_scores"]   # [x1, y1, x2, y2]
+
+    def _predict(self, model_name, image):
+        with self.models.use(model_name) as model:
+            return self._predict_with(model, image)
+
+    # 긴 영수증: 겹치는 띠로 나눠 하나의 모델로 차례대로 OCR
+    # (띠마다 모델을 따로 두면 워커 프로세스마다 PaddleOCR 인스턴스가 늘어나므로 동시 실행하지 않음)
+    def _predict_tiled(self, image):
+        return ocr_tiled(image, partial(self._predict, self.model_name))
 
     def process(self, image_path: str) -> dict:
-        # 1) 이미지 로드
+        # 1) 이미지 로드 (파일 경로)
         img_array = np.fromfile(image_path, np.uint8)
-        image = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+        return self.process_bytes(img_array)
+
+    def process_bytes(self, data: ImageBuffer) -> dict:
+        # 1) 이미지 로드 (메모리 버퍼를 복사 없이 바로 디코딩)
+        image = decode_image(data)
         if image is None:
             return {
                 "status": "failure (Image load failed)",
@@ -23,80 +75,41 @@ class AdvancedOCRProcessor:
 
         print("DEBUG: Starting OCR Process (PaddleOCR).")
 
-        # 2) (일단 크롭 없이) 높이만 정규화
-        target_process_height = 1200
-        h, w = image.shape[:2]
-        if h > 0:
-            scale = target_process_height / h
-            new_w = int(w * scale)
-            image = cv2.resize(
-                image, (new_w, target_process_height),
-                interpolation=cv2.INTER_CUBIC
-            )
-
-        # 3) PaddleOCR 실행
-        ocr_result = self.ocr.predict(image)
-        if not ocr_result:
-            return {
-                "status": "success",
-                "line_count": 0,
-                "lines": []
-            }
+        # 2) 영수증 영역만 잘라내기 (축소 사본에서 검출 → 원본 해상도에서 투시 변환, 실패 시 전체 이미지)
+        if self.receipt_crop:
+            image, crop_info = crop_receipt(image)
+            print(f"DEBUG: Receipt crop {crop_info}")
 
-        res = ocr_result[0]
-        texts = res["rec_texts"]
-        boxes = res["rec_boxes"]   # [x1, y1, x2, y2]
-        scores = res["rec_scores"]
-
-        # 4) 각 텍스트에 x/y 중심 좌표 부여
-        items = []
-        for text, box, score in zip(texts, boxes, scores):
-            x1, y1, x2, y2 = box
-            x_center = (x1 + x2) / 2.0
-            y_center = (y1 + y2) / 2.0
-            items.append({
-                "text": text,
-                "x": x_center,
-                "y": y_center,
-                "score": float(score)
-            })
-
-        if not items:
+        # 2-1) 긴 영수증은 읽을 수 있는 배율의 띠로 나눠 OCR (박스는 원본 좌표, 줄 허용 오차는 박스 높이 기준)
+        if self.tiling and should_tile(image):
+            texts, boxes, scores = self._predict_tiled(image)
+            print(f"DEBUG: Tiled OCR merged {len(texts)} boxes.")
+            line_threshold = "adaptive"
+        else:
+            # 2-2) 높이 정규화
+            target_process_height = 1200
+            h, w = image.shape[:2]
+            if h > 0:
+                scale = target_process_height / h
+                new_w = int(w * scale)
+                image = cv2.resize(
+                    image, (new_w, target_process_height),
+                    interpolation=cv2.INTER_CUBIC
+                )
+
+            # 3) PaddleOCR 실행
+            texts, boxes, scores = self._predict(self.model_name, image)
+            line_threshold = LINE_Y_THRESHOLD
+
+        if not texts:
             return {
                 "status": "success",
                 "line_count": 0,
                 "lines": []
             }
 
-        # 5) y 기준 정렬 후, 줄 단위로 묶기
-        items.sort(key=lambda x: x["y"])
-        lines_raw = []
-        threshold = 12  # y 허용 오차
-
-        for item in items:
-            if not lines_raw:
-                lines_raw.append([item])
-                continue
-
-            last_line = lines_raw[-1]
-            last_y = np.mean([t["y"] for t in last_line])
-
-            if abs(item["y"] - last_y) <= threshold:
-                last_line.append(item)
-            else:
-                lines_raw.append([item])
-
-        # 6) 줄 안에서 x 기준 정렬 후 텍스트 합치기
-        lines = []
-        for idx, line in enumerate(lines_raw, start=1):
-            line_sorted = sorted(line, key=lambda x: x["x"])
-            line_text = " ".join(t["text"] for t in line_sorted)
-            avg_score = float(np.mean([t["score"] for t in line_sorted]))
-            lines.append({
-                "index": idx,
-                "text": line_text,
-                "avg_confidence": avg_score
-            })
+        # 4~6) y 기준으로 줄 묶기 → 줄 안에서 x 기준 정렬 후 텍스트 합치기 (배열 연산)
+        lines = group_lines(texts, boxes, scores, line_threshold)
 
         print(f"DEBUG: PaddleOCR grouped {len(lines)} lines.")
 
@@ -0,0 +1,72 @@
+# image_io.py (업로드 이미지를 디스크를 거치지 않고 OCR 워커로 전달)
+
+import io
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import BinaryIO, Iterator, Optional, Union
+
+import cv2
+import numpy as np
+
+ImageBuffer = Union[bytes, bytearray, memoryview]
+
+
+# 메모리 버퍼를 바로 디코딩 (np.frombuffer는 복사 없이 버퍼를 그대로 참조)
+def decode_image(buffer: ImageBuffer) -> Optional[np.ndarray]:
+    img_array = np.frombuffer(buffer, dtype=np.uint8)
+    if img_array.size == 0:
+        return None
+    return cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+
+
+# 업로드 파일 크기 (현재 위치는 유지)
+def get_upload_size(fileobj: BinaryIO) -> int:
+    position = fileobj.tell()
+    fileobj.seek(0, io.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(position)
+    return size
+
+
+# 업로드 내용을 공유 메모리에 한 번만 복사
+# - 메모리에 있는 업로드(SpooledTemporaryFile 내부 BytesIO)는 getbuffer()로 바로 복사
+# - 이미 디스크로 넘어간 업로드는 readinto()로 공유 메모리에 직접 읽어들임
+def copy_upload_to_shared_memory(fileobj: BinaryIO, size: int) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        target = shm.buf[:size]
+        inner = getattr(fileobj, "_file", fileobj)  # SpooledTemporaryFile 내부 파일 객체
+
+        if isinstance(inner, io.BytesIO):
+            source = inner.getbuffer()
+            try:
+                target[:] = source[:size]
+            finally:
+                source.release()
+        else:
+            fileobj.seek(0)
+            read = 0
+            while read < size:
+                count = fileobj.readinto(target[read:])
+                if not count:
+                    break
+                read += count
+
+        target.release()
+        return shm
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+
+
+# (워커 프로세스) 공유 메모리에 올라온 이미지를 복사 없이 참조
+@contextmanager
+def attach_shared_image(name: str, size: int) -> Iterator[memoryview]:
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[:size]
+    try:
+        yield view
+    finally:
+        view.release()
+        shm.close()
@@ -0,0 +1,108 @@
+# line_grouping.py (OCR 텍스트 박스 → 줄 묶기, NumPy 벡터 연산)
+
+import os
+from typing import Any, Dict, List, Sequence, Union
+
+import numpy as np
+
+# 줄 묶기 y 허용 오차: 숫자(px) 또는 "adaptive" (박스 높이 중앙값 x LINE_ADAPTIVE_RATIO)
+LINE_Y_THRESHOLD: Union[float, str] = os.getenv("FRIDGE_OCR_LINE_THRESHOLD", "12")
+LINE_ADAPTIVE_RATIO = float(os.getenv("FRIDGE_OCR_LINE_ADAPTIVE_RATIO", "0.5"))
+
+
+# 박스 높이 중앙값 기반 허용 오차 (해상도/글자 크기에 따라 자동 조정)
+def adaptive_line_threshold(boxes: np.ndarray, ratio: float = LINE_ADAPTIVE_RATIO) -> float:
+    heights = boxes[:, 3] - boxes[:, 1]
+    heights = heights[heights > 0]
+    if heights.size == 0:
+        return 12.0
+    return float(np.median(heights)) * ratio
+
+def resolve_line_threshold(boxes: np.ndarray, threshold: Union[float, str, None] = LINE_Y_THRESHOLD) -> float:
+    if threshold is None or str(threshold).strip().lower() == "adaptive":
+        return adaptive_line_threshold(boxes)
+    return float(threshold)
+
+
+# y 오름차순으로 정렬된 중심 좌표에 줄 번호 부여
+# 규칙(기존과 동일): 현재 줄의 y 평균과의 차이가 threshold 이하면 같은 줄, 아니면 새 줄
+def assign_line_labels(sorted_y: np.ndarray, threshold: float) -> np.ndarray:
+    n = sorted_y.size
+    split = np.empty(n, dtype=bool)
+    split[0] = True
+    # 1) 바로 앞 박스와의 간격이 threshold를 넘으면 반드시 새 줄
+    #    (줄 평균은 앞 박스의 y 이하이므로 평균과의 차이도 threshold를 넘음)
+    split[1:] = np.diff(sorted_y) > threshold
+
+    # 2) 간격이 좁아도 줄 평균에서 조금씩 멀어지는 경우(기울어진 사진) 확인:
+    #    구간 시작부터의 누적 평균과 비교해 위반이 없으면 벡터 연산만으로 끝남
+    segment_id = np.cumsum(split) - 1
+    starts = np.flatnonzero(split)
+    cumsum = np.cumsum(sorted_y)
+    start_of = starts[segment_id]
+    before_start = cumsum[start_of] - sorted_y[start_of]
+
+    idx = np.arange(n)
+    inside = idx > start_of
+    mean_before = np.empty(n)
+    mean_before[inside] = (cumsum[idx[inside] - 1] - before_start[inside]) / (idx[inside] - start_of[inside])
+    drift = np.zeros(n, dtype=bool)
+    drift[inside] = sorted_y[inside] - mean_before[inside] > threshold
+
+    # 3) 위반이 있는 구간만 누적 합/개수로 순차 처리 (O(구간 길이))
+    for segment in np.unique(segment_id[drift]):
+        begin = starts[segment]
+        end = starts[segment + 1] if segment + 1 < starts.size else n
+        total, count = sorted_y[begin], 1
+        for i in range(begin + 1, end):
+            if sorted_y[i] - total / count > threshold:
+                split[i] = True
+                total, count = sorted_y[i], 1
+            else:
+                total += sorted_y[i]
+                count += 1
+
+    return np.cumsum(split) - 1
+
+
+# PaddleOCR 결과(rec_texts / rec_boxes / rec_scores) → 줄 목록
+def group_lines(
+        texts: Sequence[str],
+        boxes: Any,
+        scores: Any,
+        threshold: Union[float, str, None] = LINE_Y_THRESHOLD
+    ) -> List[Dict[str, Any]]:
+
+    n = len(texts)
+    if n == 0:
+        return []
+
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(n, 4)   # [x1, y1, x2, y2]
+    scores = np.asarray(scores, dtype=np.float64).reshape(n)
+    x_center = (boxes[:, 0] + boxes[:, 2]) / 2.0
+    y_center = (boxes[:, 1] + boxes[:, 3]) / 2.0
+
+    # 1) y 기준 정렬 후 줄 번호 부여
+    by_y = np.argsort(y_center, kind="stable")
+    labels = assign_line_labels(y_center[by_y], resolve_line_threshold(boxes, threshold))
+
+    # 2) 줄 번호 → x 순서로 정렬 (lexsort는 마지막 키가 1순위)
+    within = np.lexsort((x_center[by_y], labels))
+    ordered = by_y[within]
+    ordered_labels = labels[within]
+
+    # 3) 줄 경계와 줄별 평균 신뢰도
+    line_starts = np.flatnonzero(np.r_[True, ordered_labels[1:] != ordered_labels[:-1]])
+    counts = np.diff(np.r_[line_starts, n])
+    avg_scores = np.add.reduceat(scores[ordered], line_starts) / counts
+
+    # 4) 줄 안의 텍스트 합치기
+    ordered_texts = [texts[i] for i in ordered]
+    lines = []
+    for idx, (start, count, avg_score) in enumerate(zip(line_starts, counts, avg_scores), start=1):
+        lines.append({
+            "index": idx,
+            "text": " ".join(ordered_texts[start:start + count]),
+            "avg_confidence": float(avg_score)
+        })
+    return lines
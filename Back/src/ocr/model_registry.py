@@ -0,0 +1,210 @@
+# model_registry.py (무거운 모델을 처음 사용할 때 한 번만 로드하는 레지스트리: 예열 / 유휴 해제 지원)
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# 마지막 사용 후 이 시간(초)이 지나면 모델 해제 (0이면 해제하지 않음)
+MODEL_IDLE_SECONDS = float(os.getenv("FRIDGE_MODEL_IDLE_SECONDS", "0"))
+# 유휴 모델 확인 주기(초)
+MODEL_REAPER_INTERVAL = float(os.getenv("FRIDGE_MODEL_REAPER_INTERVAL", "30"))
+
+# 모델 상태
+STATE_UNLOADED = "unloaded"
+STATE_LOADING = "loading"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+
+class _ModelEntry:
+    # 모델 하나의 로더 / 인스턴스 / 상태
+    def __init__(self, loader: Callable[[], Any]):
+        self.loader = loader
+        self.lock = threading.Lock()   # 로드는 모델별로 한 번만
+        self.model: Any = None
+        self.state = STATE_UNLOADED
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.loads = 0
+        self.uses = 0
+        self.in_use = 0
+        self.last_used = 0.0
+
+
+class ModelRegistry:
+    """
+    이름 → 로더 함수로 등록해 두고, 처음 사용할 때 스레드 안전하게 한 번만 로드하는 모델 저장소.
+    - warm_up()으로 미리(백그라운드) 로드할 수 있습니다.
+    - 사용 중이 아닌 모델이 idle_seconds 이상 쓰이지 않으면 해제하여 메모리를 돌려받습니다.
+    - on_change(name, state) 콜백으로 상태 변화를 외부(예: 부모 프로세스 공유 카운터)에 알립니다.
+    """
+
+    def __init__(
+            self,
+            idle_seconds: float = MODEL_IDLE_SECONDS,
+            on_change: Optional[Callable[[str, str], None]] = None
+        ):
+        self.idle_seconds = idle_seconds
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._reaper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # 로더 등록 (이미 있으면 유지)
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        with self._lock:
+            if name not in self._entries:
+                self._entries[name] = _ModelEntry(loader)
+
+    def is_registered(self, name: str) -> bool:
+        with self._lock:
+            return name in self._entries
+
+    def _entry(self, name: str) -> _ModelEntry:
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 모델입니다: {name}")
+        return entry
+
+    def _notify(self, name: str, state: str) -> None:
+        if self.on_change is not None:
+            self.on_change(name, state)
+
+    # (entry.lock 안에서 호출) 로드되어 있지 않으면 로드
+    def _load_locked(self, name: str, entry: _ModelEntry) -> Any:
+        if entry.model is not None:
+            return entry.model
+
+        entry.state = STATE_LOADING
+        started = time.perf_counter()
+        try:
+            model = entry.loader()
+        except Exception as e:
+            entry.state = STATE_FAILED
+            entry.error = str(e)
+            self._notify(name, STATE_FAILED)
+            raise
+
+        entry.model = model
+        entry.state = STATE_READY
+        entry.error = None
+        entry.load_seconds = round(time.perf_counter() - started, 3)
+        entry.loads += 1
+        entry.last_used = time.monotonic()
+        print(f"모델 로드 완료: {name} ({entry.load_seconds}s)")
+        self._notify(name, STATE_READY)
+        return model
+
+    # 모델 가져오기 (처음이면 로드, 같은 모델을 동시에 요청해도 로드는 한 번)
+    def get(self, name: str) -> Any:
+        entry = self._entry(name)
+        model = entry.model
+        if model is None:
+            with entry.lock:
+                model = self._load_locked(name, entry)
+        entry.uses += 1
+        entry.last_used = time.monotonic()
+        return model
+
+    # 사용하는 동안 유휴 해제 대상에서 제외
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        entry = self._entry(name)
+        with entry.lock:
+            model = self._load_locked(name, entry)
+            entry.in_use += 1
+        entry.uses += 1
+        try:
+            yield model
+        finally:
+            with entry.lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    # 등록된 모델 미리 로드 (background=True면 스레드로 실행하고 바로 반환)
+    def warm_up(self, names: Optional[List[str]] = None, background: bool = False) -> Optional[threading.Thread]:
+        with self._lock:
+            targets = list(names) if names is not None else list(self._entries)
+
+        def _run() -> None:
+            for name in targets:
+                try:
+                    entry = self._entry(name)
+                    with entry.lock:
+                        self._load_locked(name, entry)
+                except Exception as e:
+                    print(f"경고: 모델 예열 실패 - {name}: {e}")
+
+        if not background:
+            _run()
+            return None
+        thread = threading.Thread(target=_run, name="model-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    # 모델 해제 (사용 중이면 해제하지 않음)
+    def unload(self, name: str) -> bool:
+        entry = self._entry(name)
+        with entry.lock:
+            if entry.model is None or entry.in_use:
+                return False
+            entry.model = None
+            entry.state = STATE_UNLOADED
+        print(f"모델 해제: {name}")
+        self._notify(name, STATE_UNLOADED)
+        return True
+
+    # 오래 쓰이지 않은 모델 해제, 해제한 이름 목록 반환
+    def unload_idle(self, idle_seconds: Optional[float] = None) -> List[str]:
+        idle_seconds = self.idle_seconds if idle_seconds is None else idle_seconds
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                name for name, entry in self._entries.items()
+                if entry.model is not None and not entry.in_use and now - entry.last_used >= idle_seconds
+            ]
+        return [name for name in candidates if self.unload(name)]
+
+    # 유휴 모델을 주기적으로 해제하는 백그라운드 스레드 시작 (idle_seconds가 0이면 시작하지 않음)
+    def start_idle_reaper(self, interval: float = MODEL_REAPER_INTERVAL) -> None:
+        if self.idle_seconds <= 0 or self._reaper is not None:
+            return
+
+        def _loop() -> None:
+            while not self._stop.wait(interval):
+                self.unload_idle()
+
+        self._reaper = threading.Thread(target=_loop, name="model-idle-reaper", daemon=True)
+        self._reaper.start()
+
+    def stop_idle_reaper(self) -> None:
+        self._stop.set()
+        if self._reaper is not None:
+            self._reaper.join(timeout=1)
+            self._reaper = None
+        self._stop.clear()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = list(self._entries.items())
+        now = time.monotonic()
+        return {
+            name: {
+                "state": entry.state,
+                "load_seconds": entry.load_seconds,
+                "loads": entry.loads,
+                "uses": entry.uses,
+                "in_use": entry.in_use,
+                "idle_seconds": round(now - entry.last_used, 1) if entry.model is not None else None,
+                "error": entry.error,
+            }
+            for name, entry in entries
+        }
+
+
+# 프로세스 전역 모델 레지스트리 (OCR 워커 프로세스마다 하나)
+model_registry = ModelRegistry()
@@ -0,0 +1,216 @@
+# ocr_jobs.py (영수증 처리 작업 큐: 즉시 작업 ID 반환 → 상태 조회로 진행률/부분 결과 확인)
+
+import asyncio
+import os
+import time
+import uuid
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+from .ocr_worker_pool import ocr_pool, OCRWorkerPool, OCRPoolBusyError
+from ..llm.llm_processor import refine_ingredients_with_llm_async
+
+# 동시에 OCR / LLM 보정 단계를 실행할 작업 수
+OCR_JOB_OCR_CONCURRENCY = int(os.getenv("FRIDGE_OCR_JOB_OCR_CONCURRENCY", "0"))  # 0이면 OCR 워커 수와 동일
+OCR_JOB_LLM_CONCURRENCY = int(os.getenv("FRIDGE_OCR_JOB_LLM_CONCURRENCY", "2"))
+# 끝나지 않은 작업의 최대 수 (초과 시 503)
+OCR_JOB_MAX_PENDING = int(os.getenv("FRIDGE_OCR_JOB_MAX_PENDING", "32"))
+# 끝난 작업 결과 보관 시간(초) / 최대 보관 개수
+OCR_JOB_TTL = float(os.getenv("FRIDGE_OCR_JOB_TTL", "600"))
+OCR_JOB_MAX_RETAINED = int(os.getenv("FRIDGE_OCR_JOB_MAX_RETAINED", "256"))
+
+# 작업 단계
+STAGE_QUEUED = "queued"
+STAGE_OCR = "ocr"
+STAGE_REFINING = "refining"
+STAGE_DONE = "done"
+STAGE_FAILED = "failed"
+FINISHED_STAGES = (STAGE_DONE, STAGE_FAILED)
+
+
+class ReceiptJob:
+    # 영수증 한 장의 처리 상태
+    def __init__(self, job_id: str, filename: str):
+        self.id = job_id
+        self.filename = filename
+        self.stage = STAGE_QUEUED
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finished_at: Optional[float] = None
+
+        self.line_count = 0
+        self.chunks_done = 0
+        self.chunks_total = 0
+        self.items: List[Dict[str, Any]] = []   # 지금까지 보정된 식재료 (부분 결과)
+        self.error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.stage in FINISHED_STAGES
+
+    def set_stage(self, stage: str) -> None:
+        self.stage = stage
+        self.updated_at = time.time()
+        if stage in FINISHED_STAGES:
+            self.finished_at = self.updated_at
+
+    # LLM 보정 진행률 갱신 (청크가 끝날 때마다 호출)
+    def on_refine_progress(self, done: int, total: int, items: List[Dict[str, Any]]) -> None:
+        self.chunks_done = done
+        self.chunks_total = total
+        self.items = items
+        self.updated_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "filename": self.filename,
+            "stage": self.stage,
+            "line_count": self.line_count,
+            "chunks_done": self.chunks_done,
+            "chunks_total": self.chunks_total,
+            "items": self.items,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ReceiptJobManager:
+    """
+    영수증 처리 작업을 이벤트 루프 안의 asyncio 태스크로 실행하는 스케줄러.
+    - 요청마다 스레드를 만들지 않고, OCR 단계는 OCR 프로세스 풀, LLM 단계는 비동기 Ollama 클라이언트로 실행합니다.
+    - 끝난 작업은 ttl 초 동안(최대 max_retained 개) 보관한 뒤 조회 시점에 정리합니다.
+    """
+
+    def __init__(
+            self,
+            pool: OCRWorkerPool = ocr_pool,
+            ocr_concurrency: int = OCR_JOB_OCR_CONCURRENCY,
+            llm_concurrency: int = OCR_JOB_LLM_CONCURRENCY,
+            max_pending: int = OCR_JOB_MAX_PENDING,
+            ttl: float = OCR_JOB_TTL,
+            max_retained: int = OCR_JOB_MAX_RETAINED
+        ):
+        self.pool = pool
+        self.ocr_concurrency = ocr_concurrency or pool.workers
+        self.llm_concurrency = max(llm_concurrency, 1)
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.max_retained = max_retained
+
+        self._jobs: Dict[str, ReceiptJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._ocr_slots: Optional[asyncio.Semaphore] = None
+        self._llm_slots: Optional[asyncio.Semaphore] = None
+
+        # 지표
+        self._submitted = 0
+        self._rejected = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def is_full(self) -> bool:
+        return self.pending >= self.max_pending
+
+    # 작업 등록 (이미지는 공유 메모리로 넘겨받고, 작업이 끝나면 해제)
+    def submit(self, shm: shared_memory.SharedMemory, size: int, filename: str) -> ReceiptJob:
+        self.purge_expired()
+        if self.is_full():
+            self._rejected += 1
+            shm.close()
+            shm.unlink()
+            raise OCRPoolBusyError(self.pool.retry_after)
+
+        if self._ocr_slots is None:
+            self._ocr_slots = asyncio.Semaphore(self.ocr_concurrency)
+            self._llm_slots = asyncio.Semaphore(self.llm_concurrency)
+
+        job = ReceiptJob(uuid.uuid4().hex, filename)
+        self._jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job, shm, size))
+        self._submitted += 1
+        return job
+
+    # 작업 조회 (없거나 만료되었으면 None)
+    def get(self, job_id: str) -> Optional[ReceiptJob]:
+        self.purge_expired()
+        return self._jobs.get(job_id)
+
+    async def _run(self, job: ReceiptJob, shm: shared_memory.SharedMemory, size: int) -> None:
+        try:
+            # 1. OCR (프로세스 풀이 거절하지 않도록 동시 실행 수를 워커 수에 맞춤)
+            async with self._ocr_slots:
+                job.set_stage(STAGE_OCR)
+                shared, shm = shm, None   # 이후 해제는 process_shared가 담당
+                ocr_result = await self.pool.process_shared(shared, size)
+
+            if ocr_result is None:
+                raise ValueError("이미지를 읽을 수 없거나 파일이 손상되었습니다.")
+
+            raw_lines = ocr_result.get("lines", [])
+            text_only_lines = [
+                line['text'] if isinstance(line, dict) and 'text' in line else str(line)
+                for line in raw_lines
+            ]
+            job.line_count = len(text_only_lines)
+
+            # 2. LLM 보정 (청크가 끝날 때마다 진행률과 부분 결과 갱신)
+            async with self._llm_slots:
+                job.set_stage(STAGE_REFINING)
+                job.items = await refine_ingredients_with_llm_async(text_only_lines, job.on_refine_progress)
+            job.set_stage(STAGE_DONE)
+
+        except asyncio.CancelledError:
+            job.error = "서버 종료로 작업이 취소되었습니다."
+            job.set_stage(STAGE_FAILED)
+            raise
+        except Exception as e:
+            print(f"영수증 작업 {job.id} 처리 중 오류 발생: {e}")
+            job.error = str(e)
+            job.set_stage(STAGE_FAILED)
+        finally:
+            # OCR 단계에 들어가기 전에 끝난 경우에도 공유 메모리 해제
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            self._tasks.pop(job.id, None)
+
+    # 보관 기간이 지난 작업 정리 (개수 한도를 넘으면 오래된 것부터)
+    def purge_expired(self) -> None:
+        now = time.time()
+        finished = [job for job in self._jobs.values() if job.finished]
+        for job in finished:
+            if now - job.finished_at > self.ttl:
+                del self._jobs[job.id]
+
+        finished = sorted((job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at)
+        for job in finished[:max(len(finished) - self.max_retained, 0)]:
+            del self._jobs[job.id]
+
+    # 서버 종료 시 진행 중인 작업 취소
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        stages: Dict[str, int] = {}
+        for job in self._jobs.values():
+            stages[job.stage] = stages.get(job.stage, 0) + 1
+        return {
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "retained": len(self._jobs),
+            "submitted": self._submitted,
+            "rejected": self._rejected,
+            "stages": stages,
+        }
+
+
+# 프로세스 전역 작업 관리자
+receipt_jobs = ReceiptJobManager()
@@ -1,21 +1,59 @@
 # ocr_router.py
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from ..ocr.OCR_processor import AdvancedOCRProcessor # 기존 OCR 함수
-from ..llm.llm_processor import refine_ingredients_with_llm # <--- [핵심] LLM 처리기 가져오기
+from fastapi import APIRouter, UploadFile, File, HTTPException, status
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from .ocr_worker_pool import ocr_pool, OCRPoolBusyError # OCR 전용 프로세스 풀
+from .ocr_jobs import receipt_jobs # 영수증 처리 작업 관리자
+from .image_io import get_upload_size, copy_upload_to_shared_memory
+from ..llm.llm_processor import refine_ingredients_with_llm_async # <--- [핵심] LLM 처리기 가져오기
 import shutil
 import os
 import uuid
 
 router = APIRouter()
 
-# 임시 저장소 설정
+# 임시 저장소 설정 (대용량 업로드를 디스크로 넘기는 옵션을 켰을 때만 사용)
 UPLOAD_DIR = "temp_uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-# [중요] OCR 프로세서 인스턴스 생성 (서버 시작 시 한 번만 로드)
-# 전역 변수로 관리하여 매 요청마다 모델을 다시 로드하지 않게 합니다.
-ocr_processor = AdvancedOCRProcessor(use_gpu=True) 
+# 이 크기(바이트)를 넘는 업로드만 디스크에 저장 후 처리 (0이면 항상 메모리에서 처리)
+OCR_SPILL_THRESHOLD = int(os.getenv("FRIDGE_OCR_SPILL_BYTES", "0"))
+
+# 업로드 처리 통계 (요청당 복사 바이트 수 확인용)
+ingest_stats = {"requests": 0, "bytes_in_memory": 0, "bytes_spilled": 0, "spilled_requests": 0}
+
+# [중요] OCR 모델은 ocr_pool의 워커 프로세스마다 한 번만 로드됩니다.
+# 추론이 이벤트 루프 밖에서 실행되므로 OCR 중에도 다른 요청이 멈추지 않습니다.
+
+# 대기열이 가득 찼을 때의 응답 (503 + Retry-After)
+def _busy_exception(e: OCRPoolBusyError) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+# 업로드 파일 검증 (이미지 타입 + 확장자)
+def _validate_image_upload(file: UploadFile) -> None:
+    if not file.content_type or not file.content_type.startswith("image/"):
+        raise HTTPException(
+            status_code=400, 
+            detail=f"이미지 파일만 업로드 가능합니다. (받은 타입: {file.content_type})"
+        )
+    if not file.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.heic')):
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
+
+
+# 작업 상태 응답 스키마
+class OCRJobStatus(BaseModel):
+    job_id: str
+    filename: str
+    stage: str                      # queued -> ocr -> refining -> done / failed
+    line_count: int
+    chunks_done: int
+    chunks_total: int
+    items: List[Dict[str, Any]]     # 지금까지 보정된 식재료 (refining 중에는 부분 결과)
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+    finished_at: Optional[float] = None
+
 
 @router.post("/receipt", summary="영수증 이미지 OCR")
 async def analyze_receipt(file: UploadFile = File(...)):
@@ -25,27 +63,33 @@ async def analyze_receipt(file: UploadFile = File(...)):
     print(f"타입: {file.content_type}")
     print(f"==================================")
     # image/jpeg, image/png 이미지 파일 허용
-    if not file.content_type.startswith("image/"):
-        raise HTTPException(
-            status_code=400, 
-            detail=f"이미지 파일만 업로드 가능합니다. (받은 타입: {file.content_type})"
-        )
+    _validate_image_upload(file)
+
+    file_path = None
+    size = get_upload_size(file.file)
 
-    # 확장자도 체크
-    filename = file.filename.lower()
-    if not filename.endswith(('.png', '.jpg', '.jpeg', '.heic')):
-         raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
-    # 파일명 충돌 방지
-    unique_filename = f"{uuid.uuid4()}_{file.filename}"
-    file_path = os.path.join(UPLOAD_DIR, unique_filename)
+    # 대용량 업로드는 캐시를 거치지 않으므로 대기열이 가득 찼으면 디스크에 저장하기 전에 바로 거절
+    # (그 외에는 캐시에 있는 이미지를 먼저 찾고 OCR 이 필요할 때 풀에서 거절)
+    spill = bool(OCR_SPILL_THRESHOLD and size > OCR_SPILL_THRESHOLD)
+    if spill and ocr_pool.is_full():
+        raise _busy_exception(OCRPoolBusyError(ocr_pool.retry_after))
+    ingest_stats["requests"] += 1
 
     try:
-        # 1. 서버에 임시 저장
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        if spill:
+            # 1-a. 대용량 업로드: 서버에 임시 저장 후 경로 전달
+            os.makedirs(UPLOAD_DIR, exist_ok=True)
+            file_path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4()}_{os.path.basename(file.filename)}")
+            with open(file_path, "wb") as buffer:
+                shutil.copyfileobj(file.file, buffer)
+            ingest_stats["bytes_spilled"] += size
+            ingest_stats["spilled_requests"] += 1
 
-        # 2. 통합 OCR 프로세서 실행 (.process 메서드 호출)
-        ocr_result = ocr_processor.process(file_path)
+            ocr_result = await ocr_pool.process(file_path)
+        else:
+            # 1-b. 기본: 업로드 버퍼를 공유 메모리로 한 번만 복사하여 워커에서 바로 디코딩
+            ingest_stats["bytes_in_memory"] += size
+            ocr_result = await ocr_pool.process_upload(file.file, size)
 
         if ocr_result is None:
             raise HTTPException(status_code=400, detail="이미지를 읽을 수 없거나 파일이 손상되었습니다.")
@@ -61,7 +105,7 @@ async def analyze_receipt(file: UploadFile = File(...)):
         # [추가됨] 3. LLM 보정 수행
         # ---------------------------------------------------------
         print(f"[Debug] LLM에 전달되는 데이터: {text_only_lines[:3]}...") # 로그 확인 필수
-        refined_data = refine_ingredients_with_llm(text_only_lines)
+        refined_data = await refine_ingredients_with_llm_async(text_only_lines)
         
         print(f"[Server] LLM 보정 완료. {len(refined_data)}개 식재료 추출됨.")
         # ---------------------------------------------------------
@@ -71,11 +115,43 @@ async def analyze_receipt(file: UploadFile = File(...)):
             "data": refined_data        # [핵심] LLM이 정제한 최종 식재료 JSON 리스트
         }
 
+    except OCRPoolBusyError as e:
+        raise _busy_exception(e)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"처리 중 오류 발생: {e}")
         raise HTTPException(status_code=500, detail=f"서버 처리 실패: {str(e)}")
         
     finally:
-        # 5. 임시 파일 삭제
-        if os.path.exists(file_path):
-            os.remove(file_path)
\ No newline at end of file
+        # 5. 임시 파일 삭제 (디스크에 저장한 경우만)
+        if file_path and os.path.exists(file_path):
+            os.remove(file_path)
+
+# POST /ocr/jobs (영수증 처리 작업 등록: 작업 ID를 바로 반환)
+@router.post("/jobs", response_model=OCRJobStatus, status_code=status.HTTP_202_ACCEPTED, summary="영수증 처리 작업 등록")
+async def create_receipt_job(file: UploadFile = File(...)):
+    _validate_image_upload(file)
+    if receipt_jobs.is_full():
+        raise _busy_exception(OCRPoolBusyError(ocr_pool.retry_after))
+
+    # 요청이 끝나면 업로드 파일이 닫히므로 공유 메모리로 옮겨 작업에 넘김
+    size = get_upload_size(file.file)
+    shm = copy_upload_to_shared_memory(file.file, size)
+    ingest_stats["requests"] += 1
+    ingest_stats["bytes_in_memory"] += size
+
+    try:
+        job = receipt_jobs.submit(shm, size, file.filename)
+    except OCRPoolBusyError as e:
+        raise _busy_exception(e)
+    return job.to_dict()
+
+
+# GET /ocr/jobs/{job_id} (작업 단계, 진행률, 부분 결과 조회)
+@router.get("/jobs/{job_id}", response_model=OCRJobStatus, summary="영수증 처리 작업 상태 조회")
+async def get_receipt_job(job_id: str):
+    job = receipt_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없거나 보관 기간이 지났습니다.")
+    return job.to_dict()
@@ -0,0 +1,259 @@
+# ocr_worker_pool.py (OCR 전용 프로세스 풀)
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+from .image_io import attach_shared_image, copy_upload_to_shared_memory
+from ..cache.result_cache import ResultCache, make_cache_key, ocr_result_cache
+
+# OCR 워커 프로세스 수 / 대기열 크기 / 과부하 시 재시도 안내(초)
+OCR_POOL_SIZE = int(os.getenv("FRIDGE_OCR_WORKERS", "1"))
+OCR_QUEUE_SIZE = int(os.getenv("FRIDGE_OCR_QUEUE_SIZE", "4"))
+OCR_RETRY_AFTER = int(os.getenv("FRIDGE_OCR_RETRY_AFTER", "10"))
+# 서버 시작 시 워커 프로세스에서 OCR 모델을 미리 로드할지 여부 / GPU 사용 여부
+OCR_WARM_UP = os.getenv("FRIDGE_OCR_WARM_UP", "1") not in ("0", "false", "False")
+OCR_USE_GPU = os.getenv("FRIDGE_OCR_USE_GPU", "0") in ("1", "true", "True")
+
+
+class OCRPoolBusyError(Exception):
+    # 실행 중 + 대기 중인 작업이 한도에 도달했을 때 발생
+    def __init__(self, retry_after: int):
+        super().__init__(f"OCR 처리 대기열이 가득 찼습니다. {retry_after}초 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+
+
+# 기본 OCR 프로세서 생성 (워커 프로세스 안에서만 생성, 모델은 첫 OCR 또는 예열 시 로드)
+def create_default_processor():
+    from .OCR_processor import AdvancedOCRProcessor
+    return AdvancedOCRProcessor(use_gpu=OCR_USE_GPU)
+
+
+# ---------- 워커 프로세스 측 ----------
+
+# 워커 프로세스마다 하나씩 보관하는 OCR 프로세서
+_worker_processor = None
+
+# loaded_models: 모든 워커가 공유하는 '로드된 모델 수' 카운터 (부모 프로세스의 준비 상태 확인용)
+def _init_worker(processor_factory: Callable[[], Any], loaded_models: Any = None) -> None:
+    global _worker_processor
+    from .model_registry import STATE_READY, STATE_UNLOADED, model_registry
+
+    if loaded_models is not None:
+        def _on_change(name: str, state: str) -> None:
+            delta = {STATE_READY: 1, STATE_UNLOADED: -1}.get(state, 0)
+            if delta:
+                with loaded_models.get_lock():
+                    loaded_models.value += delta
+        model_registry.on_change = _on_change
+    model_registry.start_idle_reaper()
+
+    _worker_processor = processor_factory()
+
+def _warm_up_worker() -> bool:
+    warm_up = getattr(_worker_processor, "warm_up", None)
+    if warm_up is not None:
+        warm_up()
+    return True
+
+def _run_ocr(image_path: str) -> dict:
+    return _worker_processor.process(image_path)
+
+def _run_ocr_shared(shm_name: str, size: int) -> dict:
+    with attach_shared_image(shm_name, size) as buffer:
+        return _worker_processor.process_bytes(buffer)
+
+
+# ---------- 서버(이벤트 루프) 측 ----------
+
+class OCRWorkerPool:
+    """
+    OCR 추론을 이벤트 루프 밖의 전용 프로세스에서 실행하는 풀.
+    - 워커 프로세스마다 자체 PaddleOCR 인스턴스를 보유합니다.
+    - 실행 중 + 대기 중인 작업 수가 workers + queue_size 를 넘으면 OCRPoolBusyError 를 발생시킵니다.
+    - 워커가 비정상 종료(크래시, OOM)되면 그때 실행 중이던 요청만 실패시키고 새 워커로 풀을 다시 만듭니다.
+    """
+
+    def __init__(
+            self,
+            workers: int = OCR_POOL_SIZE,
+            queue_size: int = OCR_QUEUE_SIZE,
+            processor_factory: Callable[[], Any] = create_default_processor,
+            retry_after: int = OCR_RETRY_AFTER,
+            result_cache: Optional[ResultCache] = None
+        ):
+        if workers < 1:
+            raise ValueError("OCR 워커 수는 1 이상이어야 합니다.")
+
+        self.workers = workers
+        self.queue_size = max(queue_size, 0)
+        self.processor_factory = processor_factory
+        self.retry_after = retry_after
+        self.result_cache = result_cache   # 같은 이미지를 다시 올리면 OCR을 건너뜀
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._loaded_models = self._mp_context.Value("i", 0)
+        self._warm_state = "not_started"   # not_started / warming / ready / failed
+        self._warm_error: Optional[str] = None
+        self._warm_task: Optional[asyncio.Task] = None
+
+        # 지표
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._restarts = 0       # 워커 비정상 종료로 풀을 다시 만든 횟수
+        self._bytes_shared = 0   # 업로드 → 공유 메모리로 복사한 바이트 수
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.queue_size
+
+    # 워커 프로세스 시작 (PaddleOCR 등 스레드를 쓰는 라이브러리를 위해 spawn 사용)
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._mp_context,
+                initializer=_init_worker,
+                initargs=(self.processor_factory, self._loaded_models),
+            )
+
+    def shutdown(self) -> None:
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            self._warm_task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        with self._loaded_models.get_lock():
+            self._loaded_models.value = 0
+        self._warm_state = "not_started"
+        self._warm_error = None
+
+    # 깨진 풀(BrokenProcessPool) 교체: 같은 풀에서 실패한 요청이 여럿이어도 한 번만 교체
+    def _restart_broken(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is not executor:
+            return
+        print("경고: OCR 워커 프로세스가 비정상 종료되어 워커 풀을 다시 시작합니다.")
+        self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        with self._loaded_models.get_lock():
+            self._loaded_models.value = 0   # 죽은 워커의 모델은 사라졌으므로 다음 OCR 에서 다시 로드
+        self._restarts += 1
+        self.start()
+
+    # 워커마다 OCR 모델 미리 로드 (요청 한도와 별개로 워커 수만큼 예열 작업 제출)
+    async def warm_up(self) -> None:
+        self.start()
+        executor = self._executor
+        self._warm_state = "warming"
+        self._warm_error = None
+        try:
+            await asyncio.gather(*(
+                asyncio.wrap_future(executor.submit(_warm_up_worker)) for _ in range(self.workers)
+            ))
+            self._warm_state = "ready"
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                self._restart_broken(executor)
+            self._warm_state = "failed"
+            self._warm_error = str(e) or type(e).__name__
+            print(f"경고: OCR 모델 예열 실패 - {e}")
+
+    # 서버 시작을 막지 않도록 예열을 백그라운드 작업으로 실행
+    def start_warm_up(self) -> None:
+        if self._warm_task is None or self._warm_task.done():
+            self._warm_task = asyncio.get_running_loop().create_task(self.warm_up())
+
+    # 준비 상태: 예열을 마쳤거나 하지 않았으면 요청을 받을 수 있음 (예열을 안 했다면 첫 요청이 모델을 로드)
+    # - 예열 중이거나 예열이 실패하면(모델 로드 불가 등) 준비되지 않음, 실패 사유는 error
+    def readiness(self) -> Dict[str, Any]:
+        return {
+            "ready": self._warm_state in ("not_started", "ready"),
+            "warm_up": self._warm_state,
+            "error": self._warm_error,
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "models_loaded": self._loaded_models.value,
+        }
+
+    # 새 작업을 받을 수 있는지 여부
+    def is_full(self) -> bool:
+        return self._in_flight >= self.capacity
+
+    # 워커 프로세스에서 함수 실행 (한도 초과 시 즉시 거절)
+    async def submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.is_full():
+            self._rejected += 1
+            raise OCRPoolBusyError(self.retry_after)
+
+        self.start()
+        executor = self._executor
+        self._in_flight += 1
+        try:
+            result = await asyncio.wrap_future(executor.submit(func, *args))
+            self._completed += 1
+            return result
+        except BrokenProcessPool:
+            # 이 요청만 실패로 돌려주고, 다음 요청은 새 워커에서 처리
+            self._failed += 1
+            self._restart_broken(executor)
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+    # 영수증 이미지 OCR (파일 경로)
+    async def process(self, image_path: str) -> dict:
+        return await self.submit(_run_ocr, image_path)
+
+    # 영수증 이미지 OCR (업로드 파일 객체 → 공유 메모리 1회 복사, 디스크 미사용)
+    # 풀이 가득 차도 캐시에 있는 이미지는 바로 반환 (한도 확인은 캐시를 찾은 뒤 submit 에서)
+    async def process_upload(self, fileobj: BinaryIO, size: int) -> dict:
+        shm = copy_upload_to_shared_memory(fileobj, size)
+        self._bytes_shared += size
+        return await self.process_shared(shm, size)
+
+    # 이미 공유 메모리에 올라온 이미지 OCR (끝나면 공유 메모리 해제)
+    async def process_shared(self, shm: shared_memory.SharedMemory, size: int) -> dict:
+        try:
+            if self.result_cache is None:
+                return await self.submit(_run_ocr_shared, shm.name, size)
+
+            with shm.buf[:size] as image:
+                key = make_cache_key("ocr", image)
+            cached = await self.result_cache.get_async(key)
+            if cached is not None:
+                return cached
+
+            result = await self.submit(_run_ocr_shared, shm.name, size)
+            if isinstance(result, dict) and result.get("status") == "success":
+                await self.result_cache.put_async(key, result)
+            return result
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "restarts": self._restarts,
+            "bytes_shared": self._bytes_shared,
+        }
+
+
+# 프로세스 전역 OCR 풀 (워커는 서버 시작 시 또는 첫 요청 시 생성)
+ocr_pool = OCRWorkerPool(result_cache=ocr_result_cache)
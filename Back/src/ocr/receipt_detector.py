@@ -0,0 +1,120 @@
+# receipt_detector.py (영수증 영역 검출 → 투시 변환으로 잘라내기, OCR 전처리)
+# test/image/temp.py 의 process_receipt_final 을 서비스용으로 옮긴 것 (imutils 없이 OpenCV만 사용)
+
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# 영수증 잘라내기 사용 여부 (기본 꺼짐: test/bench_receipt_crop.py 로 실제 영수증에서 확인한 뒤 FRIDGE_OCR_RECEIPT_CROP=1 로 켬)
+RECEIPT_CROP_ENABLED = os.getenv("FRIDGE_OCR_RECEIPT_CROP", "0") not in ("0", "false", "False")
+# 검출은 이 높이로 축소한 사본에서 수행 (원본 해상도와 무관하게 일정한 비용)
+RECEIPT_DETECT_HEIGHT = int(os.getenv("FRIDGE_OCR_DETECT_HEIGHT", "500"))
+# 검출 영역이 원본 면적의 이 비율보다 작으면 노이즈로 보고 전체 이미지 사용
+RECEIPT_MIN_AREA_RATIO = float(os.getenv("FRIDGE_OCR_CROP_MIN_AREA", "0.15"))
+# 검출 영역이 이 비율보다 크면 잘라내도 줄어드는 픽셀이 거의 없으므로 전체 이미지 사용
+RECEIPT_MAX_AREA_RATIO = float(os.getenv("FRIDGE_OCR_CROP_MAX_AREA", "0.95"))
+# 잘라낸 결과의 최소 크기 (px)
+RECEIPT_MIN_SIDE = 100
+
+_DILATE_KERNEL = np.ones((5, 5), np.uint8)
+
+
+# 네 점을 [좌상, 우상, 우하, 좌하] 순서로 정렬
+def order_points(pts: np.ndarray) -> np.ndarray:
+    rect = np.zeros((4, 2), dtype="float32")
+    s = pts.sum(axis=1)
+    rect[0] = pts[np.argmin(s)]
+    rect[2] = pts[np.argmax(s)]
+    diff = np.diff(pts, axis=1)
+    rect[1] = pts[np.argmin(diff)]
+    rect[3] = pts[np.argmax(diff)]
+    return rect
+
+# 네 점으로 둘러싸인 영역을 정면에서 본 직사각형으로 펼치기
+def four_point_transform(image: np.ndarray, pts: np.ndarray) -> np.ndarray:
+    rect = order_points(pts)
+    (tl, tr, br, bl) = rect
+
+    # 너비, 높이 최대값 계산
+    max_width = max(int(np.linalg.norm(br - bl)), int(np.linalg.norm(tr - tl)))
+    max_height = max(int(np.linalg.norm(tr - br)), int(np.linalg.norm(tl - bl)))
+
+    dst = np.array([
+        [0, 0],
+        [max_width - 1, 0],
+        [max_width - 1, max_height - 1],
+        [0, max_height - 1]], dtype="float32")
+
+    matrix = cv2.getPerspectiveTransform(rect, dst)
+    return cv2.warpPerspective(image, matrix, (max_width, max_height))
+
+
+# 축소 사본에서 영수증 네 꼭짓점 검출 (원본 좌표로 변환해 반환, 없으면 None)
+def detect_receipt_corners(image: np.ndarray, detect_height: int = RECEIPT_DETECT_HEIGHT) -> Optional[np.ndarray]:
+    h, w = image.shape[:2]
+    if h == 0 or w == 0:
+        return None
+
+    # 1) 축소 (INTER_AREA: 축소 시 빠르고 노이즈가 적음)
+    ratio = h / float(detect_height)
+    small = image
+    if h > detect_height:
+        small = cv2.resize(image, (max(1, int(w / ratio)), detect_height), interpolation=cv2.INTER_AREA)
+    else:
+        ratio = 1.0
+
+    # 2) 전처리 (Gray -> Blur -> Canny -> 팽창으로 글자 덩어리를 하나로)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+    edged = cv2.Canny(blurred, 30, 150)
+    dilated = cv2.dilate(edged, _DILATE_KERNEL, iterations=4)
+
+    # 3) 가장 큰 윤곽선
+    contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return None
+    contour = max(contours, key=cv2.contourArea)
+
+    # 전략 A: 꼭짓점 4개 근사 / 전략 B: 최소 면적 사각형
+    peri = cv2.arcLength(contour, True)
+    approx = cv2.approxPolyDP(contour, 0.02 * peri, True)
+    if len(approx) == 4:
+        corners = approx.reshape(4, 2).astype("float32")
+    else:
+        corners = cv2.boxPoints(cv2.minAreaRect(contour)).astype("float32")
+
+    # 축소 사본 밖으로 나간 점은 경계로 맞춤 (minAreaRect는 이미지 밖 좌표를 낼 수 있음)
+    sh, sw = small.shape[:2]
+    corners[:, 0] = np.clip(corners[:, 0], 0, sw - 1)
+    corners[:, 1] = np.clip(corners[:, 1], 0, sh - 1)
+    return corners * ratio
+
+
+# 영수증 영역만 잘라낸 이미지 반환, 검출 실패/의미 없는 경우 원본 그대로
+# 반환: (이미지, {"cropped": bool, "reason": str, "area_ratio": float})
+def crop_receipt(
+        image: np.ndarray,
+        detect_height: int = RECEIPT_DETECT_HEIGHT,
+        min_area_ratio: float = RECEIPT_MIN_AREA_RATIO,
+        max_area_ratio: float = RECEIPT_MAX_AREA_RATIO
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+
+    corners = detect_receipt_corners(image, detect_height)
+    if corners is None:
+        return image, {"cropped": False, "reason": "no contour", "area_ratio": 1.0}
+
+    h, w = image.shape[:2]
+    area_ratio = float(cv2.contourArea(order_points(corners))) / float(h * w)
+    if area_ratio < min_area_ratio:
+        return image, {"cropped": False, "reason": "too small", "area_ratio": round(area_ratio, 4)}
+    if area_ratio > max_area_ratio:
+        return image, {"cropped": False, "reason": "whole image", "area_ratio": round(area_ratio, 4)}
+
+    # 원본 해상도에서 투시 변환 (글자 해상도 유지)
+    warped = four_point_transform(image, corners)
+    if warped.shape[0] < RECEIPT_MIN_SIDE or warped.shape[1] < RECEIPT_MIN_SIDE:
+        return image, {"cropped": False, "reason": "too small", "area_ratio": round(area_ratio, 4)}
+
+    return warped, {"cropped": True, "reason": "detected", "area_ratio": round(area_ratio, 4)}
@@ -0,0 +1,125 @@
+# tiling.py (긴 영수증을 겹치는 가로 띠로 나눠 OCR → 전역 좌표로 합치고 겹침 구간 중복 제거)
+
+import os
+from typing import Callable, List, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# 띠 나누기 사용 여부 (기본 꺼짐: 실제 영수증으로 정확도를 확인한 뒤 FRIDGE_OCR_TILING=1 로 켬)
+# 기준: 높이 ÷ 너비가 이 값 이상이면 긴 영수증으로 판단
+TILE_ENABLED = os.getenv("FRIDGE_OCR_TILING", "0") not in ("0", "false", "False")
+TILE_MIN_ASPECT = float(os.getenv("FRIDGE_OCR_TILE_MIN_ASPECT", "3.0"))
+# 띠 OCR 기준 너비 (글자를 읽을 수 있는 크기로 맞춤, 최대 TILE_MAX_UPSCALE배까지만 확대)
+TILE_TARGET_WIDTH = int(os.getenv("FRIDGE_OCR_TILE_WIDTH", "720"))
+TILE_MAX_UPSCALE = float(os.getenv("FRIDGE_OCR_TILE_MAX_UPSCALE", "2.0"))
+# 띠 높이 / 위아래 띠와 겹치는 높이 (기준 너비로 맞춘 뒤의 px, 겹침은 글자 한 줄보다 커야 함)
+TILE_STRIP_HEIGHT = int(os.getenv("FRIDGE_OCR_TILE_HEIGHT", "960"))
+TILE_OVERLAP = int(os.getenv("FRIDGE_OCR_TILE_OVERLAP", "96"))
+# 겹침 구간 중복 판단: IoU 또는 작은 박스 기준 겹침 비율
+TILE_DEDUP_IOU = float(os.getenv("FRIDGE_OCR_TILE_DEDUP_IOU", "0.5"))
+TILE_DEDUP_COVER = 0.8
+
+# OCR 함수: 이미지 → (texts, boxes[N, 4], scores[N])
+OCRResult = Tuple[List[str], np.ndarray, np.ndarray]
+PredictFn = Callable[[np.ndarray], OCRResult]
+
+
+# 띠 나누기 대상인지 (세로로 긴 영수증)
+def should_tile(image: np.ndarray, min_aspect: float = TILE_MIN_ASPECT) -> bool:
+    h, w = image.shape[:2]
+    return w > 0 and h / w >= min_aspect
+
+# 높이를 겹치는 띠 구간 [(top, bottom), ...] 으로 나누기
+def plan_strips(height: int, strip_height: int = TILE_STRIP_HEIGHT, overlap: int = TILE_OVERLAP) -> List[Tuple[int, int]]:
+    if height <= strip_height:
+        return [(0, height)]
+    step = strip_height - overlap
+    strips = []
+    top = 0
+    while True:
+        bottom = min(top + strip_height, height)
+        strips.append((top, bottom))
+        if bottom >= height:
+            break
+        top += step
+    return strips
+
+
+# 박스 쌍별 IoU / 작은 박스 기준 겹침 비율 (벡터 연산)
+def _overlap_ratios(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    ix1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    iy1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    ix2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    iy2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(ix2 - ix1, 0, None) * np.clip(iy2 - iy1, 0, None)
+
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    smaller = np.minimum(area_a[:, None], area_b[None, :])
+    iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+    cover = np.divide(inter, smaller, out=np.zeros_like(inter), where=smaller > 0)
+    return iou, cover
+
+
+# 띠별 결과를 전역 좌표로 합치기
+# - 이웃한 띠에서 같은 글자를 두 번 읽은 박스는 하나만 남김 (띠 경계에 잘린 쪽보다 큰 박스 → 높은 신뢰도 우선)
+def merge_strip_results(
+        strip_results: Sequence[Tuple[int, OCRResult]],
+        iou_threshold: float = TILE_DEDUP_IOU,
+        cover_threshold: float = TILE_DEDUP_COVER
+    ) -> OCRResult:
+
+    merged = []   # 띠별 [texts, boxes, scores, keep]
+    for top, (strip_texts, strip_boxes, strip_scores) in strip_results:
+        strip_boxes = np.asarray(strip_boxes, dtype=np.float64).reshape(-1, 4).copy()
+        strip_scores = np.asarray(strip_scores, dtype=np.float64).reshape(-1)
+        strip_boxes[:, [1, 3]] += top
+        keep = np.ones(len(strip_texts), dtype=bool)
+
+        # 겹침은 바로 위 띠와만 생김 (겹침 높이 < 띠 간격)
+        if merged and len(strip_texts) and len(merged[-1][0]):
+            _, prev_boxes, prev_scores, prev_keep = merged[-1]
+            iou, cover = _overlap_ratios(prev_boxes, strip_boxes)
+            prev_area = (prev_boxes[:, 2] - prev_boxes[:, 0]) * (prev_boxes[:, 3] - prev_boxes[:, 1])
+            area = (strip_boxes[:, 2] - strip_boxes[:, 0]) * (strip_boxes[:, 3] - strip_boxes[:, 1])
+            for i, j in zip(*np.nonzero((iou > iou_threshold) | (cover > cover_threshold))):
+                if not prev_keep[i] or not keep[j]:
+                    continue
+                if (area[j], strip_scores[j]) > (prev_area[i], prev_scores[i]):
+                    prev_keep[i] = False
+                else:
+                    keep[j] = False
+
+        merged.append([list(strip_texts), strip_boxes, strip_scores, keep])
+
+    texts = [text for strip_texts, _, _, keep in merged for text, kept in zip(strip_texts, keep) if kept]
+    if not texts:
+        return [], np.zeros((0, 4)), np.zeros(0)
+    boxes = np.concatenate([strip_boxes[keep] for _, strip_boxes, _, keep in merged])
+    scores = np.concatenate([strip_scores[keep] for _, _, strip_scores, keep in merged])
+    return texts, boxes, scores
+
+
+# 긴 영수증을 읽을 수 있는 배율로 맞춘 뒤 띠로 나눠 차례대로 OCR (한 번에 줄여 읽을 때 작아져 놓치는 글자를 읽기 위함)
+# 반환 박스는 입력 이미지(원본) 좌표
+def ocr_tiled(
+        image: np.ndarray,
+        predict: PredictFn,
+        target_width: int = TILE_TARGET_WIDTH,
+        strip_height: int = TILE_STRIP_HEIGHT,
+        overlap: int = TILE_OVERLAP
+    ) -> OCRResult:
+
+    h, w = image.shape[:2]
+    scale = min(target_width / float(w), TILE_MAX_UPSCALE)
+    if scale != 1.0:
+        interpolation = cv2.INTER_CUBIC if scale > 1.0 else cv2.INTER_AREA
+        image = cv2.resize(image, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=interpolation)
+
+    strips = plan_strips(image.shape[0], strip_height, overlap)
+    results = [predict(np.ascontiguousarray(image[top:bottom])) for top, bottom in strips]
+
+    texts, boxes, scores = merge_strip_results([(top, result) for (top, _), result in zip(strips, results)])
+    return texts, boxes / scale, scores
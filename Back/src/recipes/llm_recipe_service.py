@@ -1,42 +1,56 @@
 # llm_recipe_service.py
 
-from typing import List, Dict, Any, Optional
-from ..db.database import get_db_connection
-from ..llm.llm_processor import run_recipe_llm as recipe_processor
-
-# DB - 사용자 식재료 조회
-def get_user_ingredients_list() -> List[str]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
+import time
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+from anyio import to_thread
+from ..db.database import db_connection
+from ..db.async_database import run_in_db_thread
+from ..llm.llm_processor import run_recipe_llm as recipe_processor, stream_recipe_llm
+from .recipe_cache import recipe_cache, pantry_fingerprint
+from .recipe_corpus import recipe_corpus
+from .prompt_builder import PantryInput, build_pantry_prompt
 
+# DB - 프롬프트 구성용 식재료 조회 (유통기한 / 분류 포함)
+def get_user_pantry_items() -> List[Dict[str, Any]]:
     try:
-        # 유통기한이 오늘 이후인 식재료만 조회
-        cursor.execute("""
-            SELECT
-                name,quantity,unit
-            FROM Ingredients
-            WHERE status = 'active' 
-                AND expiry_date >= DATE('now')
-            ORDER BY expiry_date ASC         
-        """)
-
-        ingredients = [
-            f"{row['name']} ({row['quantity']}{row['unit']})"
-            for row in cursor.fetchall()
-        ]
-
-        return ingredients
-    
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    I.name, I.quantity, I.unit, I.expiry_date, C.name AS category
+                FROM Ingredients I
+                LEFT JOIN Categories C ON C.id = I.category_id
+                WHERE I.status = 'active'
+                    AND I.expiry_date >= DATE('now')
+                ORDER BY I.expiry_date ASC
+            """)
+            return [dict(row) for row in cursor.fetchall()]
+
     except Exception as e:
         print(f"[DB ERROR] 식재료 조회 오류: {e}")
         return []
 
-    finally:
-        conn.close()
+
+# DB 보유 식재료 목록 (식재료가 바뀌기 전까지는 기억해 둔 목록 사용)
+def get_pantry_ingredients_list() -> List[Dict[str, Any]]:
+    ingredients = recipe_cache.get_pantry()
+    if ingredients is None:
+        ingredients = get_user_pantry_items()
+        recipe_cache.set_pantry(ingredients)
+    return ingredients
+
+
+# 보유 식재료 목록 → 레시피 요청 user prompt (임박도 순 정렬 / 같은 재료 합치기 / 토큰 예산 - prompt_builder)
+# avoid_recipes: 같은 재료로 이미 추천한 요리 (미리 생성할 때 다른 요리가 나오도록)
+def build_recipe_user_prompt(ingredients_list: List[PantryInput], avoid_recipes: Optional[List[str]] = None) -> str:
+    pantry_prompt = build_pantry_prompt(ingredients_list, avoid_recipes=avoid_recipes)
+    if pantry_prompt.omitted:
+        print(f"[Service] 프롬프트 예산 초과로 재료 {pantry_prompt.omitted}개를 생략했습니다. (약 {pantry_prompt.tokens} 토큰)")
+    return pantry_prompt.text
 
 
 # LLM 요청 - 레시피 생성
-def recommend_recipe_from_llm(ingredients_list: List[str]) -> Dict[str, Any]:
+def recommend_recipe_from_llm(ingredients_list: List[PantryInput], avoid_recipes: Optional[List[str]] = None) -> Dict[str, Any]:
     # 보유 식재료 목록을 기반으로 LLM에 레시피를 요청하고 응답을 정제
     if not ingredients_list:
         return {
@@ -45,22 +59,11 @@ def recommend_recipe_from_llm(ingredients_list: List[str]) -> Dict[str, Any]:
             "ingredients_needed": []
         }
     
-    ingredients_text = ", ".join(ingredients_list)
-
-    # user prompt 구현
-    user_prompt = f"""
-    다음은 사용자가 현재 보유한 식재료 목록입니다:
-
-    {ingredients_text}
-
-    위 재료들을 최대한 많이 활용하여 만들 수 있는 현실적인 요리 레시피를 하나 추천해주세요.
-    가능하면 유통기한이 임박한 재료를 우선적으로 사용해 주세요.
-
-    반드시 system_prompt에서 요구한 JSON 형식에 맞춰 출력하세요.
-    """
+    user_prompt = build_recipe_user_prompt(ingredients_list, avoid_recipes)
 
     try:
         response_json = recipe_processor(user_prompt)
+        learn_recipe(response_json)
         return response_json
     
     except Exception as e:
@@ -71,20 +74,150 @@ def recommend_recipe_from_llm(ingredients_list: List[str]) -> Dict[str, Any]:
             "ingredients_needed": []
         }
     
+# 캐시에 넣어도 되는 레시피인지 (안내 / 오류 응답은 제외)
+def is_cacheable_recipe(recipe: Dict[str, Any]) -> bool:
+    return (
+        isinstance(recipe, dict)
+        and recipe.get("recipe_name") not in (None, "", "오류", "재료 부족")
+        and bool(recipe.get("steps"))
+    )
+
+# LLM 이 만든 레시피를 로컬 레시피 모음에 추가 (다음부터 비슷한 냉장고면 LLM 없이 추천)
+def learn_recipe(recipe: Dict[str, Any]) -> None:
+    if is_cacheable_recipe(recipe):
+        recipe_corpus.persist(recipe_corpus.learn([recipe]))
+
+# 로컬 레시피 모음에서 기준 점수를 넘는 레시피 (없으면 None)
+# 기준을 넘는 상위 레시피(캐시 풀 크기만큼)를 캐시 풀에 넣어, 같은 냉장고로 다시 요청하면 다음 레시피를 차례로 반환
+def find_local_recipe(key: str, ingredients_list: List[PantryInput]) -> Optional[Dict[str, Any]]:
+    matches = recipe_corpus.good_matches(ingredients_list, limit=recipe_cache.pool_size)
+    if not matches:
+        return None
+    recipes = [dict(match.recipe) for match in matches]
+    for recipe in recipes[1:] + recipes[:1]:   # 지금 반환하는 첫 번째 레시피는 풀의 맨 뒤로
+        recipe_cache.put(key, ingredients_list, recipe)
+    print(f"[Service] 로컬 레시피 모음에서 '{recipes[0].get('recipe_name')}'을(를) 추천합니다. (점수 {matches[0].score}, 후보 {len(recipes)}개)")
+    return recipes[0]
+
+# 새 레시피를 요청할 때 피할 요리: 로컬 모음에서 이 냉장고에 맞는 상위 레시피
+def known_recipe_names(ingredients_list: List[PantryInput], limit: int = 3) -> List[str]:
+    return [match.recipe.get("recipe_name", "") for match in recipe_corpus.search(ingredients_list, limit=limit)]
+
+# 추천 순서: 같은 냉장고(지문)의 캐시 → 로컬 레시피 모음 → LLM 호출 후 저장
+# force_new: 사용자가 새 레시피를 요청한 경우, 캐시와 로컬 모음을 건너뛰고 이미 아는 요리는 피해서 생성
+def recommend_recipe_with_cache(ingredients_list: List[PantryInput], force_new: bool = False) -> Dict[str, Any]:
+    if not ingredients_list:
+        return recommend_recipe_from_llm(ingredients_list)
+
+    key = pantry_fingerprint(ingredients_list)
+    if not force_new:
+        cached = recipe_cache.get(key, ingredients_list)
+        if cached is not None:
+            print("[Service] 같은 식재료 구성의 레시피를 캐시에서 반환합니다.")
+            return cached
+
+        local = find_local_recipe(key, ingredients_list)
+        if local is not None:
+            return local
+
+    started = time.perf_counter()
+    avoid_recipes = known_recipe_names(ingredients_list) if force_new else None
+    recipe = recommend_recipe_from_llm(ingredients_list, avoid_recipes=avoid_recipes)
+    if is_cacheable_recipe(recipe):
+        recipe_cache.put(key, ingredients_list, recipe, time.perf_counter() - started)
+    return recipe
+
+# 미리 생성 (recipe_cache.start_pregeneration 에 넘기는 함수): 이미 있는 요리는 제외하고 하나 더 생성
+def pregenerate_recipe(ingredients_list: List[PantryInput], existing_recipes: List[str]) -> Optional[Dict[str, Any]]:
+    recipe = recommend_recipe_from_llm(ingredients_list, avoid_recipes=existing_recipes)
+    return recipe if is_cacheable_recipe(recipe) else None
+
 # 외부 진입점 - 최종 레시피 추천
-def get_final_recipe_recommendation(ingredients_list: Optional[List[str]] = None) -> Dict[str, Any]:
+def get_final_recipe_recommendation(ingredients_list: Optional[List[PantryInput]] = None, force_new: bool = False) -> Dict[str, Any]:
     """
     ingredients_list가 주어지면 그걸 쓰고, 
     없으면(None) DB에서 조회해서 추천한다.
+    force_new가 True면 캐시 / 로컬 레시피 모음을 건너뛰고 LLM으로 새로 생성한다.
     """
     
     # 1. 인자로 받은 리스트가 없으면 DB에서 조회 (기존 로직 하위 호환)
     if not ingredients_list:
         print("[Service] 입력된 재료가 없어 DB에서 조회합니다.")
-        ingredients_list = get_user_ingredients_list()
+        ingredients_list = get_pantry_ingredients_list()
     else:
         print(f"[Service] 앱에서 전달받은 재료 {len(ingredients_list)}개를 사용합니다.")
 
-    # 2. LLM 호출
-    return recommend_recipe_from_llm(ingredients_list)
-    
+    # 2. 캐시 → 로컬 레시피 모음 → LLM 호출
+    return recommend_recipe_with_cache(ingredients_list, force_new)
+
+# 비동기 API - DB 조회는 DB 전용 스레드, LLM 호출은 워커 스레드에서 실행
+async def get_pantry_ingredients_list_async() -> List[Dict[str, Any]]:
+    ingredients = recipe_cache.get_pantry()
+    if ingredients is None:
+        ingredients = await run_in_db_thread(get_user_pantry_items)
+        recipe_cache.set_pantry(ingredients)
+    return ingredients
+
+async def get_final_recipe_recommendation_async(ingredients_list: Optional[List[PantryInput]] = None, force_new: bool = False) -> Dict[str, Any]:
+    if not ingredients_list:
+        print("[Service] 입력된 재료가 없어 DB에서 조회합니다.")
+        ingredients_list = await get_pantry_ingredients_list_async()
+    else:
+        print(f"[Service] 앱에서 전달받은 재료 {len(ingredients_list)}개를 사용합니다.")
+
+    return await to_thread.run_sync(recommend_recipe_with_cache, ingredients_list, force_new)
+
+# 완성된 레시피 → 스트리밍 이벤트 순서 (recipe_name → ingredients_main → step... → done)
+def recipe_events(recipe: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+    for key in ("recipe_name", "ingredients_main"):
+        if key in recipe:
+            events.append((key, {key: recipe[key]}))
+    for index, step in enumerate(recipe.get("steps") or []):
+        events.append(("step", {"index": index, "text": step}))
+    events.append(("done", recipe))
+    return events
+
+# 스트리밍 API - 레시피를 완성되는 부분부터 (이벤트 이름, 데이터)로 전달
+# 재료가 없으면 안내 레시피를 done 이벤트로, LLM 오류는 같은 형식의 error 이벤트로 보냄
+async def stream_recipe_recommendation(
+        ingredients_list: Optional[List[PantryInput]] = None,
+        force_new: bool = False
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+
+    if not ingredients_list:
+        print("[Service] 입력된 재료가 없어 DB에서 조회합니다.")
+        ingredients_list = await get_pantry_ingredients_list_async()
+    else:
+        print(f"[Service] 앱에서 전달받은 재료 {len(ingredients_list)}개를 사용합니다.")
+
+    if not ingredients_list:
+        yield "done", recommend_recipe_from_llm(ingredients_list)
+        return
+
+    # 캐시 / 로컬 레시피 모음 적중: 스트리밍과 같은 순서의 이벤트를 바로 보냄
+    key = pantry_fingerprint(ingredients_list)
+    if not force_new:
+        ready = recipe_cache.get(key, ingredients_list)
+        if ready is None:
+            ready = await to_thread.run_sync(find_local_recipe, key, ingredients_list)
+        if ready is not None:
+            for event in recipe_events(ready):
+                yield event
+            return
+
+    started = time.perf_counter()
+    avoid_recipes = known_recipe_names(ingredients_list) if force_new else None
+    try:
+        async for event, data in stream_recipe_llm(build_recipe_user_prompt(ingredients_list, avoid_recipes)):
+            if event == "done" and is_cacheable_recipe(data):
+                recipe_cache.put(key, ingredients_list, data, time.perf_counter() - started)
+                await run_in_db_thread(learn_recipe, data)
+            yield event, data
+    except Exception as e:
+        print(f"[LLM ERROR] 레시피 스트리밍 오류: {e}")
+        yield "error", {
+            "recipe_name": "오류",
+            "steps": [f"LLM 요청 중 오류 발생: {str(e)}"],
+            "ingredients_needed": []
+        }
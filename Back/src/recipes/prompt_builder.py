@@ -0,0 +1,189 @@
+# prompt_builder.py (레시피 프롬프트 구성: 유통기한 임박도 / 분류 순으로 고른 식재료를 토큰 예산 안에서 나열)
+
+import os
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from ..ingredients.labeling import calculate_remaining_days, get_visual_labeling_data
+from ..llm.llm_processor import estimate_text_tokens
+
+# 레시피 user prompt 전체 토큰 예산
+# (num_ctx 4096 - system prompt 약 1,000 - 응답 JSON 여유분을 남긴 값)
+RECIPE_PROMPT_TOKENS = int(os.getenv("FRIDGE_RECIPE_PROMPT_TOKENS", "1024"))
+
+# 임박도 구간 (labeling.py 의 라벨 색상 기준과 동일: 3일 이내 / 7일 이내 / 그 이후 / 유통기한 정보 없음)
+URGENCY_ORDER = {"orange": 0, "yellow": 1, "green": 2, None: 3}
+URGENCY_HEADERS = {
+    "orange": "[유통기한 3일 이내 - 우선 사용]",
+    "yellow": "[유통기한 7일 이내]",
+    "green": "[여유 있음]",
+    None: "[유통기한 정보 없음]",
+}
+
+# 분류 우선순위: 요리의 중심이 되는 재료 → 기타 → 양념 / 완제품 (같은 임박도 안에서 적용)
+MAIN_CATEGORIES = ("육류", "두부", "달걀", "채소", "어묵", "묵류", "떡류", "건면", "비건조면류", "냉동식품", "유제품", "과일")
+MINOR_CATEGORIES = ("조미료", "식용유", "참기름", "들기름", "마가린류", "빵류", "과일·채소류음료", "도시락", "김밥", "샌드위치", "햄버거")
+
+# "두부 (1모)" / "돼지고기 (500.0g)" / "김치 ()" → 이름, 수량, 단위
+_ITEM_PATTERN = re.compile(r"^(.*?)\s*\(\s*(\d+(?:\.\d+)?)?\s*([^()]*?)\s*\)\s*$")
+
+PantryInput = Union[str, Dict[str, Any]]
+
+
+# 식재료 이름 정규화 (전각/반각 통일, 소문자, 공백 제거) - 같은 재료 판단 기준
+def normalize_ingredient_name(name: str) -> str:
+    return re.sub(r"\s+", "", unicodedata.normalize("NFKC", name).lower())
+
+# 분류 → 정렬 순위 (작을수록 먼저)
+def category_rank(category: Optional[str]) -> int:
+    if category in MAIN_CATEGORIES:
+        return 0
+    if category in MINOR_CATEGORIES:
+        return 2
+    return 1
+
+# 문자열 / 딕셔너리 입력을 {name, quantity, unit, expiry_date, category} 로 통일
+def to_pantry_item(value: PantryInput) -> Dict[str, Any]:
+    if isinstance(value, dict):
+        quantity = value.get("quantity")
+        try:
+            quantity = float(quantity) if quantity not in (None, "") else None
+        except (TypeError, ValueError):
+            quantity = None
+        return {
+            "name": str(value.get("name", "")).strip(),
+            "quantity": quantity,
+            "unit": str(value.get("unit") or "").strip(),
+            "expiry_date": value.get("expiry_date") or None,
+            "category": value.get("category") or None,
+        }
+
+    match = _ITEM_PATTERN.match(value.strip())
+    if match is None:
+        return {"name": value.strip(), "quantity": None, "unit": "", "expiry_date": None, "category": None}
+    return {
+        "name": match.group(1).strip(),
+        "quantity": float(match.group(2)) if match.group(2) else None,
+        "unit": match.group(3).strip(),
+        "expiry_date": None,
+        "category": None,
+    }
+
+# 남은 일수 / 임박도 구간 (유통기한 정보가 없으면 None, None)
+def item_urgency(item: Dict[str, Any]) -> tuple:
+    if not item.get("expiry_date"):
+        return None, None
+    remaining_days = calculate_remaining_days(item["expiry_date"])
+    return remaining_days, get_visual_labeling_data(remaining_days)["label_color"]
+
+# 같은 이름(공백 / 대소문자 무시) 합치기: 단위가 같은 수량은 더하고, 유통기한은 가장 이른 것으로
+# 이미 지난 재료(red)는 추천에 쓰지 않으므로 제외
+def merge_pantry_items(values: Iterable[PantryInput]) -> List[Dict[str, Any]]:
+    merged: Dict[str, Dict[str, Any]] = {}
+    for value in values:
+        item = to_pantry_item(value)
+        if not item["name"]:
+            continue
+        remaining_days, urgency = item_urgency(item)
+        if urgency == "red":
+            continue
+
+        key = normalize_ingredient_name(item["name"])
+        entry = merged.get(key)
+        if entry is None:
+            merged[key] = {
+                "name": item["name"],
+                "quantities": {},
+                "remaining_days": remaining_days,
+                "urgency": urgency,
+                "category": item["category"],
+            }
+            entry = merged[key]
+        elif remaining_days is not None and (entry["remaining_days"] is None or remaining_days < entry["remaining_days"]):
+            entry["remaining_days"], entry["urgency"] = remaining_days, urgency
+
+        entry["category"] = entry["category"] or item["category"]
+        if item["quantity"] is not None:
+            entry["quantities"][item["unit"]] = entry["quantities"].get(item["unit"], 0.0) + item["quantity"]
+    return list(merged.values())
+
+# 임박도 → 분류 → 남은 일수 → 이름 순 정렬
+def rank_pantry_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(items, key=lambda item: (
+        URGENCY_ORDER[item["urgency"]],
+        category_rank(item["category"]),
+        item["remaining_days"] if item["remaining_days"] is not None else 0,
+        item["name"],
+    ))
+
+def _format_quantity(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+# 프롬프트에 들어갈 재료 한 개: "두부 (2모, 2일 남음)"
+def format_pantry_item(item: Dict[str, Any]) -> str:
+    details = [f"{_format_quantity(quantity)}{unit}" for unit, quantity in item["quantities"].items()]
+    if item["remaining_days"] is not None:
+        details.append("오늘까지" if item["remaining_days"] == 0 else f"{item['remaining_days']}일 남음")
+    return f"{item['name']} ({', '.join(details)})" if details else item["name"]
+
+
+class PantryPrompt:
+    """
+    레시피 요청 user prompt 와 구성 정보.
+    - selected: 프롬프트에 넣은 재료 (임박도 순), omitted: 예산을 넘어 뺀 재료 수
+    - tokens: 추정 토큰 수 (llm_processor.estimate_text_tokens 기준)
+    """
+
+    def __init__(self, text: str, selected: List[Dict[str, Any]], omitted: int, tokens: int):
+        self.text = text
+        self.selected = selected
+        self.omitted = omitted
+        self.tokens = tokens
+
+
+def _render(sections: Dict[Any, List[str]], omitted: int, avoid_recipes: Optional[List[str]]) -> str:
+    has_expiry = any(urgency is not None for urgency in sections)
+    lines = ["다음은 사용자가 현재 보유한 식재료 목록입니다" + (" (유통기한이 임박한 순서):" if has_expiry else ":"), ""]
+    for urgency in sorted(sections, key=URGENCY_ORDER.get):
+        header = URGENCY_HEADERS[urgency] + " " if has_expiry else ""
+        lines.append(header + ", ".join(sections[urgency]))
+    if omitted:
+        lines.append(f"(그 밖의 보유 재료 {omitted}개는 생략)")
+
+    lines += ["", "위 재료들을 최대한 많이 활용하여 만들 수 있는 현실적인 요리 레시피를 하나 추천해주세요."]
+    if "orange" in sections:
+        lines.append("[유통기한 3일 이내] 재료 중 하나 이상을 반드시 메인 재료로 사용해 주세요.")
+    else:
+        lines.append("가능하면 유통기한이 임박한 재료를 우선적으로 사용해 주세요.")
+    if avoid_recipes:
+        lines.append(f"다음 요리는 이미 추천했으므로 제외하고 다른 요리를 추천하세요: {', '.join(avoid_recipes)}")
+    lines += ["", "반드시 system_prompt에서 요구한 JSON 형식에 맞춰 출력하세요."]
+    return "\n".join(lines)
+
+# 보유 식재료 → 토큰 예산 안의 레시피 user prompt
+# 임박도 순으로 하나씩 넣다가 예산을 넘는 재료는 건너뜀 (뒤쪽의 짧은 재료는 계속 들어갈 수 있음)
+def build_pantry_prompt(
+        values: Iterable[PantryInput],
+        token_budget: int = RECIPE_PROMPT_TOKENS,
+        avoid_recipes: Optional[List[str]] = None
+    ) -> PantryPrompt:
+
+    ranked = rank_pantry_items(merge_pantry_items(values))
+    # 재료 목록을 뺀 나머지(안내문, 구간 머리말)는 최대치로 잡아 둠
+    fixed = estimate_text_tokens(_render({urgency: [] for urgency in URGENCY_HEADERS}, len(ranked), avoid_recipes))
+
+    used = fixed
+    selected: List[Dict[str, Any]] = []
+    sections: Dict[Any, List[str]] = {}
+    for item in ranked:
+        text = format_pantry_item(item)
+        cost = estimate_text_tokens(text + ", ")
+        if used + cost > token_budget:
+            continue
+        used += cost
+        selected.append(item)
+        sections.setdefault(item["urgency"], []).append(text)
+
+    prompt = _render(sections, len(ranked) - len(selected), avoid_recipes)
+    return PantryPrompt(prompt, selected, len(ranked) - len(selected), estimate_text_tokens(prompt))
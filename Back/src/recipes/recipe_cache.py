@@ -0,0 +1,255 @@
+# recipe_cache.py (레시피 추천 캐시: 정규화한 보유 식재료 지문 → 이미 생성한 레시피 풀을 돌려가며 반환)
+
+import copy
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..cache.result_cache import make_cache_key
+from .prompt_builder import PantryInput, item_urgency, normalize_ingredient_name, to_pantry_item
+
+# 지문 하나당 모아 둘 레시피 수 (요청마다 돌려가며 반환)
+RECIPE_POOL_SIZE = int(os.getenv("FRIDGE_RECIPE_POOL_SIZE", "3"))
+# 보관할 지문 수 (오래 안 쓴 것부터 제거)
+RECIPE_CACHE_MAX_ENTRIES = int(os.getenv("FRIDGE_RECIPE_CACHE_ENTRIES", "256"))
+# 레시피 보관 시간(초, 0이면 무기한)
+RECIPE_CACHE_TTL = float(os.getenv("FRIDGE_RECIPE_CACHE_TTL", str(24 * 3600)))
+# 서버가 한가할 때 풀을 미리 채울지 여부 / LLM이 이 시간(초) 이상 쉬고 있을 때만 생성 / 확인 주기(초)
+RECIPE_PREGENERATE = os.getenv("FRIDGE_RECIPE_PREGENERATE", "0") not in ("0", "false", "False")
+RECIPE_PREGENERATE_IDLE_SECONDS = float(os.getenv("FRIDGE_RECIPE_PREGENERATE_IDLE", "60"))
+RECIPE_PREGENERATE_INTERVAL = float(os.getenv("FRIDGE_RECIPE_PREGENERATE_INTERVAL", "30"))
+
+# 풀 채우기 함수: (식재료 목록, 이미 있는 요리 이름들) → 레시피 (실패 시 None)
+GenerateFn = Callable[[List[PantryInput], List[str]], Optional[Dict[str, Any]]]
+
+
+# 수량 구간: 2배 단위(log2 반올림)로 묶어 1개 ↔ 2개는 구분하고 500g ↔ 600g 은 같은 지문으로
+def quantity_bucket(quantity: Optional[float], unit: str) -> str:
+    unit = normalize_ingredient_name(unit)
+    if quantity is None:
+        return "-"
+    if quantity <= 0:
+        return f"0{unit}"
+    return f"b{round(math.log2(quantity))}{unit}"
+
+# 보유 식재료 목록 → (이름, 수량 구간, 임박도) 정렬된 집합
+# 임박도가 바뀌면(예: 여유 → 3일 이내) 프롬프트가 달라지므로 다른 지문으로 봄
+def pantry_items(ingredients_list: Iterable[PantryInput]) -> List[Tuple[str, str, str]]:
+    items = set()
+    for value in ingredients_list:
+        item = to_pantry_item(value)
+        name = normalize_ingredient_name(item["name"])
+        if name:
+            items.add((name, quantity_bucket(item["quantity"], item["unit"]), item_urgency(item)[1] or "-"))
+    return sorted(items)
+
+# 보유 식재료 지문 (순서 / 공백 / 비슷한 수량 차이에 영향받지 않음)
+def pantry_fingerprint(ingredients_list: Iterable[PantryInput]) -> str:
+    return make_cache_key("pantry", *(":".join(item) for item in pantry_items(ingredients_list)))
+
+
+# DB 의 DATE('now') 와 같은 기준(UTC) 날짜
+def _today() -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime())
+
+
+class _RecipePool:
+    # 지문 하나의 레시피 풀
+    def __init__(self, ingredients_list: List[PantryInput]):
+        self.ingredients_list = list(ingredients_list)
+        self.names = {item[0] for item in pantry_items(ingredients_list)}
+        self.recipes: List[Tuple[Dict[str, Any], float, float]] = []   # (레시피, 생성 시간(초), 저장 시각)
+        self.next = 0
+        self.last_requested = time.monotonic()
+
+
+class RecipeRecommendationCache:
+    """
+    보유 식재료 지문별로 생성한 레시피를 모아 두는 캐시.
+    - 같은 냉장고로 다시 요청하면 LLM 없이 풀의 레시피를 차례로 돌려가며 반환합니다.
+    - 식재료 상태가 바뀌면(사용/폐기/복구) 그 재료가 들어간 풀과 DB 보유 목록 기억을 지웁니다.
+    - start_pregeneration()을 켜면 LLM이 한가할 때 최근 요청한 지문의 풀을 미리 채웁니다.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = RECIPE_POOL_SIZE,
+            max_entries: int = RECIPE_CACHE_MAX_ENTRIES,
+            ttl_seconds: float = RECIPE_CACHE_TTL
+        ):
+        self.pool_size = pool_size
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._pools: "OrderedDict[str, _RecipePool]" = OrderedDict()
+        self._pantry: Optional[Tuple[str, List[PantryInput]]] = None   # (날짜, DB 보유 식재료 목록)
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        # 지표
+        self._hits = 0
+        self._misses = 0
+        self._puts = 0
+        self._pregenerated = 0
+        self._invalidations = 0
+        self._saved_seconds = 0.0
+
+    # (잠금 안에서 호출) 만료된 레시피를 버린 풀 반환
+    def _live_pool(self, key: str) -> Optional[_RecipePool]:
+        pool = self._pools.get(key)
+        if pool is None:
+            return None
+        if self.ttl_seconds > 0:
+            now = time.monotonic()
+            pool.recipes = [entry for entry in pool.recipes if now - entry[2] < self.ttl_seconds]
+        return pool
+
+    # 조회: 풀에 레시피가 있으면 다음 차례 레시피 (없으면 None)
+    def get(self, key: str, ingredients_list: Optional[List[PantryInput]] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            pool = self._live_pool(key)
+            if pool is None and ingredients_list is not None:
+                # 처음 보는 지문도 기억해 두어 미리 생성 대상이 되게 함
+                pool = self._add_pool(key, ingredients_list)
+            if pool is not None:
+                pool.last_requested = time.monotonic()
+                self._pools.move_to_end(key)
+            if pool is None or not pool.recipes:
+                self._misses += 1
+                return None
+
+            recipe, generate_seconds, _ = pool.recipes[pool.next % len(pool.recipes)]
+            pool.next += 1
+            self._hits += 1
+            self._saved_seconds += generate_seconds
+            return copy.deepcopy(recipe)
+
+    # 저장: 생성한 레시피를 풀에 추가 (풀이 가득 차면 가장 오래된 레시피를 교체)
+    def put(self, key: str, ingredients_list: List[PantryInput], recipe: Dict[str, Any], generate_seconds: float = 0.0) -> None:
+        with self._lock:
+            pool = self._live_pool(key) or self._add_pool(key, ingredients_list)
+            pool.recipes.append((copy.deepcopy(recipe), generate_seconds, time.monotonic()))
+            if len(pool.recipes) > self.pool_size:
+                pool.recipes.pop(0)
+            self._puts += 1
+
+    # (잠금 안에서 호출) 새 풀 추가, 한도를 넘으면 오래 안 쓴 것부터 제거
+    def _add_pool(self, key: str, ingredients_list: List[PantryInput]) -> _RecipePool:
+        pool = _RecipePool(ingredients_list)
+        self._pools[key] = pool
+        while len(self._pools) > self.max_entries:
+            self._pools.popitem(last=False)
+        return pool
+
+    # ---------- DB 보유 식재료 목록 기억 (상태가 바뀌거나 날짜가 바뀔 때까지) ----------
+
+    def get_pantry(self) -> Optional[List[PantryInput]]:
+        with self._lock:
+            if self._pantry is None or self._pantry[0] != _today():
+                return None
+            return list(self._pantry[1])
+
+    def set_pantry(self, ingredients_list: List[PantryInput]) -> None:
+        with self._lock:
+            self._pantry = (_today(), list(ingredients_list))
+
+    # ---------- 무효화 ----------
+
+    # 새 식재료 등록 등 보유 목록만 바뀐 경우
+    def invalidate_pantry(self) -> None:
+        with self._lock:
+            self._pantry = None
+
+    # 식재료 상태 변경: 해당 재료가 들어간 풀 삭제, 삭제한 풀 수 반환
+    def invalidate_ingredients(self, names: Iterable[str]) -> int:
+        targets = {normalize_ingredient_name(name) for name in names}
+        with self._lock:
+            self._pantry = None
+            stale = [key for key, pool in self._pools.items() if pool.names & targets]
+            for key in stale:
+                del self._pools[key]
+            self._invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pools.clear()
+            self._pantry = None
+
+    # ---------- 한가할 때 미리 생성 ----------
+
+    # 최근 요청한 지문 중 풀이 덜 찬 것 하나를 채움, 채웠으면 True
+    def pregenerate_once(self, generate: GenerateFn) -> bool:
+        with self._lock:
+            candidates = [
+                (key, pool) for key, pool in self._pools.items()
+                if len(self._live_pool(key).recipes) < self.pool_size
+            ]
+            if not candidates:
+                return False
+            key, pool = max(candidates, key=lambda item: item[1].last_requested)
+            ingredients_list = list(pool.ingredients_list)
+            existing = [recipe.get("recipe_name", "") for recipe, _, _ in pool.recipes]
+
+        started = time.perf_counter()
+        recipe = generate(ingredients_list, existing)
+        if recipe is None:
+            return False
+        self.put(key, ingredients_list, recipe, time.perf_counter() - started)
+        with self._lock:
+            self._pregenerated += 1
+        return True
+
+    # LLM이 idle_seconds 이상 쉬고 있을 때만 풀을 채우는 백그라운드 스레드 시작
+    def start_pregeneration(
+            self,
+            generate: GenerateFn,
+            idle_seconds_fn: Callable[[], float],
+            idle_seconds: float = RECIPE_PREGENERATE_IDLE_SECONDS,
+            interval: float = RECIPE_PREGENERATE_INTERVAL
+        ) -> None:
+        if self._worker is not None:
+            return
+
+        def _loop() -> None:
+            while not self._stop.wait(interval):
+                if idle_seconds_fn() < idle_seconds:
+                    continue
+                try:
+                    self.pregenerate_once(generate)
+                except Exception as e:
+                    print(f"경고: 레시피 미리 생성 실패 - {e}")
+
+        self._worker = threading.Thread(target=_loop, name="recipe-pregenerate", daemon=True)
+        self._worker.start()
+
+    def stop_pregeneration(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=1)
+            self._worker = None
+        self._stop.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "fingerprints": len(self._pools),
+                "recipes": sum(len(pool.recipes) for pool in self._pools.values()),
+                "pool_size": self.pool_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "puts": self._puts,
+                "pregenerated": self._pregenerated,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "saved_seconds": round(self._saved_seconds, 2),
+            }
+
+
+# 프로세스 전역 레시피 추천 캐시
+recipe_cache = RecipeRecommendationCache()
@@ -0,0 +1,331 @@
+# recipe_corpus.py (로컬 레시피 모음 + 재료 → 레시피 역색인: 보유 식재료로 만들 수 있는 레시피를 LLM 없이 찾기)
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..db.database import db_connection
+from .prompt_builder import PantryInput, merge_pantry_items, normalize_ingredient_name
+
+# 이 점수(0~1) 이상인 레시피가 있으면 LLM 을 부르지 않음
+RECIPE_MATCH_THRESHOLD = float(os.getenv("FRIDGE_RECIPE_MATCH_THRESHOLD", "0.8"))
+# 보유하지 않은 재료가 이보다 많으면 후보에서 제외
+RECIPE_MATCH_MAX_MISSING = int(os.getenv("FRIDGE_RECIPE_MATCH_MAX_MISSING", "2"))
+
+# 점수 가중치: 레시피 재료를 얼마나 갖고 있는지 / 냉장고 재료를 얼마나 쓰는지 / 임박 재료를 쓰는지
+WEIGHT_RECIPE_COVERAGE = 0.7
+WEIGHT_PANTRY_USAGE = 0.1
+WEIGHT_URGENCY = 0.2
+# 냉장고 재료를 이 개수만큼 쓰면 사용도 만점 / 임박 재료를 이 개수만큼 쓰면 임박도 만점
+PANTRY_USAGE_TARGET = 4
+URGENT_USAGE_TARGET = 2
+
+# 대부분의 집에 있는 기본 양념 (없어도 부족한 재료로 세지 않음)
+STAPLES = {normalize_ingredient_name(name) for name in (
+    "소금", "후추", "설탕", "간장", "식용유", "물", "참기름", "들기름", "다진마늘", "마늘", "고춧가루",
+    "식초", "맛술", "올리고당", "물엿", "깨", "통깨", "참깨", "전분", "밀가루", "버터",
+)}
+# 같은 재료의 다른 이름
+ALIASES = {"달걀": "계란", "파": "대파", "돼지고기목살": "목살"}
+# 재료 이름 앞에 붙는 손질 / 보관 / 원산지 수식어 (색인 키로 쓰지 않음: "다진 마늘"이 있다고 "다진 소고기"가 있는 것은 아님)
+MODIFIERS = {normalize_ingredient_name(word) for word in (
+    "다진", "냉동", "냉장", "생", "국내산", "국산", "수입", "수입산", "유기농", "무농약", "친환경",
+    "손질", "손질된", "깐", "채썬", "슬라이스", "저염",
+)}
+
+
+# 재료 이름 → 색인 키 (정규화한 전체 이름 + 수식어를 뺀 이름 + 맨 뒤 두 글자 이상 단어(중심 명사))
+# 예: "소고기 안심" → {"소고기안심", "안심"}, "다진 소고기" → {"다진소고기", "소고기"}
+def ingredient_keys(name: str) -> Set[str]:
+    full = normalize_ingredient_name(name)
+    if not full:
+        return set()
+    keys = {ALIASES.get(full, full)}
+    words = [normalize_ingredient_name(word) for word in str(name).split()]
+    words = [word for word in words if word and word not in MODIFIERS]
+    if words:
+        stripped = "".join(words)
+        keys.add(ALIASES.get(stripped, stripped))
+        if len(words[-1]) >= 2:
+            keys.add(ALIASES.get(words[-1], words[-1]))
+    return keys
+
+# 레시피 재료 목록 (ingredients_main + ingredients_needed, 이름 중복 제거)
+def recipe_ingredients(recipe: Dict[str, Any]) -> List[str]:
+    names, seen = [], set()
+    for field in ("ingredients_main", "ingredients_needed"):
+        for name in recipe.get(field) or []:
+            key = normalize_ingredient_name(str(name))
+            if key and key not in seen:
+                seen.add(key)
+                names.append(str(name))
+    return names
+
+# 같은 레시피 판단 키 (요리 이름 + 재료)
+def recipe_key(recipe: Dict[str, Any]) -> str:
+    names = sorted(normalize_ingredient_name(name) for name in recipe_ingredients(recipe))
+    return normalize_ingredient_name(str(recipe.get("recipe_name", ""))) + "|" + ",".join(names)
+
+
+class _CorpusEntry:
+    # 레시피 하나와 재료별 색인 키
+    def __init__(self, recipe_id: int, recipe: Dict[str, Any]):
+        self.id = recipe_id
+        self.recipe = recipe
+        self.name_key = normalize_ingredient_name(str(recipe.get("recipe_name", "")))
+        self.ingredients = [(name, ingredient_keys(name)) for name in recipe_ingredients(recipe)]
+        self.required = [
+            (name, keys) for name, keys in self.ingredients
+            if not keys & STAPLES
+        ]
+
+
+class RecipeMatch:
+    """
+    보유 식재료에 대한 레시피 점수.
+    - score: 0~1 (레시피 재료 보유율 / 냉장고 재료 사용량 / 임박 재료 사용량의 가중합)
+    - used: 레시피에 쓰이는 보유 재료, urgent: 그중 3일 이내 임박 재료, missing: 없는 재료 (기본 양념 제외)
+    """
+
+    def __init__(self, recipe: Dict[str, Any], score: float, used: List[str], urgent: List[str], missing: List[str]):
+        self.recipe = recipe
+        self.score = score
+        self.used = used
+        self.urgent = urgent
+        self.missing = missing
+
+
+class RecipeCorpus:
+    """
+    지금까지 생성한 레시피와 가져온(import) 레시피 모음.
+    - 재료 색인 키 → 레시피 ID 역색인으로, 보유 재료와 하나라도 겹치는 레시피만 점수를 매깁니다.
+    - 점수가 RECIPE_MATCH_THRESHOLD 이상인 레시피가 있으면 LLM 없이 바로 추천합니다.
+    - 새로 생성한 레시피는 learn()으로 추가하고 persist()로 Recipe_Corpus 테이블에 저장합니다.
+    """
+
+    # persistent=False 이면 DB 없이 메모리 모음만 사용
+    def __init__(
+            self,
+            persistent: bool = True,
+            threshold: float = RECIPE_MATCH_THRESHOLD,
+            max_missing: int = RECIPE_MATCH_MAX_MISSING
+        ):
+        self.threshold = threshold
+        self.max_missing = max_missing
+        self._lock = threading.Lock()
+        self._entries: Dict[int, _CorpusEntry] = {}
+        self._keys: Dict[str, int] = {}            # recipe_key → ID
+        self._index: Dict[str, Set[int]] = {}      # 재료 색인 키 → 레시피 ID
+        self._next_id = -1                         # DB 에 저장되기 전 임시 ID (음수)
+        self._loaded = not persistent
+        self._persistent = persistent
+
+        # 지표
+        self._lookups = 0
+        self._hits = 0
+        self._lookup_seconds = 0.0
+        self._learned = 0
+
+    # DB에서 모음 전체 적재
+    def load(self, conn: sqlite3.Connection) -> None:
+        rows = conn.execute("SELECT id, recipe FROM Recipe_Corpus ORDER BY id").fetchall()
+        with self._lock:
+            self._entries, self._keys, self._index = {}, {}, {}
+            for recipe_id, recipe in rows:
+                self._add_locked(recipe_id, json.loads(recipe))
+            self._loaded = True
+            self._persistent = True   # 적재 실패로 메모리 전용이 됐더라도 DB를 다시 쓸 수 있으면 저장 재개
+
+    def reload(self) -> None:
+        with db_connection() as conn:
+            self.load(conn)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        try:
+            self.reload()
+        except sqlite3.Error as e:
+            print(f"경고: 레시피 모음 적재 실패 - {e}")
+            with self._lock:
+                self._loaded = True
+                self._persistent = False
+
+    # (잠금 안에서 호출) 모음과 역색인에 추가, 이미 있는 레시피면 None
+    def _add_locked(self, recipe_id: int, recipe: Dict[str, Any]) -> Optional[_CorpusEntry]:
+        key = recipe_key(recipe)
+        if key in self._keys:
+            return None
+        entry = _CorpusEntry(recipe_id, recipe)
+        self._entries[recipe_id] = entry
+        self._keys[key] = recipe_id
+        # 기본 양념은 점수에 쓰지 않으므로 색인하지 않음
+        for _, keys in entry.required:
+            for ingredient_key in keys:
+                self._index.setdefault(ingredient_key, set()).add(recipe_id)
+        return entry
+
+    # 레시피 추가 (메모리), DB에 저장할 행 반환
+    def learn(self, recipes: Iterable[Dict[str, Any]], source: str = "llm") -> List[Tuple[str, str, str, str, float]]:
+        self._ensure_loaded()
+        rows = []
+        now = time.time()
+        with self._lock:
+            for recipe in recipes:
+                if not recipe.get("recipe_name") or not recipe.get("steps") or not recipe_ingredients(recipe):
+                    continue
+                entry = self._add_locked(self._next_id, dict(recipe))
+                if entry is None:
+                    continue
+                self._next_id -= 1
+                self._learned += 1
+                rows.append((recipe_key(recipe), str(recipe["recipe_name"]), json.dumps(entry.recipe, ensure_ascii=False), source, now))
+        return rows
+
+    # learn() 결과를 DB에 저장 (같은 레시피는 무시)
+    def persist(self, rows: List[Tuple[str, str, str, str, float]]) -> None:
+        if not rows or not self._persistent:
+            return
+        try:
+            with db_connection() as conn:
+                conn.executemany("""
+                    INSERT OR IGNORE INTO Recipe_Corpus (recipe_key, recipe_name, recipe, source, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"경고: 레시피 모음 저장 실패 - {e}")
+
+    # 레시피 파일 가져오기 (JSON 객체 하나 / JSON 배열 / 한 줄에 하나씩인 JSON Lines), 추가한 개수 반환
+    def import_file(self, path: str, source: str = "import") -> int:
+        with open(path, encoding="utf-8") as f:
+            text = f.read().strip()
+        if text.startswith("["):
+            recipes = json.loads(text)
+        elif text.startswith("{") and "\n{" not in text:
+            recipes = [json.loads(text)]
+        else:
+            recipes = [json.loads(line) for line in text.splitlines() if line.strip()]
+        rows = self.learn(recipes, source=source)
+        self.persist(rows)
+        return len(rows)
+
+    # 한 레시피 점수 계산 (후보가 아니면 None)
+    def _score(
+            self,
+            entry: _CorpusEntry,
+            pantry_keys: Dict[str, Tuple[str, Optional[str]]],
+            pantry_size: int,
+            urgent_total: int
+        ) -> Optional[RecipeMatch]:
+
+        used, urgent, missing = [], [], []
+        for name, keys in entry.required:
+            found = next((pantry_keys[key] for key in keys if key in pantry_keys), None)
+            if found is None:
+                missing.append(name)
+                if len(missing) > self.max_missing:
+                    return None
+                continue
+            pantry_name, urgency = found
+            if pantry_name not in used:
+                used.append(pantry_name)
+                if urgency == "orange":
+                    urgent.append(pantry_name)
+        if not used:
+            return None
+
+        recipe_coverage = len(used) / float(len(used) + len(missing))
+        pantry_usage = min(1.0, len(used) / float(min(PANTRY_USAGE_TARGET, pantry_size)))
+        urgency_usage = min(1.0, len(urgent) / float(min(URGENT_USAGE_TARGET, urgent_total))) if urgent_total else 1.0
+        score = (
+            WEIGHT_RECIPE_COVERAGE * recipe_coverage
+            + WEIGHT_PANTRY_USAGE * pantry_usage
+            + WEIGHT_URGENCY * urgency_usage
+        )
+        return RecipeMatch(entry.recipe, round(score, 4), used, urgent, missing)
+
+    # 보유 식재료로 만들 수 있는 레시피 점수 순 상위 limit 개
+    # exclude: 제외할 요리 이름 (이미 추천한 것)
+    def search(
+            self,
+            ingredients_list: Iterable[PantryInput],
+            limit: int = 5,
+            exclude: Optional[Iterable[str]] = None
+        ) -> List[RecipeMatch]:
+
+        self._ensure_loaded()
+        pantry = merge_pantry_items(ingredients_list)
+        pantry_keys: Dict[str, Tuple[str, Optional[str]]] = {}
+        for item in pantry:
+            for key in ingredient_keys(item["name"]):
+                pantry_keys.setdefault(key, (item["name"], item["urgency"]))
+        urgent_total = sum(1 for item in pantry if item["urgency"] == "orange")
+        excluded = {normalize_ingredient_name(name) for name in exclude or []}
+
+        # 역색인으로 레시피별 보유 재료 수(상한)를 세고, 부족한 재료가 max_missing 을 넘는 레시피는 점수 계산 전에 제외
+        # (재료 하나가 여러 키로 겹쳐 세어질 수 있어 실제보다 크게 셀 뿐, 만들 수 있는 레시피를 잘못 빼지는 않음)
+        with self._lock:
+            hits: Dict[int, int] = {}
+            for key in pantry_keys:
+                for recipe_id in self._index.get(key, ()):
+                    hits[recipe_id] = hits.get(recipe_id, 0) + 1
+            entries = [
+                self._entries[recipe_id] for recipe_id, count in hits.items()
+                if len(self._entries[recipe_id].required) - count <= self.max_missing
+            ]
+
+        matches = []
+        for entry in entries:
+            if entry.name_key in excluded:
+                continue
+            match = self._score(entry, pantry_keys, len(pantry), urgent_total)
+            if match is not None:
+                matches.append(match)
+        matches.sort(key=lambda match: (-match.score, len(match.missing), -len(match.used), str(match.recipe.get("recipe_name", ""))))
+        return matches[:limit]
+
+    # 기준 점수를 넘는 레시피 점수 순 상위 limit 개
+    def good_matches(
+            self,
+            ingredients_list: Iterable[PantryInput],
+            limit: int = 1,
+            exclude: Optional[Iterable[str]] = None
+        ) -> List[RecipeMatch]:
+
+        started = time.perf_counter()
+        matches = [match for match in self.search(ingredients_list, limit=limit, exclude=exclude) if match.score >= self.threshold]
+        with self._lock:
+            self._lookups += 1
+            self._hits += int(bool(matches))
+            self._lookup_seconds += time.perf_counter() - started
+        return matches
+
+    # 기준 점수를 넘는 가장 좋은 레시피 (없으면 None)
+    def best_match(self, ingredients_list: Iterable[PantryInput], exclude: Optional[Iterable[str]] = None) -> Optional[RecipeMatch]:
+        matches = self.good_matches(ingredients_list, limit=1, exclude=exclude)
+        return matches[0] if matches else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "recipes": len(self._entries),
+                "index_keys": len(self._index),
+                "threshold": self.threshold,
+                "lookups": self._lookups,
+                "hits": self._hits,
+                "learned": self._learned,
+                "llm_skip_ratio": round(self._hits / self._lookups, 4) if self._lookups else 0.0,
+                "avg_lookup_ms": round(self._lookup_seconds * 1000 / self._lookups, 3) if self._lookups else 0.0,
+            }
+
+
+# 프로세스 전역 레시피 모음
+recipe_corpus = RecipeCorpus()
@@ -1,9 +1,11 @@
 # recipes_router.py
 
-from fastapi import APIRouter, HTTPException, Body
-from typing import Dict, Any, List
+import json
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
-from .llm_recipe_service import get_final_recipe_recommendation
+from .llm_recipe_service import get_final_recipe_recommendation_async, stream_recipe_recommendation
 
 router = APIRouter()
 
@@ -11,25 +13,34 @@ class IngredientItem(BaseModel):
     name: str
     quantity: str | float | int = "" # 수량은 없을 수도 있으므로 유연하게
     unit: str = ""
+    expiry_date: Optional[str] = None # YYYY-MM-DD, 있으면 임박한 재료를 우선 사용
+    category: Optional[str] = None
 
 class RecipeRequest(BaseModel):
     ingredients: List[IngredientItem] # 식재료 리스트
+    force_new: bool = False # True면 이미 있는 레시피 대신 LLM으로 새 레시피 생성
+
+# 요청 식재료 → 서비스용 목록 (프롬프트 구성 단계에서 같은 재료 합치기 / 임박도 정렬)
+def format_ingredients(request: RecipeRequest) -> List[Dict[str, Any]]:
+    return [item.model_dump() for item in request.ingredients]
+
+# SSE 프레임 (한글이 그대로 보이도록 ensure_ascii=False)
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
 @router.post("/recommend", response_model=Dict[str, Any], summary="LLM 기반 레시피 추천", tags=["Recipes"])
-def recommend_recipe(request: RecipeRequest):
+async def recommend_recipe(request: RecipeRequest):
     try:
-        # Pydantic 모델을 딕셔너리나 문자열 리스트로 변환하여 서비스로 전달
-        # 예: ["두부 (1개)", "양파 (2개)"] 형식으로 변환
-        formatted_ingredients = [
-            f"{item.name} ({item.quantity}{item.unit})".strip() 
-            for item in request.ingredients
-        ]
+        # Pydantic 모델을 딕셔너리 리스트로 변환하여 서비스로 전달
+        formatted_ingredients = format_ingredients(request)
 
         if not formatted_ingredients:
             raise HTTPException(status_code=400, detail="식재료 목록이 비어있습니다.")
 
         # 서비스 함수 호출 (DB 조회 대신 받은 리스트 전달)
-        recipe_data = get_final_recipe_recommendation(ingredients_list=formatted_ingredients)
+        recipe_data = await get_final_recipe_recommendation_async(
+            ingredients_list=formatted_ingredients, force_new=request.force_new
+        )
 
         if "recipe_name" not in recipe_data:
             raise HTTPException(status_code=500, detail="LLM이 유효한 레시피 응답을 반환하지 않았습니다.")
@@ -41,4 +52,22 @@ def recommend_recipe(request: RecipeRequest):
     except Exception as e:
         print(f"레시피 추천 API 오류: {e}")
         # 사용자에게 너무 자세한 에러는 숨기고 500 반환
-        raise HTTPException(status_code=500, detail="레시피 추천 시스템 처리 중 오류가 발생했습니다.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="레시피 추천 시스템 처리 중 오류가 발생했습니다.")
+
+# 스트리밍 추천: 레시피가 생성되는 동안 완성된 부분부터 server-sent events로 전달
+# 이벤트 순서 예: recipe_name → ingredients_main → step(여러 번) → field → done (오류 시 error)
+@router.post("/recommend/stream", summary="LLM 기반 레시피 추천 (SSE 스트리밍)", tags=["Recipes"])
+async def recommend_recipe_stream(request: RecipeRequest):
+    formatted_ingredients = format_ingredients(request)
+    if not formatted_ingredients:
+        raise HTTPException(status_code=400, detail="식재료 목록이 비어있습니다.")
+
+    async def event_stream():
+        async for event, data in stream_recipe_recommendation(formatted_ingredients, request.force_new):
+            yield sse_event(event, data)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
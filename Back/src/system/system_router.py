@@ -0,0 +1,65 @@
+# system_router.py (서버 상태 및 성능 지표 조회)
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from typing import Any, Dict
+
+from ..db.database import get_pool
+from ..ocr.ocr_worker_pool import ocr_pool
+from ..ocr.ocr_router import ingest_stats
+from ..ocr.ocr_jobs import receipt_jobs
+from ..cache.result_cache import ocr_result_cache, refine_result_cache
+from ..llm.line_dictionary import line_dictionary
+from ..llm.llm_client import llm_client
+from ..recipes.recipe_cache import recipe_cache
+from ..recipes.recipe_corpus import recipe_corpus
+
+router = APIRouter()
+
+# GET /system/db-pool (DB 커넥션 풀 지표)
+@router.get("/db-pool", response_model=Dict[str, Any], summary="DB 커넥션 풀 지표 조회")
+def db_pool_metrics():
+    return get_pool().metrics()
+
+# GET /system/ocr-pool (OCR 워커 풀 지표)
+@router.get("/ocr-pool", response_model=Dict[str, Any], summary="OCR 워커 풀 지표 조회")
+def ocr_pool_metrics():
+    return {**ocr_pool.metrics(), "ingest": dict(ingest_stats)}
+
+# GET /system/ocr-jobs (영수증 처리 작업 지표)
+@router.get("/ocr-jobs", response_model=Dict[str, Any], summary="영수증 처리 작업 지표 조회")
+def ocr_job_metrics():
+    return receipt_jobs.metrics()
+
+# GET /system/cache (OCR / LLM 보정 / 레시피 추천 캐시 지표)
+@router.get("/cache", response_model=Dict[str, Any], summary="결과 캐시 지표 조회")
+def cache_metrics():
+    return {
+        "ocr": ocr_result_cache.metrics(),
+        "refine": refine_result_cache.metrics(),
+        "recipe": recipe_cache.metrics(),
+    }
+
+# GET /system/line-dictionary (영수증 줄 사전 적중률: LLM을 건너뛴 줄 비율)
+@router.get("/line-dictionary", response_model=Dict[str, Any], summary="영수증 줄 사전 지표 조회")
+def line_dictionary_metrics():
+    return line_dictionary.metrics()
+
+# GET /system/recipe-corpus (로컬 레시피 모음 적중률: LLM을 건너뛴 추천 비율)
+@router.get("/recipe-corpus", response_model=Dict[str, Any], summary="로컬 레시피 모음 지표 조회")
+def recipe_corpus_metrics():
+    return recipe_corpus.metrics()
+
+# GET /system/llm (LLM 모델 상주 상태 / 호출별 로드 시간과 생성 시간)
+@router.get("/llm", response_model=Dict[str, Any], summary="LLM 모델 상주 / 호출 지표 조회")
+def llm_metrics():
+    return llm_client.metrics()
+
+# GET /system/ready (준비 상태: OCR 모델 예열 중이거나 예열에 실패했으면 503)
+@router.get("/ready", response_model=Dict[str, Any], summary="서버 준비 상태 조회")
+def readiness():
+    ocr = ocr_pool.readiness()
+    body = {"ready": ocr["ready"], "ocr": ocr}
+    if not body["ready"]:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body)
+    return body
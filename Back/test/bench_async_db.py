@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import asyncio
+import sqlite3
+import tempfile
+
+import httpx
+from fastapi import FastAPI, Depends
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import shutdown_db_executor
+from src.ingredients.ingredients_router import router as ingredients_router
+from src.ingredients.ingredients_crud import get_filtered_ingredients
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+SLOW_OCR_SECONDS = 1.0   # 느린 OCR 호출 1건의 처리 시간
+SLOW_OCR_REQUESTS = 80   # 동시에 들어오는 OCR 요청 수 (기본 스레드풀 40개를 초과)
+READ_REQUESTS = 50       # 그 사이에 들어오는 목록 조회 요청 수
+
+app = FastAPI()
+app.include_router(ingredients_router, prefix="/ingredients")
+
+# OCR/LLM 처럼 스레드풀 슬롯을 오래 점유하는 동기 엔드포인트
+@app.post("/slow-ocr")
+def slow_ocr():
+    time.sleep(SLOW_OCR_SECONDS)
+    return {"ok": True}
+
+# 비교용: 기존 방식의 동기 목록 조회 엔드포인트
+@app.get("/legacy/list")
+def legacy_list(conn: sqlite3.Connection = Depends(database.get_db_connection)):
+    return [dict(row) for row in get_filtered_ingredients(conn)]
+
+
+async def measure(client: httpx.AsyncClient, read_path: str):
+    slow_tasks = [asyncio.create_task(client.post("/slow-ocr")) for _ in range(SLOW_OCR_REQUESTS)]
+    await asyncio.sleep(0.1)  # OCR 요청이 스레드풀을 먼저 채우도록 대기
+
+    latencies = []
+    for _ in range(READ_REQUESTS):
+        started = time.perf_counter()
+        response = await client.get(read_path)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*slow_tasks)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"[{read_path}] OCR {SLOW_OCR_REQUESTS}건 처리 중 조회 p50 {p50:.1f}ms | p99 {p99:.1f}ms")
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_pool(os.path.join(tmp, "bench.db"))
+        database.initialize_database()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            await measure(client, "/legacy/list")
+            await measure(client, "/ingredients/list")
+
+        shutdown_db_executor()
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
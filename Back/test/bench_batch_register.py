@@ -0,0 +1,87 @@
+import os
+import sys
+import time
+import asyncio
+import tempfile
+
+import httpx
+from fastapi import FastAPI
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import shutdown_db_executor
+from src.ingredients.ingredients_router import router as ingredients_router
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+RECEIPT_SIZES = [10, 20, 40]  # 영수증 1장에서 나오는 식재료 수
+ROUNDS = 20                   # 크기별 반복 횟수
+
+app = FastAPI()
+app.include_router(ingredients_router, prefix="/ingredients")
+
+SAMPLE_ITEMS = [
+    ("두부", "두부", "냉장"), ("우유", "유제품", "냉장"), ("양파", "채소", "상온"),
+    ("삼겹살", "육류", "냉동"), ("사과", "과일", "냉장"), ("계란", "달걀", "냉장"),
+]
+
+
+def make_items(count: int) -> list:
+    return [
+        {
+            "name": f"{name}{i}",
+            "category_tag": category,
+            "storage_location": location,
+            "quantity": 1,
+            "unit": "개",
+        }
+        for i, (name, category, location) in ((i, SAMPLE_ITEMS[i % len(SAMPLE_ITEMS)]) for i in range(count))
+    ]
+
+
+async def single_calls(client: httpx.AsyncClient, items: list):
+    for item in items:
+        response = await client.post("/ingredients/register", json=item)
+        response.raise_for_status()
+
+
+async def batch_call(client: httpx.AsyncClient, items: list):
+    response = await client.post("/ingredients/register/batch", json=items)
+    response.raise_for_status()
+    assert response.json()["succeeded"] == len(items)
+
+
+async def timed(fn, client, items) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await fn(client, items)
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_pool(os.path.join(tmp, "bench.db"))
+        database.initialize_database()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for size in RECEIPT_SIZES:
+                items = make_items(size)
+                single_ms = await timed(single_calls, client, items)
+                batch_ms = await timed(batch_call, client, items)
+                print(f"[{size}개] 단건 {size}회 {single_ms:.1f}ms | 일괄 1회 {batch_ms:.1f}ms "
+                      f"({single_ms / batch_ms:.1f}배)")
+
+        shutdown_db_executor()
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.ingredients.ingredients_crud import get_filtered_ingredients
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+REQUESTS = 5000      # 총 요청 수
+CONCURRENCY = 32     # 동시 요청 수 (스레드)
+ROWS = 300           # 테스트용 식재료 수
+
+
+def count_open_fds() -> int:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except FileNotFoundError:
+        return -1
+
+
+def prepare_database(path: str):
+    pool = database.init_pool(path, size=1)
+    database.initialize_database()
+    with pool.connection() as conn:
+        conn.executemany("""
+            INSERT INTO Ingredients
+            (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date)
+            VALUES (?, 1, '개', 1, 1, date('now', ?), date('now'))
+        """, [(f"재료{i}", f"+{i % 30} days") for i in range(ROWS)])
+        conn.commit()
+
+
+# 기존 방식: 요청마다 새 커넥션을 열고 닫지 않음
+def legacy_request(path: str, leaked: list):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    leaked.append(conn)  # 의존성이 커넥션을 닫지 않던 기존 동작 재현
+    return get_filtered_ingredients(conn)
+
+
+# 풀 방식: 풀에서 빌려 쓰고 반납
+def pooled_request(pool: database.ConnectionPool):
+    with pool.connection() as conn:
+        return get_filtered_ingredients(conn)
+
+
+def run(label: str, fn):
+    latencies = []
+    peak_fds = [count_open_fds()]
+    lock = threading.Lock()
+
+    def timed(_):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            if len(latencies) % 250 == 0:
+                peak_fds.append(count_open_fds())
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        list(executor.map(timed, range(REQUESTS)))
+    total = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"[{label}] total {total:.2f}s | p50 {p50:.2f}ms | p99 {p99:.2f}ms | "
+          f"FD 시작 {peak_fds[0]} -> 최대 {max(peak_fds)} -> 종료 {count_open_fds()}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        prepare_database(path)
+
+        leaked = []
+        run("legacy connect", lambda: legacy_request(path, leaked))
+        for conn in leaked:
+            conn.close()
+
+        pool = database.init_pool(path, size=database.POOL_SIZE)
+        run(f"pool(size={pool.size})", lambda: pooled_request(pool))
+        print("풀 지표:", pool.metrics())
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
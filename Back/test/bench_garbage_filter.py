@@ -0,0 +1,86 @@
+import os
+import sys
+import re
+import time
+import random
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.llm.garbage_filter import garbage_filter
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+LINE_COUNTS = (1000, 5000, 20000)
+REPEAT = 5
+
+
+# 비교용: 기존 is_garbage_text (호출마다 불용어 목록 생성 + 키워드별 부분 문자열 검사)
+def legacy_is_garbage_text(item):
+    text = ""
+    if isinstance(item, dict):
+        text = str(item.get('raw_text', '') or item.get('text', '') or '').strip()
+    else:
+        text = str(item).strip()
+    if not text: return True
+    if not re.search(r'[가-힣0-9a-zA-Z]', text):
+        return True
+    GARBAGE_KEYWORDS = [
+        "결제", "카드", "부가세", "포인트", "주소", "TEL", "대표", 
+        "영수증", "Total", "내역", "배달", "반품", "교환", "가맹점", 
+        "승인", "매출", "사업자", "품목", "봉투", "쇼핑백", "종량제", "비닐", "Trash",
+        "POINT", "Point", "적립", "사용", "소멸", "잔여", "누리", "에누리",
+        "PL", "S-OIL", "L.POINT", "CASH", "CARD", "쿠폰", "부가세", "바코드", "회원", "포인트"
+        "미사용", "개월", "문의", "안내", "영수증확인", "서명", "사업자번호", "전화", "홈페이지"
+    ]
+    if any(k in text for k in GARBAGE_KEYWORDS): return True
+    return False
+
+
+# 가짜 영수증 줄 (상품 줄 70% + 헤더/결제/구분선 30%)
+def make_lines(count: int) -> list:
+    rng = random.Random(11)
+    products = ["풀/소가부침두부", "서울우유 1L", "대파", "양파 1.5kg", "삼겹살 구이용", "CJ 햇반 210g", "청정원 고추장"]
+    noise = ["신용카드 승인", "L.POINT 적립 120", "------------", "부가세 과세물품", "TEL 02-123-4567",
+             "영수증 재발행", "*", "합계 23,500", "(주)이마트 가맹점", "교환/반품 안내"]
+    lines = []
+    for i in range(count):
+        if rng.random() < 0.7:
+            text = f"{i % 50:03d} {rng.choice(products)} {rng.randint(1, 3)} {rng.randint(10, 99) * 100:,}"
+        else:
+            text = rng.choice(noise)
+        lines.append({"index": i + 1, "text": text, "avg_confidence": round(rng.uniform(0.5, 1.0), 3)})
+    return lines
+
+
+def bench(label: str, func, lines) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        func(lines)
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<24} {best * 1000:8.2f} ms  ({best / len(lines) * 1e6:.2f} µs/줄)")
+    return best
+
+
+def main():
+    print(f"=== OCR 줄 1차 필터 (최소 {REPEAT}회 중 최솟값) ===")
+    for count in LINE_COUNTS:
+        lines = make_lines(count)
+        legacy_result = [item for item in lines if not legacy_is_garbage_text(item)]
+        assert garbage_filter.filter_lines(lines) == legacy_result
+
+        print(f"[{count}줄] 남는 줄 {len(legacy_result)}")
+        legacy = bench("기존 (키워드별 검사)", lambda ls: [i for i in ls if not legacy_is_garbage_text(i)], lines)
+        single = bench("컴파일 정규식 (줄 단위)", lambda ls: [i for i in ls if not garbage_filter.is_garbage(i)], lines)
+        batch = bench("컴파일 정규식 (목록 일괄)", garbage_filter.filter_lines, lines)
+        print(f"  단축: 줄 단위 {legacy / single:.1f}배, 목록 일괄 {legacy / batch:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import tempfile
+from datetime import date, timedelta
+from typing import Any, List
+
+import httpx
+from fastapi import FastAPI
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import run_in_db_thread, shutdown_db_executor
+from src.ingredients.ingredients_router import router as ingredients_router
+from src.ingredients.ingredients_crud import get_filtered_ingredients, get_history_ingredients
+from src.ingredients.labeling import calculate_remaining_days, get_visual_labeling_data
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# - 활성 식재료 10,000개 (유통기한 -10 ~ +60일) + 사용/폐기 히스토리 10,000개
+# - 기존: 라벨링 컬럼 없는 쿼리 → 행마다 dict(row) + strptime / datetime.now() + 라벨 dict 병합
+# - 변경: 쿼리에서 julianday / CASE 로 계산한 행을 dict 로만 변환
+# ------------------------------------------------------------------
+ROWS = 10000
+REPEAT = 10
+SEED = 5
+
+LEGACY_LIST_SQL = """
+    SELECT I.*, S.name AS storage_name, C.name AS category_name
+    FROM Ingredients I
+    JOIN Storage_Locations S ON I.storage_location_id = S.id
+    JOIN Categories C ON I.category_id = C.id
+    WHERE I.status = 'active'
+    ORDER BY I.expiry_date ASC
+"""
+LEGACY_HISTORY_SQL = "SELECT * FROM Ingredients WHERE status IN ('used', 'discarded') ORDER BY id DESC"
+
+
+def legacy_rows(sql: str) -> list:
+    with database.db_connection() as conn:
+        rows = conn.execute(sql).fetchall()
+    result = []
+    for row in rows:
+        ingredient = dict(row)
+        remaining_days = calculate_remaining_days(ingredient['expiry_date'])
+        ingredient.update(get_visual_labeling_data(remaining_days))
+        result.append(ingredient)
+    return result
+
+
+def labeled_rows(fetch) -> list:
+    with database.db_connection() as conn:
+        return [dict(row) for row in fetch(conn)]
+
+
+app = FastAPI()
+app.include_router(ingredients_router, prefix="/ingredients")
+
+# 비교용: 기존 방식의 목록 / 히스토리 엔드포인트 (응답 모델은 기존 라우터와 동일)
+@app.get("/legacy/list", response_model=List[Any])
+async def legacy_list():
+    return await run_in_db_thread(legacy_rows, LEGACY_LIST_SQL)
+
+@app.get("/legacy/history", response_model=List[Any])
+async def legacy_history():
+    return await run_in_db_thread(legacy_rows, LEGACY_HISTORY_SQL)
+
+
+def seed(rng: random.Random) -> None:
+    today = date.today()
+    rows = []
+    for i in range(ROWS * 2):
+        expiry = (today + timedelta(days=rng.randint(-10, 60))).strftime("%Y-%m-%d")
+        status = "active" if i < ROWS else rng.choice(("used", "discarded"))
+        rows.append((f"재료{i}", float(rng.randint(1, 5)), "개", rng.randint(1, 24), rng.randint(1, 4),
+                     expiry, today.strftime("%Y-%m-%d"), status))
+    with database.db_connection() as conn:
+        conn.executemany("""
+            INSERT INTO Ingredients (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        conn.commit()
+
+
+def best_of(fn) -> float:
+    times = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times) * 1000
+
+
+async def best_of_request(client: httpx.AsyncClient, path: str) -> tuple:
+    times = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        times.append(time.perf_counter() - started)
+    return min(times) * 1000, response.json()
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_pool(os.path.join(tmp, "bench.db"))
+        database.initialize_database()
+        seed(random.Random(SEED))
+
+        print(f"=== 라벨링 ({ROWS}행, {REPEAT}회 중 최솟값) ===")
+        print(f"  {'엔드포인트':10} | {'방식':4} | {'조회+라벨링':>10} | {'JSON 직렬화':>10} | {'HTTP 응답':>10}")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            for name, legacy_sql, fetch in (
+                ("list", LEGACY_LIST_SQL, get_filtered_ingredients),
+                ("history", LEGACY_HISTORY_SQL, get_history_ingredients),
+            ):
+                before = legacy_rows(legacy_sql)
+                after = labeled_rows(fetch)
+                # 같은 행, 같은 라벨 (SQL 계산 결과 == 파이썬 계산 결과)
+                assert len(before) == len(after) == ROWS
+                assert sorted(map(json.dumps, before)) == sorted(map(json.dumps, after))
+
+                for label, fn, rows, path in (
+                    ("기존", lambda: legacy_rows(legacy_sql), before, f"/legacy/{name}"),
+                    ("SQL", lambda: labeled_rows(fetch), after, f"/ingredients/{name}"),
+                ):
+                    build_ms = best_of(fn)
+                    dump_ms = best_of(lambda: json.dumps(rows, ensure_ascii=False))
+                    http_ms, body = await best_of_request(client, path)
+                    assert len(body) == ROWS
+                    print(f"  {name:10} | {label:4} | {build_ms:8.1f}ms | {dump_ms:8.1f}ms | {http_ms:8.1f}ms")
+
+        shutdown_db_executor()
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
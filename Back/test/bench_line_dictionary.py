@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import random
+import asyncio
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from stub_ollama import StubOllamaServer
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+CALL_LATENCY = 0.5     # Ollama 호출 1회 지연(초)
+RECEIPTS = 30          # 같은 체인점 영수증 수
+LINES_PER_RECEIPT = 25
+CATALOG_SIZE = 80      # 체인점에서 자주 사는 상품 수
+
+stub = StubOllamaServer(latency=CALL_LATENCY).start()
+os.environ["OLLAMA_HOST"] = stub.host   # ollama 모듈 import 전에 설정
+
+from src.llm import llm_processor
+from src.llm.line_dictionary import LineDictionary
+from src.cache.result_cache import refine_result_cache
+
+llm_processor.resolve_category_tag = lambda category, name="": "기타"
+llm_processor.print = lambda *args, **kwargs: None
+
+
+# 같은 상품이 영수증마다 다른 줄 번호/코드 표기로 찍히는 상황을 흉내냄
+def make_receipts() -> list:
+    rng = random.Random(7)
+    brands = ["풀/", "CJ ", "농심 ", "", "P "]
+    foods = ["소가부침두부", "국산콩두부", "서울우유", "대파", "양파", "삼겹살", "햇반", "고추장", "계란", "콩나물",
+             "애호박", "감자", "당근", "사과", "바나나", "요거트", "치즈", "라면", "어묵", "만두"]
+    catalog = [f"{brands[i % len(brands)]}{foods[i % len(foods)]} {i // len(foods) + 1}입 1 {1000 + i * 130:,}"
+               for i in range(CATALOG_SIZE)]
+    receipts = []
+    for _ in range(RECEIPTS):
+        picked = rng.sample(catalog, LINES_PER_RECEIPT - 1) + ["비닐봉투 20L 1 100"]
+        receipts.append([f"{rng.randint(1, 40):03d}{rng.choice(['', ' ', '. '])}{line}" for line in picked])
+    return receipts
+
+
+async def run(label: str, dictionary: LineDictionary, receipts: list) -> None:
+    llm_processor.line_dictionary = dictionary
+    refine_result_cache.clear()
+    stub.reset()
+
+    started = time.perf_counter()
+    first_half = second_half = 0.0
+    for i, receipt in enumerate(receipts):
+        t0 = time.perf_counter()
+        items = await llm_processor.refine_ingredients_with_llm_async(receipt)
+        assert len(items) == LINES_PER_RECEIPT - 1
+        if i < len(receipts) // 2:
+            first_half += time.perf_counter() - t0
+        else:
+            second_half += time.perf_counter() - t0
+    elapsed = time.perf_counter() - started
+
+    half = len(receipts) // 2
+    print(f"[{label}] 총 {elapsed:6.2f}s | 영수증당 앞 절반 {first_half / half:.2f}s, 뒤 절반 {second_half / half:.2f}s "
+          f"| Ollama 호출 {stub.calls}회")
+
+
+async def main():
+    receipts = make_receipts()
+    print(f"=== 같은 체인점 영수증 {RECEIPTS}장 x {LINES_PER_RECEIPT}줄 (상품 {CATALOG_SIZE}종, 호출당 {CALL_LATENCY}s) ===")
+
+    # 기존 흐름: 모든 줄을 LLM으로 보냄 (조회가 항상 실패하는 사전)
+    class NoDictionary(LineDictionary):
+        def lookup(self, text):
+            super().lookup(text)
+            return None
+    await run("사전 없음", NoDictionary(persistent=False), receipts)
+
+    dictionary = LineDictionary(persistent=False)
+    await run("줄 사전", dictionary, receipts)
+    metrics = dictionary.metrics()
+    print(f"  LLM을 건너뛴 줄 비율 {metrics['llm_skip_ratio'] * 100:.1f}% "
+          f"(정확 일치 {metrics['exact_hits']}, 정규화 일치 {metrics['normalized_hits']}, LLM {metrics['sent_to_llm']})")
+
+    stub.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
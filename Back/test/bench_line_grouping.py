@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.line_grouping import group_lines, adaptive_line_threshold
+from test_line_grouping import legacy_group_lines, synthetic_receipt, assert_same_lines
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+BOX_COUNTS = [50, 200, 500, 1000, 2000]
+REPEAT = 20
+
+
+def timed(func, *args, **kwargs):
+    best = float("inf")
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    print(f"=== OCR 줄 묶기 (최솟값 / {REPEAT}회) ===")
+    for count in BOX_COUNTS:
+        for label, skew in (("수평", 0.0), ("기울어짐", 0.03)):
+            texts, boxes, scores = synthetic_receipt(count, seed=count, skew=skew)
+            legacy_time, expected = timed(legacy_group_lines, texts, boxes, scores, threshold=12)
+            vector_time, actual = timed(group_lines, texts, boxes, scores, threshold=12)
+            assert_same_lines(actual, expected)
+            print(f"  박스 {count:5d} ({label:4s}) | 기존 {legacy_time * 1000:8.2f}ms | 배열 연산 {vector_time * 1000:6.2f}ms "
+                  f"| x{legacy_time / vector_time:5.1f} | 줄 {len(actual)}")
+
+    texts, boxes, scores = synthetic_receipt(200, seed=0)
+    for scale in (1, 2, 3):
+        scaled = boxes * scale
+        print(f"  해상도 x{scale}: adaptive 허용 오차 {adaptive_line_threshold(scaled):.1f}px "
+              f"| 줄 수 고정 12px {len(group_lines(texts, scaled, scores, threshold=12))} "
+              f"/ adaptive {len(group_lines(texts, scaled, scores, threshold='adaptive'))}")
+
+
+if __name__ == "__main__":
+    main()
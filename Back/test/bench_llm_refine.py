@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import asyncio
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from stub_ollama import StubOllamaServer
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정 (결과 캐시 / 줄 사전은 매 실행마다 비움)
+# ------------------------------------------------------------------
+CALL_LATENCY = 1.0        # Ollama 호출 1회 고정 지연(초)
+PER_LINE_LATENCY = 0.02   # 입력 줄당 추가 지연(초, 출력 토큰 생성 시간 흉내)
+RECEIPT_SIZES = (20, 60, 120)
+PARALLEL = (2, 4)
+
+stub = StubOllamaServer(latency=CALL_LATENCY, per_line=PER_LINE_LATENCY).start()
+os.environ["OLLAMA_HOST"] = stub.host   # ollama 모듈 import 전에 설정해야 기본 클라이언트에 반영됨
+
+from src.llm import llm_processor
+from src.llm.llm_processor import refine_ingredients_with_llm_async
+from src.cache.result_cache import refine_result_cache
+from src.llm.line_dictionary import LineDictionary
+
+# DB 없이 실행 (카테고리 캐시 대신 정적 매핑만 사용)
+llm_processor.resolve_category_tag = lambda category, name="": "기타"
+# 디버그 출력 생략
+llm_processor.print = lambda *args, **kwargs: None
+
+
+# 가짜 영수증 줄 (상품명 + 수량 + 가격)
+def make_receipt(line_count: int) -> list:
+    names = ["풀무원 소가부침두부", "서울우유 1L", "대파", "양파 1.5kg", "삼겹살 구이용", "CJ 햇반 210g", "청정원 고추장", "계란 30구"]
+    return [f"{i:03d} {names[i % len(names)]} 1 {1000 + i * 10:,}" for i in range(line_count)]
+
+
+def main():
+    print(f"=== LLM 보정 지연 (호출당 {CALL_LATENCY}s + 줄당 {PER_LINE_LATENCY}s) ===")
+    for size in RECEIPT_SIZES:
+        lines = make_receipt(size)
+        chunks = llm_processor.chunk_lines_by_tokens(lines)
+
+        # 기존: 20줄 고정 청크를 순차 호출 (보정 결과 캐시는 매번 비움)
+        stub.reset()
+        refine_result_cache.clear()
+        llm_processor.line_dictionary = LineDictionary(persistent=False)
+        fixed_chunks = [lines[i:i + 20] for i in range(0, size, 20)]
+        started = time.perf_counter()
+        legacy_items = []
+        for chunk in fixed_chunks:
+            legacy_items.extend(llm_processor.refine_batch_items(chunk))
+        legacy = time.perf_counter() - started
+
+        print(f"[{size}줄] 토큰 예산 청크 {len(chunks)}개 (줄 수 {[len(c) for c in chunks]})")
+        print(f"  기존 (20줄 순차)        {legacy:6.2f}s  호출 {stub.calls}회")
+
+        # 변경: 토큰 예산 청크 + 동시 호출
+        for parallel in PARALLEL:
+            stub.reset()
+            refine_result_cache.clear()
+            llm_processor.line_dictionary = LineDictionary(persistent=False)
+            started = time.perf_counter()
+            items = asyncio.run(refine_ingredients_with_llm_async(lines, parallel=parallel))
+            elapsed = time.perf_counter() - started
+            assert [item["product_name"] for item in items] == [item["product_name"] for item in legacy_items]
+            print(f"  병렬 {parallel} (토큰 예산)     {elapsed:6.2f}s  호출 {stub.calls}회 "
+                  f"최대 동시 {stub.max_concurrency} | {legacy / elapsed:.1f}배")
+
+    stub.stop()
+
+
+if __name__ == "__main__":
+    main()
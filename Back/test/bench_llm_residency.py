@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+
+import ollama
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from stub_ollama import StubOllamaServer
+from src.llm.llm_client import LLMClient
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+LOAD_SECONDS = 1.0    # 모델 로드 시간
+CALL_LATENCY = 0.2    # 생성 시간
+ROUNDS = 6            # 한 라운드 = 영수증 보정 2회 + 레시피 추천 1회
+REFINE_MODEL = "deepseek-r1:8b"
+RECIPE_MODEL = "exaone3.5:7.8b"
+MESSAGES = [{"role": "system", "content": "recipe_name"}, {"role": "user", "content": "두부"}]
+TRAFFIC = [REFINE_MODEL, REFINE_MODEL, RECIPE_MODEL] * ROUNDS
+
+
+# 기존 방식: 보정 모델 keep_alive=-1, 레시피 모델 keep_alive=0 을 호출마다 직접 지정
+def run_legacy(stub):
+    client = ollama.Client(host=stub.host)
+    for model in TRAFFIC:
+        client.chat(model=model, messages=MESSAGES, keep_alive=-1 if model == REFINE_MODEL else 0)
+
+
+def run_managed(stub, budget_mb):
+    llm = LLMClient(memory_budget_mb=budget_mb, host=stub.host)
+    llm.register(REFINE_MODEL, keep_alive=1800, memory_mb=5500)
+    llm.register(RECIPE_MODEL, keep_alive=600, memory_mb=5000)
+    llm.warm_up([REFINE_MODEL])
+    for model in TRAFFIC:
+        llm.chat(model, MESSAGES)
+    return llm.metrics()
+
+
+def main():
+    print(f"=== Ollama 모델 상주 (로드 {LOAD_SECONDS}s, 생성 {CALL_LATENCY}s, 호출 {len(TRAFFIC)}회: 보정 2 + 레시피 1 반복) ===")
+    for max_loaded, label in ((2, "두 모델이 함께 올라가는 장비"), (1, "한 모델만 올라가는 장비")):
+        stub = StubOllamaServer(latency=CALL_LATENCY, load_seconds=LOAD_SECONDS, max_loaded=max_loaded).start()
+        print(f"  [{label}]")
+
+        t0 = time.perf_counter()
+        run_legacy(stub)
+        print(f"    기존 keep_alive 고정   | {time.perf_counter() - t0:5.2f}s | 모델 로드 {stub.loads}")
+
+        budget = 12000 if max_loaded == 2 else 6000
+        stub.reset()
+        t0 = time.perf_counter()
+        metrics = run_managed(stub, budget)
+        elapsed = time.perf_counter() - t0
+        per_model = {name: (m["cold_loads"], m["avg_load_ms"], m["avg_eval_ms"]) for name, m in metrics["models"].items()}
+        print(f"    상주 관리 (예산 {budget}MB) | {elapsed:5.2f}s | 모델 로드 {stub.loads} | 예산 초과 해제 {metrics['evictions']}회")
+        print(f"      모델별 (콜드 로드 수, 평균 로드 ms, 평균 생성 ms): {per_model}")
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
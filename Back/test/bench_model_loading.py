@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import asyncio
+import subprocess
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+# 워커 프로세스의 유휴 해제 설정 (spawn 된 워커가 환경 변수를 물려받음)
+IDLE_SECONDS = 1.0
+os.environ["FRIDGE_MODEL_IDLE_SECONDS"] = str(IDLE_SECONDS)
+os.environ["FRIDGE_MODEL_REAPER_INTERVAL"] = "0.2"
+
+from src.ocr.ocr_worker_pool import OCRWorkerPool
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+LOAD_SECONDS = 2.0   # 모델 로드 시간 (PaddleOCR 로드 흉내)
+OCR_SECONDS = 0.1    # OCR 1건 처리 시간
+WORKERS = 2
+
+
+def _load_slow_model():
+    time.sleep(LOAD_SECONDS)
+    return object()
+
+
+# 레지스트리로 모델을 지연 로드하는 가짜 프로세서 (AdvancedOCRProcessor 와 같은 구조)
+class LazyModelProcessor:
+    def __init__(self):
+        from src.ocr.model_registry import model_registry
+        self.models = model_registry
+        self.models.register("paddle_ocr", _load_slow_model)
+
+    def warm_up(self):
+        self.models.warm_up(["paddle_ocr"])
+
+    def process(self, image_path):
+        with self.models.use("paddle_ocr"):
+            time.sleep(OCR_SECONDS)
+        return {"status": "success", "line_count": 0, "lines": []}
+
+
+# 새 인터프리터에서 모듈 import 시간과 PaddleOCR 로드 여부 측정
+def measure_import(module: str):
+    code = (
+        "import sys, time; t = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - t, 'paddleocr' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=parent_dir, capture_output=True, text=True)
+    if output.returncode != 0:
+        return None, output.stderr.strip().splitlines()[-1]
+    seconds, paddle = output.stdout.split()
+    return float(seconds), paddle == "True"
+
+
+async def cold_start(warm: bool):
+    pool = OCRWorkerPool(workers=WORKERS, queue_size=4, processor_factory=LazyModelProcessor)
+    started = time.perf_counter()
+    pool.start()
+    ready_at = None
+    if warm:
+        pool.start_warm_up()
+        while not pool.readiness()["ready"] or pool.readiness()["warm_up"] != "ready":
+            await asyncio.sleep(0.05)
+        ready_at = time.perf_counter() - started
+
+    t0 = time.perf_counter()
+    await pool.process("unused.jpg")
+    first = time.perf_counter() - t0
+    loaded = pool.readiness()["models_loaded"]
+    return pool, ready_at, first, loaded
+
+
+async def main():
+    print("=== import 시간 (새 인터프리터) ===")
+    for module in ("src.main", "src.ocr.OCR_processor"):
+        seconds, paddle = measure_import(module)
+        if seconds is None:
+            print(f"  {module:24s} | 실패: {paddle}")
+        else:
+            print(f"  {module:24s} | {seconds * 1000:7.1f}ms | PaddleOCR import 여부 {paddle}")
+
+    print(f"\n=== 콜드 스타트 (워커 {WORKERS}, 모델 로드 {LOAD_SECONDS}s, OCR {OCR_SECONDS}s) ===")
+    pool, _, first, loaded = await cold_start(warm=False)
+    print(f"  예열 없음 | 첫 요청 {first:.2f}s | 로드된 모델 {loaded}")
+    pool.shutdown()
+
+    pool, ready_at, first, loaded = await cold_start(warm=True)
+    print(f"  예열 있음 | 준비 완료 {ready_at:.2f}s 후 첫 요청 {first:.2f}s | 로드된 모델 {loaded}")
+
+    # 유휴 해제: IDLE_SECONDS 동안 요청이 없으면 워커의 모델을 해제하고, 다음 요청에서 다시 로드
+    await asyncio.sleep(IDLE_SECONDS + 0.8)
+    after_idle = pool.readiness()["models_loaded"]
+    t0 = time.perf_counter()
+    await pool.process("unused.jpg")
+    print(f"  유휴 {IDLE_SECONDS}s 후 로드된 모델 {loaded} → {after_idle} | 다음 요청 {time.perf_counter() - t0:.2f}s (재로드)")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
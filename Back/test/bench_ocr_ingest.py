@@ -0,0 +1,125 @@
+import os
+import sys
+import time
+import shutil
+import asyncio
+import tempfile
+import warnings
+
+import cv2
+import numpy as np
+from starlette.datastructures import UploadFile
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.image_io import decode_image, get_upload_size, copy_upload_to_shared_memory, attach_shared_image
+from src.ocr.ocr_worker_pool import OCRWorkerPool
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+IMAGE_DIR = os.path.join(current_dir, "image")
+REPEAT = 20
+
+
+# 디코딩만 수행하는 가짜 프로세서 (PaddleOCR 없이 전달 경로만 확인)
+class DecodeOnlyProcessor:
+    def process(self, image_path: str) -> dict:
+        img = cv2.imdecode(np.fromfile(image_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        return {"shape": None if img is None else img.shape}
+
+    def process_bytes(self, data) -> dict:
+        img = decode_image(data)
+        return {"shape": None if img is None else img.shape}
+
+
+# FastAPI가 받은 것과 같은 형태의 업로드 객체 (1MB 이하는 메모리, 초과분은 디스크)
+def make_upload(data: bytes) -> UploadFile:
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    spooled.write(data)
+    spooled.seek(0)
+    return UploadFile(file=spooled, filename="r.jpg", size=len(data))
+
+
+# 기존 방식: temp_uploads에 저장 → 파일에서 다시 읽어 디코딩
+def legacy_ingest(upload: UploadFile, upload_dir: str):
+    upload.file.seek(0)
+    file_path = os.path.join(upload_dir, "r.jpg")
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(upload.file, buffer)
+    img = cv2.imdecode(np.fromfile(file_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+    os.remove(file_path)
+    return img
+
+
+# 변경 방식: 공유 메모리에 한 번 복사 → 워커가 그대로 참조해 디코딩
+def shared_ingest(upload: UploadFile):
+    size = get_upload_size(upload.file)
+    shm = copy_upload_to_shared_memory(upload.file, size)
+    try:
+        with attach_shared_image(shm.name, size) as view:
+            return decode_image(view)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def bench(label: str, func, *args) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        func(*args)
+    elapsed = (time.perf_counter() - started) / REPEAT * 1000
+    print(f"  {label:<28} {elapsed:8.2f} ms/건")
+    return elapsed
+
+
+async def run_through_pool(images):
+    pool = OCRWorkerPool(workers=1, queue_size=len(images), processor_factory=DecodeOnlyProcessor)
+    pool.start()
+    try:
+        for name, data in images:
+            upload = make_upload(data)
+            result = await pool.process_upload(upload.file, get_upload_size(upload.file))
+            print(f"  {name}: 워커 디코딩 결과 {result['shape']}")
+        print(f"  풀 지표: {pool.metrics()}")
+    finally:
+        pool.shutdown()
+
+
+def main():
+    images = []
+    for name in sorted(os.listdir(IMAGE_DIR)):
+        if name.endswith(".jpg"):
+            with open(os.path.join(IMAGE_DIR, name), "rb") as f:
+                images.append((name, f.read()))
+
+    upload_dir = tempfile.mkdtemp()
+    try:
+        print(f"=== 업로드 → 디코딩 경로 비교 ({REPEAT}회 평균) ===")
+        for name, data in images:
+            upload = make_upload(data)
+            assert np.array_equal(legacy_ingest(upload, upload_dir), shared_ingest(upload))
+
+            print(f"[{name}] {len(data) / 1024:.0f} KB")
+            print(f"  복사 바이트: 기존 {len(data) * 2:,} (디스크 쓰기 + 다시 읽기) / 변경 {len(data):,} (공유 메모리 1회)")
+            legacy = bench("기존 (디스크 경유)", legacy_ingest, upload, upload_dir)
+            shared = bench("변경 (공유 메모리)", shared_ingest, upload)
+            print(f"  단축: {legacy - shared:+.2f} ms")
+    finally:
+        shutil.rmtree(upload_dir, ignore_errors=True)
+
+    print("\n=== 워커 프로세스 전달 확인 ===")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        asyncio.run(run_through_pool(images))
+    leaked = [w for w in caught if "leaked shared_memory" in str(w.message)]
+    print(f"  공유 메모리 누수 경고: {len(leaked)}건")
+
+
+if __name__ == "__main__":
+    main()
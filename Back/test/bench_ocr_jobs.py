@@ -0,0 +1,121 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+
+import httpx
+from fastapi import FastAPI
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr import ocr_router, ocr_jobs
+from src.ocr.ocr_worker_pool import OCRWorkerPool
+from src.ocr.ocr_jobs import ReceiptJobManager
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+OCR_SECONDS = 1.0     # OCR 1건 처리 시간
+OCR_WORKERS = 2
+LINES = 60            # 영수증 한 장의 줄 수 (LLM 청크 20줄 → 3청크)
+CHUNK_SECONDS = 0.5   # LLM 청크 1개 처리 시간
+JOBS = 12             # 동시에 등록하는 작업 수
+POLL_INTERVAL = 0.2
+
+
+# PaddleOCR 대신 CPU를 점유하는 가짜 프로세서
+class SlowProcessor:
+    def process_bytes(self, data) -> dict:
+        deadline = time.perf_counter() + OCR_SECONDS
+        while time.perf_counter() < deadline:
+            pass
+        return {"status": "success", "line_count": LINES,
+                "lines": [{"index": i + 1, "text": f"두부 {i}"} for i in range(LINES)]}
+
+
+# Ollama 대신 청크마다 대기하는 가짜 보정 함수 (진행률 콜백 포함)
+async def slow_refine(lines, progress_callback=None):
+    chunks = [lines[i:i + 20] for i in range(0, len(lines), 20)]
+    items = []
+    if progress_callback:
+        progress_callback(0, len(chunks), [])
+    for done, chunk in enumerate(chunks, start=1):
+        await asyncio.sleep(CHUNK_SECONDS)
+        items.extend({"product_name": text, "quantity": 1.0, "unit": "개", "category": "기타"} for text in chunk)
+        if progress_callback:
+            progress_callback(done, len(chunks), list(items))
+    return items
+
+
+async def main():
+    pool = OCRWorkerPool(workers=OCR_WORKERS, queue_size=0, processor_factory=SlowProcessor)
+    pool.start()
+    ocr_router.ocr_pool = pool
+    ocr_router.receipt_jobs = ReceiptJobManager(pool=pool, llm_concurrency=4, max_pending=JOBS)
+    ocr_jobs.refine_ingredients_with_llm_async = slow_refine
+
+    app = FastAPI()
+    app.include_router(ocr_router.router, prefix="/ocr")
+    image = b"\xff\xd8fake-jpeg"
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        threads_before = threading.active_count()
+        started = time.perf_counter()
+
+        # 1. 작업 등록: 응답은 OCR/LLM을 기다리지 않고 바로 돌아와야 함
+        post_latencies = []
+        job_ids = []
+        for _ in range(JOBS):
+            t0 = time.perf_counter()
+            response = await client.post("/ocr/jobs", files={"file": ("r.jpg", image, "image/jpeg")})
+            post_latencies.append(time.perf_counter() - t0)
+            assert response.status_code == 202, response.text
+            job_ids.append(response.json()["job_id"])
+
+        # 한도 초과 등록은 503 + Retry-After
+        over = await client.post("/ocr/jobs", files={"file": ("r.jpg", image, "image/jpeg")})
+
+        # 2. 상태 폴링: 단계 / 진행률 / 부분 결과 관찰
+        finished_at = {}
+        partial_seen = 0
+        max_threads = threads_before
+        while len(finished_at) < JOBS:
+            await asyncio.sleep(POLL_INTERVAL)
+            max_threads = max(max_threads, threading.active_count())
+            for job_id in job_ids:
+                if job_id in finished_at:
+                    continue
+                body = (await client.get(f"/ocr/jobs/{job_id}")).json()
+                if body["stage"] == "refining" and 0 < len(body["items"]) < LINES:
+                    partial_seen += 1
+                if body["stage"] in ("done", "failed"):
+                    assert body["stage"] == "done", body["error"]
+                    assert len(body["items"]) == LINES
+                    finished_at[job_id] = time.perf_counter() - started
+
+        missing = await client.get("/ocr/jobs/unknown")
+
+    post_latencies.sort()
+    done_times = sorted(finished_at.values())
+    serial = JOBS * (OCR_SECONDS + (LINES // 20) * CHUNK_SECONDS)
+    print(f"=== 영수증 작업 API ({JOBS}건, OCR 워커 {OCR_WORKERS}, LLM 동시 4) ===")
+    print(f"  POST /ocr/jobs 응답 p50 {post_latencies[len(post_latencies) // 2] * 1000:.1f}ms | max {post_latencies[-1] * 1000:.1f}ms")
+    print(f"  한도 초과 등록: {over.status_code} Retry-After={over.headers.get('retry-after')}")
+    print(f"  완료 시각: 첫 작업 {done_times[0]:.1f}s | 마지막 작업 {done_times[-1]:.1f}s (순차 처리 시 {serial:.1f}s)")
+    print(f"  폴링 중 관찰한 부분 결과: {partial_seen}회")
+    print(f"  스레드 수: 시작 {threads_before} → 최대 {max_threads} (작업 수와 무관)")
+    print(f"  없는 작업 조회: {missing.status_code}")
+    print(f"  지표: {ocr_router.receipt_jobs.metrics()}")
+
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
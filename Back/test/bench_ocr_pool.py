@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+import asyncio
+import tempfile
+
+import httpx
+from fastapi import FastAPI, UploadFile, File
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import shutdown_db_executor
+from src.ingredients.ingredients_router import router as ingredients_router
+from src.ocr import ocr_router
+from src.ocr.ocr_worker_pool import OCRWorkerPool
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+OCR_SECONDS = 2.0    # OCR 1건 처리 시간 (CPU 기준 PaddleOCR 추론을 흉내냄)
+OCR_WORKERS = 2
+OCR_QUEUE = 2
+OCR_REQUESTS = 6     # 동시 업로드 수 (워커 + 대기열을 초과)
+READ_REQUESTS = 30
+READ_INTERVAL = 0.1   # 목록 조회 간격(초)
+
+
+# PaddleOCR 대신 CPU를 점유하는 가짜 프로세서
+class SlowProcessor:
+    def process(self, image_path: str) -> dict:
+        deadline = time.perf_counter() + OCR_SECONDS
+        while time.perf_counter() < deadline:
+            pass
+        return {"status": "success", "line_count": 1, "lines": [{"index": 1, "text": "두부", "avg_confidence": 0.9}]}
+
+    def process_bytes(self, data) -> dict:
+        return self.process("")
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(ingredients_router, prefix="/ingredients")
+    app.include_router(ocr_router.router, prefix="/ocr")
+
+    # 비교용: 기존처럼 이벤트 루프 안에서 OCR을 실행하는 엔드포인트
+    @app.post("/legacy/receipt")
+    async def legacy_receipt(file: UploadFile = File(...)):
+        await file.read()
+        return SlowProcessor().process("")
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, ocr_path: str):
+    image = b"\xff\xd8fake-jpeg"
+    upload = lambda: client.post(ocr_path, files={"file": ("r.jpg", image, "image/jpeg")})
+
+    # 일정 간격으로 목록을 조회하며, "예정된 시작 시각"부터 응답까지의 지연을 측정
+    # (이벤트 루프가 막히면 요청 시작 자체가 늦어지므로 그 시간도 포함됨)
+    async def reader() -> list:
+        latencies = []
+        begin = time.perf_counter()
+        for i in range(READ_REQUESTS):
+            scheduled = begin + i * READ_INTERVAL
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            (await client.get("/ingredients/list")).raise_for_status()
+            latencies.append(time.perf_counter() - scheduled)
+        return latencies
+
+    reader_task = asyncio.create_task(reader())
+    await asyncio.sleep(0)
+    ocr_tasks = [asyncio.create_task(upload()) for _ in range(OCR_REQUESTS)]
+
+    latencies = await reader_task
+    responses = await asyncio.gather(*ocr_tasks)
+    codes = [r.status_code for r in responses]
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    retry_after = {r.headers.get("retry-after") for r in responses if r.status_code == 503}
+    print(f"[{ocr_path}] 목록 조회 p50 {p50:.1f}ms | p99 {p99:.1f}ms | "
+          f"OCR 응답 200={codes.count(200)} 503={codes.count(503)} Retry-After={retry_after or '-'}")
+
+
+async def main():
+    # 테스트에서는 LLM 보정 단계를 생략
+    async def skip_refine(lines):
+        return lines
+    ocr_router.refine_ingredients_with_llm_async = skip_refine
+    ocr_router.ocr_pool = OCRWorkerPool(workers=OCR_WORKERS, queue_size=OCR_QUEUE, processor_factory=SlowProcessor)
+    ocr_router.ocr_pool.start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_pool(os.path.join(tmp, "bench.db"))
+        database.initialize_database()
+
+        transport = httpx.ASGITransport(app=build_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            await measure(client, "/legacy/receipt")
+            await measure(client, "/ocr/receipt")
+
+        ocr_router.ocr_pool.shutdown()
+        shutdown_db_executor()
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
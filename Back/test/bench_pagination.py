@@ -0,0 +1,138 @@
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+from datetime import date, timedelta
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.pagination import encode_cursor
+from src.ingredients.ingredients_crud import get_history_page, get_ingredients_page
+from src.ingredients.labeling import labeling_columns_sql
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# - 식재료 1,000,000행: 사용/폐기 히스토리 800,000 + 활성 200,000 (유통기한 1년 범위, 같은 날짜가 많음)
+# - 페이지 크기 50, 앞 / 중간 / 끝 위치의 페이지를 각각 REPEAT 번 조회한 중앙값
+# - 비교: 기존 전체 조회 (LIMIT 없음) / LIMIT OFFSET 페이지
+# ------------------------------------------------------------------
+TOTAL_ROWS = 1_000_000
+ACTIVE_ROWS = 200_000
+PAGE_SIZE = 50
+REPEAT = 20
+SEED = 11
+
+
+def seed(conn, rng: random.Random) -> None:
+    today = date.today()
+    dates = [(today + timedelta(days=days)).strftime("%Y-%m-%d") for days in range(-30, 335)]
+    batch = []
+    for i in range(TOTAL_ROWS):
+        status = "active" if rng.random() < ACTIVE_ROWS / TOTAL_ROWS else rng.choice(("used", "discarded"))
+        batch.append((f"재료{rng.randint(0, 5000)}", float(rng.randint(1, 5)), "개", rng.randint(1, 24), rng.randint(1, 4),
+                      rng.choice(dates), today.strftime("%Y-%m-%d"), status))
+        if len(batch) == 50_000:
+            conn.executemany("""
+                INSERT INTO Ingredients (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, batch)
+            batch = []
+    conn.commit()
+
+
+def median_ms(fn) -> float:
+    times = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return times[len(times) // 2] * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_pool(os.path.join(tmp, "bench.db"), size=1)
+        database.initialize_database()
+        with database.db_connection() as conn:
+            started = time.perf_counter()
+            seed(conn, random.Random(SEED))
+            history_total = conn.execute("SELECT COUNT(*) FROM Ingredients WHERE status != 'active'").fetchone()[0]
+            active_total = TOTAL_ROWS - history_total
+            print(f"=== 페이지 조회 ({TOTAL_ROWS:,}행: 히스토리 {history_total:,} / 활성 {active_total:,}, 생성 {time.perf_counter() - started:.1f}s) ===")
+
+            # 기존: 히스토리 전체를 한 번에 조회 + dict 변환 + JSON 직렬화 (1회)
+            started = time.perf_counter()
+            rows = conn.execute(f"""
+                SELECT *, {labeling_columns_sql()} FROM Ingredients
+                WHERE status IN ('used', 'discarded') ORDER BY id DESC
+            """).fetchall()
+            body = json.dumps([dict(row) for row in rows], ensure_ascii=False)
+            print(f"  기존 /history 전체: {(time.perf_counter() - started) * 1000:,.0f}ms, 응답 {len(body) / 1e6:.0f}MB")
+            del rows, body
+
+            # 히스토리: 앞 / 중간 / 끝 페이지 (커서 = 그 위치 직전 행의 id)
+            print(f"\n  {'히스토리 위치':>12} | {'OFFSET':>9} | {'커서':>8} | {'커서+fields':>11} | {'JSON':>7}")
+            for position in (0, history_total // 2, history_total - PAGE_SIZE):
+                offset_sql = f"""
+                    SELECT *, {labeling_columns_sql()} FROM Ingredients
+                    WHERE status IN ('used', 'discarded') ORDER BY id DESC LIMIT {PAGE_SIZE} OFFSET {position}
+                """
+                cursor = None
+                if position:
+                    before = conn.execute(f"""
+                        SELECT id FROM Ingredients WHERE status IN ('used', 'discarded')
+                        ORDER BY id DESC LIMIT 1 OFFSET {position - 1}
+                    """).fetchone()[0]
+                    cursor = encode_cursor("id:desc", [before])
+                page = get_history_page(conn, limit=PAGE_SIZE, cursor=cursor)
+                assert [item["id"] for item in page.items] == [row["id"] for row in conn.execute(offset_sql)]
+
+                offset_ms = median_ms(lambda: [dict(row) for row in conn.execute(offset_sql)])
+                cursor_ms = median_ms(lambda: get_history_page(conn, limit=PAGE_SIZE, cursor=cursor))
+                fields_ms = median_ms(lambda: get_history_page(conn, limit=PAGE_SIZE, cursor=cursor, fields="id,name,label_color"))
+                json_ms = median_ms(lambda: json.dumps(page.items, ensure_ascii=False))
+                print(f"  {position:>12,} | {offset_ms:7.2f}ms | {cursor_ms:6.2f}ms | {fields_ms:9.2f}ms | {json_ms:5.2f}ms")
+
+            # 목록: 유통기한 / 이름 정렬, 앞 / 중간 / 끝 페이지
+            print(f"\n  {'목록 정렬':18} | {'위치':>9} | {'OFFSET':>9} | {'커서':>8}")
+            for sort_by, column in (("expiry_date", "expiry_date"), ("name", "name")):
+                for position in (0, active_total // 2, active_total - PAGE_SIZE):
+                    offset_sql = f"""
+                        SELECT I.*, S.name AS storage_name, C.name AS category_name, {labeling_columns_sql("I.expiry_date")}
+                        FROM Ingredients I
+                        JOIN Storage_Locations S ON I.storage_location_id = S.id
+                        JOIN Categories C ON I.category_id = C.id
+                        WHERE I.status = 'active'
+                        ORDER BY I.{column}, I.id LIMIT {PAGE_SIZE} OFFSET {position}
+                    """
+                    cursor = None
+                    if position:
+                        value, before = conn.execute(f"""
+                            SELECT {column}, id FROM Ingredients WHERE status = 'active'
+                            ORDER BY {column}, id LIMIT 1 OFFSET {position - 1}
+                        """).fetchone()
+                        cursor = encode_cursor(f"{sort_by}:asc", [value, before])
+                    page = get_ingredients_page(conn, sort_by=sort_by, limit=PAGE_SIZE, cursor=cursor)
+                    assert [item["id"] for item in page.items] == [row["id"] for row in conn.execute(offset_sql)]
+
+                    offset_ms = median_ms(lambda: [dict(row) for row in conn.execute(offset_sql)])
+                    cursor_ms = median_ms(lambda: get_ingredients_page(conn, sort_by=sort_by, limit=PAGE_SIZE, cursor=cursor))
+                    print(f"  {sort_by:18} | {position:>9,} | {offset_ms:7.2f}ms | {cursor_ms:6.2f}ms")
+
+            total_ms = median_ms(lambda: get_history_page(conn, limit=PAGE_SIZE, include_total=True))
+            print(f"\n  include_total (히스토리 COUNT 포함 첫 페이지): {total_ms:.1f}ms")
+
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
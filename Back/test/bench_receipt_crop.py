@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import glob
+
+import cv2
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.receipt_detector import crop_receipt
+from test_receipt_detector import synthetic_photo
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+IMAGE_DIR = os.path.join(current_dir, "image")
+TARGET_HEIGHT = 1200   # AdvancedOCRProcessor 높이 정규화 기준
+REPEAT = 5
+
+
+# 높이 정규화 후 OCR에 들어가는 픽셀 수
+def ocr_pixels(image) -> int:
+    h, w = image.shape[:2]
+    return TARGET_HEIGHT * int(w * TARGET_HEIGHT / h)
+
+
+def load_images():
+    images = []
+    for path in sorted(glob.glob(os.path.join(IMAGE_DIR, "*.jpg"))):
+        if "_warped" in path:
+            continue
+        images.append((os.path.basename(path), cv2.imread(path)))
+    images.append(("synthetic_tilted", synthetic_photo()))
+    return images
+
+
+# 줄 재현율: 전체 이미지 OCR에서 나온 줄의 글자(공백 제외)가 잘라낸 이미지 OCR 결과에 남아 있는 비율
+def line_recall(full_lines, cropped_lines) -> float:
+    cropped_text = "".join(line["text"] for line in cropped_lines).replace(" ", "")
+    texts = [line["text"].replace(" ", "") for line in full_lines if line["text"].strip()]
+    if not texts:
+        return 1.0
+    return sum(text in cropped_text for text in texts) / len(texts)
+
+
+def bench_detection(images):
+    print(f"=== 영수증 영역 검출 (최솟값 / {REPEAT}회) ===")
+    total_before = total_after = 0
+    for name, image in images:
+        best = float("inf")
+        for _ in range(REPEAT):
+            t0 = time.perf_counter()
+            cropped, info = crop_receipt(image)
+            best = min(best, time.perf_counter() - t0)
+        before, after = ocr_pixels(image), ocr_pixels(cropped)
+        total_before += before
+        total_after += after
+        print(f"  {name:18s} {image.shape[1]:5d}x{image.shape[0]:<5d} → {cropped.shape[1]:5d}x{cropped.shape[0]:<5d} "
+              f"| 검출 {best * 1000:5.1f}ms | {info['reason']:11s} | OCR 입력 픽셀 {before / 1e6:5.2f}M → {after / 1e6:5.2f}M")
+    print(f"  합계 OCR 입력 픽셀: {total_before / 1e6:.2f}M → {total_after / 1e6:.2f}M "
+          f"({(1 - total_after / total_before) * 100:.1f}% 감소)")
+
+
+def bench_ocr(images):
+    try:
+        from src.ocr.OCR_processor import AdvancedOCRProcessor
+    except ImportError as e:
+        print(f"\n(PaddleOCR 를 불러올 수 없어 OCR 시간/줄 재현율 측정은 건너뜀: {e})")
+        return
+
+    processor = AdvancedOCRProcessor()
+    print("\n=== OCR 시간 / 줄 재현율 (잘라내기 없음 vs 있음) ===")
+    for name, image in images:
+        data = cv2.imencode(".jpg", image)[1].tobytes()
+        results = {}
+        for crop in (False, True):
+            processor.receipt_crop = crop
+            t0 = time.perf_counter()
+            results[crop] = (processor.process_bytes(data), time.perf_counter() - t0)
+        (full, full_time), (cropped, crop_time) = results[False], results[True]
+        print(f"  {name:18s} | 전체 {full_time:5.2f}s ({full['line_count']:3d}줄) | 잘라내기 {crop_time:5.2f}s "
+              f"({cropped['line_count']:3d}줄) | 줄 재현율 {line_recall(full['lines'], cropped['lines']) * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    images = load_images()
+    bench_detection(images)
+    bench_ocr(images)
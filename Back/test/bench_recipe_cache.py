@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+import random
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from stub_ollama import StubOllamaServer
+from src.cache.result_cache import make_cache_key
+from src.llm.llm_client import llm_client
+from src.recipes import llm_recipe_service
+from src.recipes.recipe_cache import RecipeRecommendationCache, recipe_cache
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# - 한 가정이 하루 동안 레시피 추천을 REQUESTS번 요청
+# - 앱은 매번 다른 순서로 목록을 보내고, 가끔 수량을 조금 고쳐 보냄 (같은 구간)
+# - STATUS_CHANGE 확률로 식재료 하나를 다 쓰거나 새로 사 옴 (상태 변경 → 무효화)
+# ------------------------------------------------------------------
+GENERATE_SECONDS = 0.25
+REQUESTS = 60
+STATUS_CHANGE = 0.1
+QUANTITY_TWEAK = 0.3
+SEED = 7
+
+PANTRY = {"두부": (1, "모"), "양파": (2, "개"), "돼지고기": (500, "g"), "김치": (800, "g"), "계란": (10, "개"),
+          "대파": (1, "단"), "애호박": (1, "개"), "우유": (1000, "ml")}
+RESTOCK = {"감자": (3, "개"), "당근": (2, "개"), "버섯": (200, "g"), "두부": (1, "모"), "양파": (2, "개")}
+
+
+# 요청 목록 만들기: [(식재료 문자열 목록, 상태가 바뀐 재료 이름 또는 None), ...]
+def make_trace(rng: random.Random) -> list:
+    pantry = dict(PANTRY)
+    trace = []
+    for _ in range(REQUESTS):
+        changed = None
+        if rng.random() < STATUS_CHANGE:
+            if rng.random() < 0.5 and len(pantry) > 3:
+                changed = rng.choice(sorted(pantry))
+                del pantry[changed]
+            else:
+                changed = rng.choice(sorted(RESTOCK))
+                pantry[changed] = RESTOCK[changed]
+        items = []
+        for name, (quantity, unit) in pantry.items():
+            if rng.random() < QUANTITY_TWEAK:
+                quantity = round(quantity * rng.uniform(0.8, 1.2), 1)
+            items.append(f"{name} ({quantity}{unit})")
+        rng.shuffle(items)
+        trace.append((items, changed))
+    return trace
+
+
+def run(trace: list, mode: str) -> tuple:
+    calls = 0
+    raw_cache = RecipeRecommendationCache()
+    recipe_cache.clear()
+    started = time.perf_counter()
+    for items, changed in trace:
+        if changed:
+            recipe_cache.invalidate_ingredients([changed])
+            raw_cache.invalidate_ingredients([changed])
+
+        if mode == "none":
+            llm_recipe_service.recommend_recipe_from_llm(items)
+            calls += 1
+        elif mode == "raw":
+            # 비교용: 보낸 문자열 그대로를 키로 사용
+            key = make_cache_key("raw", *items)
+            if raw_cache.get(key, items) is None:
+                raw_cache.put(key, items, llm_recipe_service.recommend_recipe_from_llm(items))
+                calls += 1
+        else:
+            before = recipe_cache.metrics()["misses"]
+            llm_recipe_service.recommend_recipe_with_cache(items)
+            calls += recipe_cache.metrics()["misses"] - before
+    elapsed = time.perf_counter() - started
+    metrics = (raw_cache if mode == "raw" else recipe_cache).metrics()
+    return elapsed, calls, metrics
+
+
+def main():
+    stub = StubOllamaServer(latency=GENERATE_SECONDS).start()
+    llm_client.host = stub.host
+    trace = make_trace(random.Random(SEED))
+    changes = sum(1 for _, changed in trace if changed)
+
+    print(f"=== 레시피 추천 캐시 (요청 {REQUESTS}회, 상태 변경 {changes}회, LLM 생성 {GENERATE_SECONDS}s) ===")
+    for mode, label in (("none", "캐시 없음"), ("raw", "입력 문자열 그대로 키"), ("fingerprint", "정규화 지문 + 레시피 풀")):
+        elapsed, calls, metrics = run(trace, mode)
+        line = f"  {label:22} | {elapsed:6.2f}s | LLM 호출 {calls:3d}회"
+        if mode != "none":
+            line += f" | 적중률 {metrics['hit_rate'] * 100:5.1f}% | 절약한 생성 시간 {metrics['saved_seconds']:.2f}s"
+        print(line)
+    stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+import random
+from datetime import date, timedelta
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.recipes.prompt_builder import merge_pantry_items
+from src.recipes.recipe_corpus import RecipeCorpus, STAPLES, ingredient_keys
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# - 레시피 모음: 자주 사는 재료 60종 중 2~5개(메인) + 기본 양념 0~3개로 만든 가짜 레시피 1,000 / 10,000개
+# - 보유 식재료: (a) 모음의 레시피 하나를 만들 수 있는 냉장고 + 다른 재료 3~10개
+#                (b) 무작위 재료 3~15개 (만들 수 있는 레시피가 없을 수도 있음)
+# - 정답: 냉장고 재료로 부족한 재료 없이 만들 수 있는 레시피 전체 (전수 비교)
+# - LLM: 레시피 한 건 생성 4.0s 로 가정 (bench_recipe_cache.py 의 가짜 Ollama 지연과 동일)
+# ------------------------------------------------------------------
+CORPUS_SIZES = (1000, 10000)
+PANTRIES = 200
+TOP_K = 5
+LLM_SECONDS = 4.0
+SEED = 7
+
+INGREDIENTS = [
+    "돼지고기", "소고기", "닭가슴살", "베이컨", "햄", "두부", "순두부", "계란", "어묵", "양파",
+    "대파", "감자", "당근", "애호박", "양배추", "시금치", "콩나물", "버섯", "브로콜리", "오이",
+    "고추", "무", "배추", "우유", "치즈", "생크림", "토마토", "떡", "소면", "우동면",
+    "만두", "냉동새우", "고추장", "된장", "케첩", "김치", "참치캔", "스팸", "연어", "고등어",
+    "오징어", "멸치", "깻잎", "상추", "파프리카", "가지", "부추", "고구마", "옥수수", "청경채",
+    "숙주", "닭다리", "차돌박이", "목살", "떡국떡", "미역", "김", "단무지", "새우젓", "쌈장",
+]
+SEASONINGS = ["소금", "후추", "설탕", "간장", "식용유", "참기름", "다진마늘", "고춧가루"]
+
+
+def make_corpus(size: int, rng: random.Random) -> list:
+    recipes = []
+    for i in range(size):
+        main = rng.sample(INGREDIENTS, rng.randint(2, 5))
+        recipes.append({
+            "recipe_name": f"{main[0]} 요리 {i}",
+            "ingredients_main": main,
+            "ingredients_needed": rng.sample(SEASONINGS, rng.randint(0, 3)),
+            "steps": ["재료를 손질한다.", "익힌다."],
+        })
+    return recipes
+
+
+def make_pantry(names: list, rng: random.Random) -> list:
+    return [{"name": name, "quantity": 1, "unit": "개",
+             "expiry_date": (date.today() + timedelta(days=rng.randint(0, 20))).strftime("%Y-%m-%d")}
+            for name in names]
+
+
+# 레시피별 (이름, 기본 양념을 뺀 재료 키 목록) - 정답 계산용
+def required_keys(recipes: list) -> list:
+    result = []
+    for recipe in recipes:
+        keys = [ingredient_keys(name) for name in recipe["ingredients_main"] + recipe["ingredients_needed"]]
+        result.append((recipe["recipe_name"], [k for k in keys if not k & STAPLES]))
+    return result
+
+
+# 역색인 없이 모음 전체를 점수 매기는 방식 (비교용)
+def full_scan(corpus: RecipeCorpus, pantry: list) -> list:
+    merged = merge_pantry_items(pantry)
+    pantry_keys = {}
+    for item in merged:
+        for key in ingredient_keys(item["name"]):
+            pantry_keys.setdefault(key, (item["name"], item["urgency"]))
+    urgent_total = sum(1 for item in merged if item["urgency"] == "orange")
+    matches = [corpus._score(entry, pantry_keys, len(merged), urgent_total) for entry in corpus._entries.values()]
+    matches = [match for match in matches if match is not None]
+    matches.sort(key=lambda match: (-match.score, len(match.missing), -len(match.used), str(match.recipe.get("recipe_name", ""))))
+    return matches[:TOP_K]
+
+
+def main():
+    rng = random.Random(SEED)
+    print(f"=== 로컬 레시피 모음 (냉장고 {PANTRIES}개 x 2종, 상위 {TOP_K}개, LLM 생성 {LLM_SECONDS}s 가정) ===")
+    print(f"  {'모음':>6} | {'냉장고':10} | {'recall@5':>8} | {'LLM 생략':>8} | {'추천 부족재료':>12} | {'역색인':>8} | {'전수 비교':>8} | 추천 평균 지연")
+
+    for size in CORPUS_SIZES:
+        recipes = make_corpus(size, rng)
+        corpus = RecipeCorpus(persistent=False)
+        corpus.learn(recipes)
+        requirements = required_keys(recipes)
+
+        for kind in ("레시피 포함", "무작위"):
+            recall_sum, recall_count, skipped, missing_sum = 0.0, 0, 0, 0
+            index_seconds, scan_seconds = 0.0, 0.0
+            for _ in range(PANTRIES):
+                if kind == "레시피 포함":
+                    target = rng.choice(recipes)
+                    extra = rng.sample(INGREDIENTS, rng.randint(3, 10))
+                    names = list(dict.fromkeys(target["ingredients_main"] + extra))
+                else:
+                    names = rng.sample(INGREDIENTS, rng.randint(3, 15))
+                pantry = make_pantry(names, rng)
+                pantry_names = {key for name in names for key in ingredient_keys(name)}
+
+                started = time.perf_counter()
+                top = corpus.search(pantry, limit=TOP_K)
+                index_seconds += time.perf_counter() - started
+                started = time.perf_counter()
+                scanned = full_scan(corpus, pantry)
+                scan_seconds += time.perf_counter() - started
+                assert [m.recipe["recipe_name"] for m in top] == [m.recipe["recipe_name"] for m in scanned]
+
+                truth = {name for name, keys in requirements if all(k & pantry_names for k in keys)}
+                if truth:
+                    found = sum(1 for match in top if match.recipe["recipe_name"] in truth)
+                    recall_sum += found / min(TOP_K, len(truth))
+                    recall_count += 1
+
+                best = corpus.best_match(pantry)
+                if best is not None:
+                    skipped += 1
+                    missing_sum += len(best.missing)
+
+            recall = recall_sum / recall_count if recall_count else 0.0
+            avg_latency = ((PANTRIES - skipped) * LLM_SECONDS + index_seconds) / PANTRIES
+            print(f"  {size:>6} | {kind:10} | {recall:8.3f} | {skipped / PANTRIES:8.1%} | "
+                  f"{(missing_sum / skipped if skipped else 0):12.2f} | {index_seconds * 1000 / PANTRIES:6.2f}ms | "
+                  f"{scan_seconds * 1000 / PANTRIES:6.2f}ms | {avg_latency:.2f}s (LLM만 {LLM_SECONDS:.2f}s)")
+        print(f"         (색인 키 {corpus.metrics()['index_keys']}개, 정답이 있는 냉장고 기준 recall)")
+
+
+if __name__ == "__main__":
+    main()
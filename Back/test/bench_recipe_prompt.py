@@ -0,0 +1,110 @@
+import os
+import sys
+import time
+import random
+from datetime import date, timedelta
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from stub_ollama import StubOllamaServer
+from src.llm.llm_client import llm_client
+from src.llm.llm_processor import RECIPE_MODEL, RECIPE_OPTIONS, build_recipe_messages, estimate_text_tokens
+from src.recipes.prompt_builder import build_pantry_prompt
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# - 가짜 Ollama: 입력 토큰당 2ms 프리필(8B 모델 CPU 추론 수준) + 생성 1.0s, num_ctx 초과 시 잘림으로 집계
+# - 보유 식재료: 자주 사는 재료 80종에서 뽑아 같은 재료가 여러 번 등록된 냉장고
+# ------------------------------------------------------------------
+PREFILL_PER_TOKEN = 0.002
+GENERATE_SECONDS = 1.0
+PANTRY_SIZES = (10, 100, 1000)
+SEED = 3
+
+NAMES = [
+    ("돼지고기", "g", "육류"), ("소고기", "g", "육류"), ("닭가슴살", "g", "육류"), ("베이컨", "g", "육류"), ("햄", "개", "육류"),
+    ("두부", "모", "두부"), ("순두부", "개", "두부"), ("계란", "개", "달걀"), ("메추리알", "개", "달걀"), ("어묵", "g", "어묵"),
+    ("양파", "개", "채소"), ("대파", "단", "채소"), ("감자", "개", "채소"), ("당근", "개", "채소"), ("애호박", "개", "채소"),
+    ("양배추", "통", "채소"), ("시금치", "단", "채소"), ("콩나물", "g", "채소"), ("버섯", "g", "채소"), ("브로콜리", "개", "채소"),
+    ("오이", "개", "채소"), ("고추", "개", "채소"), ("마늘", "g", "채소"), ("무", "개", "채소"), ("배추", "포기", "채소"),
+    ("우유", "ml", "유제품"), ("치즈", "장", "유제품"), ("요거트", "개", "유제품"), ("버터", "g", "유제품"), ("생크림", "ml", "유제품"),
+    ("사과", "개", "과일"), ("바나나", "개", "과일"), ("딸기", "g", "과일"), ("레몬", "개", "과일"), ("토마토", "개", "과일"),
+    ("떡", "g", "떡류"), ("소면", "g", "건면"), ("우동면", "개", "비건조면류"), ("만두", "g", "냉동식품"), ("냉동새우", "g", "냉동식품"),
+    ("간장", "병", "조미료"), ("고추장", "통", "조미료"), ("된장", "통", "조미료"), ("케첩", "병", "조미료"), ("마요네즈", "병", "조미료"),
+    ("식용유", "병", "식용유"), ("참기름", "병", "참기름"), ("들기름", "병", "들기름"), ("식빵", "봉", "빵류"), ("오렌지주스", "ml", "과일·채소류음료"),
+    ("김밥", "줄", "김밥"), ("샌드위치", "개", "샌드위치"), ("도시락", "개", "도시락"), ("김치", "g", "기타"), ("단무지", "g", "기타"),
+    ("청포묵", "g", "묵류"), ("미역", "g", "기타"), ("김", "봉", "기타"), ("참치캔", "개", "기타"), ("스팸", "개", "기타"),
+    ("연어", "g", "기타"), ("고등어", "마리", "기타"), ("오징어", "마리", "기타"), ("새우젓", "g", "조미료"), ("멸치", "g", "기타"),
+    ("쌈장", "통", "조미료"), ("깻잎", "묶음", "채소"), ("상추", "g", "채소"), ("파프리카", "개", "채소"), ("가지", "개", "채소"),
+    ("부추", "단", "채소"), ("고구마", "개", "채소"), ("옥수수", "개", "채소"), ("호박", "개", "채소"), ("청경채", "g", "채소"),
+    ("숙주", "g", "채소"), ("닭다리", "g", "육류"), ("차돌박이", "g", "육류"), ("목살", "g", "육류"), ("떡국떡", "g", "떡류"),
+]
+
+
+def make_pantry(size: int, rng: random.Random) -> list:
+    pantry = []
+    for _ in range(size):
+        name, unit, category = rng.choice(NAMES)
+        quantity = rng.choice((1, 2, 3, 100, 200, 300, 500)) if unit in ("g", "ml") else rng.randint(1, 4)
+        expiry = date.today() + timedelta(days=rng.randint(0, 40))
+        pantry.append({"name": name, "quantity": float(quantity), "unit": unit,
+                       "expiry_date": expiry.strftime("%Y-%m-%d"), "category": category})
+    pantry.sort(key=lambda item: item["expiry_date"])   # DB 조회 순서 (유통기한 오름차순)
+    return pantry
+
+
+# 기존 방식: 모든 재료를 "이름 (수량단위)" 로 이어 붙임
+def legacy_prompt(pantry: list) -> str:
+    ingredients_text = ", ".join(f"{item['name']} ({item['quantity']}{item['unit']})" for item in pantry)
+    return f"""
+    다음은 사용자가 현재 보유한 식재료 목록입니다:
+
+    {ingredients_text}
+
+    위 재료들을 최대한 많이 활용하여 만들 수 있는 현실적인 요리 레시피를 하나 추천해주세요.
+    가능하면 유통기한이 임박한 재료를 우선적으로 사용해 주세요.
+
+    반드시 system_prompt에서 요구한 JSON 형식에 맞춰 출력하세요.
+    """
+
+
+# 가짜 Ollama 로 한 번 호출: (전체 시간, 모델이 받은 입력 토큰, 잘렸는지)
+def call(stub, user_prompt: str) -> tuple:
+    truncated_before = stub.truncated
+    started = time.perf_counter()
+    response = llm_client.chat(RECIPE_MODEL, build_recipe_messages(user_prompt), options=RECIPE_OPTIONS)
+    return time.perf_counter() - started, response["prompt_eval_count"], stub.truncated > truncated_before
+
+
+def main():
+    stub = StubOllamaServer(latency=GENERATE_SECONDS, prefill_per_token=PREFILL_PER_TOKEN).start()
+    llm_client.host = stub.host
+    rng = random.Random(SEED)
+
+    print(f"=== 레시피 프롬프트 (num_ctx {RECIPE_OPTIONS['num_ctx']}, 프리필 {PREFILL_PER_TOKEN * 1000:.0f}ms/토큰, 생성 {GENERATE_SECONDS}s) ===")
+    print(f"  {'재료 수':>6} | {'방식':8} | {'user 토큰':>9} | {'입력 토큰':>9} | {'잘림':4} | {'생성 지연':>8} | {'고유 재료/항목':>14} | 구성 시간")
+    for size in PANTRY_SIZES:
+        pantry = make_pantry(size, rng)
+        unique = len({item["name"] for item in pantry})
+
+        before = legacy_prompt(pantry)
+        latency, prompt_tokens, truncated = call(stub, before)
+        print(f"  {size:>6} | {'기존':8} | {estimate_text_tokens(before):>9} | {prompt_tokens:>9} | {'예' if truncated else '-':4} | "
+              f"{latency:7.2f}s | {unique:>6}/{size:<7} | -")
+
+        started = time.perf_counter()
+        after = build_pantry_prompt(pantry)
+        build_ms = (time.perf_counter() - started) * 1000
+        latency, prompt_tokens, truncated = call(stub, after.text)
+        print(f"  {size:>6} | {'예산 적용':8} | {after.tokens:>9} | {prompt_tokens:>9} | {'예' if truncated else '-':4} | "
+              f"{latency:7.2f}s | {unique:>6}/{len(after.selected):<7} | {build_ms:.1f}ms")
+    stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import json
+import time
+import asyncio
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from fastapi import FastAPI
+
+from stub_ollama import StubOllamaServer
+from src.llm.llm_client import llm_client
+from src.recipes.recipes_router import router as recipes_router
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+GENERATE_SECONDS = 4.0   # 레시피 전체 생성 시간 (가짜 Ollama 가 이 시간에 걸쳐 토큰을 흘려보냄)
+RUNS = 3
+REQUEST = {"ingredients": [{"name": "두부", "quantity": 1, "unit": "모"}, {"name": "양파", "quantity": 2, "unit": "개"}]}
+
+
+# ASGI 앱을 직접 호출하며 응답 본문 조각이 도착한 시각을 기록 (httpx 전송은 본문을 모아서 돌려주므로 사용하지 않음)
+async def timed_request(app, path: str) -> dict:
+    payload = json.dumps(REQUEST).encode("utf-8")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())],
+        "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        await asyncio.Event().wait()
+
+    started = time.perf_counter()
+    marks = {}
+    body = b""
+
+    async def send(message):
+        nonlocal body
+        if message["type"] != "http.response.body" or not message.get("body"):
+            return
+        now = time.perf_counter() - started
+        marks.setdefault("first_byte", now)
+        body += message["body"]
+        text = body.decode("utf-8", errors="ignore")
+        if "recipe_name" in text:
+            marks.setdefault("recipe_name", now)
+        if "event: step" in text or '"steps"' in text:
+            marks.setdefault("first_step", now)
+
+    await app(scope, receive, send)
+    marks["complete"] = time.perf_counter() - started
+    return marks
+
+
+async def measure(app, path: str) -> dict:
+    runs = [await timed_request(app, path) for _ in range(RUNS)]
+    return {key: sum(run[key] for run in runs) / RUNS for key in runs[0]}
+
+
+def main():
+    stub = StubOllamaServer(latency=GENERATE_SECONDS).start()
+    llm_client.host = stub.host
+    app = FastAPI()
+    app.include_router(recipes_router, prefix="/recipes")
+
+    print(f"=== 레시피 추천 응답 시간 (가짜 Ollama 생성 {GENERATE_SECONDS}s, {RUNS}회 평균) ===")
+    print(f"  {'':28} | {'첫 바이트':>8} | {'요리 이름':>8} | {'첫 단계':>8} | {'전체 완료':>8}")
+    for label, path in (("blocking /recommend", "/recipes/recommend"), ("SSE /recommend/stream", "/recipes/recommend/stream")):
+        result = asyncio.run(measure(app, path))
+        print(f"  {label:28} | {result['first_byte']:7.2f}s | {result['recipe_name']:7.2f}s | "
+              f"{result['first_step']:7.2f}s | {result['complete']:7.2f}s")
+    stub.stop()
+
+
+if __name__ == "__main__":
+    main()
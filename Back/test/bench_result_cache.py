@@ -0,0 +1,97 @@
+import os
+import sys
+import time
+import asyncio
+import tempfile
+
+import httpx
+from fastapi import FastAPI
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from stub_ollama import StubOllamaServer
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+OCR_SECONDS = 1.5      # OCR 1건 처리 시간
+LLM_SECONDS = 1.0      # Ollama 호출 1회 지연
+LINES = 60
+IMAGE_PATH = os.path.join(current_dir, "image", "01.jpg")
+
+stub = StubOllamaServer(latency=LLM_SECONDS).start()
+os.environ["OLLAMA_HOST"] = stub.host   # ollama 모듈 import 전에 설정
+
+from src.ocr import ocr_router
+from src.llm import llm_processor
+from src.ocr.ocr_worker_pool import OCRWorkerPool
+from src.cache.result_cache import ResultCache
+from src.llm.line_dictionary import LineDictionary
+
+llm_processor.resolve_category_tag = lambda category, name="": "기타"
+llm_processor.print = lambda *args, **kwargs: None
+ocr_router.print = lambda *args, **kwargs: None
+
+
+# PaddleOCR 대신 CPU를 점유하는 가짜 프로세서
+class SlowProcessor:
+    def process_bytes(self, data) -> dict:
+        deadline = time.perf_counter() + OCR_SECONDS
+        while time.perf_counter() < deadline:
+            pass
+        return {"status": "success", "line_count": LINES,
+                "lines": [{"index": i + 1, "text": f"{i:03d} 풀무원 두부 {i}"} for i in range(LINES)]}
+
+
+# 서버 한 번의 수명 (캐시 인스턴스는 디스크 저장소만 공유)
+async def run_server(label: str, db_path: str, uploads: int):
+    ocr_cache = ResultCache("ocr", 128, 16 * 1024 * 1024, db_path=db_path)
+    refine_cache = ResultCache("refine", 2048, 8 * 1024 * 1024, db_path=db_path)
+    llm_processor.refine_result_cache = refine_cache
+    llm_processor.line_dictionary = LineDictionary(persistent=False)   # 보정 캐시만 측정
+
+    pool = OCRWorkerPool(workers=1, queue_size=2, processor_factory=SlowProcessor, result_cache=ocr_cache)
+    pool.start()
+    await pool.submit(len, "")   # 워커 프로세스 기동 시간은 측정에서 제외
+    ocr_router.ocr_pool = pool
+
+    app = FastAPI()
+    app.include_router(ocr_router.router, prefix="/ocr")
+    with open(IMAGE_PATH, "rb") as f:
+        image = f.read()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        for attempt in range(1, uploads + 1):
+            stub.reset()
+            started = time.perf_counter()
+            response = await client.post("/ocr/receipt", files={"file": ("r.jpg", image, "image/jpeg")})
+            elapsed = time.perf_counter() - started
+            assert response.status_code == 200, response.text
+            assert len(response.json()["data"]) == LINES
+            print(f"  [{label}] 업로드 {attempt}: {elapsed:5.2f}s  (Ollama 호출 {stub.calls}회)")
+
+    print(f"  [{label}] OCR 캐시 {ocr_cache.metrics()}")
+    print(f"  [{label}] 보정 캐시 {refine_cache.metrics()}")
+    pool.shutdown()
+    ocr_cache.close()
+    refine_cache.close()
+
+
+async def main():
+    print(f"=== 같은 영수증 재업로드 (OCR {OCR_SECONDS}s, LLM 호출당 {LLM_SECONDS}s, {LINES}줄) ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.db")
+        await run_server("메모리 전용", "", 2)
+        await run_server("디스크 저장소", db_path, 2)
+        await run_server("재시작 후", db_path, 1)
+    stub.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
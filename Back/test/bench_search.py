@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+import random
+import tempfile
+from datetime import date, timedelta
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.text_search import search_key, to_choseong
+from src.ingredients.ingredients_crud import get_filtered_ingredients, get_ingredients_page
+from src.ingredients.labeling import labeling_columns_sql
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# - 활성 식재료 200,000행: 수식어 + 재료 + 부위/형태 조합 이름 (예: "국산 돼지고기 목살")
+# - 검색어별로 기존 LIKE '%검색어%' 조회와 전문 검색 조회를 REPEAT 번씩 실행한 중앙값
+# - 결과 확인: 정규화한 이름(초성 검색은 초성 문자열)에 검색어가 들어 있는 행과 같은지
+# ------------------------------------------------------------------
+ROWS = 200_000
+REPEAT = 20
+SEED = 7
+
+PREFIXES = ["", "", "국산 ", "유기농 ", "냉동 ", "수입 ", "햇", "무농약 ", "저지방 ", "통"]
+BASES = ["두부", "순두부", "돼지고기", "소고기", "닭고기", "대파", "양파", "감자", "고구마", "당근", "애호박", "계란",
+         "우유", "치즈", "버터", "사과", "배추", "무", "콩나물", "시금치", "고등어", "오징어", "새우", "김치", "된장",
+         "고추장", "간장", "버섯", "표고버섯", "브로콜리", "토마토", "오이", "상추", "깻잎", "마늘", "생강", "레몬"]
+SUFFIXES = ["", "", "", " 목살", " 안심", " 다짐육", " 슬라이스", " 1kg", " 500g", "볶음", "조림", " 대용량", " 특품"]
+
+TERMS = ["두부", "ㄷㅂ", "고기", "목살", "돼지고기 목살", "버섯", "레몬", "깻잎", "ㅍㄱㅂㅅ", "대용량", "유", "특품슬"]
+
+
+def make_rows(rng: random.Random) -> list:
+    today = date.today()
+    return [(f"{rng.choice(PREFIXES)}{rng.choice(BASES)}{rng.choice(SUFFIXES)}{rng.randint(1, 99) if rng.random() < 0.3 else ''}",
+             (today + timedelta(days=rng.randint(-10, 60))).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
+            for _ in range(ROWS)]
+
+
+# 트리거가 같은 트랜잭션에서 검색 테이블도 색인
+def insert(conn, rows: list) -> float:
+    started = time.perf_counter()
+    conn.executemany("""
+        INSERT INTO Ingredients (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date)
+        VALUES (?, 1, '개', 1, 1, ?, ?)
+    """, rows)
+    conn.commit()
+    return time.perf_counter() - started
+
+
+# 기존 방식: 이름 LIKE '%검색어%' (앞이 와일드카드라 인덱스를 쓰지 못하고 활성 식재료 전체 확인)
+def like_search(conn, term: str) -> list:
+    rows = conn.execute(f"""
+        SELECT I.*, S.name AS storage_name, C.name AS category_name, {labeling_columns_sql("I.expiry_date")}
+        FROM Ingredients I
+        JOIN Storage_Locations S ON I.storage_location_id = S.id
+        JOIN Categories C ON I.category_id = C.id
+        WHERE I.status = 'active' AND I.name LIKE ?
+        ORDER BY I.expiry_date ASC, I.id ASC
+    """, (f"%{term}%",)).fetchall()
+    return [dict(row) for row in rows]
+
+
+def median_ms(fn) -> float:
+    times = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return times[len(times) // 2] * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_pool(os.path.join(tmp, "bench.db"), size=1)
+        database.initialize_database()
+        with database.db_connection() as conn:
+            rows = make_rows(random.Random(SEED))
+            insert_s = insert(conn, rows)
+            names = {row["id"]: row["name"] for row in conn.execute("SELECT id, name FROM Ingredients")}
+            keys = {id_: (search_key(name), to_choseong(name)) for id_, name in names.items()}
+            print(f"=== 이름 검색 ({ROWS:,}행) ===")
+
+            print(f"\n  {'검색어':14} | {'결과':>7} | {'LIKE':>9} | {'전문 검색':>9} | {'관련도 순 50개':>12}")
+            for term in TERMS:
+                key = search_key(term)
+                column = 1 if all(char in "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ" for char in key) else 0
+                expected = {id_ for id_, pair in keys.items() if key in pair[column]}
+                found = get_filtered_ingredients(conn, search_term=term)
+                assert {row["id"] for row in found} == expected, term
+                if term == key and not column:   # 정규화가 필요 없는 검색어는 LIKE 결과와 행 순서까지 같아야 함
+                    assert found == like_search(conn, term), term
+
+                like_ms = median_ms(lambda: like_search(conn, term))
+                fts_ms = median_ms(lambda: get_filtered_ingredients(conn, search_term=term))
+                top_ms = median_ms(lambda: get_ingredients_page(conn, search_term=term, sort_by="relevance", limit=50))
+                print(f"  {term:14} | {len(expected):>7,} | {like_ms:7.1f}ms | {fts_ms:7.1f}ms | {top_ms:10.1f}ms")
+
+            # 색인 유지 비용: 같은 행을 트리거를 지우고 색인 없이 다시 입력한 시간과 비교
+            for trigger in ("insert", "update", "delete"):
+                conn.execute(f"DROP TRIGGER trg_ingredients_fts_{trigger}")
+            plain_s = insert(conn, rows)
+            print(f"\n  입력 {ROWS:,}행: 트리거 색인 포함 {insert_s:.1f}s ({insert_s / ROWS * 1e6:.0f}us/행)"
+                  f" / 트리거 없음 {plain_s:.1f}s ({plain_s / ROWS * 1e6:.0f}us/행)")
+
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database, migrations
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+REPEAT = 500  # 최신 DB 기준 재시작 반복 횟수
+
+
+# 기존 부트스트랩이 최신 DB에서 매번 실행하던 구문 (CREATE 5회 + COUNT 3회)
+def legacy_bootstrap(conn: sqlite3.Connection):
+    cursor = conn.cursor()
+    for schema in (migrations.CATEGORIES_SCHEMA, migrations.STORAGE_LOCATIONS_SCHEMA,
+                   migrations.INGREDIENTS_SCHEMA, migrations.EXPIRATION_MAPPING_SCHEMA,
+                   migrations.COOKED_DISHES_SCHEMA):
+        cursor.execute(schema)
+    for table in ("Categories", "Storage_Locations", "Expiration_Mapping"):
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        cursor.fetchone()
+    conn.commit()
+
+
+def timed(label: str, fn, conn: sqlite3.Connection):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    fn(conn)
+    conn.set_trace_callback(None)
+
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        fn(conn)
+    elapsed = (time.perf_counter() - started) / REPEAT
+    print(f"[{label}] 1회 {elapsed * 1e6:.1f}us | 실행 SQL {len(statements)}개")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+
+        # 새 DB: 전체 마이그레이션 적용 시간
+        conn = database.create_connection(path)
+        started = time.perf_counter()
+        version = migrations.migrate(conn)
+        print(f"[fresh migrate] v{version} 적용 {(time.perf_counter() - started) * 1000:.2f}ms")
+
+        # 최신 DB 재시작 비용 비교
+        timed("legacy bootstrap (up-to-date)", legacy_bootstrap, conn)
+        timed("migrate (up-to-date)", migrations.migrate, conn)
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.tiling import ocr_tiled, plan_strips, TILE_TARGET_WIDTH, TILE_STRIP_HEIGHT, TILE_OVERLAP
+from src.ocr.line_grouping import group_lines
+from test_tiling import synthetic_long_receipt, fake_predict
+
+# ------------------------------------------------------------------
+# 2. 벤치마크 설정
+# ------------------------------------------------------------------
+LINE_COUNTS = [40, 90, 180]
+SINGLE_PASS_HEIGHT = 1200   # 기존 방식: 높이 1200px로 맞춰 한 번에 OCR
+BLUR_ROUNDS = 6             # 가짜 OCR의 픽셀 비례 계산량
+
+
+# 픽셀 수에 비례해 CPU를 쓰는 가짜 OCR (검출 모델 비용 흉내)
+def costly_predict(image):
+    for _ in range(BLUR_ROUNDS):
+        cv2.GaussianBlur(image, (31, 31), 0)
+    return fake_predict(image)
+
+
+def single_pass(image):
+    h, w = image.shape[:2]
+    scale = SINGLE_PASS_HEIGHT / h
+    resized = cv2.resize(image, (int(w * scale), SINGLE_PASS_HEIGHT), interpolation=cv2.INTER_CUBIC)
+    texts, boxes, scores = costly_predict(resized)
+    return texts, boxes / scale, scores
+
+
+# 줄 정확도: 그룹핑된 줄이 정답 줄("Ln Ln Ln")과 일치하는 비율
+def line_accuracy(texts, boxes, scores, line_count):
+    lines = [line["text"] for line in group_lines(texts, boxes, scores, threshold="adaptive")] if texts else []
+    expected = {f"L{i} L{i} L{i}" for i in range(line_count)}
+    return len(expected.intersection(lines)) / line_count, len(texts)
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+
+def main():
+    cv2.setNumThreads(1)   # 단일 스레드 추론 가정
+    print(f"=== 긴 영수증 띠 OCR (CPU {os.cpu_count()}개, 띠 {TILE_STRIP_HEIGHT}px / 겹침 {TILE_OVERLAP}px / 기준 너비 {TILE_TARGET_WIDTH}px) ===")
+    for line_count in LINE_COUNTS:
+        image = synthetic_long_receipt(line_count)
+        strips = plan_strips(int(image.shape[0] * min(TILE_TARGET_WIDTH / image.shape[1], 2.0)))
+        single_time, result = timed(lambda: single_pass(image))
+        accuracy, boxes = line_accuracy(*result, line_count)
+        print(f"  {line_count:3d}줄 ({image.shape[1]}x{image.shape[0]}, 띠 {len(strips)}개)")
+        print(f"    한 번에 (높이 {SINGLE_PASS_HEIGHT}px) | {single_time * 1000:7.1f}ms | 줄 정확도 {accuracy * 100:5.1f}% | 박스 {boxes}")
+        tile_time, result = timed(lambda: ocr_tiled(image, costly_predict))
+        accuracy, boxes = line_accuracy(*result, line_count)
+        print(f"    띠 OCR (차례대로)     | {tile_time * 1000:7.1f}ms | 줄 정확도 {accuracy * 100:5.1f}% | 박스 {boxes} (정답 {line_count * 3})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.recipes import llm_recipe_service
+from src.recipes.recipe_cache import recipe_cache
+from src.recipes.recipe_corpus import recipe_corpus
+
+
+# ------------------------------------------------------------------
+# 2. 레시피 테스트 공용 도우미
+# ------------------------------------------------------------------
+def expires_in(days: int) -> str:
+    return (date.today() + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+# 앱에서 넘어오는 보유 식재료 한 건 (days 가 None 이면 유통기한 없음)
+def item(name: str, quantity=1, unit: str = "개", days=None, category=None) -> dict:
+    return {"name": name, "quantity": quantity, "unit": unit,
+            "expiry_date": expires_in(days) if days is not None else None, "category": category}
+
+
+def recipe(name: str, main=("두부",), needed=()) -> dict:
+    return {"recipe_name": name, "ingredients_main": list(main), "ingredients_needed": list(needed), "steps": ["썬다", "굽는다"]}
+
+
+# ------------------------------------------------------------------
+# 3. 레시피 서비스: 임시 DB + 가짜 LLM (호출된 user prompt 목록)
+# ------------------------------------------------------------------
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    database.init_pool(str(tmp_path / "recipe.db"), size=1)
+    database.initialize_database()
+    recipe_cache.clear()
+    recipe_corpus.reload()
+
+    calls = []
+    def fake_llm(user_prompt):
+        calls.append(user_prompt)
+        return recipe(f"요리 {len(calls)}", ["두부", "양파"])
+    monkeypatch.setattr(llm_recipe_service, "recipe_processor", fake_llm)
+
+    yield calls
+
+    recipe_cache.clear()
+    database.close_pool()
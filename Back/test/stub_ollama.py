@@ -0,0 +1,216 @@
+# stub_ollama.py (벤치마크용 가짜 Ollama 서버: /api/chat 응답 지연 / 모델 로드 시간 / 상주 모델 수를 설정할 수 있음)
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubOllamaServer:
+    """
+    로컬 포트에서 Ollama /api/chat 을 흉내내는 서버.
+    - 호출마다 latency 초 + 입력 줄당 per_line 초 동안 대기한 뒤 응답합니다.
+    - 입력의 "Line N: 텍스트" 줄을 그대로 식재료 항목으로 돌려줍니다. (non_food 단어가 들어간 줄은 제외)
+    - 레시피 요청(system 프롬프트에 recipe_name 포함)에는 고정된 레시피 JSON을 돌려줍니다.
+    - prefill_per_token 을 주면 입력 토큰(추정) 수에 비례해 더 기다리고, options.num_ctx 를 넘는 입력은 잘린 것으로 셉니다.
+    - stream=true 요청에는 응답을 작은 조각(NDJSON 줄)으로 나눠 생성 시간에 걸쳐 흘려보냅니다.
+    - 올라와 있지 않은 모델은 load_seconds 동안 로드하고, keep_alive 가 지나면 내립니다.
+      max_loaded 개를 넘으면 가장 오래 안 쓴 모델을 내립니다. (실제 Ollama 의 메모리 부족 시 동작)
+    """
+
+    def __init__(
+            self,
+            latency: float = 1.0,
+            per_line: float = 0.0,
+            port: int = 0,
+            non_food: tuple = ("봉투",),
+            load_seconds: float = 0.0,
+            max_loaded: int = 0,
+            prefill_per_token: float = 0.0
+        ):
+        self.latency = latency
+        self.per_line = per_line
+        self.non_food = non_food
+        self.load_seconds = load_seconds
+        self.max_loaded = max_loaded
+        self.prefill_per_token = prefill_per_token
+        self.calls = 0
+        self.truncated = 0
+        self.loads: dict = {}
+        self.max_concurrency = 0
+        self._active = 0
+        self._loaded: dict = {}   # 모델 → (만료 시각, 마지막 사용 시각)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "StubOllamaServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.truncated = 0
+            self.loads = {}
+            self.max_concurrency = 0
+            self._loaded = {}
+
+    def loaded_models(self) -> list:
+        with self._lock:
+            now = time.monotonic()
+            return [model for model, (expires, _) in self._loaded.items() if expires > now]
+
+    # 요청 모델을 올리고(필요하면 다른 모델을 내림) 로드에 걸린 시간(초) 반환
+    # (처리 중에는 만료되지 않고, keep_alive 는 응답 후 _finish 에서 적용)
+    def _ensure_loaded(self, model: str) -> float:
+        now = time.monotonic()
+        with self._lock:
+            self._loaded = {name: state for name, state in self._loaded.items() if state[0] > now}
+            cold = model not in self._loaded
+            if cold:
+                self.loads[model] = self.loads.get(model, 0) + 1
+                if self.max_loaded and len(self._loaded) >= self.max_loaded:
+                    oldest = min(self._loaded, key=lambda name: self._loaded[name][1])
+                    del self._loaded[oldest]
+            self._loaded[model] = (float("inf"), now)
+        if cold and self.load_seconds:
+            time.sleep(self.load_seconds)
+        return self.load_seconds if cold else 0.0
+
+    # 응답 후 keep_alive 적용 (0이면 바로 내림, 음수면 계속 상주, 없으면 Ollama 기본값 5분)
+    def _finish(self, model: str, keep_alive) -> None:
+        keep_alive = 300.0 if keep_alive is None else float(keep_alive)
+        now = time.monotonic()
+        with self._lock:
+            if keep_alive == 0:
+                self._loaded.pop(model, None)
+            elif model in self._loaded:
+                self._loaded[model] = (float("inf") if keep_alive < 0 else now + keep_alive, now)
+
+    # 입력 토큰 수 추정 (한글 글자당 1, 그 밖에는 4글자당 1) - num_ctx 를 넘으면 잘림
+    def prompt_tokens(self, messages: list, num_ctx: int = 0) -> int:
+        text = "".join(message.get("content", "") for message in messages)
+        hangul = sum(1 for ch in text if '가' <= ch <= '힣')
+        tokens = hangul + (len(text) - hangul + 3) // 4
+        if num_ctx and tokens > num_ctx:
+            with self._lock:
+                self.truncated += 1
+            return num_ctx
+        return tokens
+
+    # 사용자 메시지의 "Line N: 텍스트" 줄 → 응답 JSON
+    def answer(self, messages: list) -> str:
+        user = messages[-1]["content"] if messages else ""
+        if messages and "recipe_name" in messages[0].get("content", ""):
+            recipe = {"recipe_name": "두부조림", "difficulty": "쉬움", "time_required": "20분",
+                      "ingredients_main": ["두부", "양파"], "ingredients_needed": ["간장", "설탕"],
+                      "steps": ["1. 두부를 1cm 두께로 썬다", "2. 양파를 채 썬다", "3. 팬에 두부를 노릇하게 굽는다",
+                                "4. 간장 양념을 붓고 \"약불\"에서 조린다", "5. 그릇에 담아 낸다"]}
+            return "```json\n" + json.dumps(recipe, ensure_ascii=False, indent=2) + "\n```", 0
+        lines = re.findall(r"^Line (\d+): (.+)$", user, re.MULTILINE)
+        items = [
+            {"line": int(number), "product_name": text.strip(), "quantity": 1, "unit": "개", "category": "기타"}
+            for number, text in lines
+            if not any(word in text for word in self.non_food)
+        ]
+        return json.dumps(items, ensure_ascii=False), len(lines)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                model = body.get("model", "stub")
+                keep_alive = body.get("keep_alive")
+
+                # 빈 프롬프트 generate: 모델 올리기(예열) 또는 keep_alive=0 이면 내리기
+                if self.path.endswith("/api/generate") and not body.get("prompt"):
+                    load = 0.0
+                    if keep_alive is None or float(keep_alive) != 0:
+                        load = stub._ensure_loaded(model)
+                    stub._finish(model, keep_alive)
+                    self._reply({"model": model, "created_at": "2024-01-01T00:00:00Z", "response": "",
+                                 "done": True, "load_duration": int(load * 1e9)})
+                    return
+
+                with stub._lock:
+                    stub.calls += 1
+                    stub._active += 1
+                    stub.max_concurrency = max(stub.max_concurrency, stub._active)
+                try:
+                    load = stub._ensure_loaded(model)
+                    content, line_count = stub.answer(body.get("messages", []))
+                    prompt_tokens = stub.prompt_tokens(body.get("messages", []), (body.get("options") or {}).get("num_ctx", 0))
+                    prefill = stub.prefill_per_token * prompt_tokens
+                    time.sleep(prefill)
+                    generate = stub.latency + stub.per_line * line_count
+                    if body.get("stream"):
+                        self._stream(model, content, generate)
+                    else:
+                        time.sleep(generate)
+                    stub._finish(model, keep_alive)
+                finally:
+                    with stub._lock:
+                        stub._active -= 1
+
+                final = {
+                    "model": model,
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "message": {"role": "assistant", "content": "" if body.get("stream") else content},
+                    "done": True,
+                    "done_reason": "stop",
+                    "total_duration": int((load + prefill + generate) * 1e9),
+                    "load_duration": int(load * 1e9),
+                    "prompt_eval_count": prompt_tokens,
+                    "prompt_eval_duration": int(prefill * 1e9),
+                    "eval_count": max(len(content) // 4, 1),
+                    "eval_duration": int(generate * 1e9),
+                }
+                if body.get("stream"):
+                    self._write_line(final)
+                else:
+                    self._reply(final)
+
+            # 생성 시간 동안 응답을 토큰 크기(4글자) 조각으로 나눠 한 줄씩 보냄 (Content-Length 없이 연결 종료로 끝냄)
+            def _stream(self, model: str, content: str, generate: float) -> None:
+                pieces = [content[i:i + 4] for i in range(0, len(content), 4)] or [""]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                interval = generate / len(pieces)
+                for piece in pieces:
+                    time.sleep(interval)
+                    self._write_line({"model": model, "created_at": "2024-01-01T00:00:00Z",
+                                      "message": {"role": "assistant", "content": piece}, "done": False})
+
+            def _write_line(self, body: dict) -> None:
+                self.wfile.write(json.dumps(body, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+            def _reply(self, body: dict) -> None:
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
@@ -0,0 +1,89 @@
+import os
+import sys
+import asyncio
+import threading
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import run_db, run_in_db_thread, shutdown_db_executor
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = database.init_pool(str(tmp_path / "async.db"), size=2, timeout=0.5)
+    yield pool
+    shutdown_db_executor()
+    database.close_pool()
+
+
+# ------------------------------------------------------------------
+# 2. run_in_db_thread: DB 전용 스레드에서 실행, 인자 / 예외 전달
+# ------------------------------------------------------------------
+def test_run_in_db_thread_uses_db_executor(pool):
+    def work(a, b=0):
+        return threading.current_thread().name, a + b
+
+    name, value = asyncio.run(run_in_db_thread(work, 1, b=2))
+    assert name.startswith("db") and name != threading.current_thread().name
+    assert value == 3
+
+
+def test_run_in_db_thread_propagates_exception(pool):
+    def fail():
+        raise ValueError("잘못된 값")
+
+    with pytest.raises(ValueError):
+        asyncio.run(run_in_db_thread(fail))
+
+
+# ------------------------------------------------------------------
+# 3. run_db: 풀 커넥션을 첫 번째 인자로 주입하고 끝나면 반납
+# ------------------------------------------------------------------
+def test_run_db_injects_pooled_connection_and_releases(pool):
+    seen = []
+
+    def crud(conn, value):
+        seen.append(conn)
+        assert pool.metrics()["checked_out"] == 1
+        return conn.execute("SELECT ?", (value,)).fetchone()[0]
+
+    assert asyncio.run(run_db(crud, 7)) == 7
+    assert seen[0] in pool._idle   # 같은 풀의 커넥션이 반납됨
+    assert pool.metrics()["checked_out"] == 0
+
+
+def test_run_db_releases_and_rolls_back_on_exception(pool):
+    def failing(conn):
+        conn.execute("CREATE TABLE T (v INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO T VALUES (1)")
+        raise RuntimeError("CRUD 오류")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run_db(failing))
+    assert pool.metrics()["checked_out"] == 0
+
+    count = asyncio.run(run_db(lambda conn: conn.execute("SELECT COUNT(*) FROM T").fetchone()[0]))
+    assert count == 0
+
+
+def test_concurrent_run_db_calls_share_bounded_pool(pool):
+    barrier = threading.Barrier(2, timeout=2)
+
+    def crud(conn):
+        barrier.wait()   # 두 호출이 동시에 커넥션을 들고 있어야 통과
+        return id(conn)
+
+    async def main():
+        return await asyncio.gather(run_db(crud), run_db(crud))
+
+    first, second = asyncio.run(main())
+    assert first != second
+    assert pool.metrics()["checked_out"] == 0
@@ -0,0 +1,113 @@
+import os
+import sys
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import shutdown_db_executor
+from src.db.reference_cache import reference_cache
+from src.ingredients import ingredients_crud
+from src.ingredients.ingredients_crud import register_ingredients_batch_to_db
+from src.ingredients.ingredients_router import MAX_BATCH_SIZE, router as ingredients_router
+
+
+@pytest.fixture
+def client(tmp_path):
+    database.init_pool(str(tmp_path / "batch.db"), size=2)
+    database.initialize_database()
+    reference_cache.invalidate()   # 다른 테스트의 DB로 적재된 캐시를 비움
+
+    app = FastAPI()
+    app.include_router(ingredients_router, prefix="/ingredients")
+    yield TestClient(app)
+    shutdown_db_executor()
+    database.close_pool()
+
+
+def item(name: str, category: str = "채소", location: str = "냉장", **extra) -> dict:
+    return {"name": name, "category_tag": category, "storage_location": location, "quantity": 1, "unit": "개", **extra}
+
+
+def stored(ids: list) -> dict:
+    with database.db_connection() as conn:
+        placeholders = ", ".join("?" for _ in ids)
+        return {row["id"]: row["name"] for row in conn.execute(
+            f"SELECT id, name FROM Ingredients WHERE id IN ({placeholders})", ids)}
+
+
+# ------------------------------------------------------------------
+# 2. POST /ingredients/register/batch
+# ------------------------------------------------------------------
+def test_batch_returns_ids_of_inserted_rows(client):
+    # 먼저 단건 등록 후 삭제해 ID 사이에 빈 자리를 만듦
+    first = client.post("/ingredients/register", json=item("임시")).json()["id"]
+    with database.db_connection() as conn:
+        conn.execute("DELETE FROM Ingredients WHERE id = ?", (first,))
+        conn.commit()
+
+    response = client.post("/ingredients/register/batch", json=[item("양파"), item("두부", "두부"), item("우유", "유제품")])
+    body = response.json()
+    assert response.status_code == 200
+    assert (body["total"], body["succeeded"], body["failed"]) == (3, 3, 0)
+
+    ids = [result["ingredient"]["id"] for result in body["results"]]
+    assert stored(ids) == dict(zip(ids, ["양파", "두부", "우유"]))
+    assert first not in ids
+
+
+def test_partial_validation_failure_reports_per_item(client):
+    response = client.post("/ingredients/register/batch", json=[
+        item("양파"),
+        item("정체불명", category="없는카테고리"),
+        item("당근", manual_days=10),
+        item("수박", location="창고"),
+    ])
+    body = response.json()
+    assert (body["total"], body["succeeded"], body["failed"]) == (4, 2, 2)
+    assert [result["index"] for result in body["results"]] == [0, 1, 2, 3]
+    assert [result["success"] for result in body["results"]] == [True, False, True, False]
+    assert "없는카테고리" in body["results"][1]["error"]
+    assert body["results"][1]["ingredient"] is None
+
+    ids = [body["results"][index]["ingredient"]["id"] for index in (0, 2)]
+    assert stored(ids) == dict(zip(ids, ["양파", "당근"]))
+    with database.db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM Ingredients").fetchone()[0] == 2
+
+
+def test_rejects_empty_and_oversized_batches(client):
+    assert client.post("/ingredients/register/batch", json=[]).status_code == 400
+    oversized = [item(f"양파{i}") for i in range(MAX_BATCH_SIZE + 1)]
+    assert client.post("/ingredients/register/batch", json=oversized).status_code == 400
+
+
+# 여러 문장으로 나눠 입력해도 ID 는 rows 순서대로
+def test_ids_follow_row_order_across_statements(client, monkeypatch):
+    monkeypatch.setattr(ingredients_crud, "BATCH_INSERT_ROWS", 2)
+    names = ["양파", "두부", "우유", "당근", "대파"]
+    with database.db_connection() as conn:
+        result = register_ingredients_batch_to_db(conn, [(name, 2, 1, 1.0, "개", "2030-01-01") for name in names])
+    assert result["success"]
+    assert stored(result["ids"]) == dict(zip(result["ids"], names))
+    assert result["ids"] == sorted(result["ids"])
+
+
+# ------------------------------------------------------------------
+# 3. 저장 중 DB 오류: 전체 롤백
+# ------------------------------------------------------------------
+def test_db_error_rolls_back_whole_batch(client):
+    with database.db_connection() as conn:
+        result = register_ingredients_batch_to_db(conn, [
+            ("양파", 2, 1, 1.0, "개", "2030-01-01"),
+            ("두부", None, 1, 1.0, "모", "2030-01-01"),   # category_id NOT NULL 위반
+        ])
+        assert not result["success"] and "일괄 등록 실패" in result["message"]
+        assert conn.execute("SELECT COUNT(*) FROM Ingredients").fetchone()[0] == 0
@@ -0,0 +1,100 @@
+import os
+import sys
+import threading
+import time
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db.database import ConnectionPool, PoolTimeoutError
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2, timeout=0.2)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE T (v INTEGER)")
+        conn.commit()
+    yield pool
+    pool.close()
+
+
+# ------------------------------------------------------------------
+# 2. 대여 / 고갈 / 대기 시간 초과
+# ------------------------------------------------------------------
+def test_pragmas_applied_to_pooled_connections(pool):
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_exhausted_pool_times_out(pool):
+    held = [pool.acquire(), pool.acquire()]
+    started = time.perf_counter()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    assert time.perf_counter() - started >= 0.2
+
+    metrics = pool.metrics()
+    assert metrics["checked_out"] == 2 and metrics["idle"] == 0
+    assert metrics["waits"] == 1 and metrics["timeouts"] == 1
+    for conn in held:
+        pool.release(conn)
+    assert pool.metrics()["idle"] == 2
+
+
+def test_waiter_gets_connection_released_by_other_thread(pool):
+    held = [pool.acquire(), pool.acquire()]
+    threading.Timer(0.05, pool.release, args=(held[0],)).start()
+
+    conn = pool.acquire(timeout=2)
+    assert conn is held[0]
+    assert pool.metrics()["timeouts"] == 0
+    pool.release(conn)
+    pool.release(held[1])
+
+
+def test_closed_pool_rejects_acquire(pool):
+    pool.close()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+
+# ------------------------------------------------------------------
+# 3. 반납: 예외가 나도 반납되고 열린 트랜잭션은 롤백
+# ------------------------------------------------------------------
+def test_release_on_exception_rolls_back(pool):
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO T VALUES (1)")
+            assert conn.in_transaction
+            raise RuntimeError("요청 처리 중 오류")
+
+    assert pool.metrics()["checked_out"] == 0
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM T").fetchone()[0] == 0
+
+
+def test_broken_connection_is_replaced_on_release(pool):
+    conn = pool.acquire()
+    conn.close()
+    pool.release(conn)   # 닫힌 커넥션의 in_transaction 확인 실패 → 새 커넥션으로 교체
+
+    conns = [pool.acquire(), pool.acquire()]
+    for conn in conns:
+        assert conn.execute("SELECT COUNT(*) FROM T").fetchone()[0] == 0
+        pool.release(conn)
+
+
+def test_connection_returned_after_close_is_closed(pool):
+    conn = pool.acquire()
+    pool.close()
+    pool.release(conn)
+    with pytest.raises(Exception):
+        conn.execute("SELECT 1")
@@ -0,0 +1,73 @@
+import os
+import sys
+import json
+import random
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.llm import llm_processor
+from src.llm.garbage_filter import GarbageFilter, garbage_filter
+
+
+# ------------------------------------------------------------------
+# 2. 한 줄 판정
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("line, expected", [
+    ("009풀/소가부침두부 1 3,500", False),
+    ("100g", False),
+    ("mart", False),
+    ("1", False),
+    ("", True),
+    ("   ", True),
+    ("-", True),
+    ("*** ---", True),
+    ("신용카드 승인", True),
+    ("L.POINT 적립 120", True),
+    ("포인트 미사용", True),
+    ("미사용", True),          # "포인트" "미사용" 쉼표 누락으로 빠져 있던 키워드
+    ("비닐봉투 20L", True),
+])
+def test_is_garbage(line, expected):
+    assert garbage_filter.is_garbage(line) is expected
+    assert garbage_filter.is_garbage({"text": line}) is expected
+
+
+def test_confidence_threshold(tmp_path):
+    config = tmp_path / "garbage.json"
+    config.write_text(json.dumps({"keywords": ["카드"], "min_confidence": 0.5}), encoding="utf-8")
+    strict = GarbageFilter.from_config(str(config))
+
+    assert strict.is_garbage({"text": "두부", "avg_confidence": 0.3})
+    assert strict.is_garbage({"text": "두부", "confidence": [0.2, 0.4]})
+    assert not strict.is_garbage({"text": "두부", "avg_confidence": 0.9})
+    # 신뢰도가 없는 줄은 기준을 적용하지 않음
+    assert not strict.is_garbage({"text": "두부"})
+    assert not strict.is_garbage("두부")
+
+
+# ------------------------------------------------------------------
+# 3. 줄 목록 일괄 판정 = 한 줄씩 판정
+# ------------------------------------------------------------------
+def test_garbage_mask_matches_per_line():
+    rng = random.Random(3)
+    pieces = ["두부", "우유", "카드", "-", "", " ", "001.", "TEL", "3,500", "Point", "*", "영수증", "a", "\n"]
+    items = []
+    for _ in range(2000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 4)))
+        items.append({"text": text, "avg_confidence": rng.random()} if rng.random() < 0.5 else text)
+
+    assert garbage_filter.garbage_mask(items) == [garbage_filter.is_garbage(item) for item in items]
+    assert garbage_filter.filter_lines(items) == [item for item in items if not garbage_filter.is_garbage(item)]
+
+
+def test_empty_lines():
+    assert garbage_filter.garbage_mask([]) == []
+    assert garbage_filter.filter_lines([]) == []
+    # OCR 결과에 줄이 하나도 없는 영수증
+    assert llm_processor.refine_ingredients_with_llm({"lines": []}) == []
@@ -0,0 +1,130 @@
+import os
+import sys
+import json
+import random
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from stub_ollama import StubOllamaServer
+from src.llm.json_stream import IncrementalJSONObjectParser
+from src.llm.llm_client import llm_client
+from src.llm.llm_processor import clean_recipe_step, parse_recipe_response
+from src.recipes.recipes_router import router as recipes_router
+
+RECIPE = {
+    "recipe_name": "김치 \"볶음\"밥",
+    "difficulty": "쉬움",
+    "servings": 2,
+    "spicy": True,
+    "note": None,
+    "ingredients_main": ["김치", "밥"],
+    "nutrition": {"kcal": 520, "tags": ["한식", "간단"]},
+    "steps": ["1. 김치를 썬다", "2) 밥과 볶는다\n", "3. {불}을 끈다, [끝]", 4],
+}
+
+
+# 한 번에 넣었을 때 나와야 하는 이벤트
+def expected_events(doc: dict) -> list:
+    events = []
+    for key, value in doc.items():
+        if isinstance(value, list):
+            events += [("item", key, i, item) for i, item in enumerate(value)]
+        events.append(("field", key, value))
+    return events
+
+
+def feed_in_chunks(text: str, rng: random.Random) -> list:
+    parser = IncrementalJSONObjectParser()
+    events, pos = [], 0
+    while pos < len(text):
+        size = rng.randint(1, 7)
+        events += parser.feed(text[pos:pos + size])
+        pos += size
+    assert parser.finished
+    return events
+
+
+# ------------------------------------------------------------------
+# 2. 증분 파서
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("indent", [None, 2])
+def test_random_chunking_matches_whole_document(indent):
+    text = json.dumps(RECIPE, ensure_ascii=False, indent=indent)
+    rng = random.Random(indent or 0)
+    for _ in range(50):
+        assert feed_in_chunks(text, rng) == expected_events(RECIPE)
+
+
+def test_skips_code_fence_and_trailing_text():
+    text = "```json\n" + json.dumps(RECIPE, ensure_ascii=False) + "\n```\n추가 설명"
+    assert feed_in_chunks(text, random.Random(1)) == expected_events(RECIPE)
+
+
+def test_field_is_emitted_before_document_ends():
+    parser = IncrementalJSONObjectParser()
+    assert parser.feed('{"recipe_name": "두부') == []
+    assert parser.feed('조림", "steps": ["1. 썬다",') == [
+        ("field", "recipe_name", "두부조림"),
+        ("item", "steps", 0, "1. 썬다"),
+    ]
+    assert not parser.finished
+
+
+def test_clean_recipe_step():
+    assert clean_recipe_step("1. 두부를 썬다") == "두부를 썬다"
+    assert clean_recipe_step("12) 조린다") == "조린다"
+    assert clean_recipe_step("2인분 기준") == "2인분 기준"
+    assert parse_recipe_response('```json\n{"steps": ["1. 썬다"]}\n```') == {"steps": ["썬다"]}
+
+
+# ------------------------------------------------------------------
+# 3. SSE 엔드포인트 (가짜 Ollama 스트리밍)
+# ------------------------------------------------------------------
+@pytest.fixture
+def app_client(monkeypatch):
+    server = StubOllamaServer(latency=0.05).start()
+    monkeypatch.setattr(llm_client, "host", server.host)
+    app = FastAPI()
+    app.include_router(recipes_router, prefix="/recipes")
+    yield TestClient(app)
+    server.stop()
+
+
+def parse_sse(body: str) -> list:
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_endpoint_sends_parts_then_done(app_client):
+    response = app_client.post("/recipes/recommend/stream", json={"ingredients": [{"name": "두부", "quantity": 1, "unit": "모"}]})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_sse(response.text)
+    names = [name for name, _ in events]
+    assert names[0] == "recipe_name"
+    assert names[-1] == "done"
+    assert "ingredients_main" in names
+
+    steps = [data["text"] for name, data in events if name == "step"]
+    done = events[-1][1]
+    assert steps == done["steps"]
+    assert not any(step[0].isdigit() for step in steps)
+    assert events[0][1] == {"recipe_name": done["recipe_name"]}
+
+
+def test_stream_endpoint_rejects_empty_list(app_client):
+    response = app_client.post("/recipes/recommend/stream", json={"ingredients": []})
+    assert response.status_code == 400
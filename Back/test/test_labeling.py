@@ -0,0 +1,38 @@
+import os
+import sys
+import sqlite3
+from datetime import date, timedelta
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ingredients.labeling import calculate_remaining_days, get_visual_labeling_data, labeling_columns_sql
+
+
+# ------------------------------------------------------------------
+# 2. SQL 라벨링 == 파이썬 라벨링
+# ------------------------------------------------------------------
+def test_sql_labeling_matches_python_labeling():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE Ingredients (id INTEGER PRIMARY KEY, expiry_date TEXT NOT NULL)")
+    dates = [(date.today() + timedelta(days=days)).strftime("%Y-%m-%d") for days in range(-40, 400)]
+    conn.executemany("INSERT INTO Ingredients (expiry_date) VALUES (?)", [(d,) for d in dates + ["미정"]])
+
+    rows = conn.execute(f"SELECT expiry_date, {labeling_columns_sql()} FROM Ingredients ORDER BY id").fetchall()
+    assert len(rows) == len(dates) + 1
+    for row in rows:
+        expected = get_visual_labeling_data(calculate_remaining_days(row["expiry_date"]))
+        assert {key: row[key] for key in expected} == expected
+
+
+def test_sql_labeling_with_table_alias():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE Ingredients (expiry_date TEXT NOT NULL)")
+    conn.execute("INSERT INTO Ingredients VALUES (?)", ((date.today() - timedelta(days=2)).strftime("%Y-%m-%d"),))
+    row = conn.execute(f"SELECT {labeling_columns_sql('I.expiry_date')} FROM Ingredients I").fetchone()
+    assert row == (-2, "2일 지남", "red")
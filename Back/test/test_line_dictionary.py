@@ -0,0 +1,197 @@
+import os
+import sys
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.llm import line_dictionary as line_dictionary_module
+from src.llm import llm_processor
+from src.llm.line_dictionary import LineDictionary, normalize_line_key
+
+TOFU = {"product_name": "두부", "quantity": 1.0, "unit": "개", "category": "유제품/두부/알류", "category_tag": "두부"}
+ONION = {"product_name": "양파", "quantity": 1.0, "unit": "개", "category": "채소", "category_tag": "채소"}
+
+
+# ------------------------------------------------------------------
+# 2. 정규화 키
+# ------------------------------------------------------------------
+def test_normalize_line_key_strips_codes_and_whitespace():
+    key = normalize_line_key("009풀/소가부침두부 1 3,500")
+    assert key == normalize_line_key("012 풀/소가부침두부  1 3,500")
+    assert key == normalize_line_key("001. 풀/소가부침두부 1 3,500")
+    assert key == "소가부침두부13,500"
+    assert normalize_line_key("P 몽나미 볼펜") == normalize_line_key("몽나미볼펜")
+    # 수량/가격이 다르면 다른 줄
+    assert key != normalize_line_key("009풀/소가부침두부 2 7,000")
+
+
+def test_normalize_line_key_keeps_quantity_and_unit():
+    assert normalize_line_key("2L 우유") == "2l우유"
+    assert normalize_line_key("1L 우유") == "1l우유"
+    assert normalize_line_key("500g 삼겹살") == "500g삼겹살"
+    assert normalize_line_key("3 계란 30구") != normalize_line_key("10 계란 30구")
+    assert normalize_line_key("1/2 수박") == "1/2수박"
+    assert normalize_line_key("3) 500g 삼겹살") == normalize_line_key("#500g 삼겹살")
+
+
+def test_lines_with_different_amounts_do_not_share_an_entry():
+    dictionary = LineDictionary(persistent=False)
+    milk = {"product_name": "우유", "quantity": 2.0, "unit": "L", "category": "유제품", "category_tag": "유제품"}
+    dictionary.learn([("2L 우유", [milk])])
+
+    assert dictionary.lookup("001 2L 우유") == [milk]
+    assert dictionary.lookup("1L 우유") is None   # 다른 양: LLM 으로 보냄
+
+
+def test_lookup_exact_then_normalized():
+    dictionary = LineDictionary(persistent=False)
+    dictionary.learn([("009풀/소가부침두부 1 3,500", [TOFU]), ("비닐봉투 50", [])])
+
+    assert dictionary.lookup("009풀/소가부침두부 1 3,500") == [TOFU]
+    assert dictionary.lookup("015 풀/소가부침두부 1 3,500") == [TOFU]
+    assert dictionary.lookup("비닐봉투 50") == []       # 식재료가 아닌 줄도 LLM 없이 처리
+    assert dictionary.lookup("양파 1.5kg 1 4,000") is None
+
+    metrics = dictionary.metrics()
+    assert (metrics["exact_hits"], metrics["normalized_hits"], metrics["sent_to_llm"]) == (2, 1, 1)
+    assert metrics["llm_skip_ratio"] == 0.75
+
+
+# ------------------------------------------------------------------
+# 3. LLM 답을 줄 위치로 배치
+# ------------------------------------------------------------------
+def test_assign_chunk_answers_learns_per_line(monkeypatch):
+    dictionary = LineDictionary(persistent=False)
+    monkeypatch.setattr(llm_processor, "line_dictionary", dictionary)
+
+    lines = ["두부 1", "봉투 1", "양파 1"]
+    per_line = [None, None, None]
+    answers = [dict(TOFU, line=1), dict(ONION, line=3)]
+    rows = llm_processor._assign_chunk_answers(lines, [0, 1, 2], answers, per_line)
+
+    assert per_line == [[TOFU], [], [ONION]]
+    assert len(rows) == 3
+    assert dictionary.lookup("봉투 1") == []
+
+
+def test_assign_chunk_answers_without_line_numbers_is_not_learned(monkeypatch):
+    dictionary = LineDictionary(persistent=False)
+    monkeypatch.setattr(llm_processor, "line_dictionary", dictionary)
+
+    per_line = [None, None]
+    rows = llm_processor._assign_chunk_answers(["두부 1", "양파 1"], [0, 1], [TOFU, ONION], per_line)
+
+    assert rows == []
+    assert per_line == [[], [TOFU, ONION]]   # 결과는 잃지 않고 청크 끝에 붙음
+    assert dictionary.lookup("두부 1") is None
+
+
+def test_assign_chunk_answers_with_unnumbered_answer_learns_nothing(monkeypatch):
+    dictionary = LineDictionary(persistent=False)
+    monkeypatch.setattr(llm_processor, "line_dictionary", dictionary)
+
+    per_line = [None, None]
+    rows = llm_processor._assign_chunk_answers(["두부 1", "양파 1"], [0, 1], [dict(TOFU, line=1), ONION], per_line)
+
+    assert rows == []
+    assert per_line == [[TOFU], [ONION]]
+    assert dictionary.lookup("양파 1") is None   # 번호 없는 답 때문에 '식재료 아님'으로 굳지 않음
+    assert dictionary.lookup("두부 1") is None
+
+    # 답이 하나도 없으면(호출 실패 포함) 전부 '식재료 아님'으로 기록하지 않음
+    assert llm_processor._assign_chunk_answers(["두부 1"], [0], [], [None]) == []
+    assert dictionary.lookup("두부 1") is None
+
+
+# ------------------------------------------------------------------
+# 4. '식재료 아님' 줄의 유효 기간
+# ------------------------------------------------------------------
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def test_negative_entries_expire(monkeypatch):
+    clock = FakeClock(1_000.0)
+    monkeypatch.setattr(line_dictionary_module, "time", clock)
+    dictionary = LineDictionary(persistent=False, negative_ttl=60)
+    dictionary.learn([("봉투 1", []), ("두부 1", [TOFU])])
+
+    clock.now += 59
+    assert dictionary.lookup("봉투 1") == []
+    clock.now += 1
+    assert dictionary.lookup("봉투 1") is None   # 만료 → 다시 LLM으로
+    assert dictionary.lookup("두부 1") == [TOFU]  # 식재료가 있는 답은 만료 없음
+
+
+def test_expired_negative_entries_are_not_loaded(tmp_path, monkeypatch):
+    clock = FakeClock(1_000.0)
+    monkeypatch.setattr(line_dictionary_module, "time", clock)
+    database.init_pool(str(tmp_path / "dictionary.db"), size=1)
+    database.initialize_database()
+    try:
+        first = LineDictionary(negative_ttl=60)
+        first.persist(first.learn([("봉투 1", []), ("두부 1", [TOFU])]))
+
+        clock.now += 30
+        assert LineDictionary(negative_ttl=60).lookup("봉투 1") == []
+        clock.now += 30
+        restarted = LineDictionary(negative_ttl=60)
+        assert restarted.lookup("봉투 1") is None
+        assert restarted.lookup("두부 1") == [TOFU]
+    finally:
+        database.close_pool()
+
+
+def test_refine_skips_llm_for_known_lines(monkeypatch):
+    dictionary = LineDictionary(persistent=False)
+    dictionary.learn([("009풀/소가부침두부 1 3,500", [TOFU])])
+    monkeypatch.setattr(llm_processor, "line_dictionary", dictionary)
+
+    sent = []
+    def fake_refine(chunk):
+        sent.append(list(chunk))
+        return [dict(ONION, line=1)]
+    monkeypatch.setattr(llm_processor, "refine_batch_items", fake_refine)
+
+    items = llm_processor.refine_ingredients_with_llm(["012 풀/소가부침두부 1 3,500", "양파 1.5kg 1 4,000"])
+    assert items == [TOFU, ONION]
+    assert sent == [["양파 1.5kg 1 4,000"]]
+
+    # 두 번째 영수증은 LLM을 전혀 호출하지 않음
+    sent.clear()
+    assert llm_processor.refine_ingredients_with_llm(["양파 1.5kg 1 4,000"]) == [ONION]
+    assert sent == []
+
+
+# ------------------------------------------------------------------
+# 5. DB 저장 후 다시 적재
+# ------------------------------------------------------------------
+def test_persist_and_reload(tmp_path):
+    database.init_pool(str(tmp_path / "dictionary.db"), size=1)
+    database.initialize_database()
+    try:
+        first = LineDictionary()
+        first.persist(first.learn([("009풀/소가부침두부 1 3,500", [TOFU])]))
+
+        restarted = LineDictionary()
+        assert restarted.lookup("010 풀/소가부침두부 1 3,500") == [TOFU]
+
+        # 예전 규칙으로 저장된 정규화 키('우유')는 쓰지 않음
+        with database.db_connection() as conn:
+            conn.execute("""
+                INSERT INTO Receipt_Line_Dictionary (raw_text, norm_key, items, updated_at) VALUES ('2L 우유', '우유', '[]', 0)
+            """)
+            conn.commit()
+        assert LineDictionary(negative_ttl=float("inf")).lookup("1L 우유") is None
+    finally:
+        database.close_pool()
@@ -0,0 +1,96 @@
+import os
+import sys
+import random
+import numpy as np
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.line_grouping import group_lines, adaptive_line_threshold
+
+
+# 기존 AdvancedOCRProcessor 5~6단계 (비교 기준)
+def legacy_group_lines(texts, boxes, scores, threshold=12):
+    items = []
+    for text, box, score in zip(texts, boxes, scores):
+        x1, y1, x2, y2 = box
+        items.append({"text": text, "x": (x1 + x2) / 2.0, "y": (y1 + y2) / 2.0, "score": float(score)})
+    items.sort(key=lambda x: x["y"])
+    lines_raw = []
+    for item in items:
+        if not lines_raw:
+            lines_raw.append([item])
+            continue
+        last_line = lines_raw[-1]
+        last_y = np.mean([t["y"] for t in last_line])
+        if abs(item["y"] - last_y) <= threshold:
+            last_line.append(item)
+        else:
+            lines_raw.append([item])
+    lines = []
+    for idx, line in enumerate(lines_raw, start=1):
+        line_sorted = sorted(line, key=lambda x: x["x"])
+        lines.append({
+            "index": idx,
+            "text": " ".join(t["text"] for t in line_sorted),
+            "avg_confidence": float(np.mean([t["score"] for t in line_sorted]))
+        })
+    return lines
+
+
+def synthetic_receipt(box_count, seed, skew=0.0, jitter=3.0):
+    rng = random.Random(seed)
+    texts, boxes, scores = [], [], []
+    for i in range(box_count):
+        row, col = divmod(i, 4)
+        x1 = col * 150 + rng.uniform(0, 20)
+        y1 = row * 26 + rng.uniform(-jitter, jitter) + skew * x1
+        texts.append(f"t{i}")
+        boxes.append([x1, y1, x1 + rng.uniform(40, 120), y1 + rng.uniform(16, 22)])
+        scores.append(rng.uniform(0.5, 1.0))
+    order = list(range(box_count))
+    rng.shuffle(order)
+    return [texts[i] for i in order], np.array([boxes[i] for i in order]), np.array([scores[i] for i in order])
+
+
+def assert_same_lines(actual, expected):
+    assert [(l["index"], l["text"]) for l in actual] == [(l["index"], l["text"]) for l in expected]
+    assert np.allclose([l["avg_confidence"] for l in actual], [l["avg_confidence"] for l in expected])
+
+
+# ------------------------------------------------------------------
+# 2. 기존 결과와 동일한지 확인 (기울어진 사진 / 촘촘한 줄 포함)
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("box_count, skew, jitter", [
+    (1, 0.0, 3.0), (7, 0.0, 3.0), (50, 0.0, 3.0), (400, 0.0, 3.0),
+    (400, 0.03, 3.0),   # 줄 평균에서 조금씩 멀어지는 경우
+    (400, 0.0, 12.0),   # 줄 간격보다 흔들림이 큰 경우
+])
+def test_matches_legacy_grouping(box_count, skew, jitter):
+    for seed in range(5):
+        texts, boxes, scores = synthetic_receipt(box_count, seed, skew, jitter)
+        assert_same_lines(group_lines(texts, boxes, scores, threshold=12),
+                          legacy_group_lines(texts, boxes, scores, threshold=12))
+
+
+def test_empty_input():
+    assert group_lines([], np.zeros((0, 4)), np.zeros(0)) == []
+
+
+# ------------------------------------------------------------------
+# 3. 박스 높이 기반 허용 오차
+# ------------------------------------------------------------------
+def test_adaptive_threshold_scales_with_text_height():
+    texts, boxes, scores = synthetic_receipt(80, 0)
+    small = adaptive_line_threshold(boxes)
+    assert 8 <= small <= 11
+
+    # 2배 해상도: 고정 12px은 줄을 쪼개지만 adaptive는 같은 줄 수를 유지
+    big = boxes * 2
+    assert adaptive_line_threshold(big) == pytest.approx(small * 2)
+    assert len(group_lines(texts, big, scores, threshold="adaptive")) == len(group_lines(texts, boxes, scores, threshold=12))
@@ -0,0 +1,105 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from stub_ollama import StubOllamaServer
+from src.llm.llm_client import LLMClient
+
+MESSAGES = [{"role": "system", "content": "refine"}, {"role": "user", "content": "Line 1: 두부"}]
+
+
+# ------------------------------------------------------------------
+# 2. 가짜 Ollama (로드 0.2초, 동시에 최대 2개 모델 상주)
+# ------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def stub():
+    server = StubOllamaServer(latency=0.01, load_seconds=0.2, max_loaded=2).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(stub):
+    stub.reset()
+    llm = LLMClient(memory_budget_mb=10000, idle_check_interval=0.05, cold_load_ms=100, host=stub.host)
+    llm.register("refine", keep_alive=60, memory_mb=5000)
+    llm.register("recipe", keep_alive=60, memory_mb=5000)
+    yield llm
+    llm.stop_idle_scheduler()
+
+
+def test_models_within_budget_stay_resident(stub, client):
+    for model in ("refine", "recipe", "refine", "recipe"):
+        client.chat(model, MESSAGES)
+
+    assert stub.loads == {"refine": 1, "recipe": 1}
+    metrics = client.metrics()
+    assert set(metrics["resident"]) == {"refine", "recipe"}
+    assert metrics["models"]["refine"]["calls"] == 2
+    assert metrics["models"]["refine"]["cold_loads"] == 1
+    assert metrics["recent_calls"][0]["cold"] is True and metrics["recent_calls"][2]["cold"] is False
+
+
+def test_budget_evicts_least_recently_used(stub, client):
+    client.memory_budget_mb = 6000   # 하나만 올릴 수 있음
+    client.chat("refine", MESSAGES)
+    client.chat("recipe", MESSAGES)
+
+    assert stub.loaded_models() == ["recipe"]
+    metrics = client.metrics()
+    assert list(metrics["resident"]) == ["recipe"]
+    assert metrics["evictions"] == 1
+
+
+def test_zero_keep_alive_unloads_after_call(stub, client):
+    client.register("oneshot", keep_alive=0, memory_mb=1000)
+    client.chat("oneshot", MESSAGES)
+    assert "oneshot" not in stub.loaded_models()
+    assert "oneshot" not in client.metrics()["resident"]
+
+
+def test_idle_scheduler_unloads_idle_models(stub, client):
+    client.register("refine", keep_alive=0.1, memory_mb=5000)
+    client.chat("refine", MESSAGES)
+    assert "refine" in stub.loaded_models()
+
+    client.start_idle_scheduler()
+    deadline = time.monotonic() + 3
+    while "refine" in stub.loaded_models() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert "refine" not in stub.loaded_models()
+    assert client.metrics()["idle_unloads"] == 1
+
+
+def test_warm_up_then_async_chat_is_warm(stub, client):
+    client.warm_up(["refine"])
+    assert stub.loads == {"refine": 1}
+
+    response = asyncio.run(client.chat_async("refine", MESSAGES))
+    assert response["message"]["content"]
+    assert stub.loads == {"refine": 1}
+    assert client.metrics()["recent_calls"][-1]["cold"] is False
+
+
+def test_async_calls_share_one_client(stub, client):
+    async def main():
+        await client.chat_async("refine", MESSAGES)
+        shared = client._async_client()
+        async for _ in client.chat_stream_async("refine", MESSAGES):
+            pass
+        assert client._async_client() is shared
+        await client.aclose()
+        return shared
+
+    shared = asyncio.run(main())
+    assert shared._client.is_closed
+    assert client.metrics()["models"]["refine"]["calls"] == 2
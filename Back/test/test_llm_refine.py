@@ -0,0 +1,134 @@
+import os
+import sys
+import random
+import asyncio
+import functools
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db.async_database import shutdown_db_executor
+from src.llm import llm_processor
+from src.llm.line_dictionary import LineDictionary
+from src.llm.llm_processor import chunk_lines_by_tokens, estimate_tokens
+
+LINES = [f"{name} {i} 1 3,500" for i, name in enumerate(
+    ["두부", "양파", "대파", "우유", "계란", "삼겹살", "상추", "사과", "당근", "버섯", "김치"])]
+
+
+# ------------------------------------------------------------------
+# 2. 토큰 예산 청크 분할
+# ------------------------------------------------------------------
+def test_estimate_tokens_counts_hangul_per_char():
+    assert estimate_tokens("두부") == 2 + 4
+    assert estimate_tokens("abcd") == 1 + 4
+    assert estimate_tokens("") == 4
+
+
+def test_chunk_boundary_at_exact_budget():
+    lines = ["두부", "양파", "대파"]   # 한 줄 6토큰
+    assert chunk_lines_by_tokens(lines, token_budget=12, max_lines=10) == [["두부", "양파"], ["대파"]]
+    assert chunk_lines_by_tokens(lines, token_budget=11, max_lines=10) == [["두부"], ["양파"], ["대파"]]
+    assert chunk_lines_by_tokens(lines, token_budget=18, max_lines=10) == [lines]
+
+
+def test_chunk_max_lines_and_oversized_line():
+    assert chunk_lines_by_tokens(LINES, token_budget=10_000, max_lines=4) == [LINES[:4], LINES[4:8], LINES[8:]]
+
+    long_line = "가" * 50
+    chunks = chunk_lines_by_tokens(["두부", long_line, "양파"], token_budget=20, max_lines=10)
+    assert chunks == [["두부"], [long_line], ["양파"]]   # 예산을 넘는 줄도 버리지 않고 단독 청크
+    assert chunk_lines_by_tokens([], token_budget=20) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_chunks_preserve_order_and_respect_budget(seed):
+    rng = random.Random(seed)
+    lines = ["가" * rng.randint(1, 30) for _ in range(60)]
+    chunks = chunk_lines_by_tokens(lines, token_budget=80, max_lines=7)
+
+    assert [line for chunk in chunks for line in chunk] == lines
+    for chunk in chunks:
+        assert len(chunk) <= 7
+        assert len(chunk) == 1 or sum(estimate_tokens(line) for line in chunk) <= 80
+
+
+# ------------------------------------------------------------------
+# 3. 줄 사전 + 청크 계획
+# ------------------------------------------------------------------
+@pytest.fixture
+def dictionary(monkeypatch):
+    dictionary = LineDictionary(persistent=False)
+    monkeypatch.setattr(llm_processor, "line_dictionary", dictionary)
+    # 청크를 작게 나눠 여러 청크가 동시에 처리되도록
+    monkeypatch.setattr(llm_processor, "chunk_lines_by_tokens",
+                        functools.partial(chunk_lines_by_tokens, token_budget=10_000, max_lines=3))
+    yield dictionary
+    shutdown_db_executor()
+
+
+def test_plan_chunks_map_to_pending_line_positions(dictionary):
+    tofu = {"product_name": "두부", "quantity": 1.0, "unit": "개", "category": "기타", "category_tag": "기타"}
+    dictionary.learn([(LINES[0], [tofu]), (LINES[4], [])])
+
+    resolved, chunks = llm_processor._plan_refine_chunks(LINES)
+    assert resolved == {0: [tofu], 4: []}
+    assert chunks == [[1, 2, 3], [5, 6, 7], [8, 9, 10]]
+
+
+# ------------------------------------------------------------------
+# 4. 청크가 뒤섞인 순서로 끝나도 결과는 줄 순서
+# ------------------------------------------------------------------
+def fake_item(text: str, line: int) -> dict:
+    return {"line": line, "product_name": text.split()[0], "quantity": 1.0, "unit": "개",
+            "category": "기타", "category_tag": "기타"}
+
+
+def test_async_results_follow_line_order_when_chunks_finish_out_of_order(dictionary, monkeypatch):
+    finished = []
+
+    async def fake_refine(chunk):
+        # 앞 청크일수록 늦게 끝남
+        position = LINES.index(chunk[0])
+        await asyncio.sleep(0.01 * (len(LINES) - position))
+        finished.append(position)
+        return [fake_item(text, i + 1) for i, text in enumerate(chunk)]
+
+    monkeypatch.setattr(llm_processor, "refine_batch_items_async", fake_refine)
+    progress = []
+    items = asyncio.run(llm_processor.refine_ingredients_with_llm_async(
+        LINES, progress_callback=lambda done, total, partial: progress.append((done, total, list(partial))),
+        parallel=4))
+
+    assert finished == sorted(finished, reverse=True)   # 실제로 뒤 청크부터 끝남
+    assert [item["product_name"] for item in items] == [line.split()[0] for line in LINES]
+
+    # 부분 결과는 항상 앞에서부터 끊김 없는 줄까지만 (뒤 청크가 먼저 끝나면 비어 있음)
+    assert progress[0] == (0, 4, [])
+    assert [done for done, _, _ in progress] == [0, 1, 2, 3, 4]
+    for _, _, partial in progress:
+        assert partial == items[:len(partial)]
+    assert progress[-2][2] == []
+    assert progress[-1][2] == items
+
+
+def test_async_respects_parallel_limit(dictionary, monkeypatch):
+    running, peak = 0, 0
+
+    async def fake_refine(chunk):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return [fake_item(text, i + 1) for i, text in enumerate(chunk)]
+
+    monkeypatch.setattr(llm_processor, "refine_batch_items_async", fake_refine)
+    items = asyncio.run(llm_processor.refine_ingredients_with_llm_async(LINES, parallel=2))
+    assert peak == 2
+    assert len(items) == len(LINES)
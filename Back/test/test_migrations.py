@@ -0,0 +1,132 @@
+import os
+import sys
+import sqlite3
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import migrations
+from src.db.database import create_connection
+from src.db.migrations import (
+    CATEGORIES_SCHEMA, COOKED_DISHES_SCHEMA, EXPIRATION_MAPPING_SCHEMA, INGREDIENTS_SCHEMA,
+    INITIAL_CATEGORIES, INITIAL_EXPIRATION_MAPPING, INITIAL_LOCATIONS, LATEST_VERSION,
+    STORAGE_LOCATIONS_SCHEMA, get_schema_version, migrate )
+
+
+def counts(conn: sqlite3.Connection) -> dict:
+    return {
+        table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ("Categories", "Storage_Locations", "Expiration_Mapping", "Ingredients")
+    }
+
+def index_names(conn: sqlite3.Connection) -> set:
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+# 마이그레이션 도입 전 initialize_database() 가 만들던 DB: 테이블 + 기준 데이터, user_version = 0
+def make_baseline_db(path: str) -> None:
+    conn = sqlite3.connect(path)
+    for schema in (CATEGORIES_SCHEMA, STORAGE_LOCATIONS_SCHEMA, INGREDIENTS_SCHEMA,
+                   EXPIRATION_MAPPING_SCHEMA, COOKED_DISHES_SCHEMA):
+        conn.execute(schema)
+    conn.executemany("INSERT INTO Categories (name) VALUES (?)", [(name,) for name in INITIAL_CATEGORIES])
+    conn.executemany("INSERT INTO Storage_Locations (name) VALUES (?)", [(name,) for name in INITIAL_LOCATIONS])
+    conn.execute("""
+        INSERT INTO Expiration_Mapping (category_id, storage_location_id, default_days)
+        SELECT C.id, S.id, 7 FROM Categories C, Storage_Locations S WHERE C.name = '유제품' AND S.name = '냉장'
+    """)
+    conn.execute("""
+        INSERT INTO Ingredients (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date)
+        VALUES ('두부', 1, '모', 8, 1, '2030-01-01', '2024-01-01')
+    """)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = create_connection(str(tmp_path / "migrate.db"))
+    yield conn
+    conn.close()
+
+
+# ------------------------------------------------------------------
+# 2. 새 DB / 기존 DB 업그레이드 / 재실행
+# ------------------------------------------------------------------
+def test_fresh_database_gets_latest_schema_and_seed_data(conn):
+    assert get_schema_version(conn) == 0
+    assert migrate(conn) == LATEST_VERSION == get_schema_version(conn)
+    assert counts(conn) == {
+        "Categories": len(INITIAL_CATEGORIES),
+        "Storage_Locations": len(INITIAL_LOCATIONS),
+        "Expiration_Mapping": len(INITIAL_EXPIRATION_MAPPING),
+        "Ingredients": 0,
+    }
+    assert {"idx_ingredients_status_expiry", "idx_ingredients_status_id"} <= index_names(conn)
+    assert not conn.in_transaction
+
+
+def test_upgrades_baseline_database_without_losing_data(tmp_path):
+    path = str(tmp_path / "baseline.db")
+    make_baseline_db(path)
+
+    conn = create_connection(path)
+    assert migrate(conn) == LATEST_VERSION
+    assert counts(conn) == {
+        "Categories": len(INITIAL_CATEGORIES),       # 이미 있던 기준 데이터는 중복 입력되지 않음
+        "Storage_Locations": len(INITIAL_LOCATIONS),
+        "Expiration_Mapping": len(INITIAL_EXPIRATION_MAPPING),
+        "Ingredients": 1,
+    }
+    assert conn.execute("SELECT name FROM Ingredients").fetchone()[0] == "두부"
+    # 기존 매핑 값은 덮어쓰지 않음
+    assert conn.execute("""
+        SELECT default_days FROM Expiration_Mapping M
+        JOIN Categories C ON M.category_id = C.id JOIN Storage_Locations S ON M.storage_location_id = S.id
+        WHERE C.name = '유제품' AND S.name = '냉장'
+    """).fetchone()[0] == 7
+    assert "idx_ingredients_status_expiry" in index_names(conn)
+
+    # 기존 행도 마이그레이션에서 바로 색인
+    assert tuple(conn.execute("SELECT name_key, initials FROM Ingredients_FTS").fetchone()) == ("두부", "ㄷㅂ")
+    conn.close()
+
+
+def test_running_twice_is_a_no_op(conn, capsys):
+    migrate(conn)
+    before = (counts(conn), index_names(conn))
+    capsys.readouterr()
+
+    assert migrate(conn) == LATEST_VERSION
+    assert (counts(conn), index_names(conn)) == before
+    assert "DB 마이그레이션" not in capsys.readouterr().out
+
+
+def test_applies_only_pending_migrations(conn, monkeypatch):
+    migrate(conn)
+    applied = []
+    extra = (LATEST_VERSION + 1, "테스트용", lambda cursor: applied.append(cursor.execute("SELECT 1").fetchone()))
+    monkeypatch.setattr(migrations, "MIGRATIONS", [*migrations.MIGRATIONS, extra])
+    monkeypatch.setattr(migrations, "LATEST_VERSION", LATEST_VERSION + 1)
+
+    assert migrate(conn) == LATEST_VERSION + 1
+    assert len(applied) == 1
+
+
+def test_failed_migration_rolls_back_everything(conn, monkeypatch):
+    def broken(cursor):
+        cursor.execute("CREATE TABLE Half_Done (id INTEGER)")
+        raise sqlite3.OperationalError("마이그레이션 실패")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", [*migrations.MIGRATIONS, (LATEST_VERSION + 1, "실패", broken)])
+    monkeypatch.setattr(migrations, "LATEST_VERSION", LATEST_VERSION + 1)
+
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(conn)
+    assert get_schema_version(conn) == 0
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name IN ('Categories', 'Half_Done')").fetchone()[0] == 0
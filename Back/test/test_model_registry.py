@@ -0,0 +1,112 @@
+import os
+import sys
+import time
+import threading
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.model_registry import ModelRegistry
+
+
+# 호출 횟수를 세는 느린 로더
+class CountingLoader:
+    def __init__(self, delay=0.05, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("load failed")
+        return object()
+
+
+def test_register_does_not_load():
+    loader = CountingLoader()
+    registry = ModelRegistry()
+    registry.register("ocr", loader)
+    assert loader.calls == 0
+    assert registry.status()["ocr"]["state"] == "unloaded"
+
+
+def test_concurrent_get_loads_once():
+    loader = CountingLoader(delay=0.2)
+    registry = ModelRegistry()
+    registry.register("ocr", loader)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("ocr"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert len({id(model) for model in results}) == 1
+    assert registry.status()["ocr"]["state"] == "ready"
+
+
+def test_failed_load_is_reported_and_retried():
+    loader = CountingLoader(fail=True)
+    registry = ModelRegistry()
+    registry.register("ocr", loader)
+    with pytest.raises(RuntimeError):
+        registry.get("ocr")
+    assert registry.status()["ocr"]["state"] == "failed"
+
+    loader.fail = False
+    registry.get("ocr")
+    assert registry.status()["ocr"]["state"] == "ready"
+    assert loader.calls == 2
+
+
+def test_background_warm_up_and_state_callback():
+    changes = []
+    registry = ModelRegistry(on_change=lambda name, state: changes.append((name, state)))
+    registry.register("ocr", CountingLoader(delay=0.1))
+
+    thread = registry.warm_up(background=True)
+    assert registry.status()["ocr"]["state"] in ("unloaded", "loading")
+    thread.join()
+    assert registry.status()["ocr"]["state"] == "ready"
+    assert changes == [("ocr", "ready")]
+
+
+def test_unload_idle_skips_models_in_use():
+    loader = CountingLoader(delay=0)
+    registry = ModelRegistry(idle_seconds=0.05)
+    registry.register("ocr", loader)
+
+    with registry.use("ocr"):
+        time.sleep(0.1)
+        assert registry.unload_idle() == []
+
+    time.sleep(0.1)
+    assert registry.unload_idle() == ["ocr"]
+    assert registry.status()["ocr"]["state"] == "unloaded"
+
+    # 해제 후 다시 쓰면 다시 로드
+    registry.get("ocr")
+    assert loader.calls == 2
+
+
+def test_idle_reaper_thread():
+    registry = ModelRegistry(idle_seconds=0.05)
+    registry.register("ocr", CountingLoader(delay=0))
+    registry.get("ocr")
+    registry.start_idle_reaper(interval=0.02)
+    try:
+        deadline = time.monotonic() + 2
+        while registry.status()["ocr"]["state"] != "unloaded" and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert registry.status()["ocr"]["state"] == "unloaded"
+    finally:
+        registry.stop_idle_reaper()
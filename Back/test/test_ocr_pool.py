@@ -0,0 +1,142 @@
+import io
+import os
+import sys
+import time
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr import ocr_router
+from src.cache.result_cache import ResultCache, make_cache_key
+from src.ocr.ocr_worker_pool import OCRPoolBusyError, OCRWorkerPool
+
+
+# ------------------------------------------------------------------
+# 2. 워커 프로세스에서 실행할 함수 (spawn 이므로 모듈 최상위에 정의)
+# ------------------------------------------------------------------
+class FakeProcessor:
+    def process(self, image_path: str) -> dict:
+        return {"status": "success", "pid": os.getpid(), "lines": []}
+
+    def process_bytes(self, data) -> dict:
+        return self.process("")
+
+
+class BrokenModelProcessor(FakeProcessor):
+    def warm_up(self) -> None:
+        raise RuntimeError("모델 파일 없음")
+
+
+def slow_task(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def crash_task() -> None:
+    os._exit(1)   # 워커 비정상 종료 (크래시 / OOM kill 과 같은 상황)
+
+
+@pytest.fixture
+def pool():
+    pool = OCRWorkerPool(workers=1, queue_size=1, processor_factory=FakeProcessor, retry_after=7)
+    yield pool
+    pool.shutdown()
+
+
+# ------------------------------------------------------------------
+# 3. 대기열 한도 초과 시 즉시 거절
+# ------------------------------------------------------------------
+def test_rejects_requests_beyond_capacity(pool):
+    async def main():
+        first = asyncio.create_task(pool.submit(slow_task, 0.5))
+        second = asyncio.create_task(pool.submit(slow_task, 0))
+        await asyncio.sleep(0)   # 두 작업이 먼저 자리를 차지하도록
+        with pytest.raises(OCRPoolBusyError) as excinfo:
+            await pool.submit(slow_task, 0)
+        assert excinfo.value.retry_after == 7
+        return await asyncio.gather(first, second)
+
+    assert len(asyncio.run(main())) == 2
+    metrics = pool.metrics()
+    assert (metrics["completed"], metrics["rejected"], metrics["in_flight"]) == (2, 1, 0)
+
+
+def test_router_returns_503_with_retry_after(pool, monkeypatch):
+    monkeypatch.setattr(ocr_router, "ocr_pool", pool)
+    app = FastAPI()
+    app.include_router(ocr_router.router, prefix="/ocr")
+    client = TestClient(app)
+
+    pool._in_flight = pool.capacity   # 실행 중 + 대기 중 작업이 한도에 도달한 상태
+    response = client.post("/ocr/receipt", files={"file": ("r.jpg", b"\xff\xd8fake", "image/jpeg")})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    assert pool.metrics()["rejected"] == 1   # 캐시를 찾은 뒤 워커에 넘길 때 거절
+    pool._in_flight = 0
+
+
+def test_cached_upload_is_served_while_pool_is_full():
+    cache = ResultCache("ocr", max_entries=10, max_bytes=1024, db_path="")
+    pool = OCRWorkerPool(workers=1, queue_size=0, processor_factory=FakeProcessor, retry_after=7, result_cache=cache)
+    image = b"\xff\xd8cached"
+    cache.put(make_cache_key("ocr", image), {"status": "success", "lines": ["두부"]})
+
+    pool._in_flight = pool.capacity
+    try:
+        assert asyncio.run(pool.process_upload(io.BytesIO(image), len(image)))["lines"] == ["두부"]
+        with pytest.raises(OCRPoolBusyError):
+            asyncio.run(pool.process_upload(io.BytesIO(b"\xff\xd8new"), 5))
+    finally:
+        pool._in_flight = 0
+        pool.shutdown()
+    assert pool.metrics()["rejected"] == 1
+
+
+# ------------------------------------------------------------------
+# 4. 워커 비정상 종료: 현재 요청만 실패, 다음 요청은 새 워커에서 처리
+# ------------------------------------------------------------------
+def test_recovers_from_broken_process_pool(pool):
+    async def main():
+        before = await pool.process("receipt.jpg")
+        with pytest.raises(BrokenProcessPool):
+            await pool.submit(crash_task)
+        after = await pool.process("receipt.jpg")
+        return before, after
+
+    before, after = asyncio.run(main())
+    assert after["status"] == "success"
+    assert after["pid"] != before["pid"]
+    metrics = pool.metrics()
+    assert (metrics["restarts"], metrics["failed"], metrics["completed"]) == (1, 1, 2)
+    assert pool.readiness()["started"]
+
+
+# ------------------------------------------------------------------
+# 5. 준비 상태: 예열 실패는 준비되지 않음
+# ------------------------------------------------------------------
+def test_readiness_reports_failed_warm_up():
+    pool = OCRWorkerPool(workers=1, queue_size=0, processor_factory=BrokenModelProcessor)
+    try:
+        assert pool.readiness()["ready"]   # 예열 전: 첫 요청이 모델을 로드
+        asyncio.run(pool.warm_up())
+        readiness = pool.readiness()
+        assert (readiness["ready"], readiness["warm_up"]) == (False, "failed")
+        assert "모델 파일 없음" in readiness["error"]
+    finally:
+        pool.shutdown()
+    assert pool.readiness()["ready"] and pool.readiness()["error"] is None
+
+
+def test_readiness_after_successful_warm_up(pool):
+    asyncio.run(pool.warm_up())
+    readiness = pool.readiness()
+    assert (readiness["ready"], readiness["warm_up"], readiness["error"]) == (True, "ready", None)
@@ -0,0 +1,136 @@
+import os
+import sys
+import random
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import shutdown_db_executor
+from src.db.pagination import decode_cursor, encode_cursor
+from src.ingredients.ingredients_crud import (
+    get_filtered_ingredients, get_history_ingredients, get_history_page, get_ingredients_page )
+from src.ingredients.ingredients_router import router as ingredients_router
+
+
+# ------------------------------------------------------------------
+# 2. 테스트용 DB: 정렬 값이 겹치는 활성 식재료 60개 + 사용/폐기 40개
+# ------------------------------------------------------------------
+def insert(conn, count: int, status: str, rng: random.Random) -> None:
+    conn.executemany("""
+        INSERT INTO Ingredients (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date, status)
+        VALUES (?, ?, '개', 1, 1, ?, '2024-01-01', ?)
+    """, [(f"재료{rng.randint(0, 9)}", float(rng.randint(1, 3)), f"2030-01-0{rng.randint(1, 5)}", status)
+          for _ in range(count)])
+    conn.commit()
+
+
+@pytest.fixture
+def db(tmp_path):
+    pool = database.init_pool(str(tmp_path / "page.db"), size=1)
+    database.initialize_database()
+    rng = random.Random(1)
+    with database.db_connection() as conn:
+        insert(conn, 60, "active", rng)
+        for _ in range(40):
+            insert(conn, 1, rng.choice(("used", "discarded")), rng)
+
+    yield pool
+    shutdown_db_executor()
+    database.close_pool()
+
+
+@pytest.fixture
+def conn(db):
+    conn = db.acquire()
+    yield conn
+    db.release(conn)
+
+
+def walk(fetch, limit: int) -> list:
+    items, cursor = [], None
+    while True:
+        page = fetch(limit=limit, cursor=cursor)
+        assert len(page.items) <= limit
+        items += page.items
+        if page.next_cursor is None:
+            return items
+        cursor = page.next_cursor
+
+
+# ------------------------------------------------------------------
+# 3. 키셋 페이지 조회
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("sort_by", ["expiry_date", "name", "quantity", "registration_date"])
+@pytest.mark.parametrize("sort_order", ["ASC", "DESC"])
+def test_pages_cover_full_list_in_order(conn, sort_by, sort_order):
+    full = get_filtered_ingredients(conn, sort_by=sort_by, sort_order=sort_order)
+    paged = walk(lambda **kw: get_ingredients_page(conn, sort_by=sort_by, sort_order=sort_order, **kw), 7)
+    assert [row["id"] for row in paged] == [row["id"] for row in full]
+    assert len(full) == 60
+
+
+def test_history_pages_merge_statuses_by_recent_id(conn):
+    full = get_history_ingredients(conn)
+    assert [row["id"] for row in full] == sorted((row["id"] for row in full), reverse=True)
+    assert {row["status"] for row in full} == {"used", "discarded"}
+    assert walk(lambda **kw: get_history_page(conn, **kw), 6) == full
+
+
+def test_inserts_between_pages_do_not_duplicate_or_skip(conn):
+    first = get_ingredients_page(conn, limit=20)
+    insert(conn, 10, "active", random.Random(2))
+    cursor, seen = first.next_cursor, [row["id"] for row in first.items]
+    while cursor:
+        page = get_ingredients_page(conn, limit=20, cursor=cursor)
+        seen += [row["id"] for row in page.items]
+        cursor = page.next_cursor
+    assert len(seen) == len(set(seen))
+    assert set(range(1, 61)) <= set(seen)   # 처음에 있던 활성 식재료는 모두 한 번씩
+
+
+# ------------------------------------------------------------------
+# 4. 필드 선택 / 전체 개수 / 잘못된 입력
+# ------------------------------------------------------------------
+def test_fields_projection_and_total(conn):
+    page = get_ingredients_page(conn, limit=5, fields="name,label_color", include_total=True)
+    assert [set(row) for row in page.items] == [{"name", "label_color"}] * 5
+    assert page.total == 60
+    assert decode_cursor(page.next_cursor, "expiry_date:asc", 2)[1] > 0
+
+    history = get_history_page(conn, limit=3, fields="id,status,remaining_days", include_total=True)
+    assert set(history.items[0]) == {"id", "status", "remaining_days"}
+    assert history.total == 40
+
+
+def test_rejects_unknown_fields_and_foreign_cursor(conn):
+    with pytest.raises(ValueError):
+        get_ingredients_page(conn, fields="name,password")
+    with pytest.raises(ValueError):
+        get_ingredients_page(conn, cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        get_ingredients_page(conn, sort_by="name", cursor=encode_cursor("expiry_date:asc", ["2030-01-01", 1]))
+
+
+def test_router_returns_page_headers(db):
+    app = FastAPI()
+    app.include_router(ingredients_router, prefix="/ingredients")
+    client = TestClient(app)
+
+    response = client.get("/ingredients/history", params={"limit": 30, "fields": "id", "include_total": True})
+    assert response.status_code == 200
+    assert len(response.json()) == 30 and response.headers["X-Total-Count"] == "40"
+
+    rest = client.get("/ingredients/history", params={"limit": 30, "cursor": response.headers["X-Next-Cursor"]})
+    assert len(rest.json()) == 10 and "X-Next-Cursor" not in rest.headers
+
+    assert len(client.get("/ingredients/list").json()) == 60   # limit 생략: 전체 목록 (기존 동작)
+    assert client.get("/ingredients/list", params={"fields": "secret"}).status_code == 400
+    assert client.get("/ingredients/list", params={"cursor": "@@"}).status_code == 400
@@ -0,0 +1,74 @@
+import os
+import sys
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from conftest import item
+from src.llm.llm_processor import estimate_text_tokens
+from src.recipes.prompt_builder import build_pantry_prompt, merge_pantry_items, rank_pantry_items
+
+
+# ------------------------------------------------------------------
+# 2. 같은 재료 합치기 / 임박도 정렬
+# ------------------------------------------------------------------
+def test_merge_sums_same_unit_and_keeps_earliest_expiry():
+    merged = merge_pantry_items([
+        item("두부", 1, "모", 10, "두부"),
+        item(" 두 부", 2, "모", 2, "두부"),
+        item("두부", 300, "g", 5),
+        item("우유", 1, "개", -1, "유제품"),     # 이미 지남 → 제외
+        "양파 (2개)",
+    ])
+    tofu = next(entry for entry in merged if entry["name"] == "두부")
+    assert tofu["quantities"] == {"모": 3.0, "g": 300.0}
+    assert (tofu["remaining_days"], tofu["urgency"]) == (2, "orange")
+    assert sorted(entry["name"] for entry in merged) == ["두부", "양파"]
+
+
+def test_rank_puts_urgent_main_ingredients_first():
+    ranked = rank_pantry_items(merge_pantry_items([
+        item("간장", 1, "병", 2, "조미료"),
+        item("삼겹살", 500, "g", 3, "육류"),
+        item("양파", 2, "개", 6, "채소"),
+        item("당근", 1, "개", 20, "채소"),
+        item("김치", 1, "kg"),
+        item("계란", 10, "개", 1, "달걀"),
+    ]))
+    assert [entry["name"] for entry in ranked] == ["계란", "삼겹살", "간장", "양파", "당근", "김치"]
+
+
+# ------------------------------------------------------------------
+# 3. 토큰 예산 / 임박도 안내
+# ------------------------------------------------------------------
+def test_prompt_has_urgency_sections_and_hint():
+    prompt = build_pantry_prompt([item("두부", 1, "모", 0, "두부"), item("당근", 1, "개", 20, "채소")])
+    assert "[유통기한 3일 이내 - 우선 사용] 두부 (1모, 오늘까지)" in prompt.text
+    assert "[여유 있음] 당근 (1개, 20일 남음)" in prompt.text
+    assert "반드시 메인 재료로" in prompt.text
+    assert prompt.omitted == 0
+
+
+def test_prompt_without_expiry_keeps_plain_list():
+    prompt = build_pantry_prompt(["두부 (1모)", "양파 (2개)"])
+    assert "두부 (1모), 양파 (2개)" in prompt.text
+    assert "[유통기한" not in prompt.text
+
+
+def test_budget_keeps_most_urgent_items():
+    pantry = [item(f"재료{i}", 1, "개", i % 30, "채소") for i in range(1000)]
+    prompt = build_pantry_prompt(pantry, token_budget=300)
+
+    assert prompt.tokens <= 300
+    assert prompt.tokens == estimate_text_tokens(prompt.text)
+    assert 0 < len(prompt.selected) < 1000
+    assert prompt.omitted == 1000 - len(prompt.selected)
+    assert f"그 밖의 보유 재료 {prompt.omitted}개는 생략" in prompt.text
+    # 고른 재료는 남은 일수가 가장 적은 것들
+    kept = max(entry["remaining_days"] for entry in prompt.selected)
+    dropped = [i % 30 for i in range(1000) if f"재료{i} " not in prompt.text]
+    assert kept <= min(dropped)
@@ -0,0 +1,116 @@
+import os
+import sys
+import sqlite3
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.pagination import encode_cursor
+from src.ingredients.ingredients_crud import (
+    get_filtered_ingredients, get_history_ingredients, get_history_page, get_ingredients_page )
+from src.ingredients.notifier import get_alert_ingredients
+from src.recipes.llm_recipe_service import get_user_pantry_items
+
+# ------------------------------------------------------------------
+# 2. 테스트용 DB 준비
+# - 풀 크기를 1로 두고 하나뿐인 커넥션에 trace 콜백을 걸어
+#   각 함수가 실제로 실행한 SQL을 수집합니다.
+# ------------------------------------------------------------------
+@pytest.fixture
+def traced_conn(tmp_path):
+    pool = database.init_pool(str(tmp_path / "plan.db"), size=1)
+    database.initialize_database()
+
+    conn = pool.acquire()
+    executed = []
+    conn.set_trace_callback(executed.append)
+    pool.release(conn)
+
+    yield conn, executed
+
+    conn.set_trace_callback(None)
+    database.close_pool()
+
+
+# Ingredients 테이블을 SCAN 하는 계획 단계가 있으면 반환
+# (Ingredients_FTS 의 MATCH 조회는 계획에 "SCAN ... VIRTUAL TABLE INDEX" 로 표시되지만 전문 검색 색인 조회이므로 제외)
+def ingredients_scans(conn: sqlite3.Connection, sql: str) -> list:
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    return [
+        row[3] for row in plan
+        if row[3].startswith("SCAN") and "VIRTUAL TABLE" not in row[3]
+        and ("Ingredients" in row[3] or row[3].split()[1] == "I")
+    ]
+
+
+def assert_no_scan(conn: sqlite3.Connection, executed: list):
+    queries = [sql for sql in executed if sql.lstrip().upper().startswith("SELECT")]
+    assert queries, "실행된 SELECT 문이 없습니다."
+
+    executed.clear()  # EXPLAIN 자체는 수집하지 않음
+    for sql in queries:
+        scans = ingredients_scans(conn, sql)
+        assert not scans, f"Ingredients 전체 스캔 발생: {scans}\n{sql}"
+
+
+# ------------------------------------------------------------------
+# 3. 쿼리 계획 회귀 테스트
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"storage_name": "냉장"},
+    {"category_name": "두부"},
+    {"search_term": "두부"},
+    {"search_term": "ㄷㅂ", "sort_by": "relevance"},
+    {"storage_name": "냉동", "category_name": "육류", "search_term": "고기"},
+    {"sort_by": "name", "sort_order": "DESC"},
+    {"sort_by": "quantity"},
+    {"sort_by": "registration_date", "sort_order": "DESC"},
+])
+def test_filtered_ingredients_uses_index(traced_conn, kwargs):
+    conn, executed = traced_conn
+    get_filtered_ingredients(conn, **kwargs)
+    assert_no_scan(conn, executed)
+
+
+def test_alert_ingredients_uses_index(traced_conn):
+    conn, executed = traced_conn
+    get_alert_ingredients(conn, 7)
+    assert_no_scan(conn, executed)
+
+
+def test_history_ingredients_uses_index(traced_conn):
+    conn, executed = traced_conn
+    get_history_ingredients(conn)
+    assert_no_scan(conn, executed)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"limit": 50},
+    {"limit": 50, "cursor": encode_cursor("expiry_date:asc", ["2030-01-01", 10]), "include_total": True},
+    {"limit": 50, "sort_by": "name", "sort_order": "DESC", "cursor": encode_cursor("name:desc", ["두부", 10])},
+    {"limit": 50, "search_term": "두부", "sort_by": "relevance", "cursor": encode_cursor("relevance:asc", [1, 10]),
+     "include_total": True},
+])
+def test_ingredients_page_uses_index(traced_conn, kwargs):
+    conn, executed = traced_conn
+    get_ingredients_page(conn, **kwargs)
+    assert_no_scan(conn, executed)
+
+
+def test_history_page_uses_index(traced_conn):
+    conn, executed = traced_conn
+    get_history_page(conn, limit=50, cursor=encode_cursor("id:desc", [1000]), include_total=True)
+    assert_no_scan(conn, executed)
+
+
+def test_user_pantry_items_uses_index(traced_conn):
+    conn, executed = traced_conn
+    get_user_pantry_items()
+    assert_no_scan(conn, executed)
@@ -0,0 +1,65 @@
+import os
+import sys
+import cv2
+import numpy as np
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.receipt_detector import crop_receipt, detect_receipt_corners, order_points
+
+IMAGE_DIR = os.path.join(current_dir, "image")
+
+
+# 어두운 배경 위에 기울어진 흰 영수증(글자 줄 포함)을 그린 합성 사진
+def synthetic_photo(width=1500, height=2000, angle=8.0):
+    receipt = np.full((1400, 600, 3), 245, np.uint8)
+    for row in range(40, 1360, 40):
+        cv2.putText(receipt, "ITEM 1 3,500", (30, row), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (20, 20, 20), 2)
+
+    photo = np.full((height, width, 3), 60, np.uint8)
+    top, left = (height - 1400) // 2, (width - 600) // 2
+    photo[top:top + 1400, left:left + 600] = receipt
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+    return cv2.warpAffine(photo, matrix, (width, height), borderValue=(60, 60, 60))
+
+
+def test_order_points():
+    pts = np.array([[10, 90], [90, 90], [10, 10], [90, 10]], dtype="float32")
+    assert order_points(pts).tolist() == [[10, 10], [90, 10], [90, 90], [10, 90]]
+
+
+def test_crop_detects_tilted_receipt():
+    photo = synthetic_photo()
+    corners = detect_receipt_corners(photo)
+    assert corners is not None
+    assert corners[:, 0].max() <= photo.shape[1] and corners[:, 1].max() <= photo.shape[0]
+
+    cropped, info = crop_receipt(photo)
+    assert info["cropped"] is True
+    # 원본 해상도에서 펼쳤으므로 영수증 크기와 비슷해야 함
+    assert abs(cropped.shape[0] - 1400) < 120 and abs(cropped.shape[1] - 600) < 120
+    assert cropped.shape[0] * cropped.shape[1] < 0.4 * photo.shape[0] * photo.shape[1]
+
+
+def test_crop_falls_back_to_whole_image():
+    blank = np.full((800, 600, 3), 128, np.uint8)
+    result, info = crop_receipt(blank)
+    assert result is blank and info["cropped"] is False
+
+    # 작은 얼룩은 영수증으로 보지 않음
+    speck = blank.copy()
+    cv2.rectangle(speck, (300, 300), (330, 330), (255, 255, 255), -1)
+    result, info = crop_receipt(speck)
+    assert result is speck and info["reason"] == "too small"
+
+
+def test_sample_images_are_never_enlarged():
+    for name in ("02.jpg", "04.jpg", "05.jpg"):
+        image = cv2.imread(os.path.join(IMAGE_DIR, name))
+        cropped, _ = crop_receipt(image)
+        assert cropped.shape[0] * cropped.shape[1] <= image.shape[0] * image.shape[1]
@@ -0,0 +1,118 @@
+import os
+import sys
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from conftest import recipe
+from src.db import database
+from src.ingredients.ingredients_crud import register_ingredient_to_db, update_ingredient_status
+from src.recipes import llm_recipe_service
+from src.recipes.recipe_cache import RecipeRecommendationCache, pantry_fingerprint, recipe_cache
+
+PANTRY = ["두부 (1모)", "양파 (2개)", "돼지고기 (500g)"]
+
+
+# ------------------------------------------------------------------
+# 2. 보유 식재료 지문
+# ------------------------------------------------------------------
+def test_fingerprint_ignores_order_spacing_and_small_quantity_changes():
+    base = pantry_fingerprint(PANTRY)
+    assert pantry_fingerprint(list(reversed(PANTRY))) == base
+    assert pantry_fingerprint(["두 부 (1 모)", " 양파 (2개) ", "돼지고기 (600G)"]) == base
+    assert pantry_fingerprint(["두부 (1.0모)", "양파 (2.0개)", "돼지고기 (500.0g)", "두부 (1모)"]) == base
+
+
+def test_fingerprint_separates_different_pantries():
+    base = pantry_fingerprint(PANTRY)
+    assert pantry_fingerprint(["두부 (1모)", "양파 (4개)", "돼지고기 (500g)"]) != base
+    assert pantry_fingerprint(["두부 (1모)", "양파 (2개)"]) != base
+    assert pantry_fingerprint(["두부 (1모)", "양파 (2개)", "소고기 (500g)"]) != base
+
+
+# ------------------------------------------------------------------
+# 3. 레시피 풀 / 무효화 / 미리 생성
+# ------------------------------------------------------------------
+def test_pool_rotates_and_keeps_latest_recipes():
+    cache = RecipeRecommendationCache(pool_size=2)
+    key = pantry_fingerprint(PANTRY)
+    assert cache.get(key, PANTRY) is None
+
+    for name in ("두부조림", "마파두부", "두부전골"):
+        cache.put(key, PANTRY, recipe(name), generate_seconds=5.0)
+
+    names = [cache.get(key)["recipe_name"] for _ in range(4)]
+    assert names == ["마파두부", "두부전골", "마파두부", "두부전골"]
+
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["recipes"]) == (4, 1, 2)
+    assert metrics["hit_rate"] == 0.8
+    assert metrics["saved_seconds"] == 20.0
+
+
+def test_returned_recipe_is_a_copy():
+    cache = RecipeRecommendationCache()
+    key = pantry_fingerprint(PANTRY)
+    cache.put(key, PANTRY, recipe("두부조림"))
+    cache.get(key)["steps"].append("망가뜨림")
+    assert cache.get(key)["steps"] == ["썬다", "굽는다"]
+
+
+def test_status_change_drops_pools_with_that_ingredient():
+    cache = RecipeRecommendationCache()
+    tofu, other = pantry_fingerprint(PANTRY), pantry_fingerprint(["계란 (10개)"])
+    cache.put(tofu, PANTRY, recipe("두부조림"))
+    cache.put(other, ["계란 (10개)"], recipe("계란말이"))
+    cache.set_pantry(PANTRY)
+
+    assert cache.invalidate_ingredients(["두부"]) == 1
+    assert cache.get(tofu) is None
+    assert cache.get(other)["recipe_name"] == "계란말이"
+    assert cache.get_pantry() is None
+
+
+def test_pregenerate_fills_recent_pool_and_avoids_existing_recipes():
+    cache = RecipeRecommendationCache(pool_size=2)
+    key = pantry_fingerprint(PANTRY)
+    cache.put(key, PANTRY, recipe("두부조림"))
+
+    calls = []
+    def generate(ingredients_list, existing):
+        calls.append((ingredients_list, existing))
+        return recipe(f"새 요리 {len(calls)}")
+
+    assert cache.pregenerate_once(generate)
+    assert not cache.pregenerate_once(generate)   # 풀이 가득 참
+    assert calls == [(PANTRY, ["두부조림"])]
+    assert {cache.get(key)["recipe_name"] for _ in range(2)} == {"두부조림", "새 요리 1"}
+    assert cache.metrics()["pregenerated"] == 1
+
+
+# ------------------------------------------------------------------
+# 4. 서비스 연동: 같은 냉장고면 LLM 한 번 / 상태 변경 시 무효화 (service: conftest.py)
+# ------------------------------------------------------------------
+def test_service_reuses_recipe_until_ingredient_status_changes(service):
+    with database.db_connection() as conn:
+        ingredient_id = register_ingredient_to_db(conn, "두부", 1, 1, 1, "모", "2999-12-31")["id"]
+        register_ingredient_to_db(conn, "양파", 1, 1, 2, "개", "2999-12-31")
+
+    app_items = [
+        {"name": "양파", "quantity": 2, "unit": "개", "expiry_date": "2999-12-31"},
+        {"name": "두부", "quantity": "1", "unit": "모", "expiry_date": "2999-12-31"},
+    ]
+    first = llm_recipe_service.get_final_recipe_recommendation()
+    again = llm_recipe_service.get_final_recipe_recommendation(app_items)
+    assert first == again
+    assert len(service) == 1
+
+    with database.db_connection() as conn:
+        assert update_ingredient_status(conn, ingredient_id, "used")["success"]
+
+    # 두부를 다 쓴 뒤: 목록이 바뀌어 새로 생성, 예전 두부 레시피도 삭제됨
+    assert llm_recipe_service.get_final_recipe_recommendation()["recipe_name"] == "요리 2"
+    assert recipe_cache.get(pantry_fingerprint(app_items)) is None
+    assert len(service) == 2
@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from conftest import item, recipe
+from src.db import database
+from src.recipes import llm_recipe_service
+from src.recipes.recipe_cache import pantry_fingerprint, recipe_cache
+from src.recipes.recipe_corpus import RecipeCorpus, ingredient_keys, recipe_corpus
+
+
+# ------------------------------------------------------------------
+# 2. 색인 키 / 점수
+# ------------------------------------------------------------------
+def test_ingredient_keys_use_head_noun_and_aliases():
+    assert ingredient_keys("소고기 안심") == {"소고기안심", "안심"}
+    assert ingredient_keys("다진 소고기") == {"다진소고기", "소고기"}
+    assert ingredient_keys("국내산 유기농 달걀") == {"국내산유기농달걀", "계란"}
+    assert ingredient_keys("달걀") == {"계란"}
+
+
+def test_modifiers_alone_do_not_match():
+    corpus = RecipeCorpus(persistent=False, threshold=0.0)
+    corpus.learn([recipe("새우볶음밥", ["다진 소고기", "냉동 새우"])])
+    assert corpus.search([item("다진 마늘"), item("냉동 만두")]) == []
+
+    match = corpus.search([item("소고기"), item("새우")])[0]
+    assert (match.used, match.missing) == (["소고기", "새우"], [])
+
+
+def test_best_recipe_uses_urgent_items_and_ignores_staples():
+    corpus = RecipeCorpus(persistent=False, threshold=0.0)
+    corpus.learn([
+        recipe("계란말이", ["계란", "대파"], ["소금", "식용유"]),
+        recipe("두부조림", ["두부", "양파"], ["간장", "고춧가루"]),
+        recipe("소고기무국", ["소고기", "무", "대파"], ["국간장"]),
+    ])
+    pantry = [item("두부", days=1), item("양파", days=2), item("달걀"), item("대파")]
+
+    matches = corpus.search(pantry)
+    assert [match.recipe["recipe_name"] for match in matches] == ["두부조림", "계란말이"]
+    best = matches[0]
+    assert (best.used, best.urgent, best.missing) == (["두부", "양파"], ["두부", "양파"], [])
+    assert matches[1].urgent == [] and matches[1].missing == []
+
+
+def test_too_many_missing_ingredients_is_not_a_candidate():
+    corpus = RecipeCorpus(persistent=False, threshold=0.0, max_missing=1)
+    corpus.learn([recipe("부대찌개", ["햄", "소시지", "김치", "라면사리"])])
+    assert corpus.search([item("햄"), item("김치")]) == []
+    assert len(corpus.search([item("햄"), item("김치"), item("소시지")])) == 1
+
+
+def test_best_match_respects_threshold_and_exclude():
+    corpus = RecipeCorpus(persistent=False, threshold=0.7)
+    corpus.learn([recipe("두부조림", ["두부", "양파"]), recipe("두부구이", ["두부"])])
+    pantry = [item("두부", days=1), item("양파")]
+
+    assert corpus.best_match(pantry).recipe["recipe_name"] == "두부조림"
+    assert corpus.best_match(pantry, exclude=["두부 조림"]).recipe["recipe_name"] == "두부구이"
+    assert corpus.best_match([item("당근")]) is None
+    assert corpus.metrics()["lookups"] == 3 and corpus.metrics()["hits"] == 2
+
+
+def test_learn_skips_duplicates_and_incomplete_recipes():
+    corpus = RecipeCorpus(persistent=False)
+    rows = corpus.learn([
+        recipe("두부조림", ["두부", "양파"]),
+        recipe("두부 조림", ["양파", "두부"]),
+        {"recipe_name": "오류", "steps": []},
+    ])
+    assert len(rows) == 1 and len(corpus) == 1
+
+
+# ------------------------------------------------------------------
+# 3. DB 저장 / 가져오기 / 서비스 연동 (service: conftest.py)
+# ------------------------------------------------------------------
+def test_import_file_persists_and_reloads(service, tmp_path):
+    path = tmp_path / "recipes.jsonl"
+    path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in (
+        recipe("계란말이", ["계란", "대파"]),
+        recipe("감자조림", ["감자"], ["간장"]),
+    )), encoding="utf-8")
+
+    assert recipe_corpus.import_file(str(path)) == 2
+    assert recipe_corpus.import_file(str(path)) == 0
+
+    reloaded = RecipeCorpus()
+    reloaded.reload()
+    assert len(reloaded) == 2
+    assert reloaded.best_match([item("감자")]).recipe["recipe_name"] == "감자조림"
+
+
+def test_service_answers_from_corpus_unless_new_recipe_requested(service):
+    first = llm_recipe_service.get_final_recipe_recommendation([item("두부", days=1), item("양파")])
+    assert first["recipe_name"] == "요리 1"
+
+    # 다른 냉장고(캐시 미스)지만 같은 재료를 쓰는 레시피가 모음에 있음 → LLM 호출 없음
+    local = llm_recipe_service.get_final_recipe_recommendation([item("두부", days=2), item("양파"), item("당근")])
+    assert local["recipe_name"] == "요리 1"
+    assert len(service) == 1
+
+    # 새 레시피 요청: 이미 아는 요리는 피하도록 LLM 에 알림
+    fresh = llm_recipe_service.get_final_recipe_recommendation([item("두부", days=2), item("양파")], force_new=True)
+    assert fresh["recipe_name"] == "요리 2"
+    assert "요리 1" in service[-1]
+
+    with database.db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM Recipe_Corpus").fetchone()[0] == 2
+
+
+def test_service_rotates_through_top_corpus_matches(service):
+    recipe_corpus.learn([recipe(name, ["두부", "양파"]) for name in ("두부조림", "두부전골", "마파두부")])
+    pantry = [item("두부", days=1), item("양파")]
+
+    names = [llm_recipe_service.get_final_recipe_recommendation(pantry)["recipe_name"] for _ in range(4)]
+    assert names == ["두부전골", "두부조림", "마파두부", "두부전골"]
+    assert service == []
+    assert recipe_cache.get(pantry_fingerprint(pantry)) is not None   # 모음 적중도 캐시 풀에 들어감
@@ -0,0 +1,106 @@
+import os
+import sys
+import asyncio
+import threading
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.async_database import shutdown_db_executor
+from src.db.reference_cache import ReferenceDataCache, resolve_category_tag
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = database.init_pool(str(tmp_path / "reference.db"), size=2)
+    database.initialize_database()
+    yield pool
+    shutdown_db_executor()
+    database.close_pool()
+
+
+# 적재(reload) 횟수와 실행 스레드를 기록하는 캐시
+@pytest.fixture
+def cache(pool, monkeypatch):
+    cache = ReferenceDataCache()
+    cache.reload_threads = []
+    original = cache.reload
+
+    def counted_reload():
+        cache.reload_threads.append(threading.current_thread().name)
+        original()
+
+    monkeypatch.setattr(cache, "reload", counted_reload)
+    return cache
+
+
+# ------------------------------------------------------------------
+# 2. 조회
+# ------------------------------------------------------------------
+def test_lookups_are_served_from_memory_after_first_load(cache):
+    with database.db_connection() as conn:
+        expected = conn.execute("SELECT id FROM Categories WHERE name = '두부'").fetchone()[0]
+        fridge = conn.execute("SELECT id FROM Storage_Locations WHERE name = '냉장'").fetchone()[0]
+
+    assert cache.get_id("Categories", "두부") == expected
+    assert cache.get_default_days(expected, fridge) == 3
+    assert "냉동" in cache.names("Storage_Locations")
+    assert cache.get_default_days(expected, 9999) is None
+    assert len(cache.reload_threads) == 1
+
+
+def test_unknown_names_fail_without_reloading(cache):
+    cache.get_id("Categories", "두부")
+    for index in range(200):   # 잘못된 태그 200개짜리 일괄 등록
+        with pytest.raises(ValueError):
+            cache.get_id("Categories", f"없는태그{index}")
+    assert len(cache.reload_threads) == 1
+
+    with pytest.raises(ValueError):
+        cache.get_id("Ingredients", "두부")   # 캐시 대상이 아닌 테이블
+
+
+def test_writes_invalidate_and_next_lookup_reloads_once(cache):
+    with database.db_connection() as conn:
+        new_id = cache.add_name(conn, "Categories", "밀키트")
+        assert cache.get_id("Categories", "밀키트") == new_id
+
+        location_id = cache.get_id("Storage_Locations", "냉장")
+        cache.set_default_days(conn, new_id, location_id, 2)
+    assert cache.get_default_days(new_id, location_id) == 2
+    assert len(cache.reload_threads) == 2   # 쓰기마다 무효화 → 다음 조회에서 한 번씩 적재
+
+
+def test_external_change_is_visible_after_invalidate(cache):
+    cache.get_id("Categories", "두부")
+    with database.db_connection() as conn:
+        conn.execute("INSERT INTO Categories (name) VALUES ('수입식품')")
+        conn.commit()
+
+    with pytest.raises(ValueError):
+        cache.get_id("Categories", "수입식품")
+    cache.invalidate()
+    assert cache.get_id("Categories", "수입식품") > 0
+
+
+# ------------------------------------------------------------------
+# 3. 비동기 경로: 적재는 DB 전용 스레드에서
+# ------------------------------------------------------------------
+def test_ensure_loaded_async_loads_off_event_loop(cache):
+    asyncio.run(cache.ensure_loaded_async())
+    asyncio.run(cache.ensure_loaded_async())   # 이미 적재되어 있으면 아무것도 하지 않음
+    assert len(cache.reload_threads) == 1 and cache.reload_threads[0].startswith("db")
+    cache.get_id("Categories", "두부")
+    assert len(cache.reload_threads) == 1
+
+
+def test_resolve_category_tag(pool):
+    assert resolve_category_tag("유제품/두부/알류", "부침두부") == "두부"
+    assert resolve_category_tag("유제품/두부/알류", "서울우유") == "유제품"
+    assert resolve_category_tag("없는분류", "알수없음") == "기타"
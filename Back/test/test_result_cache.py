@@ -0,0 +1,135 @@
+import os
+import sys
+import asyncio
+import threading
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.cache.result_cache import ResultCache, make_cache_key
+from src.db.async_database import shutdown_db_executor
+from src.llm.llm_processor import refine_cache_key
+
+
+# ------------------------------------------------------------------
+# 2. 메모리 LRU
+# ------------------------------------------------------------------
+def test_lru_evicts_least_recently_used():
+    cache = ResultCache("t", max_entries=2, max_bytes=1024, db_path="")
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1   # a를 최근 사용으로 갱신
+    cache.put("c", 3)            # b가 제거되어야 함
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    metrics = cache.metrics()
+    assert metrics["evictions"] == 1
+    assert metrics["hits"] == 3 and metrics["misses"] == 1
+
+
+def test_byte_limit_and_oversized_values():
+    cache = ResultCache("t", max_entries=100, max_bytes=40, db_path="")
+    cache.put("small1", "x" * 15)
+    cache.put("small2", "y" * 15)
+    cache.put("small3", "z" * 15)   # 합이 40바이트를 넘으므로 가장 오래된 항목 제거
+    cache.put("huge", "w" * 100)    # 한도보다 큰 값은 메모리에 넣지 않음
+
+    assert cache.get("small1") is None
+    assert cache.get("huge") is None
+    assert cache.metrics()["bytes"] <= 40
+
+
+# ------------------------------------------------------------------
+# 3. 디스크 저장소 (재시작 후에도 유지)
+# ------------------------------------------------------------------
+def test_disk_store_survives_restart(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    first = ResultCache("ocr", max_entries=10, max_bytes=1024, db_path=db_path)
+    first.put("k", {"lines": [{"text": "두부"}]})
+    first.close()
+
+    restarted = ResultCache("ocr", max_entries=10, max_bytes=1024, db_path=db_path)
+    assert restarted.get("k") == {"lines": [{"text": "두부"}]}
+    assert restarted.metrics()["disk_hits"] == 1
+    assert restarted.get("k") is not None
+    assert restarted.metrics()["hits"] == 1   # 두 번째부터는 메모리에서
+
+    # 이름이 다른 캐시와는 키 공간을 공유하지 않음
+    other = ResultCache("refine", max_entries=10, max_bytes=1024, db_path=db_path)
+    assert other.get("k") is None
+    restarted.close()
+    other.close()
+
+
+# 디스크 저장소 커넥션을 감싸 SQL 을 실행한 스레드를 기록
+class ThreadRecordingConnection:
+    def __init__(self, conn):
+        self.conn = conn
+        self.threads = []
+
+    def execute(self, *args):
+        self.threads.append(threading.current_thread().name)
+        return self.conn.execute(*args)
+
+    def commit(self):
+        self.threads.append(threading.current_thread().name)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def test_async_disk_access_runs_off_event_loop(tmp_path):
+    cache = ResultCache("refine", max_entries=10, max_bytes=1024, db_path=str(tmp_path / "cache.db"))
+    recorder = cache._db = ThreadRecordingConnection(cache._db)
+
+    async def main():
+        loop_thread = threading.current_thread().name
+        await cache.put_async("k", ["두부"])
+        assert await cache.get_async("k") == ["두부"]   # 메모리 적중: 디스크 접근 없음
+        cache._entries.clear()
+        assert await cache.get_async("k") == ["두부"]   # 디스크 적중
+        assert await cache.get_async("없음") is None
+        return loop_thread
+
+    try:
+        loop_thread = asyncio.run(main())
+    finally:
+        shutdown_db_executor()
+    assert recorder.threads and loop_thread not in recorder.threads
+    assert all(name.startswith("db") for name in recorder.threads)
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["disk_hits"], metrics["misses"], metrics["puts"]) == (1, 1, 1, 1)
+    cache.close()
+
+
+def test_memory_lookups_do_not_wait_for_disk(tmp_path):
+    cache = ResultCache("ocr", max_entries=10, max_bytes=1024, db_path=str(tmp_path / "cache.db"))
+    cache.put("k", "두부")
+
+    # 다른 스레드가 디스크 저장소를 쓰는 중 (디스크 잠금을 잡고 있음)
+    with cache._disk_lock:
+        finished = threading.Event()
+        reader = threading.Thread(target=lambda: cache.get("k") == "두부" and finished.set())
+        reader.start()
+        reader.join(timeout=2)
+        assert finished.is_set()
+    cache.close()
+
+
+# ------------------------------------------------------------------
+# 4. 키 생성
+# ------------------------------------------------------------------
+def test_keys():
+    assert make_cache_key("ocr", b"abc") == make_cache_key("ocr", memoryview(b"abc"))
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+    # 공백만 다른 청크는 같은 보정 결과를 재사용
+    assert refine_cache_key(["009 풀/두부  1", "  대파 "]) == refine_cache_key(["009 풀/두부 1", "대파", ""])
+    assert refine_cache_key(["두부"]) != refine_cache_key(["대파"])
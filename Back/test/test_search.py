@@ -0,0 +1,156 @@
+import os
+import sys
+import sqlite3
+import pytest
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.db import database
+from src.db.text_search import build_match_query, search_index_select_sql, search_key, to_choseong
+from src.ingredients.ingredients_crud import get_filtered_ingredients, get_ingredients_page
+
+NAMES = ["두부", "순두부", "두부조림", "부두", "돼지고기 (목살)", "소고기", "대파", "Milk 우유"]
+
+
+# ------------------------------------------------------------------
+# 2. 테스트용 DB
+# ------------------------------------------------------------------
+def insert(conn, name: str, status: str = "active") -> int:
+    cursor = conn.execute("""
+        INSERT INTO Ingredients (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date, status)
+        VALUES (?, 1, '개', 1, 1, '2030-01-01', '2024-01-01', ?)
+    """, (name, status))
+    conn.commit()
+    return cursor.lastrowid
+
+
+@pytest.fixture
+def conn(tmp_path):
+    pool = database.init_pool(str(tmp_path / "search.db"), size=1)
+    database.initialize_database()
+    conn = pool.acquire()
+    for name in NAMES:
+        insert(conn, name)
+
+    yield conn
+    pool.release(conn)
+    database.close_pool()
+
+
+def names(conn, term: str, **kwargs) -> list:
+    return [row["name"] for row in get_filtered_ingredients(conn, search_term=term, **kwargs)]
+
+
+# ------------------------------------------------------------------
+# 3. 정규화 / 토큰
+# ------------------------------------------------------------------
+def test_normalization_and_tokens():
+    assert search_key("돼지고기 (목살)") == "돼지고기목살"
+    assert search_key("ＭＩＬＫ") == "milk"
+    assert to_choseong("두부 조림") == "ㄷㅂㅈㄹ"
+    assert search_key("ㄷㅂ") == "ㄷㅂ"   # NFKC 후에도 호환용 자모 유지
+    assert build_match_query("ㄷㅂ")[0] == "initial_grams"
+    assert build_match_query(" () ") is None
+
+
+# ------------------------------------------------------------------
+# 4. 검색
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("term, expected", [
+    ("두부", {"두부", "순두부", "두부조림"}),
+    ("부조", {"두부조림"}),
+    ("고기", {"돼지고기 (목살)", "소고기"}),
+    ("고기 목", {"돼지고기 (목살)"}),          # 공백/괄호 무시
+    ("milk", {"Milk 우유"}),
+    ("ㄷㅂ", {"두부", "순두부", "두부조림"}),   # 초성 검색
+    ("ㅅㄱㄱ", {"소고기"}),
+    ("두부조림탕", set()),
+])
+def test_substring_and_choseong_search(conn, term, expected):
+    assert set(names(conn, term)) == expected
+
+
+def test_single_char_matches_like(conn):
+    expected = {row["name"] for row in conn.execute("SELECT name FROM Ingredients WHERE name LIKE '%부%'")}
+    assert set(names(conn, "부")) == expected
+
+
+def test_relevance_orders_exact_then_prefix(conn):
+    assert names(conn, "두부", sort_by="relevance") == ["두부", "두부조림", "순두부"]
+    assert names(conn, "부", sort_by="relevance")[0] == "부두"
+    # 검색 없이 relevance 를 주면 기본 정렬(유통기한)
+    assert len(names(conn, None, sort_by="relevance")) == len(NAMES)
+
+
+def test_relevance_pages_and_total(conn):
+    page = get_ingredients_page(conn, search_term="ㄷㅂ", sort_by="relevance", limit=2,
+                                fields="name,relevance", include_total=True)
+    assert [row["name"] for row in page.items] == ["두부", "두부조림"] and page.total == 3
+    rest = get_ingredients_page(conn, search_term="ㄷㅂ", sort_by="relevance", limit=2, cursor=page.next_cursor)
+    assert [row["name"] for row in rest.items] == ["순두부"] and rest.next_cursor is None
+    assert "relevance" not in rest.items[0]   # 기본 반환 필드에는 관련도 없음
+    assert page.items[0]["relevance"] == 0 and page.items[1]["relevance"] == 1
+
+
+def test_relevance_cursor_is_stable_while_rows_are_added(conn):
+    for index in range(5):
+        insert(conn, f"두부{index}")
+    first = get_ingredients_page(conn, search_term="두부", sort_by="relevance", limit=3)
+
+    # 페이지 사이에 같은 검색어의 행이 늘어나도 (bm25 점수는 바뀜) 이미 본 행이 다시 나오거나 빠지지 않음
+    for index in range(50):
+        insert(conn, f"연두부 {index}")
+    seen = [row["name"] for row in first.items]
+    cursor = first.next_cursor
+    while cursor:
+        page = get_ingredients_page(conn, search_term="두부", sort_by="relevance", limit=3, cursor=cursor)
+        seen += [row["name"] for row in page.items]
+        cursor = page.next_cursor
+
+    assert len(seen) == len(set(seen))
+    assert {"두부", "두부조림", "순두부", *(f"두부{index}" for index in range(5))} <= set(seen)
+
+
+# 트리거의 SQL 식이 검색어 쪽 파이썬 정규화 / 초성 변환과 같은 값을 만드는지
+def test_index_values_match_search_key(conn):
+    for name in [*NAMES, "국산 콩-두부 1/2모", "A급 Milk·우유"]:
+        _, name_key, initials, grams, _ = conn.execute(search_index_select_sql("0", "?"), (name,)).fetchone()
+        assert (name_key, initials) == (search_key(name), to_choseong(name))
+        assert grams.split()[:3] == [name_key[0], name_key[:2], name_key[1]]
+
+
+def test_triggers_keep_index_in_sync(conn):
+    new_id = insert(conn, "연두부")
+    assert "연두부" in names(conn, "ㅇㄷㅂ")
+
+    conn.execute("UPDATE Ingredients SET name = '연근' WHERE id = ?", (new_id,))
+    assert "연근" not in names(conn, "두부") and names(conn, "연근") == ["연근"]
+
+    conn.execute("DELETE FROM Ingredients WHERE id = ?", (new_id,))
+    assert names(conn, "연근") == []
+    assert conn.execute("SELECT COUNT(*) FROM Ingredients_FTS").fetchone()[0] == len(NAMES)
+
+
+def test_writes_without_app_connection_are_indexed(conn, tmp_path):
+    # 앱의 커넥션(풀)을 거치지 않는 쓰기: 스키마에 앱 전용 SQL 함수가 없어야 함
+    raw = sqlite3.connect(str(tmp_path / "search.db"))
+    raw.execute("""
+        INSERT INTO Ingredients (name, quantity, unit, category_id, storage_location_id, expiry_date, registration_date)
+        VALUES ('훈제 두부', 1, '개', 1, 1, '2030-01-01', '2024-01-01')
+    """)
+    raw.execute("UPDATE Ingredients SET name = '부추' WHERE name = '대파'")
+    raw.commit()
+    raw.close()
+
+    assert "훈제 두부" in names(conn, "ㅎㅈㄷㅂ")
+    assert names(conn, "부추") == ["부추"] and names(conn, "대파") == []
+
+
+def test_inactive_ingredients_are_excluded(conn):
+    insert(conn, "두부피", status="used")
+    assert "두부피" not in names(conn, "두부")
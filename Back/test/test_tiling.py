@@ -0,0 +1,123 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+
+# ------------------------------------------------------------------
+# 1. 경로 설정
+# ------------------------------------------------------------------
+current_dir = os.path.dirname(os.path.abspath(__file__)) # Back/test
+parent_dir = os.path.abspath(os.path.join(current_dir, "..")) # Back
+sys.path.append(parent_dir)
+
+from src.ocr.tiling import merge_strip_results, ocr_tiled, plan_strips, should_tile
+from src.ocr.line_grouping import group_lines
+from src.ocr.model_registry import ModelRegistry
+from src.ocr.OCR_processor import AdvancedOCRProcessor, ocr_model_name
+
+
+# ------------------------------------------------------------------
+# 2. 합성 긴 영수증 + 가짜 OCR
+# ------------------------------------------------------------------
+# 줄마다 3개의 글자 블록을 그리고, 블록 밝기로 줄 번호를 표시 (가짜 OCR이 밝기를 '읽음')  - 최대 200줄
+def synthetic_long_receipt(line_count=90, width=400, pitch=30, glyph_height=14):
+    image = np.full((line_count * pitch + 40, width, 3), 255, np.uint8)
+    for line in range(line_count):
+        y = 20 + line * pitch
+        for col, (x1, x2) in enumerate(((20, 150), (170, 260), (290, 380))):
+            value = 20 + line
+            cv2.rectangle(image, (x1, y), (x2, y + glyph_height), (value, value, value), -1)
+    return image
+
+
+# 글자 블록(연결 요소)을 찾아 줄 번호를 읽는 가짜 OCR
+# - 블록 높이가 min_readable px 보다 작으면 읽지 못함 (작게 축소된 글자)
+def fake_predict(image, min_readable=8):
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    mask = (gray < 235).astype(np.uint8)
+    count, _, stats, _ = cv2.connectedComponentsWithStats(mask)
+    texts, boxes, scores = [], [], []
+    for x, y, w, h, _ in stats[1:count]:
+        if h < min_readable or w < 4:
+            continue
+        value = int(gray[y + h // 2, x + w // 2])
+        texts.append(f"L{value - 20}")
+        boxes.append([x, y, x + w, y + h])
+        scores.append(0.9)
+    return texts, np.array(boxes, dtype=np.float64).reshape(-1, 4), np.array(scores)
+
+
+def test_plan_strips_cover_height_with_overlap():
+    strips = plan_strips(2500, strip_height=960, overlap=96)
+    assert strips[0][0] == 0 and strips[-1][1] == 2500
+    for (top_a, bottom_a), (top_b, _) in zip(strips, strips[1:]):
+        assert bottom_a - top_b == 96
+    assert plan_strips(500, 960, 96) == [(0, 500)]
+
+
+def test_should_tile_only_long_images():
+    assert should_tile(np.zeros((3000, 400, 3), np.uint8))
+    assert not should_tile(np.zeros((800, 600, 3), np.uint8))
+
+
+def test_merge_removes_duplicates_in_overlap():
+    # 띠 A 아래쪽에 잘린 박스, 띠 B 위쪽에 온전한 박스 (같은 글자)
+    strip_a = (["밀크", "우유"], np.array([[10, 100, 90, 120], [10, 950, 90, 960]]), np.array([0.9, 0.6]))
+    strip_b = (["우유 1L", "두부"], np.array([[10, 86, 90, 106], [10, 300, 90, 320]]), np.array([0.95, 0.9]))
+    texts, boxes, scores = merge_strip_results([(0, strip_a), (864, strip_b)])
+    assert texts == ["밀크", "우유 1L", "두부"]
+    assert boxes[1].tolist() == [10, 950, 90, 970]
+    assert boxes[2].tolist() == [10, 1164, 90, 1184]
+
+
+def test_tiled_ocr_reads_every_line_once():
+    image = synthetic_long_receipt()
+    texts, boxes, scores = ocr_tiled(image, fake_predict)
+
+    # 모든 줄의 블록 3개를 정확히 한 번씩 읽어야 함 (겹침 구간 중복 없음)
+    assert len(texts) == 90 * 3
+    assert sorted(set(texts)) == sorted(f"L{i}" for i in range(90))
+    # 박스는 원본 좌표
+    assert boxes[:, 3].max() <= image.shape[0] + 1
+
+    lines = group_lines(texts, boxes, scores, threshold="adaptive")
+    assert [line["text"] for line in lines] == [f"L{i} L{i} L{i}" for i in range(90)]
+
+
+# ------------------------------------------------------------------
+# 3. OCR 처리기: 띠 OCR도 모델 하나만 사용
+# ------------------------------------------------------------------
+class FakePaddleOCR:
+    loaded = 0
+
+    def __init__(self):
+        FakePaddleOCR.loaded += 1
+
+    def predict(self, image):
+        texts, boxes, scores = fake_predict(image)
+        return [{"rec_texts": texts, "rec_boxes": boxes, "rec_scores": scores}]
+
+
+def test_processor_tiles_with_single_model():
+    registry = ModelRegistry()
+    registry.register(ocr_model_name(), FakePaddleOCR)   # 처리기가 등록하는 PaddleOCR 로더보다 먼저
+    processor = AdvancedOCRProcessor(registry=registry)
+    assert not processor.tiling   # 기본 꺼짐
+    processor.tiling = True
+
+    image = synthetic_long_receipt()
+    result = processor.process_bytes(cv2.imencode(".png", image)[1])
+    assert [line["text"] for line in result["lines"]] == [f"L{i} L{i} L{i}" for i in range(90)]
+    assert FakePaddleOCR.loaded == 1
+    assert list(registry.status()) == [ocr_model_name()]
+
+
+def test_processors_on_different_devices_do_not_share_a_model():
+    registry = ModelRegistry()
+    cpu = AdvancedOCRProcessor(use_gpu=False, registry=registry)
+    gpu = AdvancedOCRProcessor(use_gpu=True, registry=registry)
+    AdvancedOCRProcessor(use_gpu=False, registry=registry)   # 같은 장치는 같은 모델을 함께 씀
+
+    assert cpu.model_name != gpu.model_name
+    assert sorted(registry.status()) == sorted([cpu.model_name, gpu.model_name])